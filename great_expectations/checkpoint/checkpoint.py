@@ -29,6 +29,9 @@ from great_expectations.core.util import (
     convert_to_json_serializable,
     get_datetime_string_from_strftime_format,
 )
+from great_expectations.core.validation_process_pool_executor import (
+    ValidationProcessPoolExecutor,
+)
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_context.types.base import (
     Attributes,
@@ -195,38 +198,59 @@ class Checkpoint:
         # concurrency is enabled in the data context configuration) -- please see the below arguments used to initialize
         # AsyncExecutor and the corresponding AsyncExecutor docstring for more details on when multiple threads are
         # used.
-        with AsyncExecutor(
-            self.data_context.concurrency, max_workers=len(validations)
-        ) as async_executor:
-            # noinspection PyUnresolvedReferences
-            async_validation_operator_results: List[
-                AsyncResult[ValidationOperatorResult]
-            ] = []
-            if len(validations) > 0:
-                for idx, validation_dict in enumerate(validations):
+        #
+        # If the process pool is also enabled, the batch requests of the validations are rather shipped to (and
+        # validated by) worker processes, which speeds up CPU-bound validations; every thread then waits for the
+        # validation result of its worker process and runs the actions on it (see ValidationProcessPoolExecutor).
+        process_pool_executor: Optional[ValidationProcessPoolExecutor] = None
+        if (
+            ValidationProcessPoolExecutor.is_enabled(self.data_context.concurrency)
+            and not self.data_context.ge_cloud_mode
+            and len(validations) > 1
+        ):
+            process_pool_executor = ValidationProcessPoolExecutor(
+                data_context=self.data_context, max_workers=len(validations)
+            )
+
+        try:
+            with AsyncExecutor(
+                self.data_context.concurrency, max_workers=len(validations)
+            ) as async_executor:
+                # noinspection PyUnresolvedReferences
+                async_validation_operator_results: List[
+                    AsyncResult[ValidationOperatorResult]
+                ] = []
+                if len(validations) > 0:
+                    for idx, validation_dict in enumerate(validations):
+                        self._run_validation(
+                            substituted_runtime_config=substituted_runtime_config,
+                            async_validation_operator_results=async_validation_operator_results,
+                            async_executor=async_executor,
+                            result_format=result_format,
+                            run_id=run_id,
+                            idx=idx,
+                            validation_dict=validation_dict,
+                            process_pool_executor=process_pool_executor,
+                        )
+                else:
                     self._run_validation(
                         substituted_runtime_config=substituted_runtime_config,
                         async_validation_operator_results=async_validation_operator_results,
                         async_executor=async_executor,
                         result_format=result_format,
                         run_id=run_id,
-                        idx=idx,
-                        validation_dict=validation_dict,
                     )
-            else:
-                self._run_validation(
-                    substituted_runtime_config=substituted_runtime_config,
-                    async_validation_operator_results=async_validation_operator_results,
-                    async_executor=async_executor,
-                    result_format=result_format,
-                    run_id=run_id,
-                )
 
-            run_results = {}
-            for async_validation_operator_result in async_validation_operator_results:
-                run_results.update(
-                    async_validation_operator_result.result().run_results
-                )
+                run_results = {}
+                for (
+                    async_validation_operator_result
+                ) in async_validation_operator_results:
+                    run_results.update(
+                        async_validation_operator_result.result().run_results
+                    )
+        finally:
+            if process_pool_executor is not None:
+                process_pool_executor.shutdown()
 
         return CheckpointResult(
             run_id=run_id, run_results=run_results, checkpoint_config=self.config_kwargs
@@ -332,6 +356,7 @@ class Checkpoint:
         run_id: Optional[Union[str, RunIdentifier]],
         idx: Optional[int] = 0,
         validation_dict: Optional[dict] = None,
+        process_pool_executor: Optional[ValidationProcessPoolExecutor] = None,
     ):
         if validation_dict is None:
             validation_dict = {}
@@ -351,19 +376,29 @@ class Checkpoint:
                 "expectation_suite_ge_cloud_id"
             )
 
-            validator: Validator = self.data_context.get_validator(
-                batch_request=batch_request,
-                expectation_suite_name=(
-                    expectation_suite_name
-                    if not self.data_context.ge_cloud_mode
-                    else None
-                ),
-                expectation_suite_ge_cloud_id=(
-                    expectation_suite_ge_cloud_id
-                    if self.data_context.ge_cloud_mode
-                    else None
-                ),
-            )
+            asset_to_validate: Union[Validator, tuple]
+            if (
+                process_pool_executor is not None
+                and ValidationProcessPoolExecutor.can_validate(
+                    batch_request=batch_request
+                )
+            ):
+                # The batch_request is validated in a worker process
+                asset_to_validate = (batch_request, expectation_suite_name)
+            else:
+                asset_to_validate = self.data_context.get_validator(
+                    batch_request=batch_request,
+                    expectation_suite_name=(
+                        expectation_suite_name
+                        if not self.data_context.ge_cloud_mode
+                        else None
+                    ),
+                    expectation_suite_ge_cloud_id=(
+                        expectation_suite_ge_cloud_id
+                        if self.data_context.ge_cloud_mode
+                        else None
+                    ),
+                )
 
             action_list: list = substituted_validation_dict.get("action_list")
             runtime_configuration_validation = substituted_validation_dict.get(
@@ -402,13 +437,14 @@ class Checkpoint:
             async_validation_operator_results.append(
                 async_executor.submit(
                     action_list_validation_operator.run,
-                    assets_to_validate=[validator],
+                    assets_to_validate=[asset_to_validate],
                     run_id=run_id,
                     evaluation_parameters=substituted_validation_dict.get(
                         "evaluation_parameters"
                     ),
                     result_format=result_format,
                     checkpoint_identifier=checkpoint_identifier,
+                    process_pool_executor=process_pool_executor,
                     **operator_run_kwargs,
                 )
             )
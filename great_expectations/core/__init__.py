@@ -16,7 +16,7 @@ from .expectation_validation_result import (
     expectationValidationResultSchema,
     get_metric_kwargs_id,
 )
-from .id_dict import IDDict
+from .id_dict import FrozenIDDict, IDDict
 from .run_identifier import RunIdentifier, RunIdentifierSchema
 from .urn import ge_urn
 
@@ -33,6 +33,7 @@ __all__ = [
     expectationSuiteValidationResultSchema,
     expectationValidationResultSchema,
     get_metric_kwargs_id,
+    FrozenIDDict,
     IDDict,
     RunIdentifier,
     RunIdentifierSchema,
@@ -1,7 +1,7 @@
 import datetime
 import json
 import logging
-from typing import Any, Callable, Dict, Optional, Set, Union
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import BatchKwargs, BatchSpec, IDDict
@@ -459,6 +459,11 @@ class BatchMarkers(BatchKwargs):
     def ge_load_time(self):
         return self.get("ge_load_time")
 
+    @property
+    def data_fingerprint(self):
+        """The fingerprint of the loaded data (None if the data was not fingerprinted)."""
+        return self.get("pandas_data_fingerprint")
+
 
 # TODO: <Alex>This module needs to be cleaned up.
 #  We have Batch used for the legacy design, and we also need Batch for the new design.
@@ -552,14 +557,15 @@ class Batch(SerializableDictDot):
         return self._batch_kwargs
 
     def to_dict(self) -> dict:
+        # The data (and the batch_markers) of a LazyBatch, which has not been loaded yet, is not loaded for display.
         dict_obj: dict = {
-            "data": str(self.data),
+            "data": str(self._data),
             "batch_request": self.batch_request.to_dict(),
             "batch_definition": self.batch_definition.to_json_dict()
             if isinstance(self.batch_definition, BatchDefinition)
             else {},
             "batch_spec": self.batch_spec,
-            "batch_markers": self.batch_markers,
+            "batch_markers": self._batch_markers,
         }
         return dict_obj
 
@@ -592,7 +598,75 @@ class Batch(SerializableDictDot):
             {"batch_id": self.id},
             {"n_rows": n_rows, "fetch_all": fetch_all},
         )
-        return self._data.execution_engine.resolve_metrics((metric,))[metric.id]
+        return self.data.execution_engine.resolve_metrics((metric,))[metric.id]
+
+
+class LazyBatch(Batch):
+    """
+    Batch, whose data is only loaded (by data_loader) upon first access, rather than upon creation.
+
+    A Validator hands the lazy batches it is given over to its execution engine (see
+    ExecutionEngine.load_lazy_batch_data), which loads the data of a batch when a metric first needs it, and may evict
+    it afterwards, so that validating (or profiling) many batches does not require the data of all of them in memory.
+    """
+
+    def __init__(
+        self,
+        data_loader: Callable[[], Tuple[Any, BatchMarkers]],
+        batch_request: Union[BatchRequest, RuntimeBatchRequest] = None,
+        batch_definition: BatchDefinition = None,
+        batch_spec: BatchSpec = None,
+    ):
+        """
+        Args:
+            data_loader: Callable returning the data of the batch and its batch_markers (e.g., the
+                get_batch_data_and_markers method of an execution engine, bound to the batch_spec of the batch)
+        """
+        super().__init__(
+            data=None,
+            batch_request=batch_request,
+            batch_definition=batch_definition,
+            batch_spec=batch_spec,
+        )
+        self._data_loader = data_loader
+        # The batch_markers describe a load of the data, hence are only known once the data has been loaded.
+        self._batch_markers = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data, _ = self.load_data()
+        return self._data
+
+    @property
+    def batch_markers(self):
+        if self._batch_markers is None:
+            self.load_data()
+        return self._batch_markers
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether or not the data of the batch is held by the batch (see data and evict_data)."""
+        return self._data is not None
+
+    def load_data(self) -> Tuple[Any, BatchMarkers]:
+        """Loads the data of the batch (without holding it; see data), and returns it along with its batch_markers."""
+        batch_data: Any
+        batch_markers: BatchMarkers
+        batch_data, batch_markers = self._data_loader()
+        self._batch_markers = batch_markers
+        return batch_data, batch_markers
+
+    def evict_data(self):
+        """Releases the data held by the batch (it is loaded again upon the next access)."""
+        self._data = None
+
+    def head(self, n_rows=5, fetch_all=False):
+        execution_engine = self.data.execution_engine
+        if self.id not in execution_engine.loaded_batch_data_dict:
+            # Unlike the data of other batches, the data of lazy batches is not loaded into the execution engine upfront.
+            execution_engine.load_batch_data(self.id, self.data)
+        return super().head(n_rows=n_rows, fetch_all=fetch_all)
 
 
 def get_batch_request_from_acceptable_arguments(
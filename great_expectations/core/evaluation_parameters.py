@@ -3,9 +3,11 @@ import datetime
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from pyparsing import (
     CaselessKeyword,
@@ -30,6 +32,13 @@ from great_expectations.exceptions import EvaluationParameterError
 logger = logging.getLogger(__name__)
 _epsilon = 1e-12
 
+# Maximum number of distinct parameter expressions, whose compiled form (see compile_evaluation_parameter_expression) is
+# kept.
+EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE = 4096
+
+# Names of the functions, whose result differs from call to call, so that expressions calling them are not deterministic.
+NON_DETERMINISTIC_FUNCTIONS = {"now"}
+
 
 class EvaluationParameterParser:
     """
@@ -201,10 +210,15 @@ def build_evaluation_parameters(
     evaluation_parameters: Optional[dict] = None,
     interactive_evaluation: bool = True,
     data_context=None,
+    evaluated_parameters: Optional[Dict[str, Any]] = None,
 ) -> Tuple[dict, dict]:
     """Build a dictionary of parameters to evaluate, using the provided evaluation_parameters,
     AND mutate expectation_args by removing any parameter values passed in as temporary values during
     exploratory work.
+
+    If evaluated_parameters is provided, it is used to look up (and record) the values of deterministic parameter
+    expressions, so that expressions shared by many expectations (evaluated with the same evaluation_parameters) are
+    only evaluated once.
     """
     evaluation_args = copy.deepcopy(expectation_args)
     substituted_parameters = {}
@@ -228,11 +242,26 @@ def build_evaluation_parameters(
             # an exception if we do not have a value
             else:
                 raw_value = value["$PARAMETER"]
-                parameter_value = parse_evaluation_parameter(
-                    raw_value,
-                    evaluation_parameters=evaluation_parameters,
-                    data_context=data_context,
-                )
+                if (
+                    evaluated_parameters is not None
+                    and isinstance(raw_value, str)
+                    and raw_value in evaluated_parameters
+                ):
+                    parameter_value = evaluated_parameters[raw_value]
+                else:
+                    parameter_value = parse_evaluation_parameter(
+                        raw_value,
+                        evaluation_parameters=evaluation_parameters,
+                        data_context=data_context,
+                    )
+                    if (
+                        evaluated_parameters is not None
+                        and isinstance(raw_value, str)
+                        and compile_evaluation_parameter_expression(
+                            raw_value
+                        ).is_deterministic
+                    ):
+                        evaluated_parameters[raw_value] = parameter_value
                 evaluation_args[key] = parameter_value
                 # Once we've substituted, we also track that we did so
                 substituted_parameters[key] = parameter_value
@@ -240,7 +269,68 @@ def build_evaluation_parameters(
     return evaluation_args, substituted_parameters
 
 
+# The parser (and its exprStack) is shared, hence only used to compile expressions, while holding _expr_lock.
 expr = EvaluationParameterParser()
+_expr_lock = threading.Lock()
+
+
+class CompiledEvaluationParameterExpression(
+    namedtuple(
+        "CompiledEvaluationParameterExpression",
+        ["tokens", "expr_stack", "parse_error"],
+    )
+):
+    """
+    Parsed form of a parameter expression: the top-level parse results (tokens), and the expression in reverse polish
+    notation (expr_stack), which EvaluationParameterParser.evaluate_stack evaluates, once the evaluation parameters are
+    substituted into a copy of it.  If the expression cannot be parsed, parse_error holds the message, the line, and the
+    column of the parse error.
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_deterministic(self) -> bool:
+        """Whether or not evaluating the expression with the same evaluation parameters yields the same value."""
+        return not any(
+            isinstance(op, tuple) and op[0] in NON_DETERMINISTIC_FUNCTIONS
+            for op in self.expr_stack
+        )
+
+
+@lru_cache(maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE)
+def compile_evaluation_parameter_expression(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    """Parse a parameter expression into its CompiledEvaluationParameterExpression.
+
+    Compiled expressions are cached (and immutable), so that every distinct expression is only parsed once, and can be
+    evaluated concurrently.
+    """
+    with _expr_lock:
+        # Calling get_parser clears the stack
+        parser = expr.get_parser()
+        try:
+            tokens = parser.parseString(parameter_expression, parseAll=True)
+        except ParseException as err:
+            return CompiledEvaluationParameterExpression(
+                tokens=(), expr_stack=(), parse_error=(str(err), err.line, err.column)
+            )
+
+        return CompiledEvaluationParameterExpression(
+            tokens=tuple(tokens), expr_stack=tuple(expr.exprStack), parse_error=None
+        )
+
+
+def _get_compiled_evaluation_parameter_expression(
+    parameter_expression: Any,
+) -> CompiledEvaluationParameterExpression:
+    try:
+        return compile_evaluation_parameter_expression(parameter_expression)
+    except TypeError:
+        # Unhashable expressions cannot be cached.
+        # noinspection PyUnresolvedReferences
+        return compile_evaluation_parameter_expression.__wrapped__(parameter_expression)
 
 
 def find_evaluation_parameter_dependencies(parameter_expression):
@@ -255,23 +345,23 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
+        compiled_expression: CompiledEvaluationParameterExpression = (
+            _get_compiled_evaluation_parameter_expression(parameter_expression)
         )
     except AttributeError as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
 
-    for word in expr.exprStack:
+    if compiled_expression.parse_error is not None:
+        err_str, err_line, err_col = compiled_expression.parse_error
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
+
+    for word in compiled_expression.expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -304,6 +394,80 @@ def find_evaluation_parameter_dependencies(parameter_expression):
     return dependencies
 
 
+def resolve_store_evaluation_parameters(
+    parameter_expressions: Iterable[str],
+    evaluation_parameters: Optional[Dict[str, Any]] = None,
+    data_context: Optional[Any] = None,  # Cannot type 'DataContext' due to import cycle
+) -> Dict[str, Any]:
+    """Fetch the values of the store URNs (urn:great_expectations:stores:...), which the parameter expressions refer to,
+    with one batched lookup per store.
+
+    Args:
+        parameter_expressions: the parameter expressions (e.g., of all expectations of a suite)
+        evaluation_parameters (dict): the evaluation parameters; URNs, whose value they provide, are not fetched
+        data_context (DataContext): the data context, whose stores are queried
+
+    Returns:
+        a dictionary of the values of the URNs (to be added to the evaluation parameters, so that the expressions are
+        evaluated without querying the stores again); URNs, which cannot be fetched in bulk (e.g., because their store
+        does not support get_query_results), are left to parse_evaluation_parameter
+
+    """
+    if data_context is None:
+        return {}
+
+    if evaluation_parameters is None:
+        evaluation_parameters = {}
+
+    urns_by_store_name: Dict[str, Dict[str, Any]] = {}
+    for parameter_expression in parameter_expressions:
+        try:
+            dependencies: dict = find_evaluation_parameter_dependencies(
+                parameter_expression
+            )
+        except EvaluationParameterError:
+            # The error is raised once the expression is evaluated.
+            continue
+
+        for urn in dependencies["urns"]:
+            if urn in evaluation_parameters:
+                continue
+
+            try:
+                parsed_urn = ge_urn.parseString(urn)
+            except ParseException:
+                continue
+
+            if parsed_urn["urn_type"] == "stores":
+                urns_by_store_name.setdefault(parsed_urn["store_name"], {})[
+                    urn
+                ] = parsed_urn
+
+    store_values: Dict[str, Any] = {}
+    for store_name, parsed_urns in urns_by_store_name.items():
+        store = data_context.stores.get(store_name)
+        if not hasattr(store, "get_query_results"):
+            continue
+
+        try:
+            results: List[Any] = store.get_query_results(
+                [
+                    (parsed_urn["metric_name"], parsed_urn.get("metric_kwargs", {}))
+                    for parsed_urn in parsed_urns.values()
+                ]
+            )
+        except Exception as e:
+            # The values are queried one by one upon evaluation, which raises the error of the failing query (if any).
+            logger.debug(
+                f"Unable to fetch the store evaluation parameters of store {store_name} in bulk: {str(e)}"
+            )
+            continue
+
+        store_values.update(zip(parsed_urns.keys(), results))
+
+    return store_values
+
+
 def parse_evaluation_parameter(
     parameter_expression: str,
     evaluation_parameters: Optional[Dict[str, Any]] = None,
@@ -327,16 +491,19 @@ def parse_evaluation_parameter(
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
-    try:
-        L = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
+    compiled_expression: CompiledEvaluationParameterExpression = (
+        _get_compiled_evaluation_parameter_expression(parameter_expression)
+    )
+    if compiled_expression.parse_error is not None:
+        L = ["Parse Failure", parameter_expression, compiled_expression.parse_error]
+    else:
+        L = compiled_expression.tokens
+    # The evaluation parameters are substituted into a copy of the (shared) compiled expression.
+    expr_stack = list(compiled_expression.expr_stack)
 
     # Represents a valid parser result of a single function that has no arguments
     if len(L) == 1 and isinstance(L[0], tuple) and L[0][2] is False:
-        # Necessary to catch `now()` (which only needs to be evaluated with `expr.exprStack`)
+        # Necessary to catch `now()` (which only needs to be evaluated with `expr_stack`)
         # NOTE: 20211122 - Chetan - Any future built-ins that are zero arity functions will match this behavior
         pass
 
@@ -374,9 +541,9 @@ def parse_evaluation_parameter(
         return evaluation_parameters[L[0]]
 
     elif len(L) == 0 or L[0] != "Parse Failure":
-        for i, ob in enumerate(expr.exprStack):
+        for i, ob in enumerate(expr_stack):
             if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
+                expr_stack[i] = str(evaluation_parameters[ob])
 
     else:
         err_str, err_line, err_col = L[-1]
@@ -385,7 +552,7 @@ def parse_evaluation_parameter(
         )
 
     try:
-        result = expr.evaluate_stack(expr.exprStack)
+        result = expr.evaluate_stack(expr_stack)
         result = convert_to_json_serializable(result)
     except Exception as e:
         exception_traceback = traceback.format_exc()
@@ -978,6 +978,7 @@ class ExpectationConfiguration(SerializableDictDot):
         data_context: Optional[
             Any
         ] = None,  # Can't type as DataContext due to import cycle
+        evaluated_parameters: Optional[Dict[str, Any]] = None,
     ) -> None:
         if self._raw_kwargs is not None:
             logger.debug(
@@ -989,6 +990,7 @@ class ExpectationConfiguration(SerializableDictDot):
             evaluation_parameters,
             interactive_evaluation,
             data_context,
+            evaluated_parameters=evaluated_parameters,
         )
 
         self._raw_kwargs = self._kwargs
@@ -9,6 +9,7 @@ import great_expectations as ge
 from great_expectations import __version__ as ge_version
 from great_expectations.core.evaluation_parameters import (
     _deduplicate_evaluation_parameter_dependencies,
+    resolve_store_evaluation_parameters,
 )
 from great_expectations.core.expectation_configuration import (
     ExpectationConfiguration,
@@ -217,6 +218,55 @@ class ExpectationSuite(SerializableDictDot):
         dependencies = _deduplicate_evaluation_parameter_dependencies(dependencies)
         return dependencies
 
+    def process_evaluation_parameters(
+        self,
+        evaluation_parameters: Optional[dict],
+        interactive_evaluation: bool = True,
+        data_context: Optional[Any] = None,
+    ) -> None:
+        """Substitute the evaluation parameters into the $PARAMETER kwargs of all expectations of the suite in one pass.
+
+        Every distinct (deterministic) parameter expression of the suite is evaluated only once, however many
+        expectations it appears in, and the values of the store URNs, which the expressions refer to, are fetched
+        upfront, with one batched lookup per store (see resolve_store_evaluation_parameters).
+        """
+        if interactive_evaluation:
+            store_values: Dict[str, Any] = resolve_store_evaluation_parameters(
+                parameter_expressions=self._get_evaluation_parameter_expressions(),
+                evaluation_parameters=evaluation_parameters,
+                data_context=data_context,
+            )
+            if store_values:
+                # The values of the store URNs do not override the evaluation parameters.
+                evaluation_parameters = {
+                    **store_values,
+                    **(evaluation_parameters or {}),
+                }
+
+        evaluated_parameters: Dict[str, Any] = {}
+        expectation: ExpectationConfiguration
+        for expectation in self.expectations:
+            expectation.process_evaluation_parameters(
+                evaluation_parameters=evaluation_parameters,
+                interactive_evaluation=interactive_evaluation,
+                data_context=data_context,
+                evaluated_parameters=evaluated_parameters,
+            )
+
+    def _get_evaluation_parameter_expressions(self) -> List[str]:
+        """The parameter expressions of the $PARAMETER kwargs (which are not supplied a value at runtime)."""
+        parameter_expressions: List[str] = []
+        for expectation in self.expectations:
+            for value in expectation.kwargs.values():
+                if (
+                    isinstance(value, dict)
+                    and "$PARAMETER" in value
+                    and f"$PARAMETER.{value['$PARAMETER']}" not in value
+                ):
+                    parameter_expressions.append(value["$PARAMETER"])
+
+        return parameter_expressions
+
     def get_citations(
         self,
         sort: bool = True,
@@ -1,3 +1,4 @@
+import copy
 import hashlib
 import json
 
@@ -23,6 +24,60 @@ class IDDict(dict):
         ).hexdigest()
 
 
+class FrozenIDDict(IDDict):
+    """An IDDict, whose keys cannot be added, removed, or reassigned after construction.
+
+    Since the contents are fixed, the default id (i.e., "to_id()" called without arguments) is computed only once, and
+    the FrozenIDDict is hashable (by that id), which makes it usable as a dictionary key or a set member.  Note that the
+    freezing is shallow: mutable values (e.g., lists) held by the dictionary must not be modified in place.
+
+    Copying a FrozenIDDict (using "copy.copy()", "copy.deepcopy()", or "copy()") returns a mutable IDDict, since copies
+    are customarily made in order to derive modified kwargs from the original ones.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._id = None
+
+    def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is not None or id_ignore_keys is not None:
+            return super().to_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+        if self._id is None:
+            self._id = super().to_id()
+
+        return self._id
+
+    def __hash__(self):
+        return hash(self.to_id())
+
+    def _raise_immutable_error(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} does not support item assignment.")
+
+    __setitem__ = _raise_immutable_error
+    __delitem__ = _raise_immutable_error
+    clear = _raise_immutable_error
+    pop = _raise_immutable_error
+    popitem = _raise_immutable_error
+    setdefault = _raise_immutable_error
+    update = _raise_immutable_error
+
+    def __ior__(self, other):
+        self._raise_immutable_error()
+
+    def copy(self):
+        return IDDict(self)
+
+    def __copy__(self):
+        return IDDict(self)
+
+    def __deepcopy__(self, memo):
+        return IDDict({key: copy.deepcopy(value, memo) for key, value in self.items()})
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
 class BatchKwargs(IDDict):
     pass
 
@@ -290,3 +290,73 @@ class ValidationMetricIdentifier(MetricIdentifier):
             metric_name=metric_id.metric_name,
             metric_kwargs_id=metric_id.metric_kwargs_id,
         )
+
+
+class MetricResultIdentifier(DataContextKey):
+    """A MetricResultIdentifier identifies the value of a metric computed on a batch, whose data has the given
+    fingerprint (so that the value can be reused, as long as the data of the batch does not change)."""
+
+    def __init__(
+        self,
+        batch_fingerprint,
+        metric_name,
+        metric_domain_kwargs_id=None,
+        metric_value_kwargs_id=None,
+    ):
+        self._batch_fingerprint = batch_fingerprint
+        self._metric_name = metric_name
+        self._metric_domain_kwargs_id = metric_domain_kwargs_id or None
+        self._metric_value_kwargs_id = metric_value_kwargs_id or None
+
+    @property
+    def batch_fingerprint(self):
+        return self._batch_fingerprint
+
+    @property
+    def metric_name(self):
+        return self._metric_name
+
+    @property
+    def metric_domain_kwargs_id(self):
+        return self._metric_domain_kwargs_id
+
+    @property
+    def metric_value_kwargs_id(self):
+        return self._metric_value_kwargs_id
+
+    @classmethod
+    def from_metric_configuration(cls, batch_fingerprint, metric_configuration):
+        return cls(
+            batch_fingerprint=batch_fingerprint,
+            metric_name=metric_configuration.metric_name,
+            metric_domain_kwargs_id=metric_configuration.metric_domain_kwargs_id,
+            metric_value_kwargs_id=metric_configuration.metric_value_kwargs_id,
+        )
+
+    def to_tuple(self):
+        return (
+            self.batch_fingerprint,
+            self.metric_name,
+            self.metric_domain_kwargs_id or "__",
+            self.metric_value_kwargs_id or "__",
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 4:
+            raise GreatExpectationsError(
+                "MetricResultIdentifier tuple must have exactly four components."
+            )
+        return cls(
+            batch_fingerprint=tuple_[0],
+            metric_name=tuple_[1],
+            metric_domain_kwargs_id=None if tuple_[2] == "__" else tuple_[2],
+            metric_value_kwargs_id=None if tuple_[3] == "__" else tuple_[3],
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
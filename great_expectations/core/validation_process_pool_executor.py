@@ -0,0 +1,231 @@
+"""
+Process pool counterpart of AsyncExecutor, which validates batch requests in worker processes.
+
+Validating pandas batches is CPU-bound (and holds the GIL), so that running the validations of a checkpoint in parallel
+threads does not speed them up.  ValidationProcessPoolExecutor rather runs them in a pool of worker processes, each of
+which builds its own DataContext (from the configuration of the DataContext of the parent process) upon start-up.  Only
+the batch requests, the expectation suites, and the validation results (serialized) are shipped between the processes
+-- the data is loaded by the worker processes themselves.
+
+WARNING: This module is experimental.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Optional, Tuple, Union
+
+from ruamel.yaml import YAML
+
+from great_expectations.core.async_executor import AsyncResult
+from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+    expectationSuiteValidationResultSchema,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.types.base import (
+    ConcurrencyConfig,
+    DataContextConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+yaml = YAML()
+
+# The DataContext of the worker process, built by _initialize_worker
+_worker_data_context = None
+
+
+class AsyncValidationResult(AsyncResult):
+    """AsyncResult of ValidationProcessPoolExecutor.submit(), which deserializes the validation result shipped back by
+    the worker process.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(self, future: Future, run_id: RunIdentifier):
+        super().__init__(future=future)
+        self._run_id = run_id
+
+    def result(self) -> Tuple[str, ExpectationSuiteValidationResult]:
+        """Return the id of the validated batch and the validation result, blocking if necessary until the validation
+        finishes.
+        """
+        batch_id: str
+        validation_result_dict: dict
+        batch_id, validation_result_dict = super().result()
+        validation_result: ExpectationSuiteValidationResult = (
+            expectationSuiteValidationResultSchema.load(validation_result_dict)
+        )
+        # The RunIdentifier is serialized into a dictionary, which actions (e.g., StoreMetricsAction) do not expect.
+        validation_result.meta["run_id"] = self._run_id
+        return batch_id, validation_result
+
+
+class ValidationProcessPoolExecutor(AbstractContextManager):
+    """Wrapper around ProcessPoolExecutor validating batch requests in worker processes.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(self, data_context, max_workers: int):
+        """Initializes a new ValidationProcessPoolExecutor, whose worker processes use a DataContext built from the
+        configuration (and the root directory and runtime environment) of data_context.
+
+        Stores of the DataContext are re-instantiated by every worker process, so that expectation suites are shipped to
+        the worker processes (and evaluation parameters are looked up by the parent process), but validations whose
+        batch data only exists in the memory of the parent process (see can_validate) cannot be run in worker processes.
+
+        Worker processes are spawned (rather than forked), so that scripts validating in worker processes must guard
+        their entry point with `if __name__ == "__main__":`.
+
+        This class is intended to be used as a context manager using the `with` statement.
+
+        Args:
+            data_context: DataContext whose configuration is used by the worker processes.
+            max_workers: The maximum number of worker processes. Note that the maximum number of worker processes is
+                also limited by concurrency_config.max_process_pool_workers (or by the number of CPUs).
+        """
+        concurrency_config: Optional[ConcurrencyConfig] = data_context.concurrency
+        if concurrency_config is None:
+            concurrency_config = ConcurrencyConfig()
+
+        max_process_pool_workers: int = (
+            concurrency_config.max_process_pool_workers or os.cpu_count() or 1
+        )
+
+        self._data_context = data_context
+        # Worker processes are started lazily, upon submissions (which may come from the threads of an AsyncExecutor),
+        # hence they are spawned rather than forked, so that they do not inherit locks held by other threads (e.g., of
+        # logging handlers, or of connection pools).
+        self._process_pool_executor = ProcessPoolExecutor(
+            max_workers=max(1, min(max_process_pool_workers, max_workers)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(
+                data_context.get_config(mode="yaml"),
+                data_context.root_directory,
+                data_context.runtime_environment,
+            ),
+        )
+
+    @staticmethod
+    def is_enabled(concurrency_config: Optional[ConcurrencyConfig]) -> bool:
+        """Whether or not the concurrency configuration enables running validations in worker processes."""
+        return (
+            concurrency_config is not None
+            and concurrency_config.enabled
+            and concurrency_config.process_pool_enabled
+        )
+
+    @staticmethod
+    def can_validate(batch_request) -> bool:
+        """Whether or not the batch request can be shipped to (and loaded by) a worker process."""
+        if isinstance(batch_request, RuntimeBatchRequest):
+            return "batch_data" not in (batch_request.runtime_parameters or {})
+
+        return isinstance(batch_request, BatchRequest)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def submit(
+        self,
+        batch_request: Union[BatchRequest, RuntimeBatchRequest],
+        expectation_suite: ExpectationSuite,
+        run_id: RunIdentifier,
+        evaluation_parameters: Optional[dict] = None,
+        result_format: Optional[Union[str, dict]] = None,
+        catch_exceptions: Optional[bool] = None,
+    ) -> AsyncValidationResult:
+        """Submits the validation of the (last) batch of batch_request against expectation_suite to a worker process.
+
+        The evaluation parameters bound in the evaluation parameter store of the DataContext for run_id are looked up
+        upon submission, and passed to the worker process along with the given ones.
+        """
+        store_evaluation_parameters: dict = (
+            self._data_context.evaluation_parameter_store.get_bind_params(run_id)
+        )
+        return AsyncValidationResult(
+            future=self._process_pool_executor.submit(
+                _validate_batch_request,
+                batch_request=batch_request,
+                expectation_suite=expectation_suite.to_json_dict(),
+                run_id=run_id,
+                store_evaluation_parameters=store_evaluation_parameters,
+                evaluation_parameters=evaluation_parameters,
+                result_format=result_format,
+                catch_exceptions=catch_exceptions,
+            ),
+            run_id=run_id,
+        )
+
+    def shutdown(self):
+        """Clean-up the resources associated with the ValidationProcessPoolExecutor and blocks until all running
+        validations finish.
+        """
+        self._process_pool_executor.shutdown()
+
+
+def _initialize_worker(
+    project_config_yaml: str,
+    context_root_directory: Optional[str],
+    runtime_environment: Optional[dict],
+):
+    global _worker_data_context
+
+    # Imported here, in order to avoid a circular import (the DataContext module depends on this one, indirectly).
+    from great_expectations.data_context import BaseDataContext
+
+    project_config: DataContextConfig = DataContextConfig.from_commented_map(
+        commented_map=yaml.load(project_config_yaml)
+    )
+    # Usage statistics are only sent by the parent process.
+    project_config.anonymous_usage_statistics.enabled = False
+
+    _worker_data_context = BaseDataContext(
+        project_config=project_config,
+        context_root_dir=context_root_directory,
+        runtime_environment=runtime_environment,
+    )
+
+
+def _validate_batch_request(
+    batch_request: Union[BatchRequest, RuntimeBatchRequest],
+    expectation_suite: dict,
+    run_id: RunIdentifier,
+    store_evaluation_parameters: dict,
+    evaluation_parameters: Optional[dict],
+    result_format: Optional[Union[str, dict]],
+    catch_exceptions: Optional[bool],
+) -> Tuple[str, dict]:
+    data_context = _worker_data_context
+    suite = ExpectationSuite(**expectation_suite, data_context=data_context)
+    validator = data_context.get_validator(
+        batch_request=batch_request, expectation_suite=suite
+    )
+
+    # Evaluation parameters of the parent process take precedence over the ones of the worker process, in the usual
+    # order (evaluation parameter store, then expectation suite, then the given ones).
+    runtime_evaluation_parameters: dict = dict(store_evaluation_parameters)
+    if suite.evaluation_parameters:
+        runtime_evaluation_parameters.update(suite.evaluation_parameters)
+    if evaluation_parameters is not None:
+        runtime_evaluation_parameters.update(evaluation_parameters)
+
+    validate_kwargs: dict = {
+        "run_id": run_id,
+        "result_format": result_format,
+        "evaluation_parameters": runtime_evaluation_parameters,
+    }
+    if catch_exceptions is not None:
+        validate_kwargs["catch_exceptions"] = catch_exceptions
+
+    validation_result: ExpectationSuiteValidationResult = validator.validate(
+        **validate_kwargs
+    )
+    return validator.active_batch_id, validation_result.to_json_dict()
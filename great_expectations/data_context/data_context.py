@@ -64,7 +64,12 @@ from great_expectations.core.usage_statistics.usage_statistics import (
 )
 from great_expectations.core.util import nested_update
 from great_expectations.data_asset import DataAsset
-from great_expectations.data_context.store import Store, TupleStoreBackend
+from great_expectations.data_context.store import (
+    CachingStoreBackend,
+    Store,
+    StoreBackend,
+    TupleStoreBackend,
+)
 from great_expectations.data_context.store.expectations_store import ExpectationsStore
 from great_expectations.data_context.store.profiler_store import ProfilerStore
 from great_expectations.data_context.store.validations_store import ValidationsStore
@@ -601,7 +606,10 @@ class BaseDataContext:
         expectations_store = self._stores[
             self.project_config_with_variables_substituted.expectations_store_name
         ]
-        if isinstance(expectations_store.store_backend, TupleStoreBackend):
+        store_backend: StoreBackend = expectations_store.store_backend
+        while isinstance(store_backend, CachingStoreBackend):
+            store_backend = store_backend.store_backend
+        if isinstance(store_backend, TupleStoreBackend):
             # suppress_warnings since a warning will already have been issued during the store creation if there was an invalid store config
             return expectations_store.store_backend_id_warnings_suppressed
 
@@ -2366,6 +2374,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics: List[Tuple[ValidationMetricIdentifier, Any]] = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -2387,7 +2396,16 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
+                    except ge_exceptions.UnavailableMetricError:
+                        # This will happen frequently in larger pipelines
+                        logger.debug(
+                            "metric {} was requested by another expectation suite but is not available in "
+                            "this validation result.".format(metric_name)
+                        )
+                        continue
+
+                    metrics.append(
+                        (
                             ValidationMetricIdentifier(
                                 run_id=run_id,
                                 data_asset_name=data_asset_name,
@@ -2401,12 +2419,12 @@ class BaseDataContext:
                             ),
                             metric_value,
                         )
-                    except ge_exceptions.UnavailableMetricError:
-                        # This will happen frequently in larger pipelines
-                        logger.debug(
-                            "metric {} was requested by another expectation suite but is not available in "
-                            "this validation result.".format(metric_name)
-                        )
+                    )
+
+        # All the metrics of the validation result are written by a single (and, for database backed stores, a
+        # single transactional) call to the store.
+        if metrics:
+            self.stores[target_store_name].set_many(metrics)
 
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
@@ -2488,10 +2506,11 @@ class BaseDataContext:
 
         if run_id is None or batch_identifier is None:
             # Get most recent run id
-            # NOTE : This method requires a (potentially very inefficient) list_keys call.
-            # It should probably move to live in an appropriate Store class,
-            # but when we do so, that Store will need to function as more than just a key-value Store.
-            key_list = selected_store.list_keys()
+            # NOTE : Only the keys of the validation results of the expectation suite are listed (the store backend
+            # narrows down its listing to the expectation suite name, whenever it can).
+            key_list = selected_store.iter_keys_for_expectation_suite(
+                expectation_suite_name=expectation_suite_name
+            )
             filtered_key_list = []
             for key in key_list:
                 if run_id is not None and key.run_id != run_id:
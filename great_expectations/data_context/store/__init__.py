@@ -14,10 +14,12 @@ from .tuple_store_backend import (  # isort:skip
     TupleAzureBlobStoreBackend,
 )
 from .database_store_backend import DatabaseStoreBackend  # isort:skip
+from .caching_store_backend import CachingStoreBackend  # isort:skip
 from .configuration_store import ConfigurationStore  # isort:skip
 from .checkpoint_store import CheckpointStore  # isort:skip
 from .metric_store import (  # isort:skip
     EvaluationParameterStore,
+    MetricResultStore,
     MetricStore,
 )
 from .expectations_store import ExpectationsStore  # isort:skip
@@ -40,6 +42,7 @@ for module_name in (
     ".tuple_store_backend",
     ".database_store_backend",
     ".ge_cloud_store_backend",
+    ".caching_store_backend",
 ):
     verify_dynamic_loading_support(
         module_name=module_name, package_name="great_expectations.data_context.store"
@@ -0,0 +1,451 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.util import (
+    instantiate_class_from_config,
+    load_class,
+)
+from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.util import (
+    filter_properties_dict,
+    verify_dynamic_loading_support,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_wrapped_store_backend_config(store_backend: dict) -> dict:
+    """Returns the configuration of the store backend wrapped by a CachingStoreBackend (following nested wrappers),
+    or store_backend itself if it does not configure a CachingStoreBackend.
+
+    Stores providing defaults for the configuration of their store backend (e.g., the filepath_suffix of a
+    TupleStoreBackend) apply them to the wrapped store backend.
+    """
+    while isinstance(store_backend.get("store_backend"), dict):
+        module_name: str = store_backend.get(
+            "module_name", "great_expectations.data_context.store"
+        )
+        class_name: Optional[str] = store_backend.get("class_name")
+        if class_name is None:
+            break
+
+        verify_dynamic_loading_support(module_name=module_name)
+        if not issubclass(load_class(class_name, module_name), CachingStoreBackend):
+            break
+
+        store_backend = store_backend["store_backend"]
+
+    return store_backend
+
+
+class _CacheEntry:
+    __slots__ = ("value", "version", "cached_at", "deserialized_value")
+
+    _NOT_DESERIALIZED = object()
+
+    def __init__(self, value: Any, version: Optional[str], cached_at: float):
+        self.value = value
+        self.version = version
+        self.cached_at = cached_at
+        self.deserialized_value = self._NOT_DESERIALIZED
+
+    @property
+    def is_deserialized(self) -> bool:
+        return self.deserialized_value is not self._NOT_DESERIALIZED
+
+
+class CachingStoreBackend(StoreBackend):
+    """Read-through, write-through in-memory cache wrapping any other store backend.
+
+    The values read from the wrapped store backend are kept in a least recently used cache of (at most) max_size
+    values, along with their deserialized form (see get_deserialized), so that a Store getting the same key again does
+    not read nor deserialize its value again. Writes, moves, and removals go to the wrapped store backend and invalidate
+    the cached values of the affected keys, both before and after changing them. Every invalidation of a key also bumps
+    its generation, so that a value read from the wrapped store backend before (or while) the key was changed is not
+    cached afterwards.
+
+    A cached value is served for ttl seconds (forever if ttl is None). If revalidate is True, once the value is older
+    than ttl (or on every read, if ttl is None), the version of the value in the wrapped store backend (a modification
+    time or an ETag, see StoreBackend.get_version) is checked, and the value is read again only if its version changed.
+    Without revalidation, changes made by other processes are picked up only once the cached values expire.
+
+    For example, to cache up to 500 expectation suites, revalidating their modification time every 60 seconds:
+
+        expectations_store:
+          class_name: ExpectationsStore
+          store_backend:
+            class_name: CachingStoreBackend
+            ttl: 60
+            max_size: 500
+            revalidate: true
+            store_backend:
+              class_name: TupleFilesystemStoreBackend
+              base_directory: expectations/
+
+    The hits, misses, revalidations, expirations, and evictions of the cache are exposed by the statistics property.
+    """
+
+    def __init__(
+        self,
+        store_backend: dict,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = 1000,
+        revalidate: bool = False,
+        runtime_environment: Optional[dict] = None,
+        store_name: Optional[str] = None,
+    ):
+        if ttl is not None and ttl < 0:
+            raise ValueError("ttl of CachingStoreBackend must be non-negative.")
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size of CachingStoreBackend must be non-negative.")
+
+        module_name = "great_expectations.data_context.store"
+        wrapped_store_backend = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment or {},
+            config_defaults={
+                "module_name": module_name,
+                "store_name": store_name,
+            },
+        )
+        if not wrapped_store_backend:
+            raise ClassInstantiationError(
+                module_name=module_name, package_name=None, class_name=store_backend
+            )
+        if not isinstance(wrapped_store_backend, StoreBackend):
+            raise DataContextError(
+                "Invalid StoreBackend configuration: expected a StoreBackend instance."
+            )
+
+        super().__init__(
+            fixed_length_key=wrapped_store_backend.fixed_length_key,
+            # The store_backend_id is the one of the wrapped store backend
+            suppress_store_backend_id=True,
+            store_name=store_name,
+        )
+
+        self._store_backend = wrapped_store_backend
+        self._ttl = ttl
+        self._max_size = max_size
+        self._revalidate = revalidate
+
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+        # The generations of the keys invalidated while values were being read from the wrapped store backend (the
+        # generations only matter to the reads in flight, so they are dropped once no read is in flight).
+        self._generations: Dict[Tuple, int] = {}
+        self._reads_in_flight = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._expirations = 0
+        self._evictions = 0
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "ttl": ttl,
+            "max_size": max_size,
+            "revalidate": revalidate,
+            "runtime_environment": runtime_environment,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    @property
+    def store_backend(self) -> StoreBackend:
+        return self._store_backend
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    @property
+    def revalidate(self) -> bool:
+        return self._revalidate
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "revalidations": self._revalidations,
+            "expirations": self._expirations,
+            "evictions": self._evictions,
+        }
+
+    @property
+    def store_backend_id(self):
+        return self._store_backend.store_backend_id
+
+    @property
+    def store_backend_id_warnings_suppressed(self):
+        return self._store_backend.store_backend_id_warnings_suppressed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self, key: Tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._reads_in_flight:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def get_deserialized(
+        self, key: Tuple, deserializer: Callable[[Any], Any], **kwargs
+    ) -> Any:
+        """Returns a copy of the deserialized value of the key, deserializing the value only once while it is cached
+        (every caller gets its own copy, so that the cached deserialized value cannot be mutated).
+        """
+        self._validate_key(key)
+        entry: _CacheEntry = self._get_entry(key, **kwargs)
+        if not entry.is_deserialized:
+            deserialized_value: Any = deserializer(entry.value)
+            with self._lock:
+                entry.deserialized_value = deserialized_value
+
+        return copy.deepcopy(entry.deserialized_value)
+
+    def get_version(self, key: Tuple) -> Optional[str]:
+        return self._store_backend.get_version(key)
+
+    def get_versions(self, keys: List[Tuple]) -> List[Optional[str]]:
+        return self._store_backend.get_versions(keys)
+
+    def _get(self, key, **kwargs):
+        return self._get_entry(key, **kwargs).value
+
+    def _get_many(self, keys: List[Tuple], **kwargs) -> List[Any]:
+        values: Dict[Tuple, Any] = {}
+        missing_keys: List[Tuple] = []
+        key: Tuple
+        for key in keys:
+            entry: Optional[_CacheEntry] = self._get_cached_entry(key)
+            if entry is None:
+                missing_keys.append(key)
+            else:
+                values[key] = entry.value
+
+        if missing_keys:
+            generations: List[int] = self._start_read(missing_keys)
+            try:
+                versions: List[Optional[str]] = self._get_versions_to_cache(
+                    missing_keys
+                )
+                missing_values: List[Any] = self._store_backend.get_many(
+                    missing_keys, **kwargs
+                )
+                generation: int
+                version: Optional[str]
+                value: Any
+                for key, generation, version, value in zip(
+                    missing_keys, generations, versions, missing_values
+                ):
+                    self._cache_entry(
+                        key=key, value=value, version=version, generation=generation
+                    )
+                    values[key] = value
+            finally:
+                self._end_read()
+
+        return [values[key] for key in keys]
+
+    def _set(self, key, value, **kwargs):
+        self.invalidate(key)
+        try:
+            return self._store_backend.set(key, value, **kwargs)
+        finally:
+            self.invalidate(key)
+
+    def _set_many(self, key_value_pairs: List[Tuple[Tuple, Any]], **kwargs) -> list:
+        self._invalidate_many([key for key, _ in key_value_pairs])
+        try:
+            return self._store_backend.set_many(key_value_pairs, **kwargs)
+        finally:
+            self._invalidate_many([key for key, _ in key_value_pairs])
+
+    def _move(self, source_key, dest_key, **kwargs):
+        self._invalidate_many([source_key, dest_key])
+        try:
+            return self._store_backend.move(source_key, dest_key, **kwargs)
+        finally:
+            self._invalidate_many([source_key, dest_key])
+
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        return (
+            self._store_backend.list_keys(prefix)
+            if prefix
+            else self._store_backend.list_keys()
+        )
+
+    def iter_keys(
+        self,
+        prefix: Tuple = (),
+        filter_function: Optional[Callable[[Tuple], bool]] = None,
+    ) -> Iterator[Tuple]:
+        return self._store_backend.iter_keys(
+            prefix=prefix, filter_function=filter_function
+        )
+
+    def remove_key(self, key):
+        if not isinstance(key, tuple):
+            key = key.to_tuple()
+        self.invalidate(key)
+        try:
+            return self._store_backend.remove_key(key)
+        finally:
+            self.invalidate(key)
+
+    def _has_key(self, key):
+        if self._get_cached_entry(key, count_miss=False) is not None:
+            return True
+
+        return self._store_backend.has_key(key)
+
+    def get_url_for_key(self, key, protocol=None):
+        return self._store_backend.get_url_for_key(key, protocol=protocol)
+
+    def _validate_key(self, key):
+        self._store_backend._validate_key(key)
+
+    def _validate_value(self, value):
+        self._store_backend._validate_value(value)
+
+    def _invalidate_many(self, keys: List[Tuple]) -> None:
+        with self._lock:
+            key: Tuple
+            for key in keys:
+                self.invalidate(key)
+
+    def _get_entry(self, key: Tuple, **kwargs) -> _CacheEntry:
+        entry: Optional[_CacheEntry] = self._get_cached_entry(key)
+        if entry is None:
+            generation: int = self._start_read([key])[0]
+            try:
+                version: Optional[str] = self._get_versions_to_cache([key])[0]
+                entry = self._cache_entry(
+                    key=key,
+                    value=self._store_backend.get(key, **kwargs),
+                    version=version,
+                    generation=generation,
+                )
+            finally:
+                self._end_read()
+
+        return entry
+
+    def _start_read(self, keys: List[Tuple]) -> List[int]:
+        """Registers a read of the keys from the wrapped store backend, returning their current generations (to be
+        passed to _cache_entry, before calling _end_read).
+        """
+        with self._lock:
+            self._reads_in_flight += 1
+            return [self._generations.get(key, 0) for key in keys]
+
+    def _end_read(self) -> None:
+        with self._lock:
+            self._reads_in_flight -= 1
+            if self._reads_in_flight == 0:
+                self._generations.clear()
+
+    def _get_cached_entry(
+        self, key: Tuple, count_miss: bool = True
+    ) -> Optional[_CacheEntry]:
+        """Returns the cached entry of the key if it can be served (counting a hit), or None (counting a miss).
+
+        The version of an entry to revalidate is read from the wrapped store backend without holding the lock, and the
+        entry is only served if it was not invalidated (or replaced) in the meantime.
+        """
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.get(key)
+            if entry is not None:
+                is_fresh: bool = (
+                    self._ttl is None or time.monotonic() - entry.cached_at < self._ttl
+                )
+                is_to_revalidate: bool = self._revalidate and (
+                    not is_fresh or self._ttl is None
+                )
+                if not (is_fresh or is_to_revalidate):
+                    del self._entries[key]
+                    self._expirations += 1
+                    entry = None
+
+        if entry is not None and is_to_revalidate:
+            is_current_version: bool = self._is_current_version(key=key, entry=entry)
+            with self._lock:
+                if self._entries.get(key) is not entry:
+                    entry = None
+                elif is_current_version:
+                    self._revalidations += 1
+                    entry.cached_at = time.monotonic()
+                else:
+                    del self._entries[key]
+                    if not is_fresh:
+                        self._expirations += 1
+                    entry = None
+
+        with self._lock:
+            if entry is None:
+                if count_miss:
+                    self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def _is_current_version(self, key: Tuple, entry: _CacheEntry) -> bool:
+        if entry.version is None:
+            return False
+
+        return self._store_backend.get_version(key) == entry.version
+
+    def _get_versions_to_cache(self, keys: List[Tuple]) -> List[Optional[str]]:
+        # The versions are read before the values, so that a change made in between is detected by the next
+        # revalidation
+        if not self._revalidate:
+            return [None] * len(keys)
+
+        return self._store_backend.get_versions(keys)
+
+    def _cache_entry(
+        self, key: Tuple, value: Any, version: Optional[str], generation: int
+    ) -> _CacheEntry:
+        """Caches the value read from the wrapped store backend, unless the key was invalidated since the read started
+        (i.e., its generation changed), in which case the value may be stale and the entry is only returned.
+        """
+        entry = _CacheEntry(value=value, version=version, cached_at=time.monotonic())
+        if self._max_size == 0:
+            return entry
+
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return entry
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while self._max_size is not None and len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return entry
+
+    @property
+    def config(self) -> dict:
+        return self._config
@@ -6,6 +6,9 @@ from ruamel.yaml.comments import CommentedMap
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.data_context.store import GeCloudStoreBackend
+from great_expectations.data_context.store.caching_store_backend import (
+    get_wrapped_store_backend_config,
+)
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
 from great_expectations.data_context.types.base import BaseYamlConfig
@@ -49,10 +52,13 @@ class ConfigurationStore(Store):
             )
 
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            wrapped_store_backend: dict = get_wrapped_store_backend_config(
+                store_backend=store_backend
+            )
+            store_backend_module_name = wrapped_store_backend.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = wrapped_store_backend.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -63,7 +69,7 @@ class ConfigurationStore(Store):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
-                store_backend["filepath_suffix"] = store_backend.get(
+                wrapped_store_backend["filepath_suffix"] = wrapped_store_backend.get(
                     "filepath_suffix", ".yml"
                 )
 
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -25,6 +25,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of bound parameters of a single bulk statement (SQLite used to allow at most 999 of them).
+MAX_BULK_STATEMENT_PARAMETERS = 900
+
 
 class DatabaseStoreBackend(StoreBackend):
     def __init__(
@@ -276,6 +279,149 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _set_many(
+        self,
+        key_value_pairs: List[Tuple[Tuple, Any]],
+        allow_update: bool = True,
+        **kwargs,
+    ) -> list:
+        """Writes all key-value pairs in a single transaction, using bulk upsert statements of the dialect (INSERT ... ON
+        CONFLICT for PostgreSQL and SQLite, INSERT ... ON DUPLICATE KEY UPDATE for MySQL) where available, and a single
+        lookup of the existing keys, followed by bulk UPDATE and INSERT statements, otherwise.
+        """
+        # Later values of a key override earlier ones, as they would if the keys were set one by one.
+        rows_by_key: Dict[Tuple, dict] = {}
+        for key, value in key_value_pairs:
+            row: dict = {k: v for (k, v) in zip(self.key_columns, key)}
+            row["value"] = value
+            rows_by_key[tuple(key)] = row
+
+        if not allow_update:
+            try:
+                with self.engine.begin() as connection:
+                    connection.execute(self._table.insert(), list(rows_by_key.values()))
+            except IntegrityError:
+                # Some keys exist already; _set tells apart the ones holding the same value from the conflicting ones.
+                for key, row in rows_by_key.items():
+                    self._set(key, row["value"], allow_update=False)
+            return [None] * len(key_value_pairs)
+
+        rows: List[dict] = list(rows_by_key.values())
+        chunk_size: int = max(
+            1, MAX_BULK_STATEMENT_PARAMETERS // (len(self.key_columns) + 1)
+        )
+        try:
+            with self.engine.begin() as connection:
+                for idx in range(0, len(rows), chunk_size):
+                    self._upsert_rows(
+                        connection=connection, rows=rows[idx : idx + chunk_size]
+                    )
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store {len(rows)} keys: got sqlalchemy error {str(e)}"
+            )
+
+        return [None] * len(key_value_pairs)
+
+    def _upsert_rows(self, connection, rows: List[dict]) -> None:
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+
+            upsert = insert(self._table).values(rows)
+            connection.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=self.key_columns,
+                    set_={"value": upsert.excluded.value},
+                )
+            )
+            return
+
+        if dialect_name in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert
+
+            upsert = insert(self._table).values(rows)
+            connection.execute(
+                upsert.on_duplicate_key_update(value=upsert.inserted.value)
+            )
+            return
+
+        if dialect_name == "sqlite":
+            try:
+                # SQLAlchemy supports the ON CONFLICT clause of SQLite (3.24 and later) from version 1.4 on.
+                from sqlalchemy.dialects.sqlite import insert
+            except ImportError:
+                insert = None
+            server_version_info: tuple = self.engine.dialect.server_version_info or ()
+            if insert is not None and server_version_info >= (3, 24):
+                upsert = insert(self._table).values(rows)
+                connection.execute(
+                    upsert.on_conflict_do_update(
+                        index_elements=self.key_columns,
+                        set_={"value": upsert.excluded.value},
+                    )
+                )
+                return
+
+        # Other dialects: look up which keys exist, then update those and insert the others.
+        existing_keys_selection = select(
+            [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        ).where(
+            sa.or_(
+                *(
+                    and_(
+                        *(
+                            getattr(self._table.columns, key_col) == row[key_col]
+                            for key_col in self.key_columns
+                        )
+                    )
+                    for row in rows
+                )
+            )
+        )
+        existing_keys = {
+            tuple(existing_key)
+            for existing_key in connection.execute(existing_keys_selection).fetchall()
+        }
+        rows_to_update: List[dict] = []
+        rows_to_insert: List[dict] = []
+        for row in rows:
+            if tuple(row[key_col] for key_col in self.key_columns) in existing_keys:
+                rows_to_update.append(row)
+            else:
+                rows_to_insert.append(row)
+
+        if rows_to_update:
+            update = (
+                self._table.update()
+                .where(
+                    and_(
+                        *(
+                            getattr(self._table.columns, key_col)
+                            == sa.bindparam(f"key_{key_col}")
+                            for key_col in self.key_columns
+                        )
+                    )
+                )
+                .values(value=sa.bindparam("value"))
+            )
+            connection.execute(
+                update,
+                [
+                    {
+                        "value": row["value"],
+                        **{
+                            f"key_{key_col}": row[key_col]
+                            for key_col in self.key_columns
+                        },
+                    }
+                    for row in rows_to_update
+                ],
+            )
+
+        if rows_to_insert:
+            connection.execute(self._table.insert(), rows_to_insert)
+
     def _move(self):
         raise NotImplementedError
 
@@ -5,6 +5,9 @@ from typing import Dict
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.expectation_suite import ExpectationSuiteSchema
 from great_expectations.data_context.store import GeCloudStoreBackend
+from great_expectations.data_context.store.caching_store_backend import (
+    get_wrapped_store_backend_config,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -118,10 +121,13 @@ class ExpectationsStore(Store):
         # TODO: refactor so ExpectationStore can have access to DataContext. Currently used by usage_stats messages.
         self._data_context = data_context
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            wrapped_store_backend: dict = get_wrapped_store_backend_config(
+                store_backend=store_backend
+            )
+            store_backend_module_name = wrapped_store_backend.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = wrapped_store_backend.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -132,15 +138,15 @@ class ExpectationsStore(Store):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
-                store_backend["filepath_suffix"] = store_backend.get(
+                wrapped_store_backend["filepath_suffix"] = wrapped_store_backend.get(
                     "filepath_suffix", ".json"
                 )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
-                store_backend["table_name"] = store_backend.get(
+                wrapped_store_backend["table_name"] = wrapped_store_backend.get(
                     "table_name", "ge_expectations_store"
                 )
-                store_backend["key_columns"] = store_backend.get(
+                wrapped_store_backend["key_columns"] = wrapped_store_backend.get(
                     "key_columns", ["expectation_suite_name"]
                 )
 
@@ -1,9 +1,12 @@
+import hashlib
 import inspect
+import json
 import logging
 import os
 import re
 import tempfile
 from mimetypes import guess_type
+from typing import Dict, Iterable, Optional, Tuple
 from zipfile import ZipFile, is_zipfile
 
 from great_expectations.data_context.types.resource_identifiers import (
@@ -29,6 +32,8 @@ from .tuple_store_backend import TupleStoreBackend
 
 logger = logging.getLogger(__name__)
 
+INDEX_MANIFEST_VERSION = 1
+
 
 class HtmlSiteStore:
     """
@@ -230,6 +235,34 @@ class HtmlSiteStore:
             "static_assets": static_assets_obj,
         }
 
+        # The index manifest keeps a compact record of every rendered validation result page, so that the index page
+        # can be rebuilt without loading every validation result from the validations store.
+        if not is_ge_cloud_store:
+            index_manifest_config_defaults = {
+                "module_name": module_name,
+                "filepath_template": "index_manifest.json",
+                "suppress_store_backend_id": True,
+            }
+            index_manifest_obj = instantiate_class_from_config(
+                config=store_backend,
+                runtime_environment=runtime_environment,
+                config_defaults=index_manifest_config_defaults,
+            )
+            if not index_manifest_obj:
+                raise ClassInstantiationError(
+                    module_name=module_name,
+                    package_name=None,
+                    class_name=store_backend["class_name"],
+                )
+            self.store_backends["index_manifest"] = index_manifest_obj
+
+        # The index manifest also records the content hashes of the rendered pages and of the copied static assets,
+        # so that unchanged pages are not rendered and unchanged static assets are not copied again.
+        self._index_manifest: Optional[Dict[Tuple[str, ...], dict]] = None
+        self._page_hashes: Dict[str, str] = {}
+        self._static_asset_hashes: Dict[str, str] = {}
+        self._index_manifest_changed = False
+
         # NOTE: Instead of using the filesystem as the source of record for keys,
         # this class tracks keys separately in an internal set.
         # This means that keys are stored for a specific session, but can't be fetched after the original
@@ -376,11 +409,150 @@ class HtmlSiteStore:
             for key in keys:
                 target_store_backend.remove_key(key)
 
+        index_manifest_backend = self.store_backends.get("index_manifest")
+        if index_manifest_backend is not None and index_manifest_backend.has_key(()):
+            index_manifest_backend.remove_key(())
+        self._index_manifest = {}
+        self._page_hashes = {}
+        self._static_asset_hashes = {}
+        self._index_manifest_changed = False
+
+    def get_index_manifest_entry(
+        self, resource_identifier: ValidationResultIdentifier
+    ) -> Optional[dict]:
+        """Returns the index manifest entry of a rendered validation result page (None if there is none)."""
+        return self._get_index_manifest().get(
+            resource_identifier.to_fixed_length_tuple()
+        )
+
+    def set_index_manifest_entry(
+        self, resource_identifier: ValidationResultIdentifier, entry: dict
+    ) -> None:
+        index_manifest: Dict[Tuple[str, ...], dict] = self._get_index_manifest()
+        key: Tuple[str, ...] = resource_identifier.to_fixed_length_tuple()
+        if index_manifest.get(key) != entry:
+            index_manifest[key] = entry
+            self._index_manifest_changed = True
+
+    def prune_index_manifest(
+        self, resource_identifiers: Iterable[ValidationResultIdentifier]
+    ) -> None:
+        """Removes the entries of all validation result pages other than the given ones from the index manifest."""
+        keys_to_keep = {
+            resource_identifier.to_fixed_length_tuple()
+            for resource_identifier in resource_identifiers
+        }
+        index_manifest: Dict[Tuple[str, ...], dict] = self._get_index_manifest()
+        stale_keys = [key for key in index_manifest if key not in keys_to_keep]
+        for key in stale_keys:
+            del index_manifest[key]
+
+        if stale_keys:
+            self._index_manifest_changed = True
+
+    def get_page_hash(self, resource_identifier: DataContextKey) -> Optional[str]:
+        """Returns the content hash of the source of the rendered page of the resource (None if there is none)."""
+        self._get_index_manifest()
+        return self._page_hashes.get(self._get_page_path(resource_identifier))
+
+    def set_page_hash(
+        self, resource_identifier: DataContextKey, page_hash: str
+    ) -> None:
+        self._get_index_manifest()
+        page_path: str = self._get_page_path(resource_identifier)
+        if self._page_hashes.get(page_path) != page_hash:
+            self._page_hashes[page_path] = page_hash
+            self._index_manifest_changed = True
+
+    def remove_page_hash(self, resource_identifier: DataContextKey) -> None:
+        self._get_index_manifest()
+        if self._page_hashes.pop(self._get_page_path(resource_identifier), None):
+            self._index_manifest_changed = True
+
+    def clear_index_manifest(self) -> None:
+        """Drops all entries and page hashes of the index manifest, so that they are recreated from the sources."""
+        self._index_manifest = {}
+        self._page_hashes = {}
+        self._index_manifest_changed = True
+
+    def write_index_manifest(self) -> None:
+        """Persists the index manifest, if it changed since it was read."""
+        index_manifest_backend = self.store_backends.get("index_manifest")
+        if index_manifest_backend is None or not self._index_manifest_changed:
+            return
+
+        index_manifest_entries = [
+            {"key": list(key), **entry}
+            for key, entry in self._get_index_manifest().items()
+        ]
+        index_manifest_backend.set(
+            (),
+            json.dumps(
+                {
+                    "version": INDEX_MANIFEST_VERSION,
+                    "validation_results": index_manifest_entries,
+                    "page_hashes": self._page_hashes,
+                    "static_assets": self._static_asset_hashes,
+                }
+            ),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+        self._index_manifest_changed = False
+
+    @staticmethod
+    def _get_page_path(resource_identifier: DataContextKey) -> str:
+        if isinstance(resource_identifier, ExpectationSuiteIdentifier):
+            section = "expectations"
+        else:
+            section = "validations"
+
+        return "/".join((section,) + tuple(resource_identifier.to_tuple()))
+
+    def _get_index_manifest(self) -> Dict[Tuple[str, ...], dict]:
+        if self._index_manifest is None:
+            self._index_manifest = self._read_index_manifest()
+
+        return self._index_manifest
+
+    def _read_index_manifest(self) -> Dict[Tuple[str, ...], dict]:
+        index_manifest_backend = self.store_backends.get("index_manifest")
+        if index_manifest_backend is None or not index_manifest_backend.has_key(()):
+            return {}
+
+        try:
+            index_manifest: dict = json.loads(index_manifest_backend.get(()))
+            if index_manifest.get("version") != INDEX_MANIFEST_VERSION:
+                raise ValueError(
+                    f"Unsupported index manifest version {index_manifest.get('version')}."
+                )
+
+            validation_results: Dict[Tuple[str, ...], dict] = {
+                tuple(entry.pop("key")): entry
+                for entry in index_manifest["validation_results"]
+            }
+            self._page_hashes = dict(index_manifest.get("page_hashes", {}))
+            self._static_asset_hashes = dict(index_manifest.get("static_assets", {}))
+            return validation_results
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(
+                f"Unable to read the index manifest of the site ({e}); it will be rebuilt from the validation results."
+            )
+            return {}
+
     def copy_static_assets(self, static_assets_source_dir=None):
         """
         Copies static assets, using a special "static_assets" backend store that accepts variable-length tuples as
         keys, with no filepath_template.
+
+        Static assets that are present in the site with the same content (according to the content hashes recorded in
+        the index manifest) are not copied again.
         """
+        self._get_index_manifest()
+        self._copy_static_assets(static_assets_source_dir=static_assets_source_dir)
+        self.write_index_manifest()
+
+    def _copy_static_assets(self, static_assets_source_dir=None):
         file_exclusions = [".DS_Store"]
         dir_exclusions = []
 
@@ -396,7 +568,7 @@ class HtmlSiteStore:
             unzip_destdir = tempfile.mkdtemp()
             unzipped_ok = self._unzip_assets(static_assets_source_dir, unzip_destdir)
             if unzipped_ok:
-                return self.copy_static_assets(unzip_destdir)
+                return self._copy_static_assets(unzip_destdir)
 
         for item in os.listdir(static_assets_source_dir):
             # Directory
@@ -405,7 +577,7 @@ class HtmlSiteStore:
                     continue
                 # Recurse
                 new_source_dir = os.path.join(static_assets_source_dir, item)
-                self.copy_static_assets(new_source_dir)
+                self._copy_static_assets(new_source_dir)
             # File
             else:
                 # Copy file over using static assets store backend
@@ -431,15 +603,24 @@ class HtmlSiteStore:
                             )
                             content_type = "text/html; charset=utf8"
 
-                    if not isinstance(
-                        self.store_backends["static_assets"], GeCloudStoreBackend
-                    ):
-                        self.store_backends["static_assets"].set(
+                    static_assets_backend = self.store_backends["static_assets"]
+                    if not isinstance(static_assets_backend, GeCloudStoreBackend):
+                        content: bytes = f.read()
+                        asset_path: str = "/".join(store_key)
+                        content_hash: str = hashlib.md5(content).hexdigest()
+                        if self._static_asset_hashes.get(
+                            asset_path
+                        ) == content_hash and static_assets_backend.has_key(store_key):
+                            continue
+
+                        static_assets_backend.set(
                             store_key,
-                            f.read(),
+                            content,
                             content_encoding=content_encoding,
                             content_type=content_type,
                         )
+                        self._static_asset_hashes[asset_path] = content_hash
+                        self._index_manifest_changed = True
 
     def _unzip_assets(self, assets_full_path: str, unzip_directory: str) -> bool:
         """
@@ -1,8 +1,21 @@
 import json
+import logging
+from typing import Any
 
-from great_expectations.core.metric import ValidationMetricIdentifier
+import numpy as np
+
+from great_expectations.core.metric import (
+    MetricResultIdentifier,
+    ValidationMetricIdentifier,
+)
 from great_expectations.core.run_identifier import RunIdentifier
-from great_expectations.core.util import ensure_json_serializable
+from great_expectations.core.util import (
+    convert_to_json_serializable,
+    ensure_json_serializable,
+)
+from great_expectations.data_context.store.caching_store_backend import (
+    get_wrapped_store_backend_config,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -13,6 +26,8 @@ from great_expectations.util import (
     verify_dynamic_loading_support,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class MetricStore(Store):
     """
@@ -23,10 +38,13 @@ class MetricStore(Store):
 
     def __init__(self, store_backend=None, store_name=None):
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            wrapped_store_backend: dict = get_wrapped_store_backend_config(
+                store_backend=store_backend
+            )
+            store_backend_module_name = wrapped_store_backend.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = wrapped_store_backend.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -36,12 +54,12 @@ class MetricStore(Store):
 
             if issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
-                if "table_name" not in store_backend:
-                    store_backend["table_name"] = store_backend.get(
+                if "table_name" not in wrapped_store_backend:
+                    wrapped_store_backend["table_name"] = wrapped_store_backend.get(
                         "table_name", "ge_metrics"
                     )
-                if "key_columns" not in store_backend:
-                    store_backend["key_columns"] = store_backend.get(
+                if "key_columns" not in wrapped_store_backend:
+                    wrapped_store_backend["key_columns"] = wrapped_store_backend.get(
                         "key_columns",
                         [
                             "run_name",
@@ -71,10 +89,13 @@ class MetricStore(Store):
 class EvaluationParameterStore(MetricStore):
     def __init__(self, store_backend=None, store_name=None):
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            wrapped_store_backend: dict = get_wrapped_store_backend_config(
+                store_backend=store_backend
+            )
+            store_backend_module_name = wrapped_store_backend.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = wrapped_store_backend.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -85,7 +106,7 @@ class EvaluationParameterStore(MetricStore):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
-                store_backend["table_name"] = store_backend.get(
+                wrapped_store_backend["table_name"] = wrapped_store_backend.get(
                     "table_name", "ge_evaluation_parameters"
                 )
         super().__init__(store_backend=store_backend, store_name=store_name)
@@ -110,3 +131,86 @@ class EvaluationParameterStore(MetricStore):
     @property
     def config(self) -> dict:
         return self._config
+
+
+class MetricResultStore(MetricStore):
+    """
+    A MetricResultStore stores the values of metrics computed on batches of data, keyed by the fingerprint of the batch
+    data and the id of the metric, so that metrics of unchanged data need not be recomputed in subsequent runs.
+    """
+
+    _key_class = MetricResultIdentifier
+
+    def __init__(self, store_backend=None, store_name=None):
+        if store_backend is not None:
+            wrapped_store_backend: dict = get_wrapped_store_backend_config(
+                store_backend=store_backend
+            )
+            store_backend_module_name = wrapped_store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = wrapped_store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                wrapped_store_backend["table_name"] = wrapped_store_backend.get(
+                    "table_name", "ge_metric_results"
+                )
+                wrapped_store_backend["key_columns"] = wrapped_store_backend.get(
+                    "key_columns",
+                    [
+                        "batch_fingerprint",
+                        "metric_name",
+                        "metric_domain_kwargs_id",
+                        "metric_value_kwargs_id",
+                    ],
+                )
+        super().__init__(store_backend=store_backend, store_name=store_name)
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    @staticmethod
+    def is_storable_value(value: Any) -> bool:
+        """Returns True if the metric value survives a round trip through JSON unchanged (up to the conversion of numpy
+        scalars to their Python equivalents); values such as DataFrames, metric partial functions, tuples, or dates are
+        not stored, since they would not be restored faithfully.
+        """
+        if value is None or isinstance(
+            value, (str, bool, int, float, np.bool_, np.integer, np.floating)
+        ):
+            return True
+
+        if isinstance(value, list):
+            return all(
+                MetricResultStore.is_storable_value(element) for element in value
+            )
+
+        if isinstance(value, dict):
+            return all(
+                isinstance(key, str) and MetricResultStore.is_storable_value(element)
+                for key, element in value.items()
+            )
+
+        return False
+
+    def serialize(self, key, value):
+        return json.dumps({"value": convert_to_json_serializable(value)})
+
+    @property
+    def config(self) -> dict:
+        return self._config
@@ -1,5 +1,6 @@
 import logging
 from string import Template
+from typing import Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.data_context_key import StringKey
@@ -105,7 +106,80 @@ class SqlAlchemyQueryStore(Store):
     def set(self, key, value):
         return super().set(self._convert_key(key), value)
 
+    def get_many(self, keys):
+        return super().get_many([self._convert_key(key) for key in keys])
+
+    def set_many(self, key_value_pairs, **kwargs):
+        return super().set_many(
+            [(self._convert_key(key), value) for key, value in key_value_pairs],
+            **kwargs,
+        )
+
     def get_query_result(self, key, query_parameters=None):
+        query, return_type = self._get_query(key=key, query_parameters=query_parameters)
+        return self._get_result(
+            rows=self.engine.execute(query).fetchall(), return_type=return_type
+        )
+
+    def get_query_results(self, queries: List[Tuple[str, Optional[dict]]]) -> List[Any]:
+        """Returns the results of several queries, given as (key, query_parameters) pairs (see get_query_result).
+
+        Identical queries are only executed once.  The "scalar" queries are executed together, as the columns of a
+        single statement, along with the number of rows returned by every one of them; the value of a scalar query is
+        only taken from that statement if the query returned exactly one row.  The other scalar queries (and all
+        scalar queries, should that statement fail) are executed one by one, as are the "list" queries, so that every
+        result is checked as by get_query_result (e.g., a "scalar" query must return exactly one value).
+        """
+        prepared_queries: List[Tuple[str, Optional[str]]] = [
+            self._get_query(key=key, query_parameters=query_parameters)
+            for key, query_parameters in queries
+        ]
+        distinct_queries: List[Tuple[str, Optional[str]]] = list(
+            dict.fromkeys(prepared_queries)
+        )
+        results: Dict[Tuple[str, Optional[str]], Any] = {}
+
+        scalar_queries: List[Tuple[str, Optional[str]]] = [
+            prepared_query
+            for prepared_query in distinct_queries
+            if prepared_query[1] == "scalar"
+        ]
+        if len(scalar_queries) > 1:
+            try:
+                with self.engine.connect() as connection:
+                    row = connection.execute(
+                        self._build_scalar_queries_statement(
+                            queries=[query for query, _ in scalar_queries]
+                        )
+                    ).fetchone()
+            except SQLAlchemyError as e:
+                logger.debug(
+                    f"Unable to execute the scalar queries in a single statement ({e}); executing them one by one."
+                )
+            else:
+                idx: int
+                prepared_query: Tuple[str, Optional[str]]
+                for idx, prepared_query in enumerate(scalar_queries):
+                    row_count, value = row[2 * idx], row[2 * idx + 1]
+                    if row_count == 1:
+                        results[prepared_query] = value
+
+        with self.engine.connect() as connection:
+            for prepared_query in distinct_queries:
+                if prepared_query in results:
+                    continue
+
+                query, return_type = prepared_query
+                results[prepared_query] = self._get_result(
+                    rows=connection.execute(query).fetchall(),
+                    return_type=return_type,
+                )
+
+        return [results[prepared_query] for prepared_query in prepared_queries]
+
+    def _get_query(
+        self, key, query_parameters: Optional[dict] = None
+    ) -> Tuple[str, Optional[str]]:
         if query_parameters is None:
             query_parameters = {}
         result = self._store_backend.get(self._convert_key(key).to_tuple())
@@ -124,10 +198,26 @@ class SqlAlchemyQueryStore(Store):
         assert query, "Query must be specified to use SqlAlchemyQueryStore"
 
         query = Template(query).safe_substitute(query_parameters)
-        res = self.engine.execute(query).fetchall()
+        return query, return_type
+
+    def _build_scalar_queries_statement(self, queries: List[str]) -> str:
+        columns: str = ", ".join(
+            f"(SELECT COUNT(*) FROM ({query}) ge_query_{idx}) AS ge_query_row_count_{idx}, "
+            f"({query}) AS ge_query_result_{idx}"
+            for idx, query in enumerate(
+                [query.strip().rstrip(";") for query in queries]
+            )
+        )
+        if self.engine.dialect.name == "oracle":
+            return f"SELECT {columns} FROM DUAL"
+
+        return f"SELECT {columns}"
+
+    @staticmethod
+    def _get_result(rows, return_type: Optional[str]):
         # NOTE: 20200617 - JPC: this approach is probably overly opinionated, but we can
         # adjust based on specific user requests
-        res = [val for row in res for val in row]
+        res = [val for row in rows for val in row]
         if return_type == "scalar":
             [res] = res
         return res
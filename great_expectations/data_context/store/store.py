@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from great_expectations.core.data_context_key import DataContextKey
 from great_expectations.data_context.store.ge_cloud_store_backend import (
@@ -147,7 +147,12 @@ class Store:
                 value = self.ge_cloud_response_json_to_object_dict(response_json=value)
         else:
             self._validate_key(key)
-            value = self._store_backend.get(self.key_to_tuple(key))
+            return self._store_backend.get_deserialized(
+                self.key_to_tuple(key),
+                deserializer=lambda value: self.deserialize(key, value)
+                if value
+                else None,
+            )
 
         if value:
             return self.deserialize(key, value)
@@ -163,6 +168,44 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value), **kwargs
             )
 
+    def get_many(self, keys: List[DataContextKey]) -> List[Any]:
+        """Returns the values of the keys, in the order of the keys.
+
+        The serialized values are read by a single call to the store backend, which may read them concurrently (as the
+        cloud store backends do).
+        """
+        if self.ge_cloud_mode:
+            return [self.get(key) for key in keys]
+
+        key: DataContextKey
+        for key in keys:
+            self._validate_key(key)
+        values: List[Any] = self._store_backend.get_many(
+            [self.key_to_tuple(key) for key in keys]
+        )
+
+        return [
+            self.deserialize(key, value) if value else None
+            for key, value in zip(keys, values)
+        ]
+
+    def set_many(self, key_value_pairs: List[Tuple[DataContextKey, Any]], **kwargs):
+        """Sets the values of the keys by a single call to the store backend (see get_many)."""
+        if self.ge_cloud_mode:
+            return [self.set(key, value, **kwargs) for key, value in key_value_pairs]
+
+        key: DataContextKey
+        value: Any
+        for key, _ in key_value_pairs:
+            self._validate_key(key)
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(key, value))
+                for key, value in key_value_pairs
+            ],
+            **kwargs,
+        )
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -171,6 +214,23 @@ class Store:
         ]
         return [self.tuple_to_key(key) for key in keys_without_store_backend_id]
 
+    def iter_keys(
+        self,
+        prefix: Tuple = (),
+        filter_function: Optional[Callable[[Tuple], bool]] = None,
+    ) -> Iterator[DataContextKey]:
+        """Lazily iterates over the keys whose key tuples start with prefix and satisfy the (optional) filter_function.
+
+        Both the prefix and the filter_function are applied to the key tuples by the store backend, so that no key
+        object is built for the filtered out keys (and the store backend may narrow down its listing to the prefix).
+        """
+        key: Tuple
+        for key in self._store_backend.iter_keys(
+            prefix=prefix, filter_function=filter_function
+        ):
+            if key != StoreBackend.STORE_BACKEND_ID_KEY:
+                yield self.tuple_to_key(key)
+
     def has_key(self, key):
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.has_key(key)
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 import pyparsing as pp
 
@@ -20,6 +20,10 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Backends that can list their keys lazily (or push the key prefix down to the persistence layer) should also
+    override iter_keys, and backends that can read or write several keys at once (e.g., concurrently) should
+    override _get_many and _set_many.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -121,6 +125,24 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_deserialized(
+        self, key, deserializer: Callable[[Any], Any], **kwargs
+    ) -> Any:
+        """Returns the value of the key, as deserialized by deserializer (store backends caching their values may
+        cache the deserialized values as well).
+        """
+        return deserializer(self.get(key, **kwargs))
+
+    def get_version(self, key) -> Optional[str]:
+        """Returns an identifier of the current version of the value of the key (e.g., its modification time or ETag),
+        or None if the store backend cannot tell (or the key does not exist).
+        """
+        return None
+
+    def get_versions(self, keys: List[Tuple]) -> List[Optional[str]]:
+        """Returns the versions of the values of the keys (see get_version), in the order of the keys."""
+        return [self.get_version(key) for key in keys]
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -131,6 +153,28 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys: List[Tuple], **kwargs) -> List[Any]:
+        """Returns the values of the keys, in the order of the keys (raising InvalidKeyError if any key is missing)."""
+        key: Tuple
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, key_value_pairs: List[Tuple[Tuple, Any]], **kwargs) -> list:
+        """Sets the values of the keys, returning whatever the implementing setter returns for every key."""
+        key: Tuple
+        value: Any
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -178,6 +222,12 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _get_many(self, keys: List[Tuple], **kwargs) -> List[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, key_value_pairs: List[Tuple[Tuple, Any]], **kwargs) -> list:
+        return [self._set(key, value, **kwargs) for key, value in key_value_pairs]
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs):
         raise NotImplementedError
@@ -186,6 +236,46 @@ class StoreBackend(metaclass=ABCMeta):
     def list_keys(self, prefix=()):
         raise NotImplementedError
 
+    def iter_keys(
+        self,
+        prefix: Tuple = (),
+        filter_function: Optional[Callable[[Tuple], bool]] = None,
+    ) -> Iterator[Tuple]:
+        """Lazily iterates over the keys that start with the given prefix and satisfy the (optional) filter_function.
+
+        The default implementation filters the result of list_keys; backends able to narrow down the listing to the
+        prefix (or to list their keys page by page) override this method.
+        """
+        keys: List[Tuple] = self.list_keys(prefix) if prefix else self.list_keys()
+        key: Tuple
+        for key in keys:
+            if key[: len(prefix)] != prefix:
+                continue
+            if filter_function is not None and not filter_function(key):
+                continue
+            yield key
+
+    def iter_key_batches(
+        self,
+        prefix: Tuple = (),
+        filter_function: Optional[Callable[[Tuple], bool]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[Tuple]]:
+        """Lazily iterates over the keys returned by iter_keys in lists of (at most) batch_size keys."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        batch: List[Tuple] = []
+        key: Tuple
+        for key in self.iter_keys(prefix=prefix, filter_function=filter_function):
+            batch.append(key)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
     @abstractmethod
     def remove_key(self, key):
         raise NotImplementedError
@@ -1,11 +1,12 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
+import concurrent.futures
 import logging
 import os
 import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import List, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -14,6 +15,14 @@ from great_expectations.util import filter_properties_dict
 logger = logging.getLogger(__name__)
 
 
+def _is_consistent_with_filepath_prefix(directory: str, filepath_prefix: str) -> bool:
+    """Checks whether the directory may contain filepaths starting with filepath_prefix."""
+    directory_path: str = directory + os.sep
+    return directory_path.startswith(filepath_prefix) or filepath_prefix.startswith(
+        directory_path
+    )
+
+
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
     If filepath_template is provided, the key to this StoreBackend abstract class must be a tuple with
@@ -21,6 +30,13 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
     For example, in the following template path: expectations/{0}/{1}/{2}/prefix-{2}.json, keys must have
     three components.
+
+    Keys are listed lazily by iter_keys, which narrows down the listing of the persistence layer to the filepaths
+    sharing the filepath prefix of the requested key prefix. If cache_key_index is True, the keys are listed only once
+    and then kept in an in-memory index, which is updated by the _set, _move, and remove_key methods of the backend
+    (keys written to the persistence layer by other processes are not picked up until refresh_key_index is called).
+
+    get_many and set_many issue up to max_concurrent_requests requests to the persistence layer at a time.
     """
 
     def __init__(
@@ -35,6 +51,8 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        cache_key_index: bool = False,
+        max_concurrent_requests: int = 1,
     ):
         super().__init__(
             fixed_length_key=fixed_length_key,
@@ -65,6 +83,13 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         self.filepath_suffix = filepath_suffix
         self.base_public_path = base_public_path
 
+        self._cache_key_index = cache_key_index
+        self._key_index: Optional[Set[Tuple]] = None
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be a positive integer.")
+        self._max_concurrent_requests = max_concurrent_requests
+        self._filepath_regex: Optional[Tuple[re.Pattern, List[int]]] = None
+
         if filepath_template is not None:
             # key length is the number of unique values to be substituted in the filepath_template
             self.key_length = len(set(re.findall(r"{\d+}", filepath_template)))
@@ -154,38 +179,16 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 filepath = filepath[: -len(self.filepath_suffix)]
 
         if self.filepath_template:
-            # filepath_template is always specified with forward slashes, but it is then
-            # used to (1) dynamically construct and evaluate a regex, and (2) split the provided (observed) filepath
-            if self.platform_specific_separator:
-                filepath_template = os.path.join(*self.filepath_template.split("/"))
-                filepath_template = filepath_template.replace("\\", "\\\\")
-            else:
-                filepath_template = self.filepath_template
-
-            # Convert the template to a regex
-            indexed_string_substitutions = re.findall(r"{\d+}", filepath_template)
-            tuple_index_list = [
-                "(?P<tuple_index_{}>.*)".format(
-                    i,
-                )
-                for i in range(len(indexed_string_substitutions))
-            ]
-            intermediate_filepath_regex = re.sub(
-                r"{\d+}", lambda m, r=iter(tuple_index_list): next(r), filepath_template
-            )
-            filepath_regex = intermediate_filepath_regex.format(*tuple_index_list)
+            filepath_regex, tuple_indices = self._get_filepath_regex()
 
             # Apply the regex to the filepath
-            matches = re.compile(filepath_regex).match(filepath)
+            matches = filepath_regex.match(filepath)
             if matches is None:
                 return None
 
             # Map key elements into the appropriate parts of the tuple
             new_key = [None] * self.key_length
-            for i in range(len(tuple_index_list)):
-                tuple_index = int(
-                    re.search(r"\d+", indexed_string_substitutions[i]).group(0)
-                )
+            for i, tuple_index in enumerate(tuple_indices):
                 key_element = matches.group("tuple_index_" + str(i))
                 new_key[tuple_index] = key_element
 
@@ -195,6 +198,172 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = tuple(filepath.split(os.sep))
         return new_key
 
+    def _get_filepath_regex(self) -> Tuple[re.Pattern, List[int]]:
+        """Returns the (compiled) regex matching the filepaths built from the filepath_template, along with the key
+        tuple index of each of its groups; the regex is built once and reused for every listed filepath.
+        """
+        if self._filepath_regex is not None:
+            return self._filepath_regex
+
+        # filepath_template is always specified with forward slashes, but it is then
+        # used to (1) dynamically construct and evaluate a regex, and (2) split the provided (observed) filepath
+        if self.platform_specific_separator:
+            filepath_template = os.path.join(*self.filepath_template.split("/"))
+            filepath_template = filepath_template.replace("\\", "\\\\")
+        else:
+            filepath_template = self.filepath_template
+
+        # Convert the template to a regex
+        indexed_string_substitutions = re.findall(r"{\d+}", filepath_template)
+        tuple_index_list = [
+            "(?P<tuple_index_{}>.*)".format(
+                i,
+            )
+            for i in range(len(indexed_string_substitutions))
+        ]
+        intermediate_filepath_regex = re.sub(
+            r"{\d+}", lambda m, r=iter(tuple_index_list): next(r), filepath_template
+        )
+        filepath_regex = intermediate_filepath_regex.format(*tuple_index_list)
+        tuple_indices: List[int] = [
+            int(re.search(r"\d+", indexed_string_substitution).group(0))
+            for indexed_string_substitution in indexed_string_substitutions
+        ]
+
+        self._filepath_regex = (re.compile(filepath_regex), tuple_indices)
+        return self._filepath_regex
+
+    def _convert_key_prefix_to_filepath_prefix(self, prefix: Tuple) -> str:
+        """Returns the longest filepath prefix shared by the filepaths of all keys starting with the key prefix."""
+        if prefix == self.STORE_BACKEND_ID_KEY:
+            return self._convert_key_to_filepath(prefix)
+
+        filepath_prefix: str
+        if not prefix:
+            filepath_prefix = ""
+        elif self.filepath_template:
+            # The filepaths share the part of the template preceding the first element missing from the prefix
+            placeholder: Optional[re.Match] = next(
+                (
+                    match
+                    for match in re.finditer(r"{(\d+)}", self.filepath_template)
+                    if int(match.group(1)) >= len(prefix)
+                ),
+                None,
+            )
+            filepath_prefix = (
+                self.filepath_template
+                if placeholder is None
+                else self.filepath_template[: placeholder.start()]
+            ).format(*prefix)
+        else:
+            filepath_prefix = "/".join(prefix)
+
+        if self.filepath_prefix:
+            filepath_prefix = self.filepath_prefix + "/" + filepath_prefix
+        if self.platform_specific_separator:
+            filepath_prefix = filepath_prefix.replace("/", os.sep)
+
+        return filepath_prefix
+
+    @property
+    def cache_key_index(self) -> bool:
+        return self._cache_key_index
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self._max_concurrent_requests
+
+    def _map_concurrently(self, function: Callable, items: list) -> list:
+        """Applies function to the items in a pool of (at most) max_concurrent_requests threads, returning the results
+        in the order of the items (and raising the exception of the first failed item, if any).
+        """
+        if self._max_concurrent_requests == 1 or len(items) <= 1:
+            return [function(item) for item in items]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._max_concurrent_requests, len(items))
+        ) as executor:
+            return list(executor.map(function, items))
+
+    def get_versions(self, keys: List[Tuple]) -> List[Optional[str]]:
+        return self._map_concurrently(function=self.get_version, items=keys)
+
+    def iter_keys(
+        self,
+        prefix: Tuple = (),
+        filter_function: Optional[Callable[[Tuple], bool]] = None,
+    ) -> Iterator[Tuple]:
+        keys: Iterable[Tuple]
+        if self._cache_key_index:
+            keys = list(self._get_key_index())
+        else:
+            keys = self._iter_listed_keys(prefix=prefix)
+
+        key: Tuple
+        for key in keys:
+            if key[: len(prefix)] != prefix:
+                continue
+            if filter_function is not None and not filter_function(key):
+                continue
+            yield key
+
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        return list(self.iter_keys(prefix=prefix))
+
+    def refresh_key_index(self) -> None:
+        """Lists the keys of the persistence layer into the key index (if cache_key_index is True)."""
+        if self._cache_key_index:
+            self._key_index = set(self._iter_listed_keys())
+
+    def clear_key_index(self) -> None:
+        self._key_index = None
+
+    def _iter_listed_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        """Lists the keys of the persistence layer, restricting the listing to the filepaths that start with the
+        filepath prefix of the given key prefix (the listed keys are not all guaranteed to start with the key prefix).
+        """
+        filepath: str
+        for filepath in self._iter_filepaths(
+            filepath_prefix=self._convert_key_prefix_to_filepath_prefix(prefix)
+        ):
+            if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
+                continue
+            elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
+                continue
+            key = self._convert_filepath_to_key(filepath)
+            if key and not self.is_ignored_key(key):
+                yield key
+
+    def _iter_filepaths(self, filepath_prefix: str = "") -> Iterator[str]:
+        """Lazily iterates over the filepaths, relative to the root of the store backend, that start with
+        filepath_prefix.
+        """
+        raise NotImplementedError
+
+    def _has_listed_key(self, key: Tuple) -> bool:
+        """Checks for the key by listing only the filepaths sharing its filepath prefix (or using the key index)."""
+        if self._cache_key_index:
+            return key in self._get_key_index()
+
+        return any(
+            listed_key == key for listed_key in self._iter_listed_keys(prefix=key)
+        )
+
+    def _get_key_index(self) -> Set[Tuple]:
+        if self._key_index is None:
+            self._key_index = set(self._iter_listed_keys())
+
+        return self._key_index
+
+    def _add_key_to_index(self, key: Tuple) -> None:
+        if self._key_index is not None and not self.is_ignored_key(key):
+            self._key_index.add(key)
+
+    def _remove_key_from_index(self, key: Tuple) -> None:
+        if self._key_index is not None:
+            self._key_index.discard(key)
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join(
@@ -241,6 +410,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        cache_key_index: bool = False,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -253,6 +423,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            cache_key_index=cache_key_index,
         )
         if os.path.isabs(base_directory):
             self.full_base_directory = base_directory
@@ -290,6 +461,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "cache_key_index": cache_key_index,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -309,6 +481,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         return contents
 
+    def get_version(self, key) -> Optional[str]:
+        filepath: str = os.path.join(
+            self.full_base_directory, self._convert_key_to_filepath(key)
+        )
+        try:
+            stat_result: os.stat_result = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+
+        return f"{stat_result.st_mtime_ns}-{stat_result.st_size}"
+
     def _set(self, key, value, **kwargs):
         if not isinstance(key, tuple):
             key = key.to_tuple()
@@ -323,6 +506,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+        self._add_key_to_index(key)
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):
@@ -338,39 +522,36 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(source_path):
             os.makedirs(dest_dir, exist_ok=True)
             shutil.move(source_path, dest_path)
+            self._remove_key_from_index(source_key)
+            self._add_key_to_index(dest_key)
             return dest_key
 
         return False
 
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        key_list = []
+    def _iter_filepaths(self, filepath_prefix: str = "") -> Iterator[str]:
+        # Walk only the directory containing the filepath prefix, descending into the subdirectories whose paths are
+        # consistent with it
         for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)
+            os.path.join(self.full_base_directory, os.path.dirname(filepath_prefix))
         ):
+            relative_root = os.path.relpath(root, self.full_base_directory)
+            if relative_root == ".":
+                relative_root = ""
+
+            dirs[:] = [
+                dir_
+                for dir_ in dirs
+                if _is_consistent_with_filepath_prefix(
+                    directory=os.path.join(relative_root, dir_),
+                    filepath_prefix=filepath_prefix,
+                )
+            ]
             for file_ in files:
-                full_path, file_name = os.path.split(os.path.join(root, file_))
-                relative_path = os.path.relpath(
-                    full_path,
-                    self.full_base_directory,
+                filepath = (
+                    os.path.join(relative_root, file_) if relative_root else file_
                 )
-                if relative_path == ".":
-                    filepath = file_name
-                else:
-                    filepath = os.path.join(relative_path, file_name)
-
-                if self.filepath_prefix and not filepath.startswith(
-                    self.filepath_prefix
-                ):
-                    continue
-                elif self.filepath_suffix and not filepath.endswith(
-                    self.filepath_suffix
-                ):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
-
-        return key_list
+                if filepath.startswith(filepath_prefix):
+                    yield filepath
 
     def rrmdir(self, mroot, curpath):
         """
@@ -398,6 +579,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             d_path = os.path.dirname(filepath)
             os.remove(filepath)
             self.rrmdir(self.full_base_directory, d_path)
+            self._remove_key_from_index(key)
             return True
         return False
 
@@ -457,6 +639,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        cache_key_index: bool = False,
+        max_concurrent_requests: int = 16,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -469,6 +653,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            cache_key_index=cache_key_index,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.bucket = bucket
         if prefix:
@@ -508,6 +694,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "cache_key_index": cache_key_index,
+            "max_concurrent_requests": max_concurrent_requests,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -531,9 +719,17 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):
-        s3_object_key = self._build_s3_object_key(key)
+        return self._get_object(s3=self._create_client(), key=key)
 
+    def _get_many(self, keys, **kwargs):
+        # boto3 clients (unlike resources and sessions) are thread-safe, so a single one is shared by the threads
         s3 = self._create_client()
+        return self._map_concurrently(
+            function=lambda key: self._get_object(s3=s3, key=key), items=keys
+        )
+
+    def _get_object(self, s3, key):
+        s3_object_key = self._build_s3_object_key(key)
 
         try:
             s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
@@ -548,6 +744,17 @@ class TupleS3StoreBackend(TupleStoreBackend):
             .decode(s3_response_object.get("ContentEncoding", "utf-8"))
         )
 
+    def get_version(self, key) -> Optional[str]:
+        s3 = self._create_client()
+        try:
+            s3_response_object = s3.head_object(
+                Bucket=self.bucket, Key=self._build_s3_object_key(key)
+            )
+        except s3.exceptions.ClientError:
+            return None
+
+        return s3_response_object.get("ETag")
+
     def _set(
         self,
         key,
@@ -556,24 +763,60 @@ class TupleS3StoreBackend(TupleStoreBackend):
         content_type="application/json",
         **kwargs,
     ):
-        s3_object_key = self._build_s3_object_key(key)
+        s3_object_key = self._put_object(
+            s3=self._create_client(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
+        self._add_key_to_index(key)
+        return s3_object_key
 
-        s3 = self._create_resource()
+    def _set_many(
+        self,
+        key_value_pairs,
+        content_encoding="utf-8",
+        content_type="application/json",
+        **kwargs,
+    ):
+        s3 = self._create_client()
+        s3_object_keys = self._map_concurrently(
+            function=lambda key_value_pair: self._put_object(
+                s3=s3,
+                key=key_value_pair[0],
+                value=key_value_pair[1],
+                content_encoding=content_encoding,
+                content_type=content_type,
+            ),
+            items=key_value_pairs,
+        )
+        for key, _ in key_value_pairs:
+            self._add_key_to_index(key)
+        return s3_object_keys
+
+    def _put_object(self, s3, key, value, content_encoding, content_type):
+        s3_object_key = self._build_s3_object_key(key)
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                     **self.s3_put_options,
                 )
             else:
-                result_s3.put(
-                    Body=value, ContentType=content_type, **self.s3_put_options
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                    **self.s3_put_options,
                 )
-        except s3.meta.client.exceptions.ClientError as e:
+        except s3.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
@@ -594,60 +837,57 @@ class TupleS3StoreBackend(TupleStoreBackend):
         )
 
         s3.Object(self.bucket, source_filepath).delete()
+        self._remove_key_from_index(source_key)
+        self._add_key_to_index(dest_key)
 
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
+    def _iter_filepaths(self, filepath_prefix: str = "") -> Iterator[str]:
         s3 = self._create_client()
         paginator = s3.get_paginator("list_objects_v2")
 
-        if self.prefix:
-            page_iterator = paginator.paginate(Bucket=self.bucket, Prefix=self.prefix)
+        if filepath_prefix and self.prefix:
+            if self.platform_specific_separator:
+                s3_prefix = os.path.join(self.prefix, filepath_prefix)
+            else:
+                s3_prefix = "/".join((self.prefix, filepath_prefix))
         else:
-            page_iterator = paginator.paginate(Bucket=self.bucket)
+            s3_prefix = filepath_prefix or self.prefix
 
-        objects = []
+        if s3_prefix:
+            page_iterator = paginator.paginate(Bucket=self.bucket, Prefix=s3_prefix)
+        else:
+            page_iterator = paginator.paginate(Bucket=self.bucket)
 
+        # Pages are requested lazily, as the filepaths are consumed
+        has_listed_objects = False
         for page in page_iterator:
             current_page_contents = page.get("Contents")
             # On first iteration check for "CommonPrefixes"
             if (
                 current_page_contents is None
-                and objects == []
+                and not has_listed_objects
                 and "CommonPrefixes" in page
             ):
                 logger.warning(
                     "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
                 )
-                objects = []
-                break
-            if current_page_contents is not None:
-                objects.extend(current_page_contents)
-
-        key_list = []
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
-            if self.platform_specific_separator:
-                s3_object_key = os.path.relpath(s3_object_key, self.prefix)
-            else:
-                if self.prefix is None:
-                    if s3_object_key.startswith("/"):
-                        s3_object_key = s3_object_key[1:]
-                else:
-                    if s3_object_key.startswith(self.prefix + "/"):
-                        s3_object_key = s3_object_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
+                return
+            if current_page_contents is None:
                 continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
 
-        return key_list
+            for s3_object_info in current_page_contents:
+                has_listed_objects = True
+                s3_object_key = s3_object_info["Key"]
+                if self.platform_specific_separator:
+                    s3_object_key = os.path.relpath(s3_object_key, self.prefix)
+                else:
+                    if self.prefix is None:
+                        if s3_object_key.startswith("/"):
+                            s3_object_key = s3_object_key[1:]
+                    else:
+                        if s3_object_key.startswith(self.prefix + "/"):
+                            s3_object_key = s3_object_key[len(self.prefix) + 1 :]
+                if s3_object_key.startswith(filepath_prefix):
+                    yield s3_object_key
 
     def get_url_for_key(self, key, protocol=None):
         location = self._create_client().get_bucket_location(Bucket=self.bucket)[
@@ -693,13 +933,13 @@ class TupleS3StoreBackend(TupleStoreBackend):
         if self.has_key(key):
             # This implementation deletes the object if non-versioned or adds a delete marker if versioned
             s3.Object(self.bucket, s3_object_key).delete()
+            self._remove_key_from_index(key)
             return True
         else:
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return self._has_listed_key(key)
 
     @property
     def boto3_options(self):
@@ -754,6 +994,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        cache_key_index: bool = False,
+        max_concurrent_requests: int = 16,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -766,6 +1008,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            cache_key_index=cache_key_index,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.bucket = bucket
         self.prefix = prefix
@@ -792,6 +1036,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "cache_key_index": cache_key_index,
+            "max_concurrent_requests": max_concurrent_requests,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -815,12 +1061,18 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _get(self, key):
-        gcs_object_key = self._build_gcs_object_key(key)
+        return self._download_blob(bucket=self._get_bucket(), key=key)
 
-        from google.cloud import storage
+    def _get_many(self, keys, **kwargs):
+        bucket = self._get_bucket()
+        return self._map_concurrently(
+            function=lambda key: self._download_blob(bucket=bucket, key=key),
+            items=keys,
+        )
+
+    def _download_blob(self, bucket, key):
+        gcs_object_key = self._build_gcs_object_key(key)
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
@@ -829,6 +1081,12 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         else:
             return gcs_response_object.download_as_string().decode("utf-8")
 
+    def get_version(self, key) -> Optional[str]:
+        gcs_response_object = self._get_bucket().get_blob(
+            self._build_gcs_object_key(key)
+        )
+        return gcs_response_object.etag if gcs_response_object else None
+
     def _set(
         self,
         key,
@@ -837,12 +1095,41 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         content_type="application/json",
         **kwargs,
     ):
-        gcs_object_key = self._build_gcs_object_key(key)
+        gcs_object_key = self._upload_blob(
+            bucket=self._get_bucket(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
+        self._add_key_to_index(key)
+        return gcs_object_key
 
-        from google.cloud import storage
+    def _set_many(
+        self,
+        key_value_pairs,
+        content_encoding="utf-8",
+        content_type="application/json",
+        **kwargs,
+    ):
+        bucket = self._get_bucket()
+        gcs_object_keys = self._map_concurrently(
+            function=lambda key_value_pair: self._upload_blob(
+                bucket=bucket,
+                key=key_value_pair[0],
+                value=key_value_pair[1],
+                content_encoding=content_encoding,
+                content_type=content_type,
+            ),
+            items=key_value_pairs,
+        )
+        for key, _ in key_value_pairs:
+            self._add_key_to_index(key)
+        return gcs_object_keys
+
+    def _upload_blob(self, bucket, key, value, content_encoding, content_type):
+        gcs_object_key = self._build_gcs_object_key(key)
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -854,6 +1141,12 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             blob.upload_from_string(value, content_type=content_type)
         return gcs_object_key
 
+    def _get_bucket(self):
+        from google.cloud import storage
+
+        gcs = storage.Client(project=self.project)
+        return gcs.bucket(self.bucket)
+
     def _move(self, source_key, dest_key, **kwargs):
         from google.cloud import storage
 
@@ -869,33 +1162,28 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
+        self._remove_key_from_index(source_key)
+        self._add_key_to_index(dest_key)
 
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
-
+    def _iter_filepaths(self, filepath_prefix: str = "") -> Iterator[str]:
         from google.cloud import storage
 
         gcs = storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        if filepath_prefix and self.prefix:
+            gcs_prefix = os.path.join(self.prefix, filepath_prefix)
+        else:
+            gcs_prefix = filepath_prefix or self.prefix
+
+        # The blobs are listed lazily, page by page
+        for blob in gcs.list_blobs(self.bucket, prefix=gcs_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
                 self.prefix,
             )
-            if self.filepath_prefix and not gcs_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not gcs_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
-                key_list.append(key)
-        return key_list
+            if gcs_object_key.startswith(filepath_prefix):
+                yield gcs_object_key
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -944,11 +1232,12 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
         except NotFound:
             return False
+        # All the blobs under the prefix are deleted
+        self.clear_key_index()
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return self._has_listed_key(key)
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
@@ -978,6 +1267,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        cache_key_index: bool = False,
+        max_concurrent_requests: int = 16,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -989,6 +1280,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             suppress_store_backend_id=suppress_store_backend_id,
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
+            cache_key_index=cache_key_index,
+            max_concurrent_requests=max_concurrent_requests,
         )
         self.connection_string = connection_string
         self.prefix = prefix
@@ -1008,16 +1301,63 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             )
 
     def _get(self, key):
-        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
-        return (
-            self._get_container_client()
-            .download_blob(az_blob_key)
-            .readall()
-            .decode("utf-8")
+        return self._download_blob(
+            container_client=self._get_container_client(), key=key
+        )
+
+    def _get_many(self, keys, **kwargs):
+        container_client = self._get_container_client()
+        return self._map_concurrently(
+            function=lambda key: self._download_blob(
+                container_client=container_client, key=key
+            ),
+            items=keys,
         )
 
+    def _download_blob(self, container_client, key):
+        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
+        return container_client.download_blob(az_blob_key).readall().decode("utf-8")
+
+    def get_version(self, key) -> Optional[str]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
+        try:
+            return (
+                self._get_container_client()
+                .get_blob_client(az_blob_key)
+                .get_blob_properties()
+                .etag
+            )
+        except ResourceNotFoundError:
+            return None
+
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
+        az_blob_key = self._upload_blob(
+            container_client=self._get_container_client(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+        )
+        self._add_key_to_index(key)
+        return az_blob_key
 
+    def _set_many(self, key_value_pairs, content_encoding="utf-8", **kwargs):
+        container_client = self._get_container_client()
+        az_blob_keys = self._map_concurrently(
+            function=lambda key_value_pair: self._upload_blob(
+                container_client=container_client,
+                key=key_value_pair[0],
+                value=key_value_pair[1],
+                content_encoding=content_encoding,
+            ),
+            items=key_value_pairs,
+        )
+        for key, _ in key_value_pairs:
+            self._add_key_to_index(key)
+        return az_blob_keys
+
+    def _upload_blob(self, container_client, key, value, content_encoding):
         from azure.storage.blob import ContentSettings
 
         az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
@@ -1025,7 +1365,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         if isinstance(value, str):
             if az_blob_key.endswith(".html"):
                 my_content_settings = ContentSettings(content_type="text/html")
-                self._get_container_client().upload_blob(
+                container_client.upload_blob(
                     name=az_blob_key,
                     data=value,
                     encoding=content_encoding,
@@ -1033,40 +1373,29 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                     content_settings=my_content_settings,
                 )
             else:
-                self._get_container_client().upload_blob(
+                container_client.upload_blob(
                     name=az_blob_key,
                     data=value,
                     encoding=content_encoding,
                     overwrite=True,
                 )
         else:
-            self._get_container_client().upload_blob(
-                name=az_blob_key, data=value, overwrite=True
-            )
+            container_client.upload_blob(name=az_blob_key, data=value, overwrite=True)
         return az_blob_key
 
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
+    def _iter_filepaths(self, filepath_prefix: str = "") -> Iterator[str]:
+        if filepath_prefix and self.prefix:
+            az_prefix = os.path.join(self.prefix, filepath_prefix)
+        else:
+            az_prefix = filepath_prefix or self.prefix
 
-        for obj in self._get_container_client().list_blobs(
-            name_starts_with=self.prefix
-        ):
+        # The blobs are listed lazily, page by page
+        for obj in self._get_container_client().list_blobs(name_starts_with=az_prefix):
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(self.prefix + "/"):
                 az_blob_key = az_blob_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not az_blob_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not az_blob_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(az_blob_key)
-
-            key_list.append(key)
-        return key_list
+            if az_blob_key.startswith(filepath_prefix):
+                yield az_blob_key
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -1078,8 +1407,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         )
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return self._has_listed_key(key)
 
     def _move(self, source_key, dest_key, **kwargs):
         source_blob_path = self._convert_key_to_filepath(source_key)
@@ -1103,6 +1431,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                 % (source_blob_path, copy_properties.status)
             )
         source_blob.delete_blob()
+        self._remove_key_from_index(source_key)
+        self._add_key_to_index(dest_key)
 
     def remove_key(self, key):
         if not isinstance(key, tuple):
@@ -1114,6 +1444,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
         blob = self._get_container_client().get_blob_client(az_blob_path)
         blob.delete_blob()
+        self._remove_key_from_index(key)
         return True
 
     @property
@@ -1,12 +1,15 @@
 import random
 import uuid
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
 )
 from great_expectations.data_context.store import GeCloudStoreBackend
+from great_expectations.data_context.store.caching_store_backend import (
+    get_wrapped_store_backend_config,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -101,10 +104,13 @@ class ValidationsStore(Store):
         )
 
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            wrapped_store_backend: dict = get_wrapped_store_backend_config(
+                store_backend=store_backend
+            )
+            store_backend_module_name = wrapped_store_backend.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = wrapped_store_backend.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -115,15 +121,15 @@ class ValidationsStore(Store):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
-                store_backend["filepath_suffix"] = store_backend.get(
+                wrapped_store_backend["filepath_suffix"] = wrapped_store_backend.get(
                     "filepath_suffix", ".json"
                 )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
-                store_backend["table_name"] = store_backend.get(
+                wrapped_store_backend["table_name"] = wrapped_store_backend.get(
                     "table_name", "ge_validations_store"
                 )
-                store_backend["key_columns"] = store_backend.get(
+                wrapped_store_backend["key_columns"] = wrapped_store_backend.get(
                     "key_columns",
                     [
                         "expectation_suite_name",
@@ -175,6 +181,31 @@ class ValidationsStore(Store):
         else:
             return self._expectationSuiteValidationResultSchema.loads(value)
 
+    def iter_keys_for_expectation_suite(
+        self, expectation_suite_name: str
+    ) -> Iterator[ValidationResultIdentifier]:
+        """Lazily iterates over the keys of the validation results of the expectation suite, pushing the expectation
+        suite name down to the store backend as a key prefix.
+        """
+        if self.ge_cloud_mode:
+            return self.iter_keys()
+
+        prefix: Tuple
+        if self._use_fixed_length_key:
+            prefix = (expectation_suite_name,)
+        else:
+            prefix = ExpectationSuiteIdentifier(
+                expectation_suite_name=expectation_suite_name
+            ).to_tuple()
+
+        # Key tuples are made of the expectation suite elements followed by the run name, run time, and batch
+        # identifier (the keys of the suites nested within the expectation suite name share the same prefix).
+        key_tuple_length: int = len(prefix) + 3
+        return self.iter_keys(
+            prefix=prefix,
+            filter_function=lambda key_tuple: len(key_tuple) == key_tuple_length,
+        )
+
     def self_check(self, pretty_print):
         return_obj = {}
 
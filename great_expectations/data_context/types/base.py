@@ -324,6 +324,9 @@ class DataConnectorConfig(DictDot):
         prefix=None,
         # Both S3/Azure
         delimiter=None,
+        # S3/GCS/Azure
+        data_references_cache_directory=None,
+        data_references_cache_ttl=None,
         **kwargs,
     ):
         self._class_name = class_name
@@ -375,6 +378,12 @@ class DataConnectorConfig(DictDot):
         if delimiter is not None:
             self.delimiter = delimiter
 
+        # S3/GCS/Azure
+        if data_references_cache_directory is not None:
+            self.data_references_cache_directory = data_references_cache_directory
+        if data_references_cache_ttl is not None:
+            self.data_references_cache_ttl = data_references_cache_ttl
+
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -441,6 +450,10 @@ class DataConnectorConfigSchema(Schema):
     # Both S3/Azure
     delimiter = fields.String(required=False, allow_none=True)
 
+    # S3/GCS/Azure
+    data_references_cache_directory = fields.String(required=False, allow_none=True)
+    data_references_cache_ttl = fields.Integer(required=False, allow_none=True)
+
     data_asset_name_prefix = fields.String(required=False, allow_none=True)
     data_asset_name_suffix = fields.String(required=False, allow_none=True)
     include_schema_name = fields.Boolean(required=False, allow_none=True)
@@ -696,6 +709,12 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache = fields.Dict(required=False, allow_none=True)
+    metric_result_store = fields.Dict(required=False, allow_none=True)
+    max_lazy_batches_in_memory = fields.Integer(required=False, allow_none=True)
+    batch_prefetch_count = fields.Integer(required=False, allow_none=True)
+    max_batch_prefetch_workers = fields.Integer(required=False, allow_none=True)
+    fuse_row_condition_domains = fields.Boolean(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
     force_reuse_spark_context = fields.Boolean(required=False, allow_none=True)
     # BigQuery Service Account Credentials
@@ -1124,19 +1143,44 @@ class ProgressBarsConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False):
-        """Initialize a concurrency configuration to control multithreaded execution.
+    def __init__(
+        self,
+        enabled: bool = False,
+        process_pool_enabled: bool = False,
+        max_process_pool_workers: Optional[int] = None,
+    ):
+        """Initialize a concurrency configuration to control multithreaded (and multiprocess) execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            process_pool_enabled: Whether or not validations of batch requests (e.g., by Checkpoint.run) are run in a
+                pool of worker processes (rather than threads), which speeds up CPU-bound (e.g., pandas) validations.
+                Only has an effect if concurrency is enabled.
+            max_process_pool_workers: The maximum number of worker processes used to run validations (defaults to the
+                number of CPUs).
         """
+        if max_process_pool_workers is not None and max_process_pool_workers < 1:
+            raise ValueError("max_process_pool_workers must be a positive integer.")
+
         self._enabled = enabled
+        self._process_pool_enabled = process_pool_enabled
+        self._max_process_pool_workers = max_process_pool_workers
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def process_pool_enabled(self) -> bool:
+        """Whether or not validations of batch requests are run in a pool of worker processes."""
+        return self._process_pool_enabled
+
+    @property
+    def max_process_pool_workers(self) -> Optional[int]:
+        """Max number of worker processes used to run validations (None means the number of CPUs)."""
+        return self._max_process_pool_workers
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
@@ -1170,6 +1214,24 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    process_pool_enabled = fields.Boolean(default=False)
+    max_process_pool_workers = fields.Integer(allow_none=True)
+
+    # The process pool options are "opt-in"; unless explicitly configured, they are wiped by the post_dump hook
+    REMOVE_KEYS_IF_DEFAULT = {
+        "process_pool_enabled": False,
+        "max_process_pool_workers": None,
+    }
+
+    # noinspection PyUnusedLocal
+    @post_dump
+    def remove_keys_if_default(self, data: dict, **kwargs) -> dict:
+        return {
+            key: value
+            for key, value in data.items()
+            if key not in self.REMOVE_KEYS_IF_DEFAULT
+            or value != self.REMOVE_KEYS_IF_DEFAULT[key]
+        }
 
 
 class GeCloudConfig(DictDot):
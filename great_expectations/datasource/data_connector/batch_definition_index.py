@@ -0,0 +1,139 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import BatchDefinition
+from great_expectations.datasource.data_connector.sorter import Sorter
+
+logger = logging.getLogger(__name__)
+
+
+class BatchDefinitionIndex:
+    """
+    Hash indexes over the batch_identifiers of the batch_definitions of one data_asset, kept in the order given by the
+    sorters of the DataConnector.
+
+    Sorting all batch_definitions once (the sorters are stable, so that sorting the batch_definitions and then
+    selecting some of them orders the selected batch_definitions exactly as selecting them and then sorting them would)
+    and indexing them by the values of their batch_identifiers makes an exact-match lookup of batch_identifiers a
+    dictionary lookup (rather than a scan of all batch_definitions followed by a sort of the matching ones).
+
+    One index is kept for every combination of batch_identifiers names looked up; the index for all the
+    batch_identifiers names of the data_asset is built upfront, and the other ones on their first lookup.
+    """
+
+    def __init__(
+        self,
+        batch_definitions: List[BatchDefinition],
+        sorters: Optional[Iterable[Sorter]] = None,
+    ):
+        """
+        Args:
+            batch_definitions (list): batch_definitions of a data_asset, in the order of the data_references cache
+            sorters (list): sorters of the DataConnector, by decreasing priority
+        """
+        self._is_sorted = True
+        if sorters:
+            try:
+                sorted_batch_definitions: List[BatchDefinition] = batch_definitions
+                sorter: Sorter
+                for sorter in reversed(list(sorters)):
+                    sorted_batch_definitions = sorter.get_sorted_batch_definitions(
+                        batch_definitions=sorted_batch_definitions
+                    )
+                batch_definitions = sorted_batch_definitions
+            except ge_exceptions.SorterError as e:
+                # Some batch_definitions cannot be sorted; only the selected ones are sorted, upon lookup.
+                logger.debug(
+                    f"Unable to sort all batch_definitions of the data_asset upfront: {e}"
+                )
+                self._is_sorted = False
+
+        self._batch_definitions = batch_definitions
+        self._indexes: Dict[
+            Tuple[str, ...], Optional[Dict[Tuple[Any, ...], List[BatchDefinition]]]
+        ] = {}
+
+        if batch_definitions:
+            self._get_index(
+                batch_identifiers_names=tuple(
+                    sorted(batch_definitions[0].batch_identifiers.keys())
+                )
+            )
+
+    @property
+    def batch_definitions(self) -> List[BatchDefinition]:
+        return self._batch_definitions
+
+    @property
+    def is_sorted(self) -> bool:
+        return self._is_sorted
+
+    def get_batch_definitions(
+        self, batch_identifiers: Optional[dict] = None
+    ) -> List[BatchDefinition]:
+        """
+        Returns the batch_definitions whose batch_identifiers include all of the given batch_identifiers (the returned
+        list belongs to the index, and must not be modified).
+        """
+        if not batch_identifiers:
+            return self._batch_definitions
+
+        batch_identifiers_names: Tuple[str, ...] = tuple(
+            sorted(batch_identifiers.keys())
+        )
+        batch_identifiers_values: Tuple[Any, ...] = tuple(
+            batch_identifiers[name] for name in batch_identifiers_names
+        )
+        index: Optional[Dict[Tuple[Any, ...], List[BatchDefinition]]] = self._get_index(
+            batch_identifiers_names=batch_identifiers_names
+        )
+        try:
+            if index is not None:
+                return index.get(batch_identifiers_values, [])
+        except TypeError:
+            # Unhashable batch_identifiers values cannot be looked up.
+            pass
+
+        return [
+            batch_definition
+            for batch_definition in self._batch_definitions
+            if _batch_identifiers_match(
+                batch_identifiers=batch_definition.batch_identifiers,
+                selected_batch_identifiers=batch_identifiers,
+            )
+        ]
+
+    def _get_index(
+        self, batch_identifiers_names: Tuple[str, ...]
+    ) -> Optional[Dict[Tuple[Any, ...], List[BatchDefinition]]]:
+        if batch_identifiers_names not in self._indexes:
+            index: Optional[Dict[Tuple[Any, ...], List[BatchDefinition]]] = {}
+            try:
+                batch_definition: BatchDefinition
+                for batch_definition in self._batch_definitions:
+                    batch_identifiers: dict = batch_definition.batch_identifiers
+                    if all(
+                        name in batch_identifiers for name in batch_identifiers_names
+                    ):
+                        index.setdefault(
+                            tuple(
+                                batch_identifiers[name]
+                                for name in batch_identifiers_names
+                            ),
+                            [],
+                        ).append(batch_definition)
+            except TypeError:
+                # Unhashable batch_identifiers values cannot be indexed.
+                index = None
+
+            self._indexes[batch_identifiers_names] = index
+
+        return self._indexes[batch_identifiers_names]
+
+
+def _batch_identifiers_match(batch_identifiers: dict, selected_batch_identifiers: dict):
+    return all(
+        name in batch_identifiers and batch_identifiers[name] == value
+        for name, value in selected_batch_identifiers.items()
+    )
@@ -1,6 +1,6 @@
 import itertools
 import logging
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition
@@ -187,28 +187,28 @@ class BatchFilter:
         else:
             filter_function = self.best_effort_batch_definition_matcher()
         selected_batch_definitions: List[BatchDefinition]
-        selected_batch_definitions = list(
-            filter(
-                lambda batch_definition: filter_function(
-                    batch_identifiers=batch_definition.batch_identifiers,
-                ),
-                batch_definition_list,
-            )
+        selected_batch_definitions_iterator: Iterator[BatchDefinition] = filter(
+            lambda batch_definition: filter_function(
+                batch_identifiers=batch_definition.batch_identifiers,
+            ),
+            batch_definition_list,
         )
+        if self.index is None:
+            # Stop filtering once limit batch_definitions are selected.
+            return list(
+                itertools.islice(selected_batch_definitions_iterator, self.limit)
+            )
+
+        selected_batch_definitions = list(selected_batch_definitions_iterator)
         if len(selected_batch_definitions) == 0:
             return selected_batch_definitions
 
-        if self.index is None:
-            selected_batch_definitions = selected_batch_definitions[: self.limit]
+        if isinstance(self.index, int):
+            selected_batch_definitions = [selected_batch_definitions[self.index]]
         else:
-            if isinstance(self.index, int):
-                selected_batch_definitions = [selected_batch_definitions[self.index]]
-            else:
-                selected_batch_definitions = list(
-                    itertools.chain.from_iterable(
-                        [selected_batch_definitions[self.index]]
-                    )
-                )
+            selected_batch_definitions = list(
+                itertools.chain.from_iterable([selected_batch_definitions[self.index]])
+            )
         return selected_batch_definitions
 
     def best_effort_batch_definition_matcher(self) -> Callable:
@@ -60,6 +60,8 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
         delimiter: str = "/",
         azure_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to Azure.
@@ -76,6 +78,9 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             delimiter (str): Azure delimiter
             azure_options (dict): wrapper object for **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing ConfiguredAssetAzureDataConnector "{name}".')
 
@@ -87,6 +92,8 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
         self._container = container
         self._name_starts_with = FilePathDataConnector.sanitize_prefix(name_starts_with)
@@ -137,6 +144,25 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
         return AzureBatchSpec(batch_spec)
 
     def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+        query_options: dict = self._get_query_options_for_asset(asset=asset)
+
+        path_list: List[str] = list_azure_keys(
+            azure=self._azure,
+            query_options=query_options,
+            recursive=False,
+        )
+        return path_list
+
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        # Azure Blob Storage cannot start a listing after a given blob name, so that persisting the data_references only
+        # saves mapping them to batch_definitions (see FilePathDataConnector._get_data_reference_list_after).
+        return self._get_query_options_for_asset(
+            asset=self._get_asset(data_asset_name=data_asset_name)
+        )
+
+    def _get_query_options_for_asset(self, asset: Optional[Asset]) -> dict:
         query_options: dict = {
             "container": self._container,
             "name_starts_with": self._name_starts_with,
@@ -149,13 +175,7 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
                 query_options["name_starts_with"] = asset.name_starts_with
             if asset.delimiter:
                 query_options["delimiter"] = asset.delimiter
-
-        path_list: List[str] = list_azure_keys(
-            azure=self._azure,
-            query_options=query_options,
-            recursive=False,
-        )
-        return path_list
+        return query_options
 
     def _get_full_file_path_for_asset(
         self, path: str, asset: Optional[Asset] = None
@@ -1,6 +1,6 @@
 import logging
 from copy import deepcopy
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition
@@ -40,6 +40,8 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data by taking in
@@ -54,6 +56,9 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): Optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): Optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing ConfiguredAssetFilePathDataConnector "{name}".')
         super().__init__(
@@ -63,6 +68,8 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         if assets is None:
@@ -117,20 +124,11 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         self._data_references_cache = {}
 
         for data_asset_name in self.get_available_data_asset_names():
-            self._data_references_cache[data_asset_name] = {}
-
-            for data_reference in self._get_data_reference_list(
-                data_asset_name=data_asset_name
-            ):
-                mapped_batch_definition_list: List[
-                    BatchDefinition
-                ] = self._map_data_reference_to_batch_definition_list(
-                    data_reference=data_reference,
-                    data_asset_name=data_asset_name,
-                )
-                self._data_references_cache[data_asset_name][
-                    data_reference
-                ] = mapped_batch_definition_list
+            self._data_references_cache[
+                data_asset_name
+            ] = self._get_mapped_data_references(data_asset_name=data_asset_name)
+
+        self._build_batch_definition_indexes()
 
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
@@ -180,11 +178,19 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
     def _get_batch_definition_list_from_cache(self) -> List[BatchDefinition]:
         batch_definition_list: List[BatchDefinition] = [
             batch_definitions[0]
+            for batch_definitions in self._get_batch_definition_lists_from_cache()
+        ]
+        return batch_definition_list
+
+    def _get_batch_definition_lists_from_cache(
+        self,
+    ) -> Iterator[Sequence[BatchDefinition]]:
+        return (
+            batch_definitions
             for data_reference_sub_cache in self._data_references_cache.values()
             for batch_definitions in data_reference_sub_cache.values()
             if batch_definitions is not None
-        ]
-        return batch_definition_list
+        )
 
     def _get_full_file_path(
         self, path: str, data_asset_name: Optional[str] = None
@@ -64,6 +64,8 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
         max_results: Optional[int] = None,
         gcs_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to GCS.
@@ -81,6 +83,9 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             max_results (int): max blob filepaths to return
             gcs_options (dict): wrapper object for optional GCS **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing ConfiguredAssetGCSDataConnector "{name}".')
 
@@ -92,6 +97,8 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
         self._bucket_or_name = bucket_or_name
         self._prefix = prefix
@@ -134,7 +141,44 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
         )
         return GCSBatchSpec(batch_spec)
 
-    def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+    def _get_data_reference_list_for_asset(
+        self, asset: Optional[Asset], start_after: Optional[str] = None
+    ) -> List[str]:
+        query_options: dict = self._get_query_options_for_asset(asset=asset)
+        if start_after is not None:
+            # The listing of GCS starts at (rather than after) start_offset
+            query_options["start_offset"] = start_after
+
+        path_list: List[str] = [
+            key
+            for key in list_gcs_keys(
+                gcs=self._gcs,
+                query_options=query_options,
+                recursive=False,
+            )
+        ]
+        return path_list
+
+    def _get_data_reference_list_after(
+        self, data_asset_name: Optional[str], start_after: str
+    ) -> List[str]:
+        return [
+            data_reference
+            for data_reference in self._get_data_reference_list_for_asset(
+                asset=self._get_asset(data_asset_name=data_asset_name),
+                start_after=start_after,
+            )
+            if data_reference > start_after
+        ]
+
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        return self._get_query_options_for_asset(
+            asset=self._get_asset(data_asset_name=data_asset_name)
+        )
+
+    def _get_query_options_for_asset(self, asset: Optional[Asset]) -> dict:
         query_options: dict = {
             "bucket_or_name": self._bucket_or_name,
             "prefix": self._prefix,
@@ -151,16 +195,7 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
                 query_options["delimiter"] = asset.delimiter
             if asset.max_results:
                 query_options["max_results"] = asset.max_results
-
-        path_list: List[str] = [
-            key
-            for key in list_gcs_keys(
-                gcs=self._gcs,
-                query_options=query_options,
-                recursive=False,
-            )
-        ]
-        return path_list
+        return query_options
 
     def _get_full_file_path_for_asset(
         self, path: str, asset: Optional[Asset] = None
@@ -52,6 +52,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
         max_keys: int = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to S3.
@@ -69,6 +71,9 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing ConfiguredAssetS3DataConnector "{name}".')
 
@@ -80,6 +85,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
         self._bucket = bucket
         self._prefix = FilePathDataConnector.sanitize_prefix(prefix)
@@ -111,7 +118,40 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
         )
         return S3BatchSpec(batch_spec)
 
-    def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+    def _get_data_reference_list_for_asset(
+        self, asset: Optional[Asset], start_after: Optional[str] = None
+    ) -> List[str]:
+        query_options: dict = self._get_query_options_for_asset(asset=asset)
+        if start_after is not None:
+            query_options["StartAfter"] = start_after
+
+        path_list: List[str] = [
+            key
+            for key in list_s3_keys(
+                s3=self._s3,
+                query_options=query_options,
+                iterator_dict={},
+                recursive=False,
+            )
+        ]
+        return path_list
+
+    def _get_data_reference_list_after(
+        self, data_asset_name: Optional[str], start_after: str
+    ) -> List[str]:
+        return self._get_data_reference_list_for_asset(
+            asset=self._get_asset(data_asset_name=data_asset_name),
+            start_after=start_after,
+        )
+
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        return self._get_query_options_for_asset(
+            asset=self._get_asset(data_asset_name=data_asset_name)
+        )
+
+    def _get_query_options_for_asset(self, asset: Optional[Asset]) -> dict:
         query_options: dict = {
             "Bucket": self._bucket,
             "Prefix": self._prefix,
@@ -127,17 +167,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
                 query_options["Delimiter"] = asset.delimiter
             if asset.max_keys:
                 query_options["MaxKeys"] = asset.max_keys
-
-        path_list: List[str] = [
-            key
-            for key in list_s3_keys(
-                s3=self._s3,
-                query_options=query_options,
-                iterator_dict={},
-                recursive=False,
-            )
-        ]
-        return path_list
+        return query_options
 
     def _get_full_file_path_for_asset(
         self, path: str, asset: Optional[Asset] = None
@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PersistedDataReferenceCache:
+    """
+    JSON file keeping, for every listing of data_references of a DataConnector (identified by the listing options and
+    the regex configuration used to map the data_references), the listed data_references, the batch_identifiers they
+    were mapped to, and the last (greatest) listed data_reference.
+
+    Object stores list keys in lexicographic order, and can start a listing after a given key (e.g., the "StartAfter"
+    option of S3 and the "start_offset" option of GCS), so that a DataConnector using this cache only lists (and maps)
+    the data_references added after the last one it has seen, rather than the whole bucket, upon every refresh.
+    Since data_references deleted, or added before the last listed one, are missed by such listings, the time of the
+    last full listing is kept too, so that the whole listing is refreshed once it is older than a time-to-live.
+
+    Entries of the cache are of the form:
+        data_reference -> [[data_asset_name, batch_identifiers], ...] (or None, if the data_reference is unmatched)
+    """
+
+    VERSION: int = 2
+    DEFAULT_TTL: int = 3600
+
+    def __init__(self, filepath: str):
+        self._filepath = filepath
+        self._listings: Optional[Dict[str, dict]] = None
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def get_listing(
+        self, listing_id: str
+    ) -> Tuple[Dict[str, Optional[List[list]]], Optional[str], Optional[float]]:
+        """
+        Returns the entries of the listing, the last listed data_reference, and the time (in seconds since the epoch)
+        of the last full listing (the latter two being None, if the listing is unknown).
+        """
+        listing: Optional[dict] = self._get_listings().get(listing_id)
+        if listing is None:
+            return {}, None, None
+
+        return (
+            dict(listing["data_references"]),
+            listing["last_data_reference"],
+            listing["listed_at"],
+        )
+
+    def set_listing(
+        self,
+        listing_id: str,
+        data_references: Dict[str, Optional[List[list]]],
+        last_data_reference: Optional[str],
+        listed_at: float,
+    ):
+        self._get_listings()[listing_id] = {
+            "data_references": data_references,
+            "last_data_reference": last_data_reference,
+            "listed_at": listed_at,
+        }
+        self._save()
+
+    def clear(self):
+        self._listings = {}
+        if os.path.isfile(self._filepath):
+            os.remove(self._filepath)
+
+    def _get_listings(self) -> Dict[str, dict]:
+        if self._listings is None:
+            self._listings = self._load()
+        return self._listings
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self._filepath) as infile:
+                contents: dict = json.load(infile)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(
+                f'Ignoring the invalid data_references cache file "{self._filepath}".'
+            )
+            return {}
+
+        if contents.get("version") != self.VERSION:
+            return {}
+
+        return contents.get("listings", {})
+
+    def _save(self):
+        directory: str = os.path.dirname(self._filepath)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first, so that readers never see a partially written cache file.
+        file_descriptor, temporary_filepath = tempfile.mkstemp(
+            dir=directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w") as outfile:
+                json.dump(
+                    {"version": self.VERSION, "listings": self._listings}, outfile
+                )
+            os.replace(temporary_filepath, self._filepath)
+        except Exception:
+            os.remove(temporary_filepath)
+            raise
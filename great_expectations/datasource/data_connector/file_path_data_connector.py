@@ -1,6 +1,8 @@
+import json
 import logging
 import os
-from typing import Iterator, List, Optional, cast
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -10,13 +12,22 @@ from great_expectations.core.batch import (
     BatchSpec,
 )
 from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.datasource.data_connector.batch_definition_index import (
+    BatchDefinitionIndex,
+)
 from great_expectations.datasource.data_connector.batch_filter import (
     BatchFilter,
     build_batch_filter,
 )
 from great_expectations.datasource.data_connector.data_connector import DataConnector
+from great_expectations.datasource.data_connector.data_reference_cache import (
+    PersistedDataReferenceCache,
+)
 from great_expectations.datasource.data_connector.sorter import Sorter
 from great_expectations.datasource.data_connector.util import (
+    DataReferenceMatcher,
+    LazyBatchDefinitionList,
     batch_definition_matches_batch_request,
     build_sorters_from_config,
     map_batch_definition_to_data_reference_string_using_regex,
@@ -45,6 +56,8 @@ class FilePathDataConnector(DataConnector):
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -57,6 +70,12 @@ class FilePathDataConnector(DataConnector):
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): Optional directory (relative to the data context root directory,
+                unless absolute) in which to persist the listed data_references, so that refreshing the cache only lists
+                the data_references added since the last refresh (see PersistedDataReferenceCache)
+            data_references_cache_ttl (int): Optional number of seconds after which the persisted data_references are
+                listed again in full, picking up deleted data_references and data_references added before the last
+                persisted one (default is PersistedDataReferenceCache.DEFAULT_TTL)
         """
         logger.debug(f'Constructing FilePathDataConnector "{name}".')
 
@@ -74,6 +93,22 @@ class FilePathDataConnector(DataConnector):
         self._sorters = build_sorters_from_config(config_list=sorters)
         self._validate_sorters_configuration()
 
+        # Lists of batch_definitions of every data_asset (indexed upon the first lookup of the data_asset), grouped from
+        # the data_references cache they belong to
+        self._batch_definition_lists_by_data_asset_name: Dict[
+            str, List[Sequence[BatchDefinition]]
+        ] = {}
+        self._batch_definition_indexes: Dict[str, BatchDefinitionIndex] = {}
+        self._batch_definition_indexes_data_references_cache: Optional[dict] = None
+
+        self._data_references_cache_directory = data_references_cache_directory
+        if data_references_cache_ttl is None:
+            data_references_cache_ttl = PersistedDataReferenceCache.DEFAULT_TTL
+        self._data_references_cache_ttl = data_references_cache_ttl
+        self._persisted_data_reference_cache: Optional[
+            PersistedDataReferenceCache
+        ] = None
+
     @property
     def sorters(self) -> Optional[dict]:
         return self._sorters
@@ -96,11 +131,6 @@ class FilePathDataConnector(DataConnector):
             )
         )
 
-        if len(self.sorters) > 0:
-            batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
-            )
-
         path_list: List[str] = [
             map_batch_definition_to_data_reference_string_using_regex(
                 batch_definition=batch_definition,
@@ -157,20 +187,12 @@ class FilePathDataConnector(DataConnector):
         if len(self._data_references_cache) == 0:
             self._refresh_data_references_cache()
 
-        batch_definition_list: List[BatchDefinition] = list(
-            filter(
-                lambda batch_definition: batch_definition_matches_batch_request(
-                    batch_definition=batch_definition, batch_request=batch_request
-                ),
-                self._get_batch_definition_list_from_cache(),
-            )
+        batch_definition_list: List[
+            BatchDefinition
+        ] = self._get_sorted_batch_definition_list_matching_batch_request(
+            batch_request=batch_request
         )
 
-        if len(self.sorters) > 0:
-            batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
-            )
-
         if batch_request.data_connector_query is not None:
 
             data_connector_query_dict = batch_request.data_connector_query.copy()
@@ -186,9 +208,367 @@ class FilePathDataConnector(DataConnector):
             batch_definition_list = batch_filter_obj.select_from_data_connector_query(
                 batch_definition_list=batch_definition_list
             )
+        else:
+            # The list may belong to a BatchDefinitionIndex
+            batch_definition_list = list(batch_definition_list)
+
+        return batch_definition_list
+
+    def _get_sorted_batch_definition_list_matching_batch_request(
+        self, batch_request: BatchRequestBase
+    ) -> List[BatchDefinition]:
+        """
+        Retrieve the sorted batch_definitions that match the batch_request (without applying the index, limit, or
+        custom_filter_function of its data_connector_query).
+
+        When the batch_request names a data_asset, its batch_definitions are looked up in the BatchDefinitionIndex of
+        the data_asset (by the batch_filter_parameters of the data_connector_query and the batch_identifiers of the
+        batch_request), rather than filtered out of all cached batch_definitions and sorted.
+
+        The returned list may belong to a BatchDefinitionIndex, and must not be modified.
+        """
+        if not batch_request.data_asset_name:
+            batch_definition_list: List[BatchDefinition] = list(
+                filter(
+                    lambda batch_definition: batch_definition_matches_batch_request(
+                        batch_definition=batch_definition, batch_request=batch_request
+                    ),
+                    self._get_batch_definition_list_from_cache(),
+                )
+            )
+            if len(self.sorters) > 0:
+                batch_definition_list = self._sort_batch_definition_list(
+                    batch_definition_list=batch_definition_list
+                )
+
+            return batch_definition_list
+
+        batch_definition_index: Optional[
+            BatchDefinitionIndex
+        ] = self._get_batch_definition_index(
+            data_asset_name=batch_request.data_asset_name
+        )
+        if batch_definition_index is None:
+            return []
+
+        batch_identifiers: dict = {}
+        if batch_request.data_connector_query:
+            batch_filter_parameters: Optional[
+                dict
+            ] = batch_request.data_connector_query.get("batch_filter_parameters")
+            if batch_filter_parameters:
+                if not isinstance(batch_filter_parameters, dict):
+                    return []
+                batch_identifiers.update(batch_filter_parameters)
+
+        if batch_request.batch_identifiers:
+            if not isinstance(batch_request.batch_identifiers, dict):
+                return []
+            for key, value in batch_request.batch_identifiers.items():
+                if key in batch_identifiers and batch_identifiers[key] != value:
+                    return []
+                batch_identifiers[key] = value
+
+        batch_definition_list = batch_definition_index.get_batch_definitions(
+            batch_identifiers=batch_identifiers
+        )
+        if not batch_definition_index.is_sorted:
+            batch_definition_list = self._sort_batch_definition_list(
+                batch_definition_list=batch_definition_list
+            )
 
         return batch_definition_list
 
+    def _get_batch_definition_index(
+        self, data_asset_name: str
+    ) -> Optional[BatchDefinitionIndex]:
+        """
+        Return the BatchDefinitionIndex of the data_asset (or None, if the data_asset has no cached batch_definitions),
+        creating the batch_definitions of the data_asset, and sorting and indexing them, upon its first lookup after
+        every refresh of the data_references cache.
+        """
+        if (
+            self._batch_definition_indexes_data_references_cache
+            is not self._data_references_cache
+        ):
+            self._build_batch_definition_indexes()
+
+        batch_definition_index: Optional[
+            BatchDefinitionIndex
+        ] = self._batch_definition_indexes.get(data_asset_name)
+        if batch_definition_index is None:
+            batch_definition_lists: Optional[
+                List[Sequence[BatchDefinition]]
+            ] = self._batch_definition_lists_by_data_asset_name.get(data_asset_name)
+            if batch_definition_lists is None:
+                return None
+
+            batch_definition_index = BatchDefinitionIndex(
+                batch_definitions=[
+                    batch_definition_list[0]
+                    for batch_definition_list in batch_definition_lists
+                ],
+                sorters=self.sorters.values(),
+            )
+            self._batch_definition_indexes[data_asset_name] = batch_definition_index
+
+        return batch_definition_index
+
+    def _get_cached_data_asset_names(self) -> List[str]:
+        """
+        Return the names of the data_assets having cached batch_definitions (without creating the batch_definitions).
+        """
+        if len(self._data_references_cache) == 0:
+            self._refresh_data_references_cache()
+        if (
+            self._batch_definition_indexes_data_references_cache
+            is not self._data_references_cache
+        ):
+            self._build_batch_definition_indexes()
+
+        return list(self._batch_definition_lists_by_data_asset_name.keys())
+
+    def _build_batch_definition_indexes(self):
+        """
+        Group the cached batch_definitions by data_asset (called whenever the data_references cache is refreshed).
+
+        The batch_definitions of a data_asset are only created, sorted, and indexed upon the first lookup of the
+        data_asset (see _get_batch_definition_index), so that they are sorted and indexed once per refresh rather than
+        once per request, and that refreshing the cache does not create the batch_definitions of every data_reference.
+        """
+        batch_definition_lists_by_data_asset_name: Dict[
+            str, List[Sequence[BatchDefinition]]
+        ] = {}
+        batch_definition_list: Sequence[BatchDefinition]
+        for batch_definition_list in self._get_batch_definition_lists_from_cache():
+            if isinstance(batch_definition_list, LazyBatchDefinitionList):
+                data_asset_name: str = batch_definition_list.data_asset_name
+            else:
+                data_asset_name = batch_definition_list[0].data_asset_name
+            batch_definition_lists_by_data_asset_name.setdefault(
+                data_asset_name, []
+            ).append(batch_definition_list)
+
+        self._batch_definition_lists_by_data_asset_name = (
+            batch_definition_lists_by_data_asset_name
+        )
+        self._batch_definition_indexes = {}
+        self._batch_definition_indexes_data_references_cache = (
+            self._data_references_cache
+        )
+
+    def _get_batch_definition_lists_from_cache(
+        self,
+    ) -> Iterator[Sequence[BatchDefinition]]:
+        """
+        Iterate over the lists of batch_definitions of the matched data_references in the data_references cache.
+        """
+        raise NotImplementedError
+
+    def _get_mapped_data_references(
+        self, data_asset_name: Optional[str] = None
+    ) -> Dict[str, Optional[Sequence[BatchDefinition]]]:
+        """
+        List the data_references (of the data_asset, if data_asset_name is given) and map them to batch_definitions.
+
+        The regex pattern is compiled once, and the whole listing is mapped in a single pass, into lists of
+        batch_definitions whose BatchDefinition objects are only created upon access (see LazyBatchDefinitionList).
+
+        If a data_references_cache_directory is configured, the data_references and the batch_identifiers they map to
+        are persisted, and only the data_references sorting after the last persisted one are listed and mapped.  Since
+        such listings miss data_references deleted or added before the last persisted one, all data_references are
+        listed again once the last full listing is older than data_references_cache_ttl (or once the persisted cache is
+        cleared; see clear_persisted_data_references_cache), keeping the mapping of the data_references still listed.
+
+        Returns:
+            dictionary mapping every data_reference to its list of batch_definitions (or None, if it is unmatched)
+        """
+        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
+        data_reference_matcher = DataReferenceMatcher(
+            regex_pattern=regex_config["pattern"],
+            group_names=regex_config["group_names"],
+        )
+
+        persisted_data_reference_cache: Optional[
+            PersistedDataReferenceCache
+        ] = self._get_persisted_data_reference_cache()
+        if persisted_data_reference_cache is None:
+            return {
+                data_reference: None
+                if mapped_batch_identifiers is None
+                else LazyBatchDefinitionList(
+                    datasource_name=self.datasource_name,
+                    data_connector_name=self.name,
+                    mapped_batch_identifiers=[
+                        (
+                            mapped_batch_identifiers[0]
+                            if data_asset_name is None
+                            else data_asset_name,
+                            mapped_batch_identifiers[1],
+                        )
+                    ],
+                )
+                for data_reference, mapped_batch_identifiers in data_reference_matcher.match_all(
+                    data_references=self._get_data_reference_list(
+                        data_asset_name=data_asset_name
+                    )
+                )
+            }
+
+        listing_id: str = json.dumps(
+            {
+                "data_asset_name": data_asset_name,
+                "listing_options": self._get_data_reference_listing_options(
+                    data_asset_name=data_asset_name
+                ),
+                "regex": regex_config,
+            },
+            sort_keys=True,
+        )
+        entries: Dict[str, Optional[List[list]]]
+        last_data_reference: Optional[str]
+        listed_at: Optional[float]
+        (
+            entries,
+            last_data_reference,
+            listed_at,
+        ) = persisted_data_reference_cache.get_listing(listing_id=listing_id)
+
+        is_full_listing: bool = (
+            last_data_reference is None
+            or listed_at is None
+            or time.time() - listed_at >= self._data_references_cache_ttl
+        )
+        data_reference_list: List[str]
+        if is_full_listing:
+            listed_at = time.time()
+            data_reference_list = self._get_data_reference_list(
+                data_asset_name=data_asset_name
+            )
+            # Drop the deleted data_references, and keep the mapping of the ones still listed.
+            entries = {
+                data_reference: entries[data_reference]
+                for data_reference in data_reference_list
+                if data_reference in entries
+            }
+            last_data_reference = max(entries, default=None)
+        else:
+            data_reference_list = self._get_data_reference_list_after(
+                data_asset_name=data_asset_name, start_after=last_data_reference
+            )
+
+        is_updated: bool = is_full_listing
+        data_reference: str
+        mapped_batch_identifiers: Optional[Tuple[str, IDDict]]
+        for (
+            data_reference,
+            mapped_batch_identifiers,
+        ) in data_reference_matcher.match_all(
+            data_references=(
+                data_reference
+                for data_reference in data_reference_list
+                if data_reference not in entries
+            )
+        ):
+            entries[data_reference] = (
+                None
+                if mapped_batch_identifiers is None
+                else [
+                    [
+                        mapped_batch_identifiers[0]
+                        if data_asset_name is None
+                        else data_asset_name,
+                        dict(mapped_batch_identifiers[1]),
+                    ]
+                ]
+            )
+            if last_data_reference is None or data_reference > last_data_reference:
+                last_data_reference = data_reference
+            is_updated = True
+
+        if is_full_listing:
+            # Keep the data_references in the order in which they are listed (as without a persisted cache).
+            entries = {
+                data_reference: entries[data_reference]
+                for data_reference in data_reference_list
+            }
+
+        if is_updated:
+            persisted_data_reference_cache.set_listing(
+                listing_id=listing_id,
+                data_references=entries,
+                last_data_reference=last_data_reference,
+                listed_at=listed_at,
+            )
+
+        return {
+            data_reference: None
+            if entry is None
+            else LazyBatchDefinitionList(
+                datasource_name=self.datasource_name,
+                data_connector_name=self.name,
+                mapped_batch_identifiers=[
+                    (entry_data_asset_name, IDDict(batch_identifiers))
+                    for entry_data_asset_name, batch_identifiers in entry
+                ],
+            )
+            for data_reference, entry in entries.items()
+        }
+
+    def clear_persisted_data_references_cache(self):
+        """
+        Clear the persisted data_references (if a data_references_cache_directory is configured), so that the next
+        refresh of the data_references cache lists all data_references again.
+        """
+        persisted_data_reference_cache: Optional[
+            PersistedDataReferenceCache
+        ] = self._get_persisted_data_reference_cache()
+        if persisted_data_reference_cache is not None:
+            persisted_data_reference_cache.clear()
+
+    def _get_persisted_data_reference_cache(
+        self,
+    ) -> Optional[PersistedDataReferenceCache]:
+        if self._data_references_cache_directory is None:
+            return None
+
+        if self._persisted_data_reference_cache is None:
+            directory: str = self._data_references_cache_directory
+            if not os.path.isabs(directory) and self.data_context_root_directory:
+                directory = os.path.join(self.data_context_root_directory, directory)
+            self._persisted_data_reference_cache = PersistedDataReferenceCache(
+                filepath=os.path.join(
+                    directory, f"{self.datasource_name}.{self.name}.json"
+                )
+            )
+
+        return self._persisted_data_reference_cache
+
+    def _get_data_reference_list_after(
+        self, data_asset_name: Optional[str], start_after: str
+    ) -> List[str]:
+        """
+        List the data_references sorting after start_after.
+
+        Subclasses able to start the listing of the underlying data store after a given key override this method.
+        """
+        return [
+            data_reference
+            for data_reference in self._get_data_reference_list(
+                data_asset_name=data_asset_name
+            )
+            if data_reference > start_after
+        ]
+
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        """
+        Return the options of the listing of the data_references (e.g., bucket and prefix), identifying, along with
+        the regex configuration, the data_references persisted in the data_references cache directory.
+        """
+        return {}
+
     def _sort_batch_definition_list(
         self, batch_definition_list: List[BatchDefinition]
     ) -> List[BatchDefinition]:
@@ -49,6 +49,8 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
         delimiter: str = "/",
         azure_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         InferredAssetAzureDataConnector for connecting to Azure Blob Storage.
@@ -64,6 +66,9 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
             delimiter (str): Azure delimiter
             azure_options (dict): wrapper object for **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing InferredAssetAzureDataConnector "{name}".')
 
@@ -74,6 +79,8 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         self._container = container
@@ -132,11 +139,7 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
 
         This method is used to refresh the cache.
         """
-        query_options: dict = {
-            "container": self._container,
-            "name_starts_with": self._name_starts_with,
-            "delimiter": self._delimiter,
-        }
+        query_options: dict = self._get_data_reference_listing_options()
 
         path_list: List[str] = list_azure_keys(
             azure=self._azure,
@@ -145,6 +148,17 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
         )
         return path_list
 
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        # Azure Blob Storage cannot start a listing after a given blob name, so that persisting the data_references only
+        # saves mapping them to batch_definitions (see FilePathDataConnector._get_data_reference_list_after).
+        return {
+            "container": self._container,
+            "name_starts_with": self._name_starts_with,
+            "delimiter": self._delimiter,
+        }
+
     def _get_full_file_path(
         self,
         path: str,
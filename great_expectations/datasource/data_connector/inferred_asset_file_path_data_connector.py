@@ -1,8 +1,8 @@
 import copy
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
-from great_expectations.core.batch import BatchDefinition, BatchRequestBase
+from great_expectations.core.batch import BatchDefinition
 from great_expectations.core.batch_spec import BatchSpec, PathBatchSpec
 from great_expectations.datasource.data_connector.file_path_data_connector import (
     FilePathDataConnector,
@@ -34,6 +34,8 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -46,6 +48,9 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): Optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): Optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing InferredAssetFilePathDataConnector "{name}".')
 
@@ -56,20 +61,18 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
     def _refresh_data_references_cache(self):
         """refreshes data_reference cache"""
         # Map data_references to batch_definitions
-        self._data_references_cache = {}
+        self._data_references_cache = self._get_mapped_data_references(
+            data_asset_name=None
+        )
 
-        for data_reference in self._get_data_reference_list():
-            mapped_batch_definition_list: List[
-                BatchDefinition
-            ] = self._map_data_reference_to_batch_definition_list(
-                data_reference=data_reference, data_asset_name=None
-            )
-            self._data_references_cache[data_reference] = mapped_batch_definition_list
+        self._build_batch_definition_indexes()
 
     def get_data_reference_list_count(self) -> int:
         """
@@ -98,26 +101,8 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
         Returns:
             A list of available names
         """
-        if len(self._data_references_cache) == 0:
-            self._refresh_data_references_cache()
-
-        # This will fetch ALL batch_definitions in the cache
-        batch_definition_list: List[
-            BatchDefinition
-        ] = self._get_batch_definition_list_from_batch_request(
-            batch_request=BatchRequestBase(
-                datasource_name=self.datasource_name,
-                data_connector_name=self.name,
-                data_asset_name="",
-            )
-        )
-
-        data_asset_names: List[str] = [
-            batch_definition.data_asset_name
-            for batch_definition in batch_definition_list
-        ]
-
-        return list(set(data_asset_names))
+        # The data_asset_names are known without creating the batch_definitions in the cache
+        return self._get_cached_data_asset_names()
 
     def build_batch_spec(self, batch_definition: BatchDefinition) -> PathBatchSpec:
         """
@@ -138,11 +123,19 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
     def _get_batch_definition_list_from_cache(self) -> List[BatchDefinition]:
         batch_definition_list: List[BatchDefinition] = [
             batch_definitions[0]
-            for batch_definitions in self._data_references_cache.values()
-            if batch_definitions is not None
+            for batch_definitions in self._get_batch_definition_lists_from_cache()
         ]
         return batch_definition_list
 
+    def _get_batch_definition_lists_from_cache(
+        self,
+    ) -> Iterator[Sequence[BatchDefinition]]:
+        return (
+            batch_definitions
+            for batch_definitions in self._data_references_cache.values()
+            if batch_definitions is not None
+        )
+
     def _get_regex_config(self, data_asset_name: Optional[str] = None) -> dict:
         regex_config: dict = copy.deepcopy(self._default_regex)
         return regex_config
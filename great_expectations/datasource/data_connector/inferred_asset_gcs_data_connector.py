@@ -62,6 +62,8 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
         max_results: Optional[int] = None,
         gcs_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         InferredAssetDataConnector for connecting to GCS.
@@ -78,6 +80,9 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             max_results (int): max blob filepaths to return
             gcs_options (dict): wrapper object for optional GCS **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing InferredAssetGCSDataConnector "{name}".')
 
@@ -88,6 +93,8 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         self._bucket_or_name = bucket_or_name
@@ -132,14 +139,12 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
         return GCSBatchSpec(batch_spec)
 
     def _get_data_reference_list(
-        self, data_asset_name: Optional[str] = None
+        self, data_asset_name: Optional[str] = None, start_after: Optional[str] = None
     ) -> List[str]:
-        query_options: dict = {
-            "bucket_or_name": self._bucket_or_name,
-            "prefix": self._prefix,
-            "delimiter": self._delimiter,
-            "max_results": self._max_results,
-        }
+        query_options: dict = self._get_data_reference_listing_options()
+        if start_after is not None:
+            # The listing of GCS starts at (rather than after) start_offset
+            query_options["start_offset"] = start_after
 
         path_list: List[str] = [
             key
@@ -151,6 +156,27 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
         ]
         return path_list
 
+    def _get_data_reference_list_after(
+        self, data_asset_name: Optional[str], start_after: str
+    ) -> List[str]:
+        return [
+            data_reference
+            for data_reference in self._get_data_reference_list(
+                data_asset_name=data_asset_name, start_after=start_after
+            )
+            if data_reference > start_after
+        ]
+
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        return {
+            "bucket_or_name": self._bucket_or_name,
+            "prefix": self._prefix,
+            "delimiter": self._delimiter,
+            "max_results": self._max_results,
+        }
+
     def _get_full_file_path(
         self, path: str, data_asset_name: Optional[str] = None
     ) -> str:
@@ -50,6 +50,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         max_keys: int = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        data_references_cache_directory: Optional[str] = None,
+        data_references_cache_ttl: Optional[int] = None,
     ):
         """
         InferredAssetS3DataConnector for connecting to S3.
@@ -66,6 +68,9 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            data_references_cache_directory (str): optional directory in which to persist the listed data_references
+            data_references_cache_ttl (int): optional number of seconds after which the persisted data_references
+                are listed again in full
         """
         logger.debug(f'Constructing InferredAssetS3DataConnector "{name}".')
 
@@ -76,6 +81,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         self._bucket = bucket
@@ -109,19 +116,19 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         return S3BatchSpec(batch_spec)
 
     def _get_data_reference_list(
-        self, data_asset_name: Optional[str] = None
+        self, data_asset_name: Optional[str] = None, start_after: Optional[str] = None
     ) -> List[str]:
         """
         List objects in the underlying data store to create a list of data_references.
 
         This method is used to refresh the cache.
         """
-        query_options: dict = {
-            "Bucket": self._bucket,
-            "Prefix": self._prefix,
-            "Delimiter": self._delimiter,
-            "MaxKeys": self._max_keys,
-        }
+        query_options: dict = self._get_data_reference_listing_options()
+        if start_after is not None:
+            # The common prefixes of a delimited listing starting after a key do not include the prefix of that key
+            # (so that the keys added under it would be missed), whereas a listing without delimiter lists all keys.
+            query_options.pop("Delimiter")
+            query_options["StartAfter"] = start_after
 
         path_list: List[str] = [
             key
@@ -134,6 +141,23 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         ]
         return path_list
 
+    def _get_data_reference_list_after(
+        self, data_asset_name: Optional[str], start_after: str
+    ) -> List[str]:
+        return self._get_data_reference_list(
+            data_asset_name=data_asset_name, start_after=start_after
+        )
+
+    def _get_data_reference_listing_options(
+        self, data_asset_name: Optional[str] = None
+    ) -> dict:
+        return {
+            "Bucket": self._bucket,
+            "Prefix": self._prefix,
+            "Delimiter": self._delimiter,
+            "MaxKeys": self._max_keys,
+        }
+
     def _get_full_file_path(
         self,
         path: str,
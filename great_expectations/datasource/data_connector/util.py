@@ -7,8 +7,9 @@ import re
 import sre_constants
 import sre_parse
 import warnings
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from great_expectations.core.batch import BatchDefinition, BatchRequestBase
 from great_expectations.core.id_dict import IDDict
@@ -136,42 +137,158 @@ def convert_data_reference_string_to_batch_identifiers_using_regex(
     regex_pattern: str,
     group_names: List[str],
 ) -> Optional[Tuple[str, IDDict]]:
-    # noinspection PyUnresolvedReferences
-    pattern = re.compile(regex_pattern)
-    matches: Optional[re.Match] = pattern.match(data_reference)
-    if matches is None:
-        return None
+    return DataReferenceMatcher(
+        regex_pattern=regex_pattern, group_names=group_names
+    ).match(data_reference=data_reference)
 
-    # Check for `(?P<name>)` named group syntax
-    match_dict = matches.groupdict()
-    if match_dict:  # Only named groups will populate this dict
-        batch_identifiers = _determine_batch_identifiers_using_named_groups(
-            match_dict, group_names
-        )
-    else:
-        groups: list = list(matches.groups())
-        batch_identifiers: IDDict = IDDict(dict(zip(group_names, groups)))
 
-    # TODO: <Alex>Accommodating "data_asset_name" inside batch_identifiers (e.g., via "group_names") is problematic; we need a better mechanism.</Alex>
-    # TODO: <Alex>Update: Approach -- we can differentiate "def map_data_reference_string_to_batch_definition_list_using_regex(()" methods between ConfiguredAssetFilesystemDataConnector and InferredAssetFilesystemDataConnector so that IDDict never needs to include data_asset_name. (ref: https://superconductivedata.slack.com/archives/C01C0BVPL5Q/p1603843413329400?thread_ts=1603842470.326800&cid=C01C0BVPL5Q)</Alex>
-    data_asset_name: str = batch_identifiers.pop(
-        "data_asset_name", DEFAULT_DATA_ASSET_NAME
-    )
-    return data_asset_name, batch_identifiers
+class DataReferenceMatcher:
+    """
+    Maps data_references to the data_asset_name and the batch_identifiers parsed out of them by a regex pattern.
 
+    The pattern is compiled, and the group names it captures are resolved, once (rather than for every data_reference),
+    so that mapping a whole listing of data_references costs one regex match and one IDDict per data_reference.
+    """
 
-def _determine_batch_identifiers_using_named_groups(
-    match_dict: dict, group_names: List[str]
-) -> IDDict:
-    batch_identifiers = IDDict()
-    for key, value in match_dict.items():
-        if key in group_names:
-            batch_identifiers[key] = value
+    def __init__(self, regex_pattern: str, group_names: List[str]):
+        # noinspection PyUnresolvedReferences
+        self._pattern: re.Pattern = re.compile(regex_pattern)
+
+        # Check for `(?P<name>)` named group syntax
+        named_group_names: List[str] = list(self._pattern.groupindex.keys())
+        self._uses_named_groups: bool = len(named_group_names) > 0
+        if self._uses_named_groups:
+            self._group_names: List[str] = [
+                name for name in named_group_names if name in group_names
+            ]
+            self._unlisted_named_group_names: List[str] = [
+                name for name in named_group_names if name not in group_names
+            ]
         else:
+            self._group_names = group_names
+            self._unlisted_named_group_names = []
+
+    def match(self, data_reference: str) -> Optional[Tuple[str, IDDict]]:
+        """
+        Returns the data_asset_name and the batch_identifiers of the data_reference (or None, if it does not match).
+        """
+        matches: Optional[re.Match] = self._pattern.match(data_reference)
+        if matches is None:
+            return None
+
+        batch_identifiers: IDDict
+        if self._uses_named_groups:
+            if self._unlisted_named_group_names:
+                self._warn_about_unlisted_named_groups()
+            match_dict: dict = matches.groupdict()
+            batch_identifiers = IDDict(
+                (name, match_dict[name]) for name in self._group_names
+            )
+        else:
+            batch_identifiers = IDDict(zip(self._group_names, matches.groups()))
+
+        # TODO: <Alex>Accommodating "data_asset_name" inside batch_identifiers (e.g., via "group_names") is problematic; we need a better mechanism.</Alex>
+        # TODO: <Alex>Update: Approach -- we can differentiate "def map_data_reference_string_to_batch_definition_list_using_regex(()" methods between ConfiguredAssetFilesystemDataConnector and InferredAssetFilesystemDataConnector so that IDDict never needs to include data_asset_name. (ref: https://superconductivedata.slack.com/archives/C01C0BVPL5Q/p1603843413329400?thread_ts=1603842470.326800&cid=C01C0BVPL5Q)</Alex>
+        data_asset_name: str = batch_identifiers.pop(
+            "data_asset_name", DEFAULT_DATA_ASSET_NAME
+        )
+        return data_asset_name, batch_identifiers
+
+    def match_all(
+        self, data_references: Iterable[str]
+    ) -> Iterator[Tuple[str, Optional[Tuple[str, IDDict]]]]:
+        """
+        Lazily maps every data_reference of the listing, in a single pass over it.
+
+        Yields:
+            the data_reference, and its data_asset_name and batch_identifiers (or None, if it does not match)
+        """
+        match = self.match
+        data_reference: str
+        for data_reference in data_references:
+            yield data_reference, match(data_reference)
+
+    def _warn_about_unlisted_named_groups(self):
+        # Warn once per matcher, rather than once per matched data_reference.
+        name: str
+        for name in self._unlisted_named_group_names:
             logger.warn(
-                f"The named group '{key}' must explicitly be stated in group_names to be parsed"
+                f"The named group '{name}' must explicitly be stated in group_names to be parsed"
             )
-    return batch_identifiers
+        self._unlisted_named_group_names = []
+
+
+class LazyBatchDefinitionList(Sequence):
+    """
+    The (read-only) list of the batch_definitions a data_reference maps to, whose BatchDefinition objects are only
+    created upon first access to its elements.
+
+    Refreshing the data_references cache of a DataConnector maps every listed data_reference, but typically only the
+    batch_definitions of the requested data_asset (if any) are used afterwards.
+    """
+
+    __slots__ = (
+        "_datasource_name",
+        "_data_connector_name",
+        "_mapped_batch_identifiers",
+        "_batch_definitions",
+    )
+
+    def __init__(
+        self,
+        datasource_name: str,
+        data_connector_name: str,
+        mapped_batch_identifiers: List[Tuple[str, IDDict]],
+    ):
+        """
+        Args:
+            datasource_name (str): name of the Datasource of the batch_definitions
+            data_connector_name (str): name of the DataConnector of the batch_definitions
+            mapped_batch_identifiers (list): data_asset_name and batch_identifiers of every batch_definition
+        """
+        self._datasource_name = datasource_name
+        self._data_connector_name = data_connector_name
+        self._mapped_batch_identifiers = mapped_batch_identifiers
+        self._batch_definitions: Optional[List[BatchDefinition]] = None
+
+    @property
+    def mapped_batch_identifiers(self) -> List[Tuple[str, IDDict]]:
+        return self._mapped_batch_identifiers
+
+    @property
+    def data_asset_name(self) -> str:
+        """The data_asset_name of the first batch_definition (i.e., the one the data_reference is cached under)."""
+        return self._mapped_batch_identifiers[0][0]
+
+    def _get_batch_definitions(self) -> List[BatchDefinition]:
+        if self._batch_definitions is None:
+            self._batch_definitions = [
+                BatchDefinition(
+                    datasource_name=self._datasource_name,
+                    data_connector_name=self._data_connector_name,
+                    data_asset_name=data_asset_name,
+                    batch_identifiers=batch_identifiers,
+                )
+                for data_asset_name, batch_identifiers in self._mapped_batch_identifiers
+            ]
+        return self._batch_definitions
+
+    def __getitem__(self, index):
+        return self._get_batch_definitions()[index]
+
+    def __len__(self) -> int:
+        return len(self._mapped_batch_identifiers)
+
+    def __iter__(self) -> Iterator[BatchDefinition]:
+        return iter(self._get_batch_definitions())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return self._get_batch_definitions() == list(other)
+
+    def __repr__(self) -> str:
+        return repr(self._get_batch_definitions())
 
 
 def map_batch_definition_to_data_reference_string_using_regex(
@@ -450,7 +567,11 @@ def list_s3_keys(
 
     s3_objects_info: dict = s3.list_objects_v2(**query_options)
 
-    if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
+    # A listing starting after a given key is empty if no key was added after it.
+    if (
+        not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"])
+        and "StartAfter" not in query_options
+    ):
         raise ValueError("S3 query may not have been configured correctly.")
 
     if "Contents" in s3_objects_info:
@@ -1,4 +1,5 @@
 import copy
+import functools
 import logging
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -6,11 +7,11 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
     Batch,
     BatchDefinition,
-    BatchMarkers,
     BatchRequest,
+    LazyBatch,
     RuntimeBatchRequest,
 )
-from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.core.batch_spec import BatchSpec
 from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import DataConnector
@@ -132,6 +133,9 @@ class BaseDatasource:
         """
         Processes batch_request and returns the (possibly empty) list of batch objects.
 
+        The data of the batches of a BatchRequest is only loaded upon first access (see LazyBatch), so that listing many
+        batches (e.g., to compute metrics of each of them in turn) does not load all of them upfront.
+
         Args:
             :batch_request encapsulation of request parameters necessary to identify the (possibly multiple) batches
             :returns possibly empty list of batch objects; each batch object contains a dataset and associated metatada
@@ -184,22 +188,17 @@ class BaseDatasource:
                 batch_definition.batch_spec_passthrough = (
                     batch_request.batch_spec_passthrough
                 )
-                batch_data: Any
-                batch_spec: PathBatchSpec
-                batch_markers: BatchMarkers
-                (
-                    batch_data,
-                    batch_spec,
-                    batch_markers,
-                ) = data_connector.get_batch_data_and_metadata(
+                batch_spec: BatchSpec = data_connector.build_batch_spec(
                     batch_definition=batch_definition
                 )
-                new_batch: Batch = Batch(
-                    data=batch_data,
+                new_batch: Batch = LazyBatch(
+                    data_loader=functools.partial(
+                        self.execution_engine.get_batch_data_and_markers,
+                        batch_spec=batch_spec,
+                    ),
                     batch_request=batch_request,
                     batch_definition=batch_definition,
                     batch_spec=batch_spec,
-                    batch_markers=batch_markers,
                 )
                 batches.append(new_batch)
             return batches
@@ -1,4 +1,6 @@
+from .batch_loader import PrefetchingBatchLoader
 from .execution_engine import ExecutionEngine
+from .metric_cache import MetricCache
 from .pandas_execution_engine import PandasExecutionEngine
 from .sparkdf_execution_engine import SparkDFExecutionEngine
 from .sqlalchemy_execution_engine import SqlAlchemyExecutionEngine
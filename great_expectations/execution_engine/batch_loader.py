@@ -0,0 +1,127 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from great_expectations.core.batch import BatchMarkers
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchingBatchLoader:
+    """Loads the data of lazily loaded batches, prefetching the data of the batches that are expected to be accessed next
+    in a pool of worker threads.
+
+    Loading batch data (reading files, downloading cloud storage objects) is mostly I/O-bound, so that loading the next
+    batches concurrently, while the current batch is being validated, hides most of the I/O latency.  Memory is bounded:
+    at most prefetch_count batches are prefetched (i.e., loaded but not yet taken by load) at any time.
+
+    Args:
+        prefetch_count: maximum number of batches prefetched at once (0 disables prefetching)
+        max_workers: maximum number of worker threads loading batches (defaults to prefetch_count)
+    """
+
+    def __init__(self, prefetch_count: int = 0, max_workers: Optional[int] = None):
+        if prefetch_count < 0:
+            raise ValueError(
+                "prefetch_count of PrefetchingBatchLoader must be non-negative."
+            )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(
+                "max_workers of PrefetchingBatchLoader must be at least 1."
+            )
+
+        self._prefetch_count = prefetch_count
+        self._max_workers = max_workers
+        # The worker threads are only started upon the first prefetch.
+        self._thread_pool_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched: Dict[str, Future] = {}
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def prefetch_count(self) -> int:
+        return self._prefetch_count
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers or self._prefetch_count
+
+    @property
+    def prefetched_batch_ids(self) -> Tuple[str, ...]:
+        """Ids of the batches, whose data is being (or has been) prefetched, but has not been taken yet."""
+        return tuple(self._prefetched)
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Number of loads served by prefetched data (hits), and of loads which were not prefetched (misses)."""
+        return {
+            "prefetched": len(self._prefetched),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def prefetch(
+        self,
+        batch_data_loaders: Iterable[
+            Tuple[str, Callable[[], Tuple[Any, BatchMarkers]]]
+        ],
+    ) -> None:
+        """Starts loading the data of the given batches (ordered from the one expected to be accessed first) in the
+        background, as long as fewer than prefetch_count batches are prefetched; batches already prefetched are skipped.
+        """
+        if self._prefetch_count == 0:
+            return
+
+        batch_id: str
+        batch_data_loader: Callable[[], Tuple[Any, BatchMarkers]]
+        for batch_id, batch_data_loader in batch_data_loaders:
+            if len(self._prefetched) >= self._prefetch_count:
+                return
+
+            if batch_id in self._prefetched:
+                continue
+
+            if self._thread_pool_executor is None:
+                self._thread_pool_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="ge_batch_loader",
+                )
+
+            logger.debug(f"Prefetching the data of batch {batch_id}.")
+            self._prefetched[batch_id] = self._thread_pool_executor.submit(
+                batch_data_loader
+            )
+
+    def load(
+        self,
+        batch_id: str,
+        batch_data_loader: Callable[[], Tuple[Any, BatchMarkers]],
+    ) -> Tuple[Any, BatchMarkers]:
+        """Returns the data (and the batch_markers) of the batch, waiting for its prefetched data (if it is being
+        prefetched), or loading it with batch_data_loader otherwise.  Errors raised by a prefetch are raised here.
+        """
+        future: Optional[Future] = self._prefetched.pop(batch_id, None)
+        if future is None:
+            self._misses += 1
+            return batch_data_loader()
+
+        self._hits += 1
+        return future.result()
+
+    def discard(self, batch_id: str) -> None:
+        """Drops the prefetched data of the batch (e.g., because the batch has been unloaded), if any; a prefetch that
+        has not started yet is cancelled (so that the data of the batch is not loaded at all).
+        """
+        future: Optional[Future] = self._prefetched.pop(batch_id, None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self) -> None:
+        """Drops all prefetched data and stops the worker threads."""
+        for batch_id in list(self._prefetched):
+            self.discard(batch_id=batch_id)
+
+        if self._thread_pool_executor is not None:
+            self._thread_pool_executor.shutdown(wait=False)
+            self._thread_pool_executor = None
@@ -1,24 +1,48 @@
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 from ruamel.yaml import YAML
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.metric import MetricResultIdentifier
 from great_expectations.core.util import AzureUrl, DBFSPath, GCSUrl, S3Url
+from great_expectations.execution_engine.batch_loader import PrefetchingBatchLoader
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import filter_properties_dict
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
+if TYPE_CHECKING:
+    # The execution engine does not depend on the data context at runtime; stores are passed in (or configured).
+    from great_expectations.data_context.store.metric_store import MetricResultStore
+
 logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.default_flow_style = False
 
 
+# Sentinel distinguishing metrics missing from the cache from cached metrics whose value is None.
+_MISSING_METRIC_VALUE = object()
+
+
 class NoOpDict:
     def __getitem__(self, item):
         return None
@@ -138,6 +162,28 @@ class DataConnectorStorageDataReferenceResolver:
         )
 
 
+class LoadedBatchDataDict(Mapping):
+    """
+    Read-only view of the batch data loaded into an ExecutionEngine, which loads the data of lazily loaded batches (see
+    ExecutionEngine.load_lazy_batch_data) upon access.
+    """
+
+    def __init__(self, execution_engine: "ExecutionEngine"):
+        self._execution_engine = execution_engine
+
+    def __getitem__(self, batch_id: str) -> Any:
+        return self._execution_engine._get_batch_data(batch_id=batch_id)
+
+    def __iter__(self):
+        return iter(self._execution_engine._batch_data_dict)
+
+    def __len__(self) -> int:
+        return len(self._execution_engine._batch_data_dict)
+
+    def __contains__(self, batch_id) -> bool:
+        return batch_id in self._execution_engine._batch_data_dict
+
+
 class ExecutionEngine(ABC):
     recognized_batch_spec_defaults = set()
 
@@ -148,6 +194,11 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        metric_result_store: Optional[Union["MetricResultStore", dict]] = None,
+        max_lazy_batches_in_memory: Optional[int] = None,
+        batch_prefetch_count: int = 0,
+        max_batch_prefetch_workers: Optional[int] = None,
     ):
         self.name = name
         self._validator = validator
@@ -155,12 +206,39 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache = {}
+            # The metric_cache can be either a (custom) MetricCache instance or the keyword arguments of a MetricCache.
+            if metric_cache is None:
+                self._metric_cache = MetricCache()
+            elif isinstance(metric_cache, dict):
+                self._metric_cache = MetricCache(**metric_cache)
+            else:
+                self._metric_cache = metric_cache
         else:
             self._metric_cache = NoOpDict()
 
+        # The metric_result_store persists metric values across runs, keyed by the fingerprints of the batch data.
+        if isinstance(metric_result_store, dict):
+            # Imported here, so that the execution engine does not import the data context (and its stores) at
+            # module level.
+            from great_expectations.data_context.util import (
+                instantiate_class_from_config,
+            )
+
+            self._metric_result_store = instantiate_class_from_config(
+                config=metric_result_store,
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.data_context.store",
+                    "class_name": "MetricResultStore",
+                },
+            )
+        else:
+            self._metric_result_store = metric_result_store
+
+        self._batch_fingerprints: Dict[str, str] = {}
+        self._metric_result_store_misses: Set[MetricResultIdentifier] = set()
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
         batch_spec_defaults_keys = set(batch_spec_defaults.keys())
@@ -176,7 +254,26 @@ class ExecutionEngine(ABC):
             if key in self.recognized_batch_spec_defaults
         }
 
+        # The data of lazily loaded batches is None, until it is loaded (and after it is evicted).
         self._batch_data_dict = {}
+        self._loaded_batch_data_dict = LoadedBatchDataDict(execution_engine=self)
+        self._lazy_batch_data_loaders: Dict[
+            str, Callable[[], Tuple[Any, BatchMarkers]]
+        ] = {}
+        # Ids of the lazily loaded batches, whose data is in memory, from the least to the most recently accessed.
+        self._lazy_batch_data_ids_in_memory: Dict[str, None] = OrderedDict()
+        # Ids of the lazily loaded batches, whose data has been loaded at least once (and whose fingerprint is known).
+        self._fingerprinted_lazy_batch_data_ids: Set[str] = set()
+        if max_lazy_batches_in_memory is not None and max_lazy_batches_in_memory < 1:
+            raise ValueError("max_lazy_batches_in_memory must be at least 1.")
+        self._max_lazy_batches_in_memory = max_lazy_batches_in_memory
+        # Once the data of a lazily loaded batch is loaded, the data of the (batch_prefetch_count) lazily loaded batches
+        # following it, which are not in memory, is loaded in the background.
+        self._batch_loader = PrefetchingBatchLoader(
+            prefetch_count=batch_prefetch_count,
+            max_workers=max_batch_prefetch_workers,
+        )
+
         if batch_data_dict is None:
             batch_data_dict = {}
         self._active_batch_data_id = None
@@ -190,6 +287,12 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": metric_cache,
+            "metric_result_store": metric_result_store,
+            "max_lazy_batches_in_memory": max_lazy_batches_in_memory,
+            # Like the other Falsy values, 0 (the default, which disables prefetching) is left out.
+            "batch_prefetch_count": batch_prefetch_count or None,
+            "max_batch_prefetch_workers": max_batch_prefetch_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -217,7 +320,7 @@ class ExecutionEngine(ABC):
     @active_batch_data_id.setter
     def active_batch_data_id(self, batch_id):
         if batch_id in self.loaded_batch_data_dict.keys():
-            self._active_batch_data_id = batch_id
+            self._set_active_batch_data_id(batch_id=batch_id)
         else:
             raise ge_exceptions.ExecutionEngineError(
                 f"Unable to set active_batch_data_id to {batch_id}. The may data may not be loaded."
@@ -232,9 +335,9 @@ class ExecutionEngine(ABC):
             return self.loaded_batch_data_dict.get(self.active_batch_data_id)
 
     @property
-    def loaded_batch_data_dict(self):
-        """The current dictionary of batches."""
-        return self._batch_data_dict
+    def loaded_batch_data_dict(self) -> LoadedBatchDataDict:
+        """The current dictionary of batches (the data of lazily loaded batches is loaded upon access)."""
+        return self._loaded_batch_data_dict
 
     @property
     def loaded_batch_data_ids(self):
@@ -244,6 +347,40 @@ class ExecutionEngine(ABC):
     def config(self) -> dict:
         return self._config
 
+    @property
+    def metric_result_store(self) -> Optional["MetricResultStore"]:
+        return self._metric_result_store
+
+    @property
+    def batch_fingerprints(self) -> Dict[str, str]:
+        """The fingerprints of the data of the loaded batches (for the batches, whose data was fingerprinted)."""
+        return self._batch_fingerprints
+
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        """The cache of resolved metric values (None if caching is disabled)."""
+        if self._caching:
+            return self._metric_cache
+
+        return None
+
+    @property
+    def batch_loader(self) -> PrefetchingBatchLoader:
+        """The loader of the data of lazily loaded batches, which prefetches the data of the next batches."""
+        return self._batch_loader
+
+    def close(self) -> None:
+        """Stops the worker threads prefetching the data of lazily loaded batches (dropping the prefetched data)."""
+        self._batch_loader.shutdown()
+
+    def __del__(self):
+        # The batch loader is missing if __init__ failed before creating it.
+        batch_loader: Optional[PrefetchingBatchLoader] = getattr(
+            self, "_batch_loader", None
+        )
+        if batch_loader is not None:
+            batch_loader.shutdown()
+
     @property
     def dialect(self):
         return None
@@ -272,8 +409,166 @@ class ExecutionEngine(ABC):
         """
         Loads the specified batch_data into the execution engine
         """
+        batch_data = self._prepare_batch_data(batch_data=batch_data)
+        self._lazy_batch_data_loaders.pop(batch_id, None)
+        self._lazy_batch_data_ids_in_memory.pop(batch_id, None)
+        self._fingerprinted_lazy_batch_data_ids.discard(batch_id)
+        self._batch_loader.discard(batch_id=batch_id)
+
+        if (
+            self._caching
+            and batch_id in self._batch_data_dict
+            and self._batch_data_dict[batch_id] is not batch_data
+        ):
+            # The batch is reloaded with (possibly) different data, hence the metrics computed on it are stale.
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+
+        if self._batch_data_dict.get(batch_id) is not batch_data:
+            self._batch_fingerprints.pop(batch_id, None)
+
+        self._batch_data_dict[batch_id] = batch_data
+        self._set_active_batch_data_id(batch_id=batch_id)
+
+    def load_lazy_batch_data(
+        self,
+        batch_id: str,
+        batch_data_loader: Callable[[], Tuple[Any, BatchMarkers]],
+    ) -> None:
+        """
+        Loads the specified batch into the execution engine without loading its data, which batch_data_loader returns
+        (along with its batch_markers) when the data is first accessed (e.g., in order to compute a metric).
+
+        The data of lazily loaded batches can be evicted from memory (see evict_batch_data, and the
+        max_lazy_batches_in_memory argument of the ExecutionEngine), and is loaded again upon its next access.  Metrics
+        computed on an evicted batch remain cached, which assumes that the loaded data does not change.
+        """
+        if self._caching and batch_id in self._batch_data_dict:
+            # The batch is reloaded with (possibly) different data, hence the metrics computed on it are stale.
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+
+        self._batch_fingerprints.pop(batch_id, None)
+        self._lazy_batch_data_ids_in_memory.pop(batch_id, None)
+        self._fingerprinted_lazy_batch_data_ids.discard(batch_id)
+        self._batch_loader.discard(batch_id=batch_id)
+        self._lazy_batch_data_loaders[batch_id] = batch_data_loader
+        self._batch_data_dict[batch_id] = None
+        self._set_active_batch_data_id(batch_id=batch_id)
+
+    def evict_batch_data(self, batch_id: str) -> bool:
+        """
+        Releases the data of the specified lazily loaded batch from memory (the batch remains loaded, and its data is
+        loaded again upon its next access); returns False if the data of the batch cannot be evicted, because the batch
+        was not loaded lazily (or its data is not in memory).
+        """
+        if batch_id not in self._lazy_batch_data_ids_in_memory:
+            return False
+
+        del self._lazy_batch_data_ids_in_memory[batch_id]
+        self._batch_data_dict[batch_id] = None
+        return True
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Unloads the specified batch_data from the execution engine and discards the metrics cached for it
+        """
+        if batch_id not in self._batch_data_dict:
+            raise ge_exceptions.ExecutionEngineError(
+                f"Unable to unload batch_data with batch_id {batch_id}. The data may not be loaded."
+            )
+
+        previous_active_batch_data_id: Optional[str] = self.active_batch_data_id
+        del self._batch_data_dict[batch_id]
+        self._lazy_batch_data_loaders.pop(batch_id, None)
+        self._lazy_batch_data_ids_in_memory.pop(batch_id, None)
+        self._fingerprinted_lazy_batch_data_ids.discard(batch_id)
+        self._batch_loader.discard(batch_id=batch_id)
+        self._batch_fingerprints.pop(batch_id, None)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+        if self._caching:
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+            if self.active_batch_data_id != previous_active_batch_data_id:
+                self._metric_cache.invalidate_batch(batch_id=None)
+
+    def set_batch_fingerprint(self, batch_id: str, fingerprint: str) -> None:
+        """
+        Records the fingerprint of the data of a loaded batch, so that the values of the metrics computed on the batch
+        can be saved to (and reused from) the metric_result_store
+        """
+        if batch_id not in self._batch_data_dict:
+            raise ge_exceptions.ExecutionEngineError(
+                f"Unable to set the fingerprint of batch_data with batch_id {batch_id}. The data may not be loaded."
+            )
+
+        self._batch_fingerprints[batch_id] = fingerprint
+
+    def _prepare_batch_data(self, batch_data: Any) -> Any:
+        """Converts batch_data into the batch data type of the execution engine (if necessary)."""
+        return batch_data
+
+    def _get_batch_data(self, batch_id: str) -> Any:
+        if batch_id not in self._lazy_batch_data_loaders:
+            return self._batch_data_dict[batch_id]
+
+        if batch_id in self._lazy_batch_data_ids_in_memory:
+            self._lazy_batch_data_ids_in_memory.move_to_end(batch_id)
+            return self._batch_data_dict[batch_id]
+
+        batch_data: Any
+        batch_markers: BatchMarkers
+        batch_data, batch_markers = self._batch_loader.load(
+            batch_id=batch_id,
+            batch_data_loader=self._lazy_batch_data_loaders[batch_id],
+        )
+        batch_data = self._prepare_batch_data(batch_data=batch_data)
+        logger.debug(f"Loaded the data of lazily loaded batch {batch_id}.")
+        self._prefetch_lazy_batch_data(batch_id=batch_id)
+
         self._batch_data_dict[batch_id] = batch_data
+        if (
+            isinstance(batch_markers, BatchMarkers)
+            and batch_markers.data_fingerprint is not None
+        ):
+            self._batch_fingerprints[batch_id] = batch_markers.data_fingerprint
+        self._fingerprinted_lazy_batch_data_ids.add(batch_id)
+
+        self._lazy_batch_data_ids_in_memory[batch_id] = None
+        if self._max_lazy_batches_in_memory is not None:
+            while (
+                len(self._lazy_batch_data_ids_in_memory)
+                > self._max_lazy_batches_in_memory
+            ):
+                self.evict_batch_data(
+                    batch_id=next(iter(self._lazy_batch_data_ids_in_memory))
+                )
+
+        return batch_data
+
+    def _prefetch_lazy_batch_data(self, batch_id: str) -> None:
+        """
+        Prefetches the data of the lazily loaded batches following batch_id (in the order, in which the batches were
+        loaded), which is not in memory, since (multi-batch) workloads tend to access the batches in that order.
+        """
+        if self._batch_loader.prefetch_count == 0:
+            return
+
+        batch_ids: List[str] = list(self._batch_data_dict)
+        self._batch_loader.prefetch(
+            batch_data_loaders=(
+                (next_batch_id, self._lazy_batch_data_loaders[next_batch_id])
+                for next_batch_id in batch_ids[batch_ids.index(batch_id) + 1 :]
+                if next_batch_id in self._lazy_batch_data_loaders
+                and next_batch_id not in self._lazy_batch_data_ids_in_memory
+            )
+        )
+
+    def _set_active_batch_data_id(self, batch_id: str) -> None:
+        previous_active_batch_data_id: Optional[str] = self.active_batch_data_id
         self._active_batch_data_id = batch_id
+        if self._caching and batch_id != previous_active_batch_data_id:
+            # Metrics computed without specifying the batch_id refer to the active batch, which is about to change.
+            self._metric_cache.invalidate_batch(batch_id=None)
 
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
@@ -302,20 +597,42 @@ class ExecutionEngine(ABC):
         if metrics is None:
             metrics = {}
 
+        metrics_to_resolve = list(metrics_to_resolve)
+
         resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        batch_ids: Dict[Tuple[str, str, str], Optional[str]] = {}
+
+        # Metrics of unchanged batch data, which were computed in previous runs, need not be computed again.
+        stored_metrics: Dict[Tuple[str, str, str], Any] = self.load_metric_results(
+            metric_configurations=metrics_to_resolve
+        )
+        resolved_metrics.update(stored_metrics)
 
         metric_fn_bundle = []
         for metric_to_resolve in metrics_to_resolve:
+            batch_ids[
+                metric_to_resolve.id
+            ] = metric_to_resolve.metric_domain_kwargs.get("batch_id")
+            if metric_to_resolve.id in stored_metrics:
+                continue
+
             metric_dependencies = {}
             for k, v in metric_to_resolve.metric_dependencies.items():
                 if v.id in metrics:
                     metric_dependencies[k] = metrics[v.id]
-                elif self._caching and v.id in self._metric_cache:
-                    metric_dependencies[k] = self._metric_cache[v.id]
-                else:
-                    raise ge_exceptions.MetricError(
-                        message=f'Missing metric dependency: {str(k)} for metric "{metric_to_resolve.metric_name}".'
+                    continue
+
+                if self._caching:
+                    cached_value: Any = self._metric_cache.get(
+                        v.id, default=_MISSING_METRIC_VALUE
                     )
+                    if cached_value is not _MISSING_METRIC_VALUE:
+                        metric_dependencies[k] = cached_value
+                        continue
+
+                raise ge_exceptions.MetricError(
+                    message=f'Missing metric dependency: {str(k)} for metric "{metric_to_resolve.metric_name}".'
+                )
 
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
@@ -361,6 +678,18 @@ class ExecutionEngine(ABC):
                 MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
                 MetricPartialFunctionTypes.AGGREGATE_FN,
             ]:
+                if self._is_bundled_metric_fn(metric_fn=metric_fn):
+                    metric_fn_bundle.append(
+                        (
+                            metric_to_resolve,
+                            metric_fn,
+                            None,
+                            None,
+                            metric_provider_kwargs,
+                        )
+                    )
+                    continue
+
                 # NOTE: 20201026 - JPC - we could use the fact that these metric functions return functions rather
                 # than data to optimize compute in the future
                 try:
@@ -396,19 +725,142 @@ class ExecutionEngine(ABC):
             try:
                 new_resolved = self.resolve_metric_bundle(metric_fn_bundle)
                 resolved_metrics.update(new_resolved)
+            except ge_exceptions.MetricResolutionError:
+                # The execution engine has already attributed the failure to the affected metrics of the bundle.
+                raise
             except Exception as e:
                 raise ge_exceptions.MetricResolutionError(
                     message=str(e), failed_metrics=[x[0] for x in metric_fn_bundle]
                 )
+        self._save_metric_results(
+            metric_configurations=[
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id in resolved_metrics
+                and metric_to_resolve.id not in stored_metrics
+            ],
+            resolved_metrics=resolved_metrics,
+        )
+
         if self._caching:
-            self._metric_cache.update(resolved_metrics)
+            self._metric_cache.update(resolved_metrics, batch_ids=batch_ids)
 
         return resolved_metrics
 
+    def load_metric_results(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Loads the values of the given metrics, which were saved to the metric_result_store, when the metrics were
+        computed (in this or a previous run) on batch data with the same fingerprint.
+
+        Args:
+            metric_configurations: the metrics to look up
+
+        Returns:
+            A dictionary with the values of the metrics found in the metric_result_store
+        """
+        stored_metrics: Dict[Tuple[str, str, str], Any] = {}
+        if self._metric_result_store is None:
+            return stored_metrics
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            key: Optional[MetricResultIdentifier] = self._get_metric_result_key(
+                metric_configuration=metric_configuration
+            )
+            if key is None or key in self._metric_result_store_misses:
+                continue
+
+            try:
+                stored_metrics[metric_configuration.id] = self._metric_result_store.get(
+                    key=key
+                )
+            except ge_exceptions.InvalidKeyError:
+                self._metric_result_store_misses.add(key)
+            except Exception as e:
+                self._metric_result_store_misses.add(key)
+                logger.warning(
+                    f'Unable to load the value of metric "{metric_configuration.metric_name}" from the '
+                    f"metric_result_store: {str(e)}"
+                )
+
+        return stored_metrics
+
+    def _save_metric_results(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        if self._metric_result_store is None:
+            return
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            value: Any = resolved_metrics[metric_configuration.id]
+            if not self._metric_result_store.is_storable_value(value):
+                continue
+
+            key: Optional[MetricResultIdentifier] = self._get_metric_result_key(
+                metric_configuration=metric_configuration
+            )
+            if key is None:
+                continue
+
+            try:
+                self._metric_result_store.set(key=key, value=value)
+                self._metric_result_store_misses.discard(key)
+            except Exception as e:
+                logger.warning(
+                    f'Unable to save the value of metric "{metric_configuration.metric_name}" to the '
+                    f"metric_result_store: {str(e)}"
+                )
+
+    def _get_metric_result_key(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[MetricResultIdentifier]:
+        batch_id: Optional[str] = metric_configuration.metric_domain_kwargs.get(
+            "batch_id", self.active_batch_data_id
+        )
+        if (
+            batch_id in self._lazy_batch_data_loaders
+            and batch_id not in self._fingerprinted_lazy_batch_data_ids
+        ):
+            # The fingerprint of the data of a lazily loaded batch is only known once the data has been loaded.
+            self._get_batch_data(batch_id=batch_id)
+
+        batch_fingerprint: Optional[str] = self._batch_fingerprints.get(batch_id)
+        if batch_fingerprint is None:
+            return None
+
+        try:
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_configuration.metric_name, execution_engine=self
+            )
+        except ge_exceptions.MetricProviderError:
+            return None
+
+        if isinstance(
+            getattr(metric_fn, "metric_fn_type", None), MetricPartialFunctionTypes
+        ):
+            # Partial functions (and the intermediate data they produce) are computed in every run.
+            return None
+
+        return MetricResultIdentifier.from_metric_configuration(
+            batch_fingerprint=batch_fingerprint,
+            metric_configuration=metric_configuration,
+        )
+
     def resolve_metric_bundle(self, metric_fn_bundle):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
 
+    def _is_bundled_metric_fn(self, metric_fn: Callable) -> bool:
+        """Returns True if the given partial metric function is resolved by resolve_metric_bundle (along with the other
+        bundled metrics) rather than on its own. The compute domain and accessor domain kwargs of such entries of the
+        bundle are None, since computing them is left to the bundle.
+        """
+        return False
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
@@ -0,0 +1,196 @@
+import datetime
+import decimal
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCALAR_TYPES: Tuple[type, ...] = (
+    str,
+    bytes,
+    bool,
+    int,
+    float,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    np.generic,
+    type(None),
+)
+
+
+def is_scalar_metric_value(value: Any) -> bool:
+    """Returns True if the metric value is a scalar (or a list, tuple, set, or dictionary of scalars), i.e., a value
+    that holds no reference to the underlying data (such as a DataFrame, a Series, or a metric partial function).
+    """
+    if isinstance(value, SCALAR_TYPES):
+        return True
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(is_scalar_metric_value(element) for element in value)
+
+    if isinstance(value, dict):
+        return all(
+            is_scalar_metric_value(key) and is_scalar_metric_value(element)
+            for key, element in value.items()
+        )
+
+    return False
+
+
+class MetricCache:
+    """Bounded cache of resolved metric values, keyed by MetricConfiguration.id.
+
+    The cache evicts the least recently used metric values once it holds more than max_size of them, keeps track of
+    the batch on which every metric value was computed (so that the values of a batch can be invalidated once the batch
+    is reloaded or unloaded), and counts hits, misses, and evictions.
+
+    Args:
+        max_size: maximum number of metric values to keep (None for no limit)
+        scalar_values_only: if True, only scalar metric values are cached (intermediate values, such as metric
+            partial functions and Series, which keep the underlying data alive, are not)
+    """
+
+    def __init__(
+        self, max_size: Optional[int] = None, scalar_values_only: bool = False
+    ):
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size of MetricCache must be non-negative.")
+
+        self._max_size = max_size
+        self._scalar_values_only = scalar_values_only
+
+        self._values: OrderedDict = OrderedDict()
+        self._batch_ids: Dict[Tuple, Optional[str]] = {}
+        self._metric_ids_by_batch_id: Dict[Optional[str], Set[Tuple]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    @property
+    def scalar_values_only(self) -> bool:
+        return self._scalar_values_only
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        return {
+            "size": len(self._values),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, metric_id: Hashable) -> bool:
+        return metric_id in self._values
+
+    def __getitem__(self, metric_id: Tuple) -> Any:
+        return self._values[metric_id]
+
+    def __setitem__(self, metric_id: Tuple, value: Any) -> None:
+        self.set(metric_id=metric_id, value=value)
+
+    def get(self, metric_id: Tuple, default: Any = None) -> Any:
+        """Returns the cached value of the metric (marking it as the most recently used one), or default if the metric
+        value is not cached.
+        """
+        try:
+            value: Any = self._values[metric_id]
+        except KeyError:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._values.move_to_end(metric_id)
+        return value
+
+    def set(self, metric_id: Tuple, value: Any, batch_id: Optional[str] = None):
+        """Caches the value of the metric, computed on the batch with the given batch_id (None if the metric was
+        computed on the active batch without specifying the batch_id).
+        """
+        if self._scalar_values_only and not is_scalar_metric_value(value):
+            return
+
+        if self._max_size == 0:
+            return
+
+        self._remove(metric_id=metric_id)
+        self._values[metric_id] = value
+        self._batch_ids[metric_id] = batch_id
+        self._metric_ids_by_batch_id.setdefault(batch_id, set()).add(metric_id)
+
+        while self._max_size is not None and len(self._values) > self._max_size:
+            evicted_metric_id: Tuple = next(iter(self._values))
+            self._remove(metric_id=evicted_metric_id)
+            self._evictions += 1
+
+    def update(
+        self,
+        resolved_metrics: Dict[Tuple, Any],
+        batch_ids: Optional[Dict[Tuple, Optional[str]]] = None,
+    ) -> None:
+        """Caches the resolved metric values (batch_ids maps metric ids to the batch on which they were computed)."""
+        if batch_ids is None:
+            batch_ids = {}
+
+        metric_id: Tuple
+        value: Any
+        for metric_id, value in resolved_metrics.items():
+            self.set(
+                metric_id=metric_id, value=value, batch_id=batch_ids.get(metric_id)
+            )
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> int:
+        """Removes the values of all metrics computed on the batch with the given batch_id (use None for the metrics
+        computed on the active batch without specifying the batch_id) and returns their number.
+        """
+        metric_ids: Set[Tuple] = self._metric_ids_by_batch_id.pop(batch_id, set())
+        for metric_id in metric_ids:
+            self._values.pop(metric_id, None)
+            self._batch_ids.pop(metric_id, None)
+
+        if metric_ids:
+            logger.debug(
+                f"Invalidated {len(metric_ids)} cached metric values of batch_id {batch_id}."
+            )
+
+        return len(metric_ids)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._batch_ids.clear()
+        self._metric_ids_by_batch_id.clear()
+
+    def _remove(self, metric_id: Tuple) -> None:
+        if metric_id not in self._values:
+            return
+
+        del self._values[metric_id]
+        batch_id: Optional[str] = self._batch_ids.pop(metric_id)
+        metric_ids: Set[Tuple] = self._metric_ids_by_batch_id[batch_id]
+        metric_ids.discard(metric_id)
+        if not metric_ids:
+            del self._metric_ids_by_batch_id[batch_id]
@@ -1,17 +1,33 @@
 import copy
 import datetime
 import hashlib
+import json
 import logging
+import os
 import pickle
 import random
+import threading
 import warnings
+from collections import OrderedDict
 from functools import partial
-from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from io import BufferedReader, BytesIO, RawIOBase
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core import IDDict
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
@@ -21,10 +37,17 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
-from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
+from great_expectations.core.util import (
+    AzureUrl,
+    GCSUrl,
+    S3Url,
+    convert_to_json_serializable,
+    sniff_s3_compression,
+)
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +84,48 @@ except ImportError:
     )
 
 
-HASH_THRESHOLD = 1e9
+DEFAULT_FINGERPRINT_CHUNK_SIZE = 100000
+DEFAULT_FINGERPRINT_SAMPLE_SIZE = 10000
+
+DATA_FINGERPRINT_METHODS = {"data", "sample", "file_metadata"}
+
+# Maximum number of domain records (DataFrames filtered by a row_condition) and domain column values kept per engine.
+DOMAIN_RECORDS_CACHE_SIZE = 32
+
+# Reader methods, which read their input sequentially, so that cloud storage objects can be streamed to them (rather
+# than downloaded into memory before being parsed).  Other readers (e.g., read_parquet) need to seek in their input.
+STREAMABLE_READER_METHODS = {"read_csv", "read_table", "read_fwf"}
+# Compression methods, which can be decompressed sequentially (zip archives need to be seeked in).
+STREAMABLE_COMPRESSIONS = {None, "gzip", "bz2", "xz"}
+# Size of the chunks, in which cloud storage objects are streamed to the reader.
+STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class ChunkedStreamReader(RawIOBase):
+    """Read-only, non-seekable file object reading the bytes of an iterator of chunks (e.g., of the body of a cloud
+    storage object), so that the chunks can be parsed while they are downloaded.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._chunk: bytes = b""
+        self._offset: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._chunk):
+            self._chunk = next(self._chunks, None)
+            self._offset = 0
+            if self._chunk is None:
+                self._chunk = b""
+                return 0
+
+        size: int = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:size] = self._chunk[self._offset : self._offset + size]
+        self._offset += size
+        return size
 
 
 class PandasExecutionEngine(ExecutionEngine):
@@ -107,6 +171,29 @@ Notes:
         self.discard_subset_failing_expectations = kwargs.pop(
             "discard_subset_failing_expectations", False
         )
+        # The method used to compute the "pandas_data_fingerprint" batch marker:
+        #   "data" hashes the entire dataframe in chunks of data_fingerprint_chunk_size rows,
+        #   "sample" hashes (at most) data_fingerprint_sample_size evenly spaced rows of the dataframe, and
+        #   "file_metadata" hashes the batch_spec and the metadata of the file (path, size, and modification time,
+        #   or ETag, size, and modification time for S3 objects), falling back to "data" for in-memory data.
+        # None disables the fingerprint.
+        self.data_fingerprint_method: Optional[str] = kwargs.pop(
+            "data_fingerprint_method", "data"
+        )
+        if (
+            self.data_fingerprint_method is not None
+            and self.data_fingerprint_method not in DATA_FINGERPRINT_METHODS
+        ):
+            raise ge_exceptions.ExecutionEngineError(
+                f'Unrecognized data_fingerprint_method "{self.data_fingerprint_method}"; must be one of '
+                f"{sorted(DATA_FINGERPRINT_METHODS)} or None."
+            )
+        self.data_fingerprint_chunk_size: int = kwargs.pop(
+            "data_fingerprint_chunk_size", DEFAULT_FINGERPRINT_CHUNK_SIZE
+        )
+        self.data_fingerprint_sample_size: int = kwargs.pop(
+            "data_fingerprint_sample_size", DEFAULT_FINGERPRINT_SAMPLE_SIZE
+        )
         boto3_options: dict = kwargs.pop("boto3_options", {})
         azure_options: dict = kwargs.pop("azure_options", {})
         gcs_options: dict = kwargs.pop("gcs_options", {})
@@ -116,6 +203,11 @@ Notes:
         self._s3 = None
         self._azure = None
         self._gcs = None
+        # Batches may be loaded in (prefetching) worker threads, which must not instantiate the same client concurrently.
+        self._cloud_client_lock = threading.Lock()
+
+        # Domain records (and domain column values) shared by all metrics computed on the same domain of a batch.
+        self._domain_records_cache: OrderedDict = OrderedDict()
 
         super().__init__(*args, **kwargs)
 
@@ -127,6 +219,25 @@ Notes:
                 "gcs_options": gcs_options,
             }
         )
+        # Only the non-default data fingerprint options are part of the config.
+        data_fingerprint_config: dict = {
+            "data_fingerprint_method": (self.data_fingerprint_method, "data"),
+            "data_fingerprint_chunk_size": (
+                self.data_fingerprint_chunk_size,
+                DEFAULT_FINGERPRINT_CHUNK_SIZE,
+            ),
+            "data_fingerprint_sample_size": (
+                self.data_fingerprint_sample_size,
+                DEFAULT_FINGERPRINT_SAMPLE_SIZE,
+            ),
+        }
+        self._config.update(
+            {
+                key: value
+                for key, (value, default_value) in data_fingerprint_config.items()
+                if value != default_value
+            }
+        )
 
     def _instantiate_azure_client(self):
         azure_options = self.config.get("azure_options", {})
@@ -178,6 +289,33 @@ Notes:
         validator.expose_dataframe_methods = True
 
     def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+        batch_data = self._prepare_batch_data(batch_data=batch_data)
+        if self._batch_data_dict.get(batch_id) is not batch_data:
+            self._invalidate_domain_records_cache(batch_id=batch_id)
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    def load_lazy_batch_data(
+        self,
+        batch_id: str,
+        batch_data_loader: Callable[[], Tuple[Any, BatchMarkers]],
+    ) -> None:
+        self._invalidate_domain_records_cache(batch_id=batch_id)
+        super().load_lazy_batch_data(
+            batch_id=batch_id, batch_data_loader=batch_data_loader
+        )
+
+    def evict_batch_data(self, batch_id: str) -> bool:
+        evicted: bool = super().evict_batch_data(batch_id=batch_id)
+        if evicted:
+            # The cached domain records hold (parts of) the data of the batch.
+            self._invalidate_domain_records_cache(batch_id=batch_id)
+        return evicted
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        super().unload_batch_data(batch_id=batch_id)
+        self._invalidate_domain_records_cache(batch_id=batch_id)
+
+    def _prepare_batch_data(self, batch_data: Any) -> PandasBatchData:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
         elif isinstance(batch_data, PandasBatchData):
@@ -186,7 +324,7 @@ Notes:
             raise ge_exceptions.GreatExpectationsError(
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        return batch_data
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -200,6 +338,9 @@ Notes:
             }
         )
 
+        # Metadata of the file holding the data (if any), used by the "file_metadata" fingerprint method.
+        file_metadata: Optional[Dict[str, Any]] = None
+
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -220,8 +361,9 @@ Please check your config."""
             batch_spec.batch_data = "PandasDataFrame"
 
         elif isinstance(batch_spec, S3BatchSpec):
-            if self._s3 is None:
-                self._instantiate_s3_client()
+            with self._cloud_client_lock:
+                if self._s3 is None:
+                    self._instantiate_s3_client()
             # if we were not able to instantiate S3 client, then raise error
             if self._s3 is None:
                 raise ge_exceptions.ExecutionEngineError(
@@ -249,13 +391,27 @@ Please check your config."""
                 )
             )
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())
-            buf.seek(0)
+            if self._can_stream_to_reader(reader_fn, reader_options):
+                buf = BufferedReader(
+                    ChunkedStreamReader(
+                        s3_object["Body"].iter_chunks(chunk_size=STREAM_CHUNK_SIZE)
+                    ),
+                    buffer_size=STREAM_CHUNK_SIZE,
+                )
+            else:
+                buf = BytesIO(s3_object["Body"].read())
+                buf.seek(0)
             df = reader_fn(buf, **reader_options)
+            file_metadata = {
+                "etag": s3_object.get("ETag"),
+                "size": s3_object.get("ContentLength"),
+                "last_modified": s3_object.get("LastModified"),
+            }
 
         elif isinstance(batch_spec, AzureBatchSpec):
-            if self._azure is None:
-                self._instantiate_azure_client()
+            with self._cloud_client_lock:
+                if self._azure is None:
+                    self._instantiate_azure_client()
             # if we were not able to instantiate Azure client, then raise error
             if self._azure is None:
                 raise ge_exceptions.ExecutionEngineError(
@@ -275,13 +431,20 @@ Please check your config."""
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
-            buf = BytesIO(azure_object.readall())
-            buf.seek(0)
+            if self._can_stream_to_reader(reader_fn, reader_options):
+                buf = BufferedReader(
+                    ChunkedStreamReader(azure_object.chunks()),
+                    buffer_size=STREAM_CHUNK_SIZE,
+                )
+            else:
+                buf = BytesIO(azure_object.readall())
+                buf.seek(0)
             df = reader_fn(buf, **reader_options)
 
         elif isinstance(batch_spec, GCSBatchSpec):
-            if self._gcs is None:
-                self._instantiate_gcs_client()
+            with self._cloud_client_lock:
+                if self._gcs is None:
+                    self._instantiate_gcs_client()
             # if we were not able to instantiate GCS client, then raise error
             if self._gcs is None:
                 raise ge_exceptions.ExecutionEngineError(
@@ -303,8 +466,14 @@ Please check your config."""
                     f"""PandasExecutionEngine encountered the following error while trying to read data from GCS Bucket: {error}"""
                 )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
-            buf = BytesIO(gcs_blob.download_as_bytes())
-            buf.seek(0)
+            if self._can_stream_to_reader(reader_fn, reader_options) and hasattr(
+                gcs_blob, "open"
+            ):
+                # Blob.open (google-cloud-storage >= 1.38) downloads the blob in chunks, as the reader consumes them.
+                buf = gcs_blob.open("rb", chunk_size=STREAM_CHUNK_SIZE)
+            else:
+                buf = BytesIO(gcs_blob.download_as_bytes())
+                buf.seek(0)
             df = reader_fn(buf, **reader_options)
 
         elif isinstance(batch_spec, PathBatchSpec):
@@ -313,6 +482,16 @@ Please check your config."""
             path: str = batch_spec.path
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
+            if self.data_fingerprint_method == "file_metadata":
+                try:
+                    stat_result: os.stat_result = os.stat(path)
+                    file_metadata = {
+                        "size": stat_result.st_size,
+                        "mtime_ns": stat_result.st_mtime_ns,
+                    }
+                except (OSError, TypeError, ValueError):
+                    # E.g., the path is a URL or a directory read by the reader_fn; fingerprint the data instead.
+                    file_metadata = None
 
         else:
             raise ge_exceptions.BatchSpecError(
@@ -320,13 +499,62 @@ Please check your config."""
             )
 
         df = self._apply_splitting_and_sampling_methods(batch_spec, df)
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        fingerprint: Optional[str] = self._get_data_fingerprint(
+            batch_spec=batch_spec, df=df, file_metadata=file_metadata
+        )
+        if fingerprint is not None:
+            batch_markers["pandas_data_fingerprint"] = fingerprint
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
         return typed_batch_data, batch_markers
 
+    @staticmethod
+    def _can_stream_to_reader(reader_fn: Callable, reader_options: dict) -> bool:
+        """Whether or not reader_fn (as returned by _get_reader_fn) reads its input sequentially, given the reader_options,
+        so that a cloud storage object can be streamed to it, rather than being downloaded into memory first.
+        """
+        reader_method: Optional[str] = getattr(
+            getattr(reader_fn, "func", reader_fn), "__name__", None
+        )
+        if reader_method not in STREAMABLE_READER_METHODS:
+            return False
+
+        compression: Any = reader_options.get(
+            "compression", getattr(reader_fn, "keywords", {}).get("compression")
+        )
+        if isinstance(compression, dict):
+            compression = compression.get("method")
+        return compression in STREAMABLE_COMPRESSIONS
+
+    def _get_data_fingerprint(
+        self,
+        batch_spec: BatchSpec,
+        df: pd.DataFrame,
+        file_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        if self.data_fingerprint_method is None:
+            return None
+
+        if self.data_fingerprint_method == "file_metadata" and file_metadata:
+            try:
+                return hash_file_metadata(
+                    batch_spec=batch_spec, file_metadata=file_metadata
+                )
+            except TypeError as e:
+                # The batch_spec holds objects (e.g., in reader_options) that cannot be serialized; hash the data.
+                logger.debug(
+                    f"Unable to fingerprint the file metadata ({e}); fingerprinting the data instead."
+                )
+
+        sample_size: Optional[int] = None
+        if self.data_fingerprint_method == "sample":
+            sample_size = self.data_fingerprint_sample_size
+
+        return hash_pandas_dataframe(
+            df, chunk_size=self.data_fingerprint_chunk_size, sample_size=sample_size
+        )
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         if batch_spec.get("splitter_method"):
             splitter_fn = getattr(self, batch_spec.get("splitter_method"))
@@ -445,6 +673,7 @@ Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ge_exceptions.ValidationError(
@@ -470,8 +699,14 @@ Please check your config."""
                     " and must be 'python' or 'pandas'"
                 )
             else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+                # Querying row condition (once per batch, row_condition, and condition_parser)
+                data = self._get_cached_domain_data(
+                    key=(batch_id, "records", row_condition, condition_parser),
+                    source=data,
+                    compute_fn=partial(
+                        data.query, row_condition, parser=condition_parser
+                    ),
+                )
 
         if "column" in domain_kwargs:
             return data
@@ -541,6 +776,78 @@ Please check your config."""
 
         return data
 
+    def get_domain_column_values(
+        self,
+        domain_kwargs: dict,
+        column_name: str,
+        filter_column_isnull: bool = False,
+    ) -> pd.Series:
+        """
+        Returns the values of the column within the domain records (see get_domain_records), excluding the null values
+        if filter_column_isnull is True. The values are computed once per batch and domain, and then shared by all of
+        the metrics (of all expectations) computed on the same column and domain.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the domain kwargs specifying which data to obtain
+            column_name (str) - The name of the column
+            filter_column_isnull (bool) - Whether the null values of the column should be excluded
+
+        Returns:
+            A Series (the column values on which to compute)
+        """
+        data: pd.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        def get_column_values() -> pd.Series:
+            column_values: pd.Series = data[column_name]
+            if filter_column_isnull:
+                column_values = column_values[column_values.notnull()]
+
+            return column_values
+
+        return self._get_cached_domain_data(
+            key=(
+                domain_kwargs.get("batch_id") or self.active_batch_data_id,
+                "column_values",
+                domain_kwargs.get("row_condition"),
+                domain_kwargs.get("condition_parser"),
+                column_name,
+                filter_column_isnull,
+            ),
+            source=data,
+            compute_fn=get_column_values,
+        )
+
+    def _get_cached_domain_data(
+        self, key: Tuple, source: pd.DataFrame, compute_fn: Callable[[], Any]
+    ) -> Any:
+        """Returns the cached value of key computed from the source DataFrame, computing (and caching) it if needed.
+
+        Cached values computed from a different source DataFrame (i.e., before the batch was reloaded) are stale.
+        """
+        if not self._caching:
+            return compute_fn()
+
+        cached_entry: Optional[
+            Tuple[pd.DataFrame, Any]
+        ] = self._domain_records_cache.get(key)
+        if cached_entry is not None and cached_entry[0] is source:
+            self._domain_records_cache.move_to_end(key)
+            return cached_entry[1]
+
+        value: Any = compute_fn()
+        self._domain_records_cache[key] = (source, value)
+        self._domain_records_cache.move_to_end(key)
+        while len(self._domain_records_cache) > DOMAIN_RECORDS_CACHE_SIZE:
+            self._domain_records_cache.popitem(last=False)
+
+        return value
+
+    def _invalidate_domain_records_cache(self, batch_id: Optional[str]) -> None:
+        key: Tuple
+        for key in list(self._domain_records_cache.keys()):
+            if key[0] == batch_id:
+                del self._domain_records_cache[key]
+
     def get_compute_domain(
         self,
         domain_kwargs: dict,
@@ -651,6 +958,117 @@ Please check your config."""
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[
+            Tuple[MetricConfiguration, Callable, Optional[dict], Optional[dict], dict]
+        ],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """
+        Evaluates the conditions of column map metrics (see column_condition_partial) column by column: the compute
+        domain and the values of every column are obtained once, and then passed to the conditions of all metrics
+        computed on the column (e.g., of all expectations of a suite on the column), rather than once per metric.
+
+        Args:
+            metric_fn_bundle: the metrics to resolve, along with their partial metric functions and the keyword
+                arguments of their metric provider functions
+
+        Returns:
+            A dictionary mapping the ids of the metrics to their unexpected condition series, along with their compute
+            and accessor domain kwargs (as returned by the partial metric functions)
+        """
+        column_conditions_by_domain: Dict[
+            Tuple[str, bool], List[Tuple[MetricConfiguration, Callable, dict]]
+        ] = {}
+        metric_to_resolve: MetricConfiguration
+        metric_fn: Callable
+        metric_provider_kwargs: dict
+        for (
+            metric_to_resolve,
+            metric_fn,
+            _,
+            _,
+            metric_provider_kwargs,
+        ) in metric_fn_bundle:
+            filter_column_isnull: bool = metric_fn.metric_definition_kwargs.get(
+                "filter_column_isnull",
+                getattr(metric_provider_kwargs["cls"], "filter_column_isnull", True),
+            )
+            column_conditions_by_domain.setdefault(
+                (
+                    IDDict(metric_to_resolve.metric_domain_kwargs).to_id(),
+                    filter_column_isnull,
+                ),
+                [],
+            ).append((metric_to_resolve, metric_fn, metric_provider_kwargs))
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        for (
+            _,
+            filter_column_isnull,
+        ), column_conditions in column_conditions_by_domain.items():
+            metric_provider_kwargs = column_conditions[0][2]
+            try:
+                (
+                    _,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                ) = self.get_compute_domain(
+                    domain_kwargs=metric_provider_kwargs["metric_domain_kwargs"],
+                    domain_type=MetricDomainTypes.COLUMN,
+                )
+                column_name: str = accessor_domain_kwargs["column"]
+                if (
+                    column_name
+                    not in metric_provider_kwargs["metrics"]["table.columns"]
+                ):
+                    raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                        message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                    )
+
+                column_values: pd.Series = self.get_domain_column_values(
+                    domain_kwargs=compute_domain_kwargs,
+                    column_name=column_name,
+                    filter_column_isnull=filter_column_isnull,
+                )
+            except Exception as e:
+                raise ge_exceptions.MetricResolutionError(
+                    message=str(e),
+                    failed_metrics=[
+                        column_condition[0] for column_condition in column_conditions
+                    ],
+                )
+
+            for (
+                metric_to_resolve,
+                metric_fn,
+                metric_provider_kwargs,
+            ) in column_conditions:
+                try:
+                    meets_expectation_series: pd.Series = (
+                        metric_fn.column_condition_metric_fn(
+                            metric_provider_kwargs["cls"],
+                            column_values,
+                            **metric_provider_kwargs["metric_value_kwargs"],
+                            _metrics=metric_provider_kwargs["metrics"],
+                        )
+                    )
+                except Exception as e:
+                    raise ge_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric_to_resolve,)
+                    )
+
+                resolved_metrics[metric_to_resolve.id] = (
+                    ~meets_expectation_series,
+                    dict(compute_domain_kwargs),
+                    dict(accessor_domain_kwargs),
+                )
+
+        return resolved_metrics
+
+    def _is_bundled_metric_fn(self, metric_fn: Callable) -> bool:
+        return getattr(metric_fn, "column_condition_metric_fn", None) is not None
+
     ### Splitter methods for partitioning dataframes ###
     @staticmethod
     def _split_on_whole_table(
@@ -797,11 +1215,107 @@ Please check your config."""
         return df[matches]
 
 
-def hash_pandas_dataframe(df):
+def hash_pandas_dataframe(
+    df: pd.DataFrame,
+    chunk_size: int = DEFAULT_FINGERPRINT_CHUNK_SIZE,
+    sample_size: Optional[int] = None,
+) -> str:
+    """Computes the md5 fingerprint of the dataframe incrementally, chunk_size rows at a time, so that the memory needed
+    does not grow with the size of the dataframe.
+
+    The shape, columns, and dtypes of the dataframe are hashed first, since the row hashes of pd.util.hash_pandas_object
+    do not depend on them (e.g., swapping the names of two columns holding the same type of data does not change them).
+    Since the row hashes do not depend on the other rows, the fingerprint does not depend on chunk_size. Dataframes
+    holding unhashable objects (like dict) are hashed column by column instead, pickling every value of the columns
+    holding unhashable values one at a time.
+
+    If sample_size is given, only (at most) sample_size evenly spaced rows are hashed; such a fingerprint is cheap, but
+    does not detect every change to the data.
+    """
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    hash_object = hashlib.md5()
+    hash_object.update(
+        json.dumps(
+            {
+                "shape": list(df.shape),
+                "columns": [str(column) for column in df.columns],
+                "dtypes": [str(dtype) for dtype in df.dtypes],
+            }
+        ).encode("utf-8")
+    )
+
+    if sample_size is not None:
+        if len(df) > sample_size:
+            positions: np.ndarray = np.unique(
+                np.linspace(0, len(df) - 1, num=max(sample_size, 0)).astype(np.int64)
+            )
+            df = df.iloc[positions]
+
+    hash_object_before_data = hash_object.copy()
+
     try:
-        obj = pd.util.hash_pandas_object(df, index=True).values
+        start: int
+        for start in range(0, len(df), chunk_size):
+            hash_object.update(
+                pd.util.hash_pandas_object(
+                    df.iloc[start : start + chunk_size], index=True
+                ).values
+            )
     except TypeError:
-        # In case of facing unhashable objects (like dict), use pickle
-        obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+        # In case of facing unhashable objects (like dict), start over, hashing the dataframe column by column.
+        hash_object = _hash_column_by_column(
+            hash_object=hash_object_before_data, df=df, chunk_size=chunk_size
+        )
+
+    return hash_object.hexdigest()
 
-    return hashlib.md5(obj).hexdigest()
+
+def _hash_column_by_column(hash_object, df: pd.DataFrame, chunk_size: int):
+    start: int
+    for start in range(0, len(df), chunk_size):
+        hash_object.update(
+            pd.util.hash_pandas_object(df.index[start : start + chunk_size]).values
+        )
+
+    column_index: int
+    for column_index in range(df.shape[1]):
+        column: pd.Series = df.iloc[:, column_index]
+        column_hash_object = hash_object.copy()
+        try:
+            for start in range(0, len(df), chunk_size):
+                column_hash_object.update(
+                    pd.util.hash_pandas_object(
+                        column.iloc[start : start + chunk_size], index=False
+                    ).values
+                )
+        except TypeError:
+            # Pickle every value of the column (rather than the values of the failing chunks only), so that the
+            # fingerprint does not depend on chunk_size.
+            column_hash_object = hash_object.copy()
+            value: Any
+            for value in column:
+                column_hash_object.update(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+        hash_object = column_hash_object
+
+    return hash_object
+
+
+def hash_file_metadata(batch_spec: BatchSpec, file_metadata: Dict[str, Any]) -> str:
+    """Computes the md5 fingerprint of a batch read from a file, based on the batch_spec (path, reader_method,
+    reader_options, splitting and sampling directives) and the metadata of the file (e.g., size, modification time,
+    ETag), without reading the data.
+    """
+    fingerprint_source: dict = convert_to_json_serializable(
+        {
+            "batch_spec": {
+                key: value for key, value in batch_spec.items() if key != "batch_data"
+            },
+            "file_metadata": file_metadata,
+        }
+    )
+    return hashlib.md5(
+        json.dumps(fingerprint_source, sort_keys=True).encode("utf-8")
+    ).hexdigest()
@@ -194,7 +194,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return self.active_batch_data.dataframe
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def _prepare_batch_data(self, batch_data: Any) -> SparkDFBatchData:
         if isinstance(batch_data, DataFrame):
             batch_data = SparkDFBatchData(self, batch_data)
         elif isinstance(batch_data, SparkDFBatchData):
@@ -203,7 +203,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
             raise GreatExpectationsError(
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        return batch_data
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from great_expectations.execution_engine.execution_engine import BatchData
 from great_expectations.util import generate_temporary_table_name
@@ -100,6 +101,7 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._temp_table_name = None
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -155,6 +157,7 @@ class SqlAlchemyBatchData(BatchData):
                 query=query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            self._temp_table_name = generated_table_name
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -191,6 +194,11 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def temp_table_name(self) -> Optional[str]:
+        """The name of the temporary table created for this batch (None if no temporary table was created)."""
+        return self._temp_table_name
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ):
@@ -4,7 +4,7 @@ import logging
 import traceback
 import warnings
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from great_expectations._version import get_versions  # isort:skip
 
@@ -13,6 +13,7 @@ del get_versions  # isort:skip
 
 
 from great_expectations.core import IDDict
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
@@ -26,12 +27,17 @@ from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidBatchSpecError,
     InvalidConfigError,
+    MetricResolutionError,
 )
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.util import (
+    get_sqlalchemy_conditional_aggregate,
+)
 from great_expectations.expectations.row_conditions import parse_condition_to_sqlalchemy
 from great_expectations.util import (
     filter_properties_dict,
@@ -42,6 +48,9 @@ from great_expectations.util import (
 )
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
+if TYPE_CHECKING:
+    from great_expectations.data_context.store.metric_store import MetricResultStore
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -192,6 +201,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        fuse_row_condition_domains: bool = False,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        metric_result_store: Optional[Union["MetricResultStore", dict]] = None,
+        max_lazy_batches_in_memory: Optional[int] = None,
+        batch_prefetch_count: int = 0,
+        max_batch_prefetch_workers: Optional[int] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -218,15 +233,53 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
-                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.  If \
+                    concurrency is enabled and the engine is backed by a connection pool, the queries for the \
+                    different compute domains of a metric bundle are executed concurrently (with at most \
+                    concurrency.max_database_query_concurrency queries in flight).  If not provided, the concurrency \
+                    config of the data_context is used.
+                fuse_row_condition_domains (bool): If True, the metrics of compute domains that differ only by \
+                    their row_condition are computed in a single query (as conditional aggregates over the common \
+                    domain), scanning the batch once instead of once per row_condition.  Defaults to False (one \
+                    query per compute domain).
+                metric_cache (MetricCache or dict): The cache of resolved metric values (or the keyword arguments of \
+                    a MetricCache, such as max_size and scalar_values_only).  By default, an unbounded MetricCache \
+                    is used.
+                metric_result_store (MetricResultStore or dict): The store (or the configuration of the store), to \
+                    which the values of metrics computed on fingerprinted batches are saved, so that they can be \
+                    reused across runs.
+                max_lazy_batches_in_memory (int): The maximum number of lazily loaded batches (see \
+                    load_lazy_batch_data), whose data is kept at once; the data of the least recently accessed ones \
+                    is evicted first.  By default, the data of all loaded batches is kept.
+                batch_prefetch_count (int): The maximum number of lazily loaded batches, whose data is loaded in the \
+                    background (while the preceding batch is being validated); 0 (the default) disables prefetching.
+                max_batch_prefetch_workers (int): The maximum number of threads prefetching batch data (defaults to \
+                    batch_prefetch_count).
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache=metric_cache,
+            metric_result_store=metric_result_store,
+            max_lazy_batches_in_memory=max_lazy_batches_in_memory,
+            batch_prefetch_count=batch_prefetch_count,
+            max_batch_prefetch_workers=max_batch_prefetch_workers,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._fuse_row_condition_domains = fuse_row_condition_domains
+
+        if concurrency is None:
+            if data_context is None or data_context.concurrency is None:
+                concurrency = ConcurrencyConfig()
+            else:
+                concurrency = data_context.concurrency
+
+        self._concurrency = concurrency
 
         if engine is not None:
             if credentials is not None:
@@ -236,12 +289,6 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            concurrency: ConcurrencyConfig
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
             concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             if credentials is not None:
@@ -336,6 +383,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache": metric_cache,
+            "metric_result_store": metric_result_store,
+            "max_lazy_batches_in_memory": max_lazy_batches_in_memory,
+            # Like the other Falsy values, 0 (the default, which disables prefetching) is left out.
+            "batch_prefetch_count": batch_prefetch_count or None,
+            "max_batch_prefetch_workers": max_batch_prefetch_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -789,55 +842,254 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             if domain_id not in queries:
                 queries[domain_id] = {
                     "select": [],
+                    "engine_fns": [],
                     "ids": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
             queries[domain_id]["select"].append(
                 engine_fn.label(metric_to_resolve.metric_name)
             )
+            queries[domain_id]["engine_fns"].append(engine_fn)
             queries[domain_id]["ids"].append(metric_to_resolve.id)
-        for query in queries.values():
-            domain_kwargs = query["domain_kwargs"]
-            selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs,
-            )
-            assert len(query["select"]) == len(query["ids"])
+            queries[domain_id]["metric_configurations"].append(metric_to_resolve)
+
+        if self._fuse_row_condition_domains:
+            queries = self._fuse_queries_on_row_condition_domains(queries=queries)
+
+        execute_concurrently: bool = len(
+            queries
+        ) > 1 and self._can_execute_queries_concurrently(
+            domain_kwargs_list=[query["domain_kwargs"] for query in queries.values()]
+        )
+        with AsyncExecutor(
+            concurrency_config=self._concurrency,
+            max_workers=len(queries) if execute_concurrently else 1,
+        ) as executor:
+            # When executing sequentially, the first failing query raises an exception right away (in "submit()").
+            async_results: Dict[Tuple, AsyncResult] = {
+                domain_id: executor.submit(self._execute_bundled_query, query=query)
+                for domain_id, query in queries.items()
+            }
+
+        failed_queries: List[dict] = []
+        exception_messages: List[str] = []
+        for domain_id, async_result in async_results.items():
+            query = queries[domain_id]
             try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if TextClause and isinstance(selectable, TextClause):
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(
-                            selectable.columns().subquery()
+                resolved_metrics.update(async_result.result())
+            except MetricResolutionError as e:
+                failed_queries.append(query)
+                exception_messages.append(str(e))
+
+        if failed_queries:
+            raise MetricResolutionError(
+                message="  ".join(exception_messages),
+                failed_metrics=[
+                    metric_configuration
+                    for query in failed_queries
+                    for metric_configuration in query["metric_configurations"]
+                ],
+            )
+
+        return resolved_metrics
+
+    def _fuse_queries_on_row_condition_domains(
+        self, queries: Dict[Tuple, dict]
+    ) -> Dict[Tuple, dict]:
+        """Folds the queries of compute domains, which differ only by their row_condition, into a single query over the
+        common (unconditioned) domain, so that the batch is scanned once instead of once per row_condition.
+
+        Every aggregate of a conditioned domain is rewritten into its conditional form (e.g., "SUM(CASE WHEN
+        <row_condition> THEN ... END)"), which is computed over all rows of the common domain.  Domains having
+        aggregates that cannot be rewritten safely (or using a condition_parser other than the great_expectations one)
+        are left to their own queries.
+        """
+        fusable_queries: Dict[Tuple, List[dict]] = {}
+        fused_queries: Dict[Tuple, dict] = {}
+
+        domain_id: Tuple
+        query: dict
+        for domain_id, query in queries.items():
+            domain_kwargs: IDDict = query["domain_kwargs"]
+            condition: Optional[Any] = None
+            if domain_kwargs.get("row_condition") is not None:
+                if (
+                    domain_kwargs.get("condition_parser")
+                    != "great_expectations__experimental__"
+                ):
+                    fused_queries[domain_id] = query
+                    continue
+
+                condition = parse_condition_to_sqlalchemy(
+                    domain_kwargs["row_condition"]
+                )
+
+            conditional_engine_fns: List[Any] = [
+                get_sqlalchemy_conditional_aggregate(
+                    aggregate=engine_fn, condition=condition
+                )
+                for engine_fn in query["engine_fns"]
+            ]
+            if any(engine_fn is None for engine_fn in conditional_engine_fns):
+                fused_queries[domain_id] = query
+                continue
+
+            unconditioned_domain_kwargs: IDDict = IDDict(
+                {
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key not in ["row_condition", "condition_parser"]
+                }
+            )
+            fusable_queries.setdefault(unconditioned_domain_kwargs.to_id(), []).append(
+                dict(
+                    query,
+                    select=[
+                        engine_fn.label(metric_configuration.metric_name)
+                        for engine_fn, metric_configuration in zip(
+                            conditional_engine_fns, query["metric_configurations"]
                         )
-                    ).fetchall()
-                else:
-                    res = self.engine.execute(
-                        sa.select(query["select"]).select_from(selectable)
-                    ).fetchall()
+                    ],
+                    domain_kwargs=unconditioned_domain_kwargs,
+                    original_query=query,
+                )
+            )
+
+        unconditioned_domain_id: Tuple
+        conditional_queries: List[dict]
+        for unconditioned_domain_id, conditional_queries in fusable_queries.items():
+            if len(conditional_queries) == 1:
+                query = conditional_queries[0]["original_query"]
+                fused_queries[query["domain_kwargs"].to_id()] = query
+                continue
+
+            fused_queries[unconditioned_domain_id] = {
+                "select": [
+                    labeled_engine_fn
+                    for query in conditional_queries
+                    for labeled_engine_fn in query["select"]
+                ],
+                "ids": [id for query in conditional_queries for id in query["ids"]],
+                "metric_configurations": [
+                    metric_configuration
+                    for query in conditional_queries
+                    for metric_configuration in query["metric_configurations"]
+                ],
+                "domain_kwargs": conditional_queries[0]["domain_kwargs"],
+                "fused_queries": [
+                    query["original_query"] for query in conditional_queries
+                ],
+            }
+
+        return fused_queries
+
+    def _execute_bundled_query(self, query: dict) -> Dict[Tuple, Any]:
+        """Executes the bundled query of a single compute domain and returns the resolved metrics.
+
+        Any exception is attributed to the metrics of this compute domain only, by raising MetricResolutionError for
+        them (so that the metrics computed on other compute domains are not affected by the failure).  If a query fused
+        from several compute domains fails, the original queries are executed one by one to attribute the failure.
+        """
+        domain_kwargs: IDDict = query["domain_kwargs"]
+        selectable: Selectable = self.get_domain_records(
+            domain_kwargs=domain_kwargs,
+        )
+        assert len(query["select"]) == len(query["ids"])
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if TextClause and isinstance(selectable, TextClause):
+            statement = sa.select(query["select"]).select_from(
+                selectable.columns().subquery()
+            )
+        else:
+            statement = sa.select(query["select"]).select_from(selectable)
+
+        try:
+            res = self.engine.execute(statement).fetchall()
+            logger.debug(
+                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {domain_kwargs.to_id()}"
+            )
+        except Exception as e:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{str(e)}".  Traceback: "{exception_traceback}".'
+            )
+            if "fused_queries" in query:
                 logger.debug(
-                    f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
+                    f"{exception_message}  Executing the queries fused into it one by one."
                 )
-            except OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+                return self._execute_fused_queries(queries=query["fused_queries"])
+
+            logger.error(exception_message)
+            raise MetricResolutionError(
+                message=exception_message,
+                failed_metrics=query["metric_configurations"],
+            )
+
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(query["ids"]) == len(res[0]), "unexpected number of metrics returned"
+        return {
+            id: convert_to_json_serializable(res[0][idx])
+            for idx, id in enumerate(query["ids"])
+        }
+
+    def _execute_fused_queries(self, queries: List[dict]) -> Dict[Tuple, Any]:
+        resolved_metrics: Dict[Tuple, Any] = {}
+        failed_metrics: List[MetricConfiguration] = []
+        exception_messages: List[str] = []
+
+        query: dict
+        for query in queries:
+            try:
+                resolved_metrics.update(self._execute_bundled_query(query=query))
+            except MetricResolutionError as e:
+                failed_metrics.extend(e.failed_metrics)
+                exception_messages.append(str(e))
+
+        if failed_metrics:
+            raise MetricResolutionError(
+                message="  ".join(exception_messages),
+                failed_metrics=failed_metrics,
+            )
 
         return resolved_metrics
 
+    def _can_execute_queries_concurrently(self, domain_kwargs_list: List[dict]) -> bool:
+        """Queries can only be issued concurrently when the engine hands out pooled connections (rather than being a
+        single pinned Connection) and when none of the batches involved lives in a session-scoped temporary table.
+        """
+        if not self._concurrency.enabled:
+            return False
+
+        if self._engine_backup is not None or not isinstance(
+            self.engine, sa.engine.Engine
+        ):
+            return False
+
+        if self.engine.dialect.name.lower() in ["bigquery", "dremio"]:
+            # The "temporary" tables created for these dialects are persistent tables, visible to all connections.
+            return True
+
+        domain_kwargs: dict
+        for domain_kwargs in domain_kwargs_list:
+            batch_id: Optional[str] = domain_kwargs.get("batch_id")
+            batch_data: Optional[SqlAlchemyBatchData] = (
+                self.active_batch_data
+                if batch_id is None
+                else self.loaded_batch_data_dict.get(batch_id)
+            )
+            if getattr(batch_data, "temp_table_name", None) is not None:
+                return False
+
+        return True
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -856,6 +1108,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
+        super().close()
         if self._engine_backup:
             self.engine.close()
             self._engine_backup.dispose()
@@ -1,6 +1,6 @@
 # Utility methods for dealing with Dataset objects
 import logging
-from typing import Any, List
+from typing import Any, List, Optional
 
 import numpy as np
 
@@ -10,8 +10,12 @@ logger = logging.getLogger(__name__)
 
 try:
     import sqlalchemy
+    from sqlalchemy.sql import expression, operators
+    from sqlalchemy.sql.functions import FunctionElement
+    from sqlalchemy.sql.visitors import replacement_traverse
 except ImportError:
     logger.debug("Unable to load SqlAlchemy or one of its subclasses.")
+    sqlalchemy = None
 
 
 def is_valid_partition_object(partition_object):
@@ -515,3 +519,108 @@ def check_sql_engine_dialect(
         return isinstance(actual_sql_engine_dialect, candidate_sql_engine_dialect)
     except (AttributeError, TypeError):
         return False
+
+
+# Aggregate functions, which skip NULL values and can therefore be restricted to a subset of the rows by replacing the
+# values outside of that subset with NULL (using "CASE WHEN <condition> THEN <value> END").
+SQL_NULL_IGNORING_AGGREGATE_FUNCTION_NAMES = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "stdev",
+    "sum",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+
+
+def get_sqlalchemy_conditional_aggregate(
+    aggregate: Any, condition: Optional[Any] = None
+) -> Optional[Any]:
+    """Rewrites a SQL aggregate expression so that, computed over all rows of a selectable, it yields the value that
+    the original expression yields over only the rows that satisfy the condition (i.e., as if the condition had been
+    applied in a WHERE clause).
+
+    Every argument of the NULL-ignoring aggregate functions is wrapped in "CASE WHEN <condition> THEN <argument> END"
+    (the portable equivalent of "FILTER (WHERE <condition>)").  If the expression references data outside of such
+    aggregate functions (e.g., through other aggregate or window functions, subqueries, or textual SQL), it cannot be
+    rewritten safely, and None is returned.
+
+    Args:
+        aggregate: SqlAlchemy aggregate expression
+        condition: SqlAlchemy boolean expression (if None, the aggregate is returned unchanged)
+
+    Returns:
+        The conditional aggregate expression, or None if the expression cannot be rewritten
+    """
+    if condition is None:
+        return aggregate
+
+    is_rewritable: bool = True
+
+    def _replace(element: Any) -> Optional[Any]:
+        nonlocal is_rewritable
+
+        if (
+            isinstance(element, FunctionElement)
+            and getattr(element, "name", "").lower()
+            in SQL_NULL_IGNORING_AGGREGATE_FUNCTION_NAMES
+        ):
+            return _get_sqlalchemy_conditional_aggregate_function(
+                aggregate_function=element, condition=condition
+            )
+
+        if isinstance(
+            element,
+            (
+                expression.ColumnClause,
+                expression.TextClause,
+                expression.Over,
+                expression.WithinGroup,
+                expression.FunctionFilter,
+                expression.SelectBase,
+            ),
+        ):
+            is_rewritable = False
+
+        return None
+
+    conditional_aggregate: Any = replacement_traverse(aggregate, {}, _replace)
+    if not is_rewritable:
+        return None
+
+    return conditional_aggregate
+
+
+def _get_sqlalchemy_conditional_aggregate_function(
+    aggregate_function: "FunctionElement", condition: Any
+) -> "FunctionElement":
+    arguments: list = []
+    for argument in aggregate_function.clauses.clauses:
+        if (
+            isinstance(argument, expression.UnaryExpression)
+            and argument.operator is operators.distinct_op
+        ):
+            argument = sqlalchemy.distinct(
+                sqlalchemy.case([(condition, argument.element)])
+            )
+        elif (
+            isinstance(argument, expression.ColumnClause)
+            and argument.is_literal
+            and argument.name == "*"
+        ):
+            # "COUNT(*)" counts the rows satisfying the condition as "COUNT(CASE WHEN <condition> THEN 1 END)".
+            argument = sqlalchemy.case([(condition, sqlalchemy.literal_column("1"))])
+        else:
+            argument = sqlalchemy.case([(condition, argument)])
+
+        arguments.append(argument)
+
+    return getattr(sqlalchemy.func, aggregate_function.name)(
+        *arguments, type_=aggregate_function.type
+    )
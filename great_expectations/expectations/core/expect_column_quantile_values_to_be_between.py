@@ -18,6 +18,7 @@ from great_expectations.render.util import (
     parse_row_condition_string_pandas_engine,
     substitute_none_for_missing,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
@@ -623,9 +624,17 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             configuration, execution_engine, runtime_configuration
         )
         # column.quantile_values expects a "quantiles" key
-        all_dependencies["metrics"]["column.quantile_values"].metric_value_kwargs[
-            "quantiles"
-        ] = configuration.kwargs["quantile_ranges"]["quantiles"]
+        metric_configuration: MetricConfiguration = all_dependencies["metrics"][
+            "column.quantile_values"
+        ]
+        all_dependencies["metrics"]["column.quantile_values"] = MetricConfiguration(
+            metric_name=metric_configuration.metric_name,
+            metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+            metric_value_kwargs={
+                **metric_configuration.metric_value_kwargs,
+                "quantiles": configuration.kwargs["quantile_ranges"]["quantiles"],
+            },
+        )
         return all_dependencies
 
     def _validate(
@@ -17,6 +17,7 @@ from great_expectations.expectations.expectation import (
     ColumnMapExpectation,
     TableExpectation,
 )
+from great_expectations.expectations.metrics.util import _native_type_type_map
 from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.expectations.util import render_evaluation_parameter_string
 from great_expectations.render.renderer.renderer import renderer
@@ -561,27 +562,3 @@ def _get_dialect_type_module(
         pass
 
     return execution_engine.dialect_module
-
-
-def _native_type_type_map(type_):
-    # We allow native python types in cases where the underlying type is "object":
-    if type_.lower() == "none":
-        return (type(None),)
-    elif type_.lower() == "bool":
-        return (bool,)
-    elif type_.lower() in ["int", "long"]:
-        return (int,)
-    elif type_.lower() == "float":
-        return (float,)
-    elif type_.lower() == "bytes":
-        return (bytes,)
-    elif type_.lower() == "complex":
-        return (complex,)
-    elif type_.lower() in ["str", "string_types"]:
-        return (str,)
-    elif type_.lower() == "list":
-        return (list,)
-    elif type_.lower() == "dict":
-        return (dict,)
-    elif type_.lower() == "unicode":
-        return None
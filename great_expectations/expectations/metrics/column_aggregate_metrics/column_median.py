@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Dict, Optional
 
 import numpy as np
@@ -16,8 +17,22 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    get_column_middle_values_using_window_functions,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
+logger = logging.getLogger(__name__)
+
+try:
+    from sqlalchemy.exc import OperationalError, ProgrammingError
+except ImportError:
+    logger.debug(
+        "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
+    )
+    OperationalError = None
+    ProgrammingError = None
+
 
 class ColumnMedian(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
@@ -52,31 +67,42 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         nonnull_count = metrics.get("column_values.nonnull.count")
         if not nonnull_count:
             return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
-            .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
-        )
-
-        column_values = list(element_values.fetchall())
+        column_values: list
+        try:
+            # Both center values are picked by a single query over one sort of the column values.
+            column_values = get_column_middle_values_using_window_functions(
+                column=column,
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+            )
+        except (OperationalError, ProgrammingError):
+            # Databases without window functions: sort the column values and fetch the two center values.
+            element_values = sqlalchemy_engine.execute(
+                sa.select([column])
+                .order_by(column)
+                .where(column != None)
+                .offset(max(nonnull_count // 2 - 1, 0))
+                .limit(2)
+                .select_from(selectable)
+            )
+            column_values = [row[0] for row in element_values.fetchall()]
+            if nonnull_count % 2 == 1:
+                column_values = column_values[-1:] * 2
 
-        if len(column_values) == 0:
+        if len(column_values) == 0 or column_values[0] is None:
             column_median = None
         elif nonnull_count % 2 == 0:
             # An even number of column values: take the average of the two center values
             column_median = (
                 float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
+                    column_values[0]
+                    + column_values[1]  # left center value  # right center value
                 )
                 / 2.0
             )  # Average center values
         else:
             # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
+            column_median = column_values[1]  # True center value
         return column_median
 
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
@@ -23,13 +23,16 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    get_column_quantiles_using_window_functions,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
 try:
-    from sqlalchemy.exc import ProgrammingError
+    from sqlalchemy.exc import OperationalError, ProgrammingError
     from sqlalchemy.sql import Select
     from sqlalchemy.sql.elements import Label, TextClause, WithinGroup
     from sqlalchemy.sql.selectable import CTE
@@ -37,6 +40,7 @@ except ImportError:
     logger.debug(
         "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
     )
+    OperationalError = None
     ProgrammingError = None
     Select = None
     Label = None
@@ -297,11 +301,23 @@ def _get_column_quantiles_sqlite(
     column, quantiles: Iterable, selectable, sqlalchemy_engine, table_row_count
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many
-    calls to "sqlalchemy_engine.execute()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    SQLite has no percentile functions, so all quantiles are computed by a single query, which numbers the column
+    values with window functions (available as of SQLite 3.25) over one sort.  Older versions of SQLite fall back to
+    as many calls to "sqlalchemy_engine.execute()" as the number of partitions in the "quantiles" parameter.
     """
+    try:
+        return get_column_quantiles_using_window_functions(
+            column=column,
+            quantiles=list(quantiles),
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    except OperationalError:
+        logger.debug(
+            "Unable to compute quantiles using window functions; please upgrade your SQLite installation to 3.25 or "
+            "later.  Computing quantiles using one query per quantile instead."
+        )
+
     offsets: List[int] = [quantile * table_row_count - 1 for quantile in quantiles]
     quantile_queries: List[Select] = [
         sa.select([column])
@@ -358,8 +374,9 @@ def _get_column_quantiles_generic_sqlalchemy(
     except ProgrammingError:
         # ProgrammingError: (psycopg2.errors.SyntaxError) Aggregate function "percentile_disc" is not supported;
         # use approximate percentile_disc or percentile_cont instead.
-        if attempt_allowing_relative_error(dialect):
-            # Redshift does not have a percentile_disc method, but does support an approximate version.
+        if allow_relative_error and attempt_allowing_relative_error(dialect):
+            # Redshift does not have a percentile_disc method, but does support an approximate version, which
+            # avoids sorting the column values of very large tables.
             sql_approx: str = get_approximate_percentile_disc_sql(
                 selects=selects, sql_engine_dialect=dialect
             )
@@ -367,25 +384,29 @@ def _get_column_quantiles_generic_sqlalchemy(
             quantiles_query_approx: Select = sa.select(selects_approx).select_from(
                 selectable
             )
-            if allow_relative_error:
-                try:
-                    quantiles_results: Row = sqlalchemy_engine.execute(
-                        quantiles_query_approx
-                    ).fetchone()
-                    return list(quantiles_results)
-                except ProgrammingError as pe:
-                    exception_message: str = "An SQL syntax Exception occurred."
-                    exception_traceback: str = traceback.format_exc()
-                    exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-                    logger.error(exception_message)
-                    raise pe
-            else:
-                raise ValueError(
-                    f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles '
-                    "without approximation error; set allow_relative_error to True to allow approximate quantiles."
-                )
-        else:
+            try:
+                quantiles_results: Row = sqlalchemy_engine.execute(
+                    quantiles_query_approx
+                ).fetchone()
+                return list(quantiles_results)
+            except ProgrammingError as pe:
+                exception_message: str = "An SQL syntax Exception occurred."
+                exception_traceback: str = traceback.format_exc()
+                exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+                logger.error(exception_message)
+                raise pe
+
+        # Without (exact) percentile functions, all quantiles are computed exactly by a single query using window
+        # functions over one sort of the column values.
+        try:
+            return get_column_quantiles_using_window_functions(
+                column=column,
+                quantiles=list(quantiles),
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+            )
+        except (OperationalError, ProgrammingError):
             raise ValueError(
-                f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles with '
-                "approximation error; set allow_relative_error to False to disable approximate quantiles."
+                f'The SQL engine dialect "{str(dialect)}" supports neither percentile functions nor window functions, '
+                "which are required for computing quantiles."
             )
@@ -1,5 +1,7 @@
 import warnings
 
+import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 from great_expectations.execution_engine import (
@@ -71,6 +73,22 @@ future release.  Please update code accordingly.
         if min_value is not None and max_value is not None and min_value > max_value:
             raise ValueError("min_value cannot be greater than max_value")
 
+        if _can_compare_numeric_column(temp_column, min_value, max_value):
+            # Vectorized comparisons yield the same result as the element-wise is_between below for numeric columns
+            # and bounds (for which there are no cross-type comparisons to handle).
+            between = pd.Series(True, index=temp_column.index)
+            if min_value is not None:
+                between &= (
+                    temp_column > min_value if strict_min else temp_column >= min_value
+                )
+
+            if max_value is not None:
+                between &= (
+                    temp_column < max_value if strict_max else temp_column <= max_value
+                )
+
+            return between
+
         def is_between(val):
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).
             # Ensure types can be compared since some types in Python 3 cannot be logically compared.
@@ -274,3 +292,17 @@ future release.  Please update code accordingly.
                 return (min_value <= column) & (column < max_value)
             else:
                 return (min_value <= column) & (column <= max_value)
+
+
+def _can_compare_numeric_column(column: pd.Series, *bounds) -> bool:
+    # Only numpy numeric dtypes (not extension dtypes, such as nullable integers or categoricals) are compared at once.
+    if not (
+        isinstance(column.dtype, np.dtype)
+        and pd.api.types.is_numeric_dtype(column.dtype)
+    ):
+        return False
+
+    return all(
+        bound is None or isinstance(bound, (int, float, np.integer, np.floating))
+        for bound in bounds
+    )
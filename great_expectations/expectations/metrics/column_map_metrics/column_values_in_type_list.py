@@ -2,13 +2,11 @@ import numpy as np
 import pandas as pd
 
 from great_expectations.execution_engine import PandasExecutionEngine
-from great_expectations.expectations.core.expect_column_values_to_be_of_type import (
-    _native_type_type_map,
-)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import _native_type_type_map
 
 
 class ColumnValuesInTypeList(ColumnMapMetricProvider):
@@ -105,12 +105,15 @@ def column_function_partial(
                         message=f'Error: The column "{column_name}" in BatchData does not exist.'
                     )
 
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                column_values = execution_engine.get_domain_column_values(
+                    domain_kwargs=compute_domain_kwargs,
+                    column_name=column_name,
+                    filter_column_isnull=filter_column_isnull,
+                )
 
                 values = metric_fn(
                     cls,
-                    df[column_name],
+                    column_values,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -327,12 +330,15 @@ def column_condition_partial(
                         message=f'Error: The column "{column_name}" in BatchData does not exist.'
                     )
 
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                column_values = execution_engine.get_domain_column_values(
+                    domain_kwargs=compute_domain_kwargs,
+                    column_name=column_name,
+                    filter_column_isnull=filter_column_isnull,
+                )
 
                 meets_expectation_series = metric_fn(
                     cls,
-                    df[column_name],
+                    column_values,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -342,6 +348,9 @@ def column_condition_partial(
                     accessor_domain_kwargs,
                 )
 
+            # The conditions of all column map metrics are evaluated together, column by column, by the bundle of the
+            # PandasExecutionEngine (see PandasExecutionEngine.resolve_metric_bundle)
+            inner_func.column_condition_metric_fn = metric_fn
             return inner_func
 
         return wrapper
@@ -1384,10 +1393,6 @@ def _pandas_column_map_condition_values(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics["unexpected_condition"]
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
-    )
-
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -1411,10 +1416,11 @@ def _pandas_column_map_condition_values(
             message=f'Error: The column "{column_name}" in BatchData does not exist.'
         )
 
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = execution_engine.get_domain_column_values(
+        domain_kwargs=compute_domain_kwargs,
+        column_name=column_name,
+        filter_column_isnull=filter_column_isnull,
+    )
 
     domain_values = domain_values[boolean_mapped_unexpected_values == True]
 
@@ -1643,10 +1649,6 @@ def _pandas_column_map_series_and_domain_values(
     assert (
         accessor_domain_kwargs == accessor_domain_kwargs_2
     ), "map_series and condition must have the same accessor kwargs"
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
-    )
-
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -1670,10 +1672,11 @@ def _pandas_column_map_series_and_domain_values(
             message=f'Error: The column "{column_name}" in BatchData does not exist.'
         )
 
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = execution_engine.get_domain_column_values(
+        domain_kwargs=compute_domain_kwargs,
+        column_name=column_name,
+        filter_column_isnull=filter_column_isnull,
+    )
 
     domain_values = domain_values[boolean_mapped_unexpected_values == True]
     map_series = map_series[boolean_mapped_unexpected_values == True]
@@ -1731,8 +1734,12 @@ def _pandas_map_condition_index(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
 
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
+        # Only the index of the unexpected rows is needed, for which the (shared) column values suffice.
+        df = execution_engine.get_domain_column_values(
+            domain_kwargs=compute_domain_kwargs,
+            column_name=column_name,
+            filter_column_isnull=filter_column_isnull,
+        )
 
     elif "column_list" in accessor_domain_kwargs:
         column_list = accessor_domain_kwargs["column_list"]
@@ -1767,10 +1774,6 @@ def _pandas_column_map_condition_value_counts(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
-    )
-
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -1794,10 +1797,11 @@ def _pandas_column_map_condition_value_counts(
             message=f'Error: The column "{column_name}" in BatchData does not exist.'
         )
 
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = execution_engine.get_domain_column_values(
+        domain_kwargs=compute_domain_kwargs,
+        column_name=column_name,
+        filter_column_isnull=filter_column_isnull,
+    )
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
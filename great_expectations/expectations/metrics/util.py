@@ -263,6 +263,92 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+def get_ranked_column_values(column, selectable):
+    """Returns a subquery numbering the non-null values of the column in ascending order (with a single sort), which
+    has the columns "value", "row_number" (starting at 1), and "row_count" (the number of non-null values).
+    """
+    return (
+        sa.select(
+            [
+                column.label("value"),
+                sa.func.row_number().over(order_by=column.asc()).label("row_number"),
+                sa.func.count().over().label("row_count"),
+            ]
+        )
+        .where(column != None)
+        .select_from(selectable)
+        .alias("ranked_values")
+    )
+
+
+def get_column_quantiles_using_window_functions(
+    column, quantiles: List[float], selectable, sqlalchemy_engine
+) -> list:
+    """Computes all quantiles of the column in a single query, for dialects without a native percentile_disc function.
+
+    The non-null values are numbered with ROW_NUMBER() over one sort, and the value of every quantile q is picked by
+    the same aggregation as the smallest value whose row number is at least q times the number of non-null values
+    (which matches the semantics of percentile_disc).
+    """
+    ranked_values = get_ranked_column_values(column=column, selectable=selectable)
+    selects: List[Label] = [
+        sa.func.min(
+            sa.case(
+                [
+                    (
+                        ranked_values.c.row_number
+                        >= ranked_values.c.row_count * float(quantile),
+                        ranked_values.c.value,
+                    )
+                ],
+                else_=None,
+            )
+        ).label(f"q_{idx}")
+        for idx, quantile in enumerate(quantiles)
+    ]
+    quantiles_query: Select = sa.select(selects).select_from(ranked_values)
+    return list(sqlalchemy_engine.execute(quantiles_query).fetchone())
+
+
+def get_column_middle_values_using_window_functions(
+    column, selectable, sqlalchemy_engine
+) -> list:
+    """Returns the two middle (non-null) values of the column (which coincide for an odd number of values), computed
+    by a single query over one sort of the column values (see get_ranked_column_values).
+
+    The query is separate from the one of get_column_quantiles_using_window_functions, so computing both column.median
+    and column.quantile_values of a column sorts its values twice.
+    """
+    ranked_values = get_ranked_column_values(column=column, selectable=selectable)
+    middle_values_query: Select = sa.select(
+        [
+            sa.func.min(
+                sa.case(
+                    [
+                        (
+                            ranked_values.c.row_number * 2 >= ranked_values.c.row_count,
+                            ranked_values.c.value,
+                        )
+                    ],
+                    else_=None,
+                )
+            ).label("lower_middle_value"),
+            sa.func.min(
+                sa.case(
+                    [
+                        (
+                            ranked_values.c.row_number * 2 > ranked_values.c.row_count,
+                            ranked_values.c.value,
+                        )
+                    ],
+                    else_=None,
+                )
+            ).label("upper_middle_value"),
+        ]
+    ).select_from(ranked_values)
+    return list(sqlalchemy_engine.execute(middle_values_query).fetchone())
+
+
 def is_column_present_in_table(
     engine: Engine,
     table_selectable: Select,
@@ -726,3 +812,27 @@ def is_valid_continuous_partition_object(partition_object):
         and np.all(np.diff(partition_object["bins"]) > 0)
         and np.allclose(np.sum(comb_weights), 1.0)
     )
+
+
+def _native_type_type_map(type_):
+    # We allow native python types in cases where the underlying type is "object":
+    if type_.lower() == "none":
+        return (type(None),)
+    elif type_.lower() == "bool":
+        return (bool,)
+    elif type_.lower() in ["int", "long"]:
+        return (int,)
+    elif type_.lower() == "float":
+        return (float,)
+    elif type_.lower() == "bytes":
+        return (bytes,)
+    elif type_.lower() == "complex":
+        return (complex,)
+    elif type_.lower() in ["str", "string_types"]:
+        return (str,)
+    elif type_.lower() == "list":
+        return (list,)
+    elif type_.lower() == "dict":
+        return (dict,)
+    elif type_.lower() == "unicode":
+        return None
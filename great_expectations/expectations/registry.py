@@ -1,9 +1,15 @@
+import importlib
 import logging
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric import Metric
+from great_expectations.expectations.registry_manifest import (
+    EXPECTATION_MODULES,
+    METRIC_MODULES,
+    RENDERER_MODULES,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
@@ -12,6 +18,10 @@ _registered_expectations = {}
 _registered_metrics = {}
 _registered_renderers = {}
 
+# Expectations, metrics, and renderers register themselves when the classes implementing them are defined.  Rather than
+# importing all of the implementations of Great Expectations upfront, the registry imports the module implementing a
+# name (as recorded in the generated registry_manifest module) upon the first lookup of the name.
+
 """
 {
   "metric_name"
@@ -65,17 +75,28 @@ def register_renderer(
 
 
 def get_renderer_names(object_name: str) -> List[str]:
+    _import_unregistered(object_name, _registered_renderers, RENDERER_MODULES)
     return list(_registered_renderers.get(object_name, {}).keys())
 
 
 def get_renderer_impls(object_name: str) -> List[str]:
+    _import_unregistered(object_name, _registered_renderers, RENDERER_MODULES)
     return list(_registered_renderers.get(object_name, {}).values())
 
 
 def get_renderer_impl(object_name, renderer_type):
+    _import_unregistered(object_name, _registered_renderers, RENDERER_MODULES)
     return _registered_renderers.get(object_name, {}).get(renderer_type)
 
 
+def list_registered_renderer_object_names() -> List[str]:
+    return list(_registered_renderers.keys()) + [
+        object_name
+        for object_name in RENDERER_MODULES
+        if object_name not in _registered_renderers
+    ]
+
+
 def register_expectation(expectation: Type["Expectation"]) -> None:  # noqa: F821
     expectation_type = expectation.expectation_type
     # TODO: add version to key
@@ -178,6 +199,7 @@ def register_metric(
 def get_metric_provider(
     metric_name: str, execution_engine: "ExecutionEngine"  # noqa: F821
 ) -> Tuple["MetricProvider", Callable]:  # noqa: F821
+    _import_unregistered(metric_name, _registered_metrics, METRIC_MODULES)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -190,6 +212,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: "ExecutionEngine"  # noqa: F821
 ) -> Optional[Union["MetricPartialFunctionTypes", "MetricFunctionTypes"]]:  # noqa: F821
+    _import_unregistered(metric_name, _registered_metrics, METRIC_MODULES)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, provider_class = metric_definition["providers"][
@@ -207,6 +230,7 @@ def get_metric_kwargs(
     configuration: Optional["ExpectationConfiguration"] = None,  # noqa: F821
     runtime_configuration: Optional[dict] = None,
 ) -> Dict:
+    _import_unregistered(metric_name, _registered_metrics, METRIC_MODULES)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -263,12 +287,27 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name):
+    _import_unregistered(
+        expectation_name, _registered_expectations, EXPECTATION_MODULES
+    )
     return _registered_expectations.get(expectation_name)
 
 
 def list_registered_expectation_implementations(
     expectation_root: Type["Expectation"] = None,  # noqa: F821
 ) -> List[str]:
+    if expectation_root is None:
+        # Names of the expectations of the manifest are listed without importing their implementations.
+        return list(_registered_expectations.keys()) + [
+            expectation_name
+            for expectation_name in EXPECTATION_MODULES
+            if expectation_name not in _registered_expectations
+        ]
+
+    module_name: str
+    for module_name in set(EXPECTATION_MODULES.values()):
+        importlib.import_module(module_name)
+
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -282,3 +321,45 @@ def list_registered_expectation_implementations(
             registered_expectation_implementations.append(expectation_name)
 
     return registered_expectation_implementations
+
+
+def _import_unregistered(name: str, registry: dict, manifest: Dict[str, str]) -> None:
+    """Imports the module implementing name according to the manifest, unless name is registered already."""
+    if name not in registry and name in manifest:
+        logger.debug(f"Importing {manifest[name]} for {name}.")
+        importlib.import_module(manifest[name])
+
+
+def build_registry_manifest() -> Dict[str, Dict[str, str]]:
+    """Imports all the expectations and metrics of Great Expectations, and returns the modules implementing them (and
+    their renderers) by name, which scripts/generate_registry_manifest.py writes to the registry_manifest module.
+    """
+    importlib.import_module("great_expectations.expectations.core")
+    importlib.import_module("great_expectations.expectations.metrics")
+
+    expectation_modules: Dict[str, str] = {
+        expectation_name: expectation.__module__
+        for expectation_name, expectation in _registered_expectations.items()
+    }
+    metric_modules: Dict[str, str] = {
+        metric_name: next(iter(metric_definition["providers"].values()))[0].__module__
+        for metric_name, metric_definition in _registered_metrics.items()
+    }
+    renderer_modules: Dict[str, str] = {
+        object_name: next(iter(renderers.values()))[0].__module__
+        for object_name, renderers in _registered_renderers.items()
+    }
+
+    # Expectations and metrics defined outside of Great Expectations (e.g., in plugins) register themselves on import.
+    return {
+        manifest_name: {
+            name: module_name
+            for name, module_name in sorted(modules.items())
+            if module_name.startswith("great_expectations.")
+        }
+        for manifest_name, modules in (
+            ("EXPECTATION_MODULES", expectation_modules),
+            ("METRIC_MODULES", metric_modules),
+            ("RENDERER_MODULES", renderer_modules),
+        )
+    }
@@ -1,12 +1,16 @@
+import concurrent.futures
+import hashlib
+import json
 import logging
 import os
 import traceback
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations import __version__ as ge_version
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
@@ -33,6 +37,95 @@ FALSEY_YAML_STRINGS = [
 ]
 
 
+def get_validation_result_index_manifest_entry(
+    resource_key: ValidationResultIdentifier,
+    validation_result: ExpectationSuiteValidationResult,
+) -> dict:
+    """Returns the compact record of a validation result that the index page is rendered from."""
+    batch_kwargs: dict = validation_result.meta.get("batch_kwargs", {}) or {}
+    batch_spec: dict = validation_result.meta.get("batch_spec", {}) or {}
+    return convert_to_json_serializable(
+        {
+            "expectation_suite_name": resource_key.expectation_suite_identifier.expectation_suite_name,
+            "run_name": resource_key.run_id.run_name,
+            "run_time": resource_key.run_id.run_time,
+            "batch_identifier": resource_key.batch_identifier,
+            "asset_name": batch_kwargs.get("data_asset_name")
+            or batch_spec.get("data_asset_name"),
+            "success": validation_result.success,
+            "statistics": validation_result.statistics,
+            "batch_kwargs": batch_kwargs,
+            "batch_spec": batch_spec,
+        }
+    )
+
+
+class _ExpectationSuiteMetaDataContext:
+    """Stands in for the data context of the page renderers in rendering worker processes: page renderers only look up
+    the meta of expectation suites in the data context, which the site section builder sends along with every page.
+    """
+
+    def __init__(self):
+        self.expectation_suite_metas: Dict[str, Optional[dict]] = {}
+
+    def get_expectation_suite(self, expectation_suite_name: str) -> ExpectationSuite:
+        expectation_suite_meta: Optional[dict] = self.expectation_suite_metas.get(
+            expectation_suite_name
+        )
+        if expectation_suite_meta is None:
+            raise exceptions.DataContextError(
+                f"expectation_suite {expectation_suite_name} not found"
+            )
+
+        expectation_suite = ExpectationSuite(
+            expectation_suite_name=expectation_suite_name
+        )
+        expectation_suite.meta = expectation_suite_meta
+        return expectation_suite
+
+
+_rendering_worker: Dict[str, Any] = {}
+
+
+def _initialize_rendering_worker(
+    renderer_config: dict,
+    view_config: dict,
+    custom_styles_directory: Optional[str],
+    custom_views_directory: Optional[str],
+) -> None:
+    data_context = _ExpectationSuiteMetaDataContext()
+    _rendering_worker["data_context"] = data_context
+    _rendering_worker["renderer"] = instantiate_class_from_config(
+        config=renderer_config,
+        runtime_environment={"data_context": data_context},
+        config_defaults={},
+    )
+    _rendering_worker["view"] = instantiate_class_from_config(
+        config=view_config,
+        runtime_environment={
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        },
+        config_defaults={},
+    )
+
+
+def _render_page(
+    resource: Any,
+    expectation_suite_metas: Dict[str, Optional[dict]],
+    data_context_id: Optional[str],
+    show_how_to_buttons: bool,
+) -> str:
+    """Renders the page of a resource in a rendering worker process."""
+    _rendering_worker["data_context"].expectation_suite_metas = expectation_suite_metas
+    rendered_content = _rendering_worker["renderer"].render(resource)
+    return _rendering_worker["view"].render(
+        rendered_content,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
     DataContext.
@@ -107,6 +200,30 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Pages are rendered serially by default; set rendering_processes (for the
+    site, or for an individual section) to render them in a pool of worker
+    processes instead::
+
+        local_site:
+            class_name: SiteBuilder
+            rendering_processes: 8
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    Set skip_unchanged_pages (for the site, or for an individual section) to
+    only render the pages whose content hash (of the resource, of the renderer
+    and view configuration, and of the custom views and styles) changed since
+    they were last rendered; build(rebuild_index_manifest=True) forgets the
+    recorded hashes, forcing every page to be rendered again::
+
+        local_site:
+            class_name: SiteBuilder
+            skip_unchanged_pages: true
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
     """
 
     def __init__(
@@ -119,6 +236,8 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         ge_cloud_mode=False,
+        rendering_processes=None,
+        skip_unchanged_pages=False,
         **kwargs,
     ):
         self.site_name = site_name
@@ -126,6 +245,8 @@ class SiteBuilder:
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        self.rendering_processes = rendering_processes
+        self.skip_unchanged_pages = skip_unchanged_pages
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -233,6 +354,8 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "ge_cloud_mode": self.ge_cloud_mode,
+                    "rendering_processes": self.rendering_processes,
+                    "skip_unchanged_pages": self.skip_unchanged_pages,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -282,7 +405,12 @@ class SiteBuilder:
     def clean_site(self):
         self.target_store.clean_site()
 
-    def build(self, resource_identifiers=None, build_index: bool = True):
+    def build(
+        self,
+        resource_identifiers=None,
+        build_index: bool = True,
+        rebuild_index_manifest: bool = False,
+    ):
         """
 
         :param resource_identifiers: a list of resource identifiers
@@ -296,9 +424,19 @@ class SiteBuilder:
 
         :param build_index: a flag if False, skips building the index page
 
+        :param rebuild_index_manifest: a flag if True, recreates the index
+                            manifest (the record of the rendered validation
+                            results that the index page is built from, and
+                            of the content hashes used to skip rendering
+                            unchanged pages) from the source stores, rather
+                            than updating it incrementally
+
         :return:
         """
 
+        if rebuild_index_manifest and not self.ge_cloud_mode:
+            self.target_store.clear_index_manifest()
+
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
             site_section_builder.build(resource_identifiers=resource_identifiers)
@@ -334,6 +472,8 @@ class SiteBuilder:
 
 
 class DefaultSiteSectionBuilder:
+    SOURCE_STORE_READ_BATCH_SIZE = 64
+
     def __init__(
         self,
         name,
@@ -349,6 +489,8 @@ class DefaultSiteSectionBuilder:
         view=None,
         data_context_id=None,
         ge_cloud_mode=False,
+        rendering_processes=None,
+        skip_unchanged_pages=False,
         **kwargs,
     ):
         self.name = name
@@ -360,6 +502,10 @@ class DefaultSiteSectionBuilder:
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        self.rendering_processes = rendering_processes
+        self.skip_unchanged_pages = skip_unchanged_pages
+        self.custom_styles_directory = custom_styles_directory
+        self.custom_views_directory = custom_views_directory
         if renderer is None:
             raise exceptions.InvalidConfigError(
                 "SiteSectionBuilder requires a renderer configuration "
@@ -368,6 +514,7 @@ class DefaultSiteSectionBuilder:
         module_name = (
             renderer.get("module_name") or "great_expectations.render.renderer"
         )
+        self.renderer_config = {**renderer, "module_name": module_name}
         self.renderer_class = instantiate_class_from_config(
             config=renderer,
             runtime_environment={"data_context": data_context},
@@ -387,6 +534,7 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
+        self.view_config = {**view, "module_name": module_name}
         self.view_class = instantiate_class_from_config(
             config=view,
             runtime_environment={
@@ -402,6 +550,10 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
+        self._expectation_suite_metas: Dict[str, Optional[dict]] = {}
+        self._site_keys: Dict[type, Set[Tuple[str, ...]]] = {}
+        self._custom_templates_fingerprint: Optional[list] = None
+
     def build(self, resource_identifiers=None):
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
@@ -409,6 +561,46 @@ class DefaultSiteSectionBuilder:
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        if resource_identifiers:
+            resource_identifiers = set(resource_identifiers)
+
+        self._expectation_suite_metas = {}
+        self._site_keys = {}
+        self._custom_templates_fingerprint = None
+
+        if (
+            not self.ge_cloud_mode
+            and self.rendering_processes
+            and self.rendering_processes > 1
+        ):
+            self._render_pages_in_parallel(
+                resources=self._get_resources_to_render(
+                    source_store_keys=source_store_keys,
+                    resource_identifiers=resource_identifiers,
+                    data_context=None,
+                )
+            )
+        else:
+            self._render_pages(
+                resources=self._get_resources_to_render(
+                    source_store_keys=source_store_keys,
+                    resource_identifiers=resource_identifiers,
+                    data_context=self.data_context,
+                )
+            )
+
+        if not self.ge_cloud_mode:
+            self.target_store.write_index_manifest()
+
+    def _get_resources_to_render(
+        self, source_store_keys, resource_identifiers, data_context
+    ) -> Iterator[Tuple[Any, Any, Optional[str]]]:
+        """Yields the resource key, the resource, and the content hash of every page to render.
+
+        Pages whose resource (and rendering configuration) did not change since they were rendered, according to
+        their content hash, are skipped.
+        """
+        resource_keys: list = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -423,12 +615,46 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
+
+            resource_keys.append(resource_key)
+
+        serialized_resources: Iterator[Tuple[Any, Any]]
+        if self.ge_cloud_mode:
+            serialized_resources = (
+                (resource_key, None) for resource_key in resource_keys
+            )
+        else:
+            serialized_resources = self._read_serialized_resources(
+                resource_keys=resource_keys
+            )
+
+        for resource_key, serialized_resource in serialized_resources:
+            page_hash: Optional[str] = None
             try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(
-                        **resource, data_context=self.data_context
+                if self.ge_cloud_mode:
+                    resource = self.source_store.get(resource_key)
+                else:
+                    if self.skip_unchanged_pages:
+                        page_hash = self._get_page_hash(
+                            resource_key=resource_key,
+                            serialized_resource=serialized_resource,
+                        )
+                        if self._is_page_unchanged(
+                            resource_key=resource_key, page_hash=page_hash
+                        ):
+                            logger.debug(
+                                f"        Skipping unchanged page of {str(resource_key)}"
+                            )
+                            continue
+
+                    resource = (
+                        self.source_store.deserialize(resource_key, serialized_resource)
+                        if serialized_resource
+                        else None
                     )
+
+                if isinstance(resource_key, ExpectationSuiteIdentifier):
+                    resource = ExpectationSuite(**resource, data_context=data_context)
             except exceptions.InvalidKeyError:
                 logger.warning(
                     f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
@@ -457,6 +683,50 @@ class DefaultSiteSectionBuilder:
                         f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
                     )
 
+            yield resource_key, resource, page_hash
+
+    def _read_serialized_resources(
+        self, resource_keys: list
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Yields the resource key and the serialized resource of every resource that can be retrieved.
+
+        The resources are read from the source store backend in batches of SOURCE_STORE_READ_BATCH_SIZE resources
+        (which the cloud store backends read concurrently), rather than one request at a time.
+        """
+        store_backend = self.source_store.store_backend
+        batch_start: int
+        for batch_start in range(
+            0, len(resource_keys), self.SOURCE_STORE_READ_BATCH_SIZE
+        ):
+            batch_resource_keys: list = resource_keys[
+                batch_start : batch_start + self.SOURCE_STORE_READ_BATCH_SIZE
+            ]
+            try:
+                serialized_resources: list = store_backend.get_many(
+                    [
+                        self.source_store.key_to_tuple(resource_key)
+                        for resource_key in batch_resource_keys
+                    ]
+                )
+            except exceptions.InvalidKeyError:
+                # Read the resources of the batch one at a time, so as to skip only the missing ones
+                for resource_key in batch_resource_keys:
+                    try:
+                        serialized_resource = store_backend.get(
+                            self.source_store.key_to_tuple(resource_key)
+                        )
+                    except exceptions.InvalidKeyError:
+                        logger.warning(
+                            f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+                        )
+                        continue
+
+                    yield resource_key, serialized_resource
+            else:
+                yield from zip(batch_resource_keys, serialized_resources)
+
+    def _render_pages(self, resources) -> None:
+        for resource_key, resource, page_hash in resources:
             try:
                 rendered_content = self.renderer_class.render(resource)
 
@@ -475,26 +745,217 @@ class DefaultSiteSectionBuilder:
                         data_context_id=self.data_context_id,
                         show_how_to_buttons=self.show_how_to_buttons,
                     )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
+                    self._write_page(
+                        resource_key=resource_key,
+                        viewable_content=viewable_content,
+                        page_hash=page_hash,
+                        index_manifest_entry=self._get_index_manifest_entry(
+                            resource_key=resource_key, resource=resource
                         ),
-                        viewable_content,
                     )
             except Exception as e:
-                exception_message = f"""\
+                self._log_rendering_error(e)
+
+    def _render_pages_in_parallel(self, resources) -> None:
+        """Renders the pages in a pool of rendering_processes worker processes, while the resources are read and the
+        pages are written by the present process, keeping at most two pages per worker process in flight.
+        """
+        max_pending_pages: int = 2 * self.rendering_processes
+        pending_pages: Dict[concurrent.futures.Future, tuple] = {}
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.rendering_processes,
+            initializer=_initialize_rendering_worker,
+            initargs=(
+                self.renderer_config,
+                self.view_config,
+                self.custom_styles_directory,
+                self.custom_views_directory,
+            ),
+        ) as executor:
+            for resource_key, resource, page_hash in resources:
+                try:
+                    future: concurrent.futures.Future = executor.submit(
+                        _render_page,
+                        resource,
+                        self._get_expectation_suite_metas(resource_key=resource_key),
+                        self.data_context_id,
+                        self.show_how_to_buttons,
+                    )
+                    pending_pages[future] = (
+                        resource_key,
+                        page_hash,
+                        self._get_index_manifest_entry(
+                            resource_key=resource_key, resource=resource
+                        ),
+                    )
+                except Exception as e:
+                    self._log_rendering_error(e)
+                    continue
+
+                if len(pending_pages) >= max_pending_pages:
+                    done, _ = concurrent.futures.wait(
+                        pending_pages, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    self._write_rendered_pages(
+                        futures=done, pending_pages=pending_pages
+                    )
+
+            self._write_rendered_pages(
+                futures=list(pending_pages), pending_pages=pending_pages
+            )
+
+    def _write_rendered_pages(self, futures, pending_pages: dict) -> None:
+        for future in futures:
+            resource_key, page_hash, index_manifest_entry = pending_pages.pop(future)
+            try:
+                self._write_page(
+                    resource_key=resource_key,
+                    viewable_content=future.result(),
+                    page_hash=page_hash,
+                    index_manifest_entry=index_manifest_entry,
+                )
+            except Exception as e:
+                self._log_rendering_error(e)
+
+    def _write_page(
+        self,
+        resource_key,
+        viewable_content: str,
+        page_hash: Optional[str],
+        index_manifest_entry: Optional[dict],
+    ) -> None:
+        # Verify type
+        self.target_store.set(
+            SiteSectionIdentifier(
+                site_section_name=self.name,
+                resource_identifier=resource_key,
+            ),
+            viewable_content,
+        )
+        if index_manifest_entry is not None:
+            self.target_store.set_index_manifest_entry(
+                resource_key, index_manifest_entry
+            )
+        if page_hash is not None:
+            self.target_store.set_page_hash(resource_key, page_hash)
+
+    @staticmethod
+    def _get_index_manifest_entry(resource_key, resource) -> Optional[dict]:
+        if isinstance(resource_key, ValidationResultIdentifier):
+            return get_validation_result_index_manifest_entry(
+                resource_key=resource_key, validation_result=resource
+            )
+
+        return None
+
+    def _get_page_hash(self, resource_key, serialized_resource) -> str:
+        """Returns the content hash of the page of the resource, which covers the serialized resource, the meta of
+        its expectation suite (for validation results), and everything else the rendered page depends on.
+        """
+        page_hash = hashlib.md5()
+        page_hash.update(
+            json.dumps(
+                [
+                    ge_version,
+                    self.name,
+                    self.renderer_config,
+                    self.view_config,
+                    self.custom_styles_directory,
+                    self.custom_views_directory,
+                    self._get_custom_templates_fingerprint(),
+                    self.data_context_id,
+                    self.show_how_to_buttons,
+                    self._get_expectation_suite_metas(resource_key=resource_key),
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        )
+        if not isinstance(serialized_resource, str):
+            serialized_resource = json.dumps(
+                serialized_resource, sort_keys=True, default=str
+            )
+        page_hash.update(serialized_resource.encode("utf-8"))
+        return page_hash.hexdigest()
+
+    def _get_custom_templates_fingerprint(self) -> list:
+        """Returns the path, modification time and size of every file of the custom views and styles directories, so
+        that editing a custom template changes the hashes of the pages (computed once per build).
+        """
+        if self._custom_templates_fingerprint is None:
+            fingerprint: list = []
+            directory: Optional[str]
+            for directory in [
+                self.custom_views_directory,
+                self.custom_styles_directory,
+            ]:
+                if not directory or not os.path.isdir(directory):
+                    continue
+
+                for root, _, filenames in os.walk(directory):
+                    for filename in sorted(filenames):
+                        path: str = os.path.join(root, filename)
+                        stat_result: os.stat_result = os.stat(path)
+                        fingerprint.append(
+                            [path, stat_result.st_mtime_ns, stat_result.st_size]
+                        )
+
+            self._custom_templates_fingerprint = sorted(fingerprint)
+
+        return self._custom_templates_fingerprint
+
+    def _is_page_unchanged(self, resource_key, page_hash: str) -> bool:
+        if self.target_store.get_page_hash(resource_key) != page_hash:
+            return False
+
+        # The page could have been removed from the site since it was rendered.
+        key_type: type = type(resource_key)
+        if key_type not in self._site_keys:
+            self._site_keys[key_type] = set(
+                self.target_store.store_backends[key_type].list_keys()
+            )
+
+        return resource_key.to_tuple() in self._site_keys[key_type]
+
+    def _get_expectation_suite_metas(self, resource_key) -> Dict[str, Optional[dict]]:
+        """Returns the meta of the expectation suite of a validation result, which validation result page renderers
+        look up in the data context (an empty dictionary for any other resource).
+        """
+        if not isinstance(resource_key, ValidationResultIdentifier):
+            return {}
+
+        expectation_suite_name: str = (
+            resource_key.expectation_suite_identifier.expectation_suite_name
+        )
+        if expectation_suite_name not in self._expectation_suite_metas:
+            try:
+                expectation_suite_meta: Optional[dict] = convert_to_json_serializable(
+                    self.data_context.get_expectation_suite(expectation_suite_name).meta
+                )
+            except Exception:
+                expectation_suite_meta = None
+            self._expectation_suite_metas[
+                expectation_suite_name
+            ] = expectation_suite_meta
+
+        return {
+            expectation_suite_name: self._expectation_suite_metas[
+                expectation_suite_name
+            ]
+        }
+
+    @staticmethod
+    def _log_rendering_error(e: Exception) -> None:
+        exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+        exception_traceback = traceback.format_exc()
+        exception_message += (
+            f'{type(e).__name__}: "{str(e)}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
 
 
 class DefaultSiteIndexBuilder:
@@ -712,12 +1173,18 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        rebuild_index_manifest: bool = False,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param rebuild_index_manifest: if True, the index manifest (the record of every rendered validation result
+        page that the index page is built from) is recreated by loading all validation results from their store;
+        otherwise, only the validation results that are missing from the index manifest are loaded
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -733,6 +1200,9 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
+        if rebuild_index_manifest:
+            self.target_store.clear_index_manifest()
+
         self._add_expectations_to_index_links(index_links_dict, skip_and_clean_missing)
         validation_and_profiling_result_site_keys = (
             self._build_validation_and_profiling_result_site_keys(
@@ -746,6 +1216,11 @@ class DefaultSiteIndexBuilder:
             index_links_dict, validation_and_profiling_result_site_keys
         )
 
+        self.target_store.prune_index_manifest(
+            validation_and_profiling_result_site_keys
+        )
+        self.target_store.write_index_manifest()
+
         viewable_content = ""
         try:
             rendered_content = self.renderer_class.render(index_links_dict)
@@ -773,11 +1248,13 @@ diagnose and repair the underlying issue.  Detailed information follows:
     ) -> None:
         expectations = self.site_section_builders_config.get("expectations", "None")
         if expectations and expectations not in FALSEY_YAML_STRINGS:
-            expectation_suite_source_keys = self.data_context.stores[
-                self.site_section_builders_config["expectations"].get(
-                    "source_store_name"
-                )
-            ].list_keys()
+            expectation_suite_source_keys: Set[ExpectationSuiteIdentifier] = set(
+                self.data_context.stores[
+                    self.site_section_builders_config["expectations"].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             expectation_suite_site_keys = [
                 ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
                 for expectation_suite_tuple in self.target_store.store_backends[
@@ -816,9 +1293,15 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 if (validations and validations not in FALSEY_YAML_STRINGS)
                 else "profiling"
             )
-            validation_and_profiling_result_source_keys = self.data_context.stores[
-                self.site_section_builders_config[source_store].get("source_store_name")
-            ].list_keys()
+            validation_and_profiling_result_source_keys: Set[
+                ValidationResultIdentifier
+            ] = set(
+                self.data_context.stores[
+                    self.site_section_builders_config[source_store].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             validation_and_profiling_result_site_keys = [
                 ValidationResultIdentifier.from_tuple(validation_result_tuple)
                 for validation_result_tuple in self.target_store.store_backends[
@@ -860,18 +1343,17 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
+            self._load_missing_index_manifest_entries(
+                validation_result_keys=profiling_result_site_keys,
+                validations_store_name=self.source_stores.get("profiling"),
+            )
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
+                    index_manifest_entry = self._get_index_manifest_entry(
+                        validation_result_key=profiling_result_key,
                         validations_store_name=self.source_stores.get("profiling"),
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
@@ -880,10 +1362,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         run_id=profiling_result_key.run_id,
                         run_time=profiling_result_key.run_id.run_time,
                         run_name=profiling_result_key.run_id.run_name,
-                        asset_name=batch_kwargs.get("data_asset_name")
-                        or batch_spec.get("data_asset_name"),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=index_manifest_entry["asset_name"],
+                        batch_kwargs=index_manifest_entry["batch_kwargs"],
+                        batch_spec=index_manifest_entry["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Profiling result not found: {str(profiling_result_key.to_tuple()):s} - skipping"
@@ -915,37 +1396,104 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
+            self._load_missing_index_manifest_entries(
+                validation_result_keys=validation_result_site_keys,
+                validations_store_name=self.source_stores.get("validations"),
+            )
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
+                    index_manifest_entry = self._get_index_manifest_entry(
+                        validation_result_key=validation_result_key,
                         validations_store_name=self.source_stores.get("validations"),
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
                         section_name="validations",
                         batch_identifier=validation_result_key.batch_identifier,
                         run_id=validation_result_key.run_id,
-                        validation_success=validation_success,
+                        validation_success=index_manifest_entry["success"],
                         run_time=validation_result_key.run_id.run_time,
                         run_name=validation_result_key.run_id.run_name,
-                        asset_name=batch_kwargs.get("data_asset_name")
-                        or batch_spec.get("data_asset_name"),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=index_manifest_entry["asset_name"],
+                        batch_kwargs=index_manifest_entry["batch_kwargs"],
+                        batch_spec=index_manifest_entry["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Validation result not found: {str(validation_result_key.to_tuple()):s} - skipping"
                     logger.warning(error_msg)
 
+    def _load_missing_index_manifest_entries(
+        self,
+        validation_result_keys: List[ValidationResultIdentifier],
+        validations_store_name: Optional[str],
+    ) -> None:
+        """Records the index manifest entries missing for the validation results, loading the validation results in
+        batches from the validations store (the results that cannot be loaded are left to _get_index_manifest_entry).
+        """
+        missing_validation_result_keys: List[ValidationResultIdentifier] = [
+            validation_result_key
+            for validation_result_key in validation_result_keys
+            if self.target_store.get_index_manifest_entry(validation_result_key) is None
+        ]
+        if not missing_validation_result_keys:
+            return
+
+        validations_store = self.data_context.stores[
+            validations_store_name or self.data_context.validations_store_name
+        ]
+        batch_size: int = DefaultSiteSectionBuilder.SOURCE_STORE_READ_BATCH_SIZE
+        batch_start: int
+        for batch_start in range(0, len(missing_validation_result_keys), batch_size):
+            batch_validation_result_keys: List[
+                ValidationResultIdentifier
+            ] = missing_validation_result_keys[batch_start : batch_start + batch_size]
+            try:
+                validation_results: list = validations_store.get_many(
+                    batch_validation_result_keys
+                )
+            except exceptions.InvalidKeyError:
+                continue
+
+            for validation_result_key, validation_result in zip(
+                batch_validation_result_keys, validation_results
+            ):
+                if validation_result is not None:
+                    self.target_store.set_index_manifest_entry(
+                        validation_result_key,
+                        get_validation_result_index_manifest_entry(
+                            resource_key=validation_result_key,
+                            validation_result=validation_result,
+                        ),
+                    )
+
+    def _get_index_manifest_entry(
+        self,
+        validation_result_key: ValidationResultIdentifier,
+        validations_store_name: Optional[str],
+    ) -> dict:
+        index_manifest_entry: Optional[
+            dict
+        ] = self.target_store.get_index_manifest_entry(validation_result_key)
+        if index_manifest_entry is None:
+            # Pages rendered before the index manifest existed (or a rebuild of the index manifest on demand) require
+            # loading the validation result once.
+            validation = self.data_context.get_validation_result(
+                batch_identifier=validation_result_key.batch_identifier,
+                expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+                run_id=validation_result_key.run_id,
+                validations_store_name=validations_store_name,
+            )
+            index_manifest_entry = get_validation_result_index_manifest_entry(
+                resource_key=validation_result_key, validation_result=validation
+            )
+            self.target_store.set_index_manifest_entry(
+                validation_result_key, index_manifest_entry
+            )
+
+        return index_manifest_entry
+
 
 class CallToActionButton:
     def __init__(self, title, link):
@@ -214,6 +214,9 @@ class ParameterBuilder(ABC):
             metric_value = validator.get_metric(
                 metric=MetricConfiguration(**metric_configuration_arguments)
             )
+            # The data of (lazily loaded) batches is released once their metric is computed, so that only one batch at
+            # a time is held in memory, however many batches the metric is computed for.
+            validator.execution_engine.evict_batch_data(batch_id=batch_id)
             if enforce_numeric_metric:
                 if not is_numeric(value=metric_value):
                     raise ge_exceptions.ProfilerExecutionError(
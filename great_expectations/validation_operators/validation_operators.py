@@ -1,14 +1,17 @@
 import logging
 import warnings
 from collections import OrderedDict
-from typing import Union
+from typing import Optional, Union
 
 from dateutil.parser import parse
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.util import send_slack_notification
 from great_expectations.core.async_executor import AsyncExecutor
-from great_expectations.core.batch import Batch
+from great_expectations.core.batch import Batch, BatchRequest, RuntimeBatchRequest
+from great_expectations.core.validation_process_pool_executor import (
+    ValidationProcessPoolExecutor,
+)
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import parse_result_format
 from great_expectations.data_context.types.resource_identifiers import (
@@ -252,7 +255,8 @@ class ActionListValidationOperator(ValidationOperator):
     def _build_batch_from_item(self, item):
         """Internal helper method to take an asset to validate, which can be either:
           (1) a DataAsset; or
-          (2) a tuple of data_asset_name, expectation_suite_name, and batch_kwargs (suitable for passing to get_batch)
+          (2) a tuple of data_asset_name, expectation_suite_name, and batch_kwargs (suitable for passing to get_batch); or
+          (3) a tuple of batch_request and expectation_suite_name (suitable for passing to get_validator)
 
         Args:
             item: The item to convert to a batch (see above)
@@ -262,7 +266,11 @@ class ActionListValidationOperator(ValidationOperator):
 
         """
         # if not isinstance(item, (DataAsset, Validator)):
-        if isinstance(item, tuple):
+        if self._is_batch_request_item(item):
+            batch = self.data_context.get_validator(
+                batch_request=item[0], expectation_suite_name=item[1]
+            )
+        elif isinstance(item, tuple):
             if not (
                 len(item) == 2
                 and isinstance(item[0], dict)
@@ -277,6 +285,22 @@ class ActionListValidationOperator(ValidationOperator):
 
         return batch
 
+    @staticmethod
+    def _is_batch_request_item(item) -> bool:
+        return (
+            isinstance(item, tuple)
+            and len(item) == 2
+            and isinstance(item[0], (BatchRequest, RuntimeBatchRequest))
+            and isinstance(item[1], str)
+        )
+
+    def _can_validate_item_in_process_pool(self, item) -> bool:
+        return (
+            self._is_batch_request_item(item)
+            and not self.data_context.ge_cloud_mode
+            and ValidationProcessPoolExecutor.can_validate(batch_request=item[0])
+        )
+
     def run(
         self,
         assets_to_validate,
@@ -287,7 +311,16 @@ class ActionListValidationOperator(ValidationOperator):
         catch_exceptions=None,
         result_format=None,
         checkpoint_identifier=None,
+        process_pool_executor: Optional[ValidationProcessPoolExecutor] = None,
     ):
+        """
+        Validate every asset to validate and run the actions on every validation result.
+
+        Assets given as tuples of batch_request and expectation_suite_name are validated in worker processes if the
+        process pool is enabled in the concurrency configuration of the data context (and the batch_request does not
+        hold in-memory batch data), in the given process_pool_executor (if any) or in one created for this run -- the
+        actions are run in the current process, with data_asset=None.
+        """
         assert not (run_id and run_name) and not (
             run_id and run_time
         ), "Please provide either a run_id or run_name and/or run_time."
@@ -328,21 +361,81 @@ class ActionListValidationOperator(ValidationOperator):
         # len(assets_to_validate) is equal to 1. So no unnecessary multithreading is ever used here even though it may
         # be nested inside another AsyncExecutor (and this is a good thing because it avoids extra overhead associated
         # with each thread and minimizes the total number of threads to simplify debugging).
+        #
+        # If the process pool is enabled, the assets given as batch requests are rather validated in worker processes
+        # (see ValidationProcessPoolExecutor), which speeds up CPU-bound validations.
+        owns_process_pool_executor: bool = False
+        if (
+            process_pool_executor is None
+            and ValidationProcessPoolExecutor.is_enabled(self.data_context.concurrency)
+            and sum(
+                self._can_validate_item_in_process_pool(item)
+                for item in assets_to_validate
+            )
+            > 1
+        ):
+            process_pool_executor = ValidationProcessPoolExecutor(
+                data_context=self.data_context, max_workers=len(assets_to_validate)
+            )
+            owns_process_pool_executor = True
+
+        try:
+            return self._run(
+                assets_to_validate=assets_to_validate,
+                run_id=run_id,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=result_format,
+                checkpoint_identifier=checkpoint_identifier,
+                process_pool_executor=process_pool_executor,
+            )
+        finally:
+            if owns_process_pool_executor:
+                process_pool_executor.shutdown()
+
+    def _run(
+        self,
+        assets_to_validate,
+        run_id: RunIdentifier,
+        evaluation_parameters,
+        catch_exceptions,
+        result_format,
+        checkpoint_identifier,
+        process_pool_executor: Optional[ValidationProcessPoolExecutor],
+    ):
         with AsyncExecutor(
             self.data_context.concurrency, max_workers=len(assets_to_validate)
         ) as async_executor:
             batch_and_async_result_tuples = []
             for item in assets_to_validate:
-                batch = self._build_batch_from_item(item)
-
-                if hasattr(batch, "active_batch_id"):
-                    batch_identifier = batch.active_batch_id
-                else:
-                    batch_identifier = batch.batch_id
-
                 if result_format is None:
                     result_format = self.result_format
 
+                if (
+                    process_pool_executor is not None
+                    and self._can_validate_item_in_process_pool(item)
+                ):
+                    expectation_suite = self.data_context.get_expectation_suite(
+                        expectation_suite_name=item[1]
+                    )
+                    batch_and_async_result_tuples.append(
+                        (
+                            None,
+                            expectation_suite,
+                            process_pool_executor.submit(
+                                batch_request=item[0],
+                                expectation_suite=expectation_suite,
+                                run_id=run_id,
+                                evaluation_parameters=evaluation_parameters,
+                                result_format=result_format,
+                                catch_exceptions=catch_exceptions,
+                            ),
+                        )
+                    )
+                    continue
+
+                batch = self._build_batch_from_item(item)
+
                 batch_validate_arguments = {
                     "run_id": run_id,
                     "result_format": result_format,
@@ -355,6 +448,7 @@ class ActionListValidationOperator(ValidationOperator):
                 batch_and_async_result_tuples.append(
                     (
                         batch,
+                        batch._expectation_suite,
                         async_executor.submit(
                             batch.validate,
                             **batch_validate_arguments,
@@ -363,18 +457,35 @@ class ActionListValidationOperator(ValidationOperator):
                 )
 
             run_results = {}
-            for batch, async_batch_validation_result in batch_and_async_result_tuples:
+            for (
+                batch,
+                expectation_suite,
+                async_batch_validation_result,
+            ) in batch_and_async_result_tuples:
+                if batch is None:
+                    # Validated in a worker process
+                    (
+                        batch_identifier,
+                        batch_validation_result,
+                    ) = async_batch_validation_result.result()
+                else:
+                    if hasattr(batch, "active_batch_id"):
+                        batch_identifier = batch.active_batch_id
+                    else:
+                        batch_identifier = batch.batch_id
+                    batch_validation_result = async_batch_validation_result.result()
+
                 if self.data_context.ge_cloud_mode:
                     expectation_suite_identifier = GeCloudIdentifier(
                         resource_type="expectation_suite",
-                        ge_cloud_id=batch._expectation_suite.ge_cloud_id,
+                        ge_cloud_id=expectation_suite.ge_cloud_id,
                     )
                     validation_result_id = GeCloudIdentifier(
                         resource_type="suite_validation_result"
                     )
                 else:
                     expectation_suite_identifier = ExpectationSuiteIdentifier(
-                        expectation_suite_name=batch._expectation_suite.expectation_suite_name
+                        expectation_suite_name=expectation_suite.expectation_suite_name
                     )
                     validation_result_id = ValidationResultIdentifier(
                         batch_identifier=batch_identifier,
@@ -385,15 +496,15 @@ class ActionListValidationOperator(ValidationOperator):
                 batch_actions_results = self._run_actions(
                     batch=batch,
                     expectation_suite_identifier=expectation_suite_identifier,
-                    expectation_suite=batch._expectation_suite,
-                    batch_validation_result=async_batch_validation_result.result(),
+                    expectation_suite=expectation_suite,
+                    batch_validation_result=batch_validation_result,
                     run_id=run_id,
                     validation_result_id=validation_result_id,
                     checkpoint_identifier=checkpoint_identifier,
                 )
 
                 run_result_obj = {
-                    "validation_result": async_batch_validation_result.result(),
+                    "validation_result": batch_validation_result,
                     "actions_results": batch_actions_results,
                 }
                 run_results[validation_result_id] = run_result_obj
@@ -434,12 +545,12 @@ class ActionListValidationOperator(ValidationOperator):
                 "Processing validation action with name {}".format(action["name"])
             )
 
-            if hasattr(batch, "active_batch_id"):
-                batch_identifier = batch.active_batch_id
-            else:
-                batch_identifier = batch.batch_id
-
             if validation_result_id is None:
+                if hasattr(batch, "active_batch_id"):
+                    batch_identifier = batch.active_batch_id
+                else:
+                    batch_identifier = batch.batch_id
+
                 validation_result_id = ValidationResultIdentifier(
                     expectation_suite_identifier=expectation_suite_identifier,
                     run_id=run_id,
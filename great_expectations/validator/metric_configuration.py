@@ -1,7 +1,16 @@
+import copy
 import json
-from typing import Dict, Tuple
+from typing import Dict, NamedTuple, Optional
 
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+
+
+class MetricConfigurationID(NamedTuple):
+    """Immutable, hashable key identifying a metric (it compares equal to the plain "(name, domain, value)" tuple)."""
+
+    metric_name: str
+    metric_domain_kwargs_id: str
+    metric_value_kwargs_id: str
 
 
 class MetricConfiguration:
@@ -13,17 +22,18 @@ class MetricConfiguration:
         metric_dependencies: dict = None,
     ):
         self._metric_name = metric_name
-        if not isinstance(metric_domain_kwargs, IDDict):
-            metric_domain_kwargs = IDDict(metric_domain_kwargs)
+        if not isinstance(metric_domain_kwargs, FrozenIDDict):
+            metric_domain_kwargs = FrozenIDDict(metric_domain_kwargs)
         self._metric_domain_kwargs = metric_domain_kwargs
-        if not isinstance(metric_value_kwargs, IDDict):
+        if not isinstance(metric_value_kwargs, FrozenIDDict):
             if metric_value_kwargs is None:
                 metric_value_kwargs = {}
-            metric_value_kwargs = IDDict(metric_value_kwargs)
+            metric_value_kwargs = FrozenIDDict(metric_value_kwargs)
         self._metric_value_kwargs = metric_value_kwargs
         if metric_dependencies is None:
             metric_dependencies = {}
         self._metric_dependencies = metric_dependencies
+        self._id: Optional[MetricConfigurationID] = None
 
     def __repr__(self):
         return json.dumps(self.to_json_dict(), indent=2)
@@ -31,16 +41,36 @@ class MetricConfiguration:
     def __str__(self):
         return self.__repr__()
 
+    def __deepcopy__(self, memo):
+        metric_configuration: MetricConfiguration = MetricConfiguration(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=copy.deepcopy(self.metric_domain_kwargs, memo),
+            metric_value_kwargs=copy.deepcopy(self.metric_value_kwargs, memo),
+        )
+        memo[id(self)] = metric_configuration
+        metric_configuration.metric_dependencies = copy.deepcopy(
+            self.metric_dependencies, memo
+        )
+        return metric_configuration
+
+    def __eq__(self, other):
+        if not isinstance(other, MetricConfiguration):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
     @property
     def metric_name(self):
         return self._metric_name
 
     @property
-    def metric_domain_kwargs(self):
+    def metric_domain_kwargs(self) -> IDDict:
         return self._metric_domain_kwargs
 
     @property
-    def metric_value_kwargs(self):
+    def metric_value_kwargs(self) -> IDDict:
         return self._metric_value_kwargs
 
     @property
@@ -60,12 +90,14 @@ class MetricConfiguration:
         self._metric_dependencies = metric_dependencies
 
     @property
-    def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+    def id(self) -> MetricConfigurationID:
+        if self._id is None:
+            self._id = MetricConfigurationID(
+                metric_name=self.metric_name,
+                metric_domain_kwargs_id=self.metric_domain_kwargs_id,
+                metric_value_kwargs_id=self.metric_value_kwargs_id,
+            )
+        return self._id
 
     def to_json_dict(self) -> dict:
         json_dict: dict = {
@@ -1,5 +1,15 @@
-import copy
-from typing import Dict, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.validator.exception_info import ExceptionInfo
@@ -29,26 +39,251 @@ class MetricEdge:
 
 
 class ValidationGraph:
+    """Directed acyclic graph of metric dependencies.
+
+    Edges point from a metric ("left") to one of the metrics it depends on ("right"); an edge without a "right" vertex
+    denotes a metric with no dependencies.  In addition to the list of edges, the graph maintains adjacency indexes
+    (dependencies and dependents of every metric), so that ready metrics can be released incrementally as their
+    dependencies are resolved, without rescanning every edge of the graph.
+    """
+
     def __init__(self, edges: Optional[List[MetricEdge]] = None):
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges = []
+        self._edge_ids = set()
+
+        # Metrics that appear on the "left" side of at least one edge (i.e., metrics that are scheduled for resolution).
+        self._metric_configurations: Dict[
+            Tuple[str, str, str], MetricConfiguration
+        ] = {}
+        # Maps metric id to the ids of the metrics, on which it depends.
+        self._dependencies: Dict[Tuple[str, str, str], Set[Tuple[str, str, str]]] = {}
+        # Maps metric id to the ids of the metrics, which depend on it.
+        self._dependents: Dict[Tuple[str, str, str], Set[Tuple[str, str, str]]] = {}
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            edge: MetricEdge
+            for edge in edges:
+                self.add(edge=edge)
 
     def add(self, edge: MetricEdge):
-        if edge.id not in self._edge_ids:
-            self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+        edge_id: Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]] = edge.id
+        if edge_id in self._edge_ids:
+            return
+
+        self._edges.append(edge)
+        self._edge_ids.add(edge_id)
+
+        left_id: Tuple[str, str, str]
+        right_id: Optional[Tuple[str, str, str]]
+        left_id, right_id = edge_id
+        if left_id not in self._metric_configurations:
+            self._metric_configurations[left_id] = edge.left
+            self._dependencies[left_id] = set()
+
+        if right_id is not None:
+            self._dependencies[left_id].add(right_id)
+            self._dependents.setdefault(right_id, set()).add(left_id)
 
     @property
-    def edges(self):
-        return copy.deepcopy(self._edges)
+    def edges(self) -> List[MetricEdge]:
+        return list(self._edges)
 
     @property
-    def edge_ids(self):
-        return {edge.id for edge in self.edges}
+    def edge_ids(
+        self,
+    ) -> Set[Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]]]:
+        return set(self._edge_ids)
+
+    @property
+    def metric_configurations(self) -> Dict[Tuple[str, str, str], MetricConfiguration]:
+        return dict(self._metric_configurations)
+
+    def __contains__(self, metric_id: Tuple[str, str, str]) -> bool:
+        return metric_id in self._metric_configurations
+
+    def get_metric_configuration(
+        self, metric_id: Tuple[str, str, str]
+    ) -> Optional[MetricConfiguration]:
+        return self._metric_configurations.get(metric_id)
+
+    def get_dependencies(
+        self, metric_id: Tuple[str, str, str]
+    ) -> Set[Tuple[str, str, str]]:
+        return set(self._dependencies.get(metric_id, set()))
+
+    def get_dependents(
+        self, metric_id: Tuple[str, str, str]
+    ) -> Set[Tuple[str, str, str]]:
+        return set(self._dependents.get(metric_id, set()))
+
+    def get_ready_and_needed_metrics(
+        self,
+        metrics: Dict[Tuple[str, str, str], Any],
+    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
+        """Return unresolved metrics, whose dependencies are all resolved ("ready"), and unresolved metrics, which
+        still have at least one unresolved dependency ("needed"), in a single pass over the graph indexes.
+        """
+        ready_metrics: Set[MetricConfiguration] = set()
+        needed_metrics: Set[MetricConfiguration] = set()
+
+        metric_id: Tuple[str, str, str]
+        metric_configuration: MetricConfiguration
+        for metric_id, metric_configuration in self._metric_configurations.items():
+            if metric_id in metrics:
+                continue
+
+            if all(
+                dependency_id in metrics
+                for dependency_id in self._dependencies[metric_id]
+            ):
+                ready_metrics.add(metric_configuration)
+            else:
+                needed_metrics.add(metric_configuration)
+
+        return ready_metrics, needed_metrics
+
+    def find_cycle(self) -> Optional[List[Tuple[str, str, str]]]:
+        """Return the ids of the metrics, forming a dependency cycle (with the first metric id repeated at the end),
+        or None if the graph is acyclic.
+        """
+        visiting: Set[Tuple[str, str, str]] = set()
+        visited: Set[Tuple[str, str, str]] = set()
+
+        start_id: Tuple[str, str, str]
+        for start_id in self._metric_configurations:
+            if start_id in visited:
+                continue
+
+            path: List[Tuple[str, str, str]] = [start_id]
+            stack: List[Iterator[Tuple[str, str, str]]] = [
+                iter(self._dependencies[start_id])
+            ]
+            visiting.add(start_id)
+            while stack:
+                dependency_id: Optional[Tuple[str, str, str]] = next(stack[-1], None)
+                if dependency_id is None:
+                    stack.pop()
+                    finished_id: Tuple[str, str, str] = path.pop()
+                    visiting.discard(finished_id)
+                    visited.add(finished_id)
+                elif dependency_id in visiting:
+                    return path[path.index(dependency_id) :] + [dependency_id]
+                elif dependency_id not in visited:
+                    visiting.add(dependency_id)
+                    path.append(dependency_id)
+                    stack.append(iter(self._dependencies.get(dependency_id, set())))
+
+        return None
+
+
+class ValidationGraphScheduler:
+    """Releases metrics of a ValidationGraph for resolution in topological order.
+
+    The scheduler keeps, for every unresolved metric, the number of its dependencies that are still unresolved.  When a
+    metric is marked as resolved, the counters of its dependents are decremented, and the dependents whose counters
+    drop to zero become ready.  Hence, the total scheduling work over the life of the scheduler is proportional to the
+    size of the graph, regardless of the number of resolution rounds.
+
+    Only the metrics needed by the graph are scheduled: the dependencies of metrics, whose values are already available
+    (e.g., loaded from a store), are not resolved, unless they are requested (e.g., by an expectation) or other
+    unresolved metrics depend on them.
+    """
+
+    def __init__(
+        self,
+        graph: ValidationGraph,
+        metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        requested_metric_ids: Optional[Iterable[Tuple[str, str, str]]] = None,
+    ):
+        if metrics is None:
+            metrics = {}
+
+        if requested_metric_ids is None:
+            requested_metric_ids = []
+
+        self._graph = graph
+        self._unresolved_dependency_counts: Dict[Tuple[str, str, str], int] = {}
+        self._ready_ids: Set[Tuple[str, str, str]] = set()
+
+        metric_id: Tuple[str, str, str]
+        for metric_id in self._get_needed_metric_ids(
+            graph=graph, metrics=metrics, requested_metric_ids=requested_metric_ids
+        ):
+            num_unresolved_dependencies: int = len(
+                [
+                    dependency_id
+                    for dependency_id in graph.get_dependencies(metric_id=metric_id)
+                    if dependency_id not in metrics
+                ]
+            )
+            self._unresolved_dependency_counts[metric_id] = num_unresolved_dependencies
+            if num_unresolved_dependencies == 0:
+                self._ready_ids.add(metric_id)
+
+    @staticmethod
+    def _get_needed_metric_ids(
+        graph: ValidationGraph,
+        metrics: Dict[Tuple[str, str, str], Any],
+        requested_metric_ids: Iterable[Tuple[str, str, str]],
+    ) -> Set[Tuple[str, str, str]]:
+        """Returns the ids of the unresolved metrics, which are either requested, not depended upon by any metric of
+        the graph, or depended upon by other needed metrics.
+        """
+        requested_metric_ids = set(requested_metric_ids)
+        metric_ids_to_visit: List[Tuple[str, str, str]] = [
+            metric_id
+            for metric_id in graph.metric_configurations
+            if metric_id not in metrics
+            and (
+                metric_id in requested_metric_ids
+                or not graph.get_dependents(metric_id=metric_id)
+            )
+        ]
+        needed_metric_ids: Set[Tuple[str, str, str]] = set(metric_ids_to_visit)
+
+        metric_id: Tuple[str, str, str]
+        dependency_id: Tuple[str, str, str]
+        while metric_ids_to_visit:
+            metric_id = metric_ids_to_visit.pop()
+            for dependency_id in graph.get_dependencies(metric_id=metric_id):
+                if dependency_id in metrics or dependency_id in needed_metric_ids:
+                    continue
+
+                needed_metric_ids.add(dependency_id)
+                metric_ids_to_visit.append(dependency_id)
+
+        return needed_metric_ids
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        return {
+            self._graph.get_metric_configuration(metric_id=metric_id)
+            for metric_id in self._ready_ids
+        }
+
+    @property
+    def ready_metric_ids(self) -> Set[Tuple[str, str, str]]:
+        return set(self._ready_ids)
+
+    @property
+    def num_unresolved_metrics(self) -> int:
+        return len(self._unresolved_dependency_counts)
+
+    def mark_resolved(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        for metric_id in metric_ids:
+            if self._unresolved_dependency_counts.pop(metric_id, None) is None:
+                continue
+
+            self._ready_ids.discard(metric_id)
+            for dependent_id in self._graph.get_dependents(metric_id=metric_id):
+                if dependent_id not in self._unresolved_dependency_counts:
+                    continue
+
+                self._unresolved_dependency_counts[dependent_id] -= 1
+                if self._unresolved_dependency_counts[dependent_id] == 0:
+                    self._ready_ids.add(dependent_id)
 
 
 class ExpectationValidationGraph:
@@ -89,13 +324,13 @@ class ExpectationValidationGraph:
         Tuple[str, str, str],
         Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
     ]:
-        graph_metric_ids: List[Tuple[str, str, str]] = []
-        edge: MetricEdge
-        vertex: MetricConfiguration
-        for edge in self.graph.edges:
-            for vertex in [edge.left, edge.right]:
-                if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+        graph_metric_ids: Set[Tuple[str, str, str]] = set()
+        edge_id: Tuple[Tuple[str, str, str], Optional[Tuple[str, str, str]]]
+        vertex_id: Optional[Tuple[str, str, str]]
+        for edge_id in self.graph.edge_ids:
+            for vertex_id in edge_id:
+                if vertex_id is not None:
+                    graph_metric_ids.add(vertex_id)
 
         metric_id: Tuple[str, str, str]
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
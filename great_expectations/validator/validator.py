@@ -14,7 +14,12 @@ from dateutil.parser import parse
 from tqdm.auto import tqdm
 
 from great_expectations import __version__ as ge_version
-from great_expectations.core.batch import Batch, BatchDefinition, BatchMarkers
+from great_expectations.core.batch import (
+    Batch,
+    BatchDefinition,
+    BatchMarkers,
+    LazyBatch,
+)
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
@@ -55,6 +60,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    ValidationGraphScheduler,
 )
 
 logger = logging.getLogger(__name__)
@@ -230,10 +236,10 @@ class Validator:
             return self.validate_expectation(name)
         elif (
             self._expose_dataframe_methods
-            and isinstance(self.active_batch.data, PandasBatchData)
+            and isinstance(self.active_batch_data, PandasBatchData)
             and hasattr(pd.DataFrame, name)
         ):
-            return getattr(self.active_batch.data.dataframe, name)
+            return getattr(self.active_batch_data.dataframe, name)
         else:
             raise AttributeError(
                 f"'{type(self).__name__}'  object has no attribute '{name}'"
@@ -373,26 +379,36 @@ class Validator:
     def get_metrics(self, metrics: Dict[str, MetricConfiguration]) -> Dict[str, Any]:
         """Return a dictionary with the requested metrics"""
         graph: ValidationGraph = ValidationGraph()
+        metric_configurations: Dict[str, MetricConfiguration] = {}
         for metric_name, metric_configuration in metrics.items():
             provider_cls, _ = get_metric_provider(
                 metric_configuration.metric_name, self.execution_engine
             )
+            # MetricConfiguration kwargs are immutable; default values are filled in on a new configuration object.
+            metric_domain_kwargs: dict = dict(metric_configuration.metric_domain_kwargs)
             for key in provider_cls.domain_keys:
                 if (
-                    key not in metric_configuration.metric_domain_kwargs
+                    key not in metric_domain_kwargs
                     and key in provider_cls.default_kwarg_values
                 ):
-                    metric_configuration.metric_domain_kwargs[
-                        key
-                    ] = provider_cls.default_kwarg_values[key]
+                    metric_domain_kwargs[key] = provider_cls.default_kwarg_values[key]
+            metric_value_kwargs: dict = dict(metric_configuration.metric_value_kwargs)
             for key in provider_cls.value_keys:
                 if (
-                    key not in metric_configuration.metric_value_kwargs
+                    key not in metric_value_kwargs
                     and key in provider_cls.default_kwarg_values
                 ):
-                    metric_configuration.metric_value_kwargs[
-                        key
-                    ] = provider_cls.default_kwarg_values[key]
+                    metric_value_kwargs[key] = provider_cls.default_kwarg_values[key]
+            if metric_domain_kwargs != metric_configuration.metric_domain_kwargs or (
+                metric_value_kwargs != metric_configuration.metric_value_kwargs
+            ):
+                metric_configuration = MetricConfiguration(
+                    metric_name=metric_configuration.metric_name,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metric_dependencies=metric_configuration.metric_dependencies,
+                )
+            metric_configurations[metric_name] = metric_configuration
             self.build_metric_dependency_graph(
                 graph=graph,
                 execution_engine=self._execution_engine,
@@ -407,10 +423,14 @@ class Validator:
         ] = self.resolve_validation_graph(
             graph=graph,
             metrics=resolved_metrics,
+            requested_metric_ids=[
+                metric_configuration.id
+                for metric_configuration in metric_configurations.values()
+            ],
         )
         return {
             metric_name: resolved_metrics[metric_configuration.id]
-            for (metric_name, metric_configuration) in metrics.items()
+            for (metric_name, metric_configuration) in metric_configurations.items()
         }
 
     def get_metric(self, metric: MetricConfiguration) -> Any:
@@ -451,6 +471,8 @@ class Validator:
         expectation_validation_graphs: List[ExpectationValidationGraph] = []
         exception_info: ExceptionInfo
         processed_configurations = []
+        # Ids of the metrics, on which the expectations depend directly.
+        requested_metric_ids: List[Tuple[str, str, str]] = []
         # noinspection SpellCheckingInspection
         evrs = []
         for configuration in configurations:
@@ -485,6 +507,10 @@ class Validator:
                     )
                     expectation_validation_graph.update(graph=graph)
                 expectation_validation_graphs.append(expectation_validation_graph)
+                requested_metric_ids.extend(
+                    metric_configuration.id
+                    for metric_configuration in validation_dependencies.values()
+                )
                 processed_configurations.append(evaluated_config)
             except Exception as err:
                 if catch_exceptions:
@@ -529,6 +555,7 @@ class Validator:
                 graph=graph,
                 metrics=metrics,
                 runtime_configuration=runtime_configuration,
+                requested_metric_ids=requested_metric_ids,
             )
 
             # Trace MetricResolutionError occurrences to expectations relying on corresponding malfunctioning metrics.
@@ -615,9 +642,16 @@ class Validator:
         metric_configuration: MetricConfiguration,
         configuration: Optional[ExpectationConfiguration] = None,
         runtime_configuration: Optional[dict] = None,
+        _dependency_path: Optional[List[Tuple[str, str, str]]] = None,
     ):
         """Obtain domain and value keys for metrics and proceeds to add these metrics to the validation graph
-        until all metrics have been added."""
+        until all metrics have been added.
+
+        Metrics, whose dependencies have already been expanded into the graph, are not traversed again.  A dependency
+        that refers back to a metric on the current dependency path (i.e., a cycle) is reported and left out of the
+        graph, so that the resulting graph is guaranteed to be acyclic."""
+        if _dependency_path is None:
+            _dependency_path = []
 
         metric_impl = get_metric_provider(
             metric_configuration.metric_name, execution_engine=execution_engine
@@ -637,11 +671,14 @@ class Validator:
             )
         else:
             metric_configuration.metric_dependencies = metric_dependencies
+            _dependency_path.append(metric_configuration.id)
             for metric_dependency in metric_dependencies.values():
-                # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
-                if metric_dependency.id == metric_configuration.id:
+                if metric_dependency.id in _dependency_path:
+                    cycle: List[Tuple[str, str, str]] = _dependency_path[
+                        _dependency_path.index(metric_dependency.id) :
+                    ] + [metric_dependency.id]
                     logger.warning(
-                        f"Metric {str(metric_configuration.id)} has created a circular dependency"
+                        f"Metric {str(metric_configuration.id)} has created a circular dependency: {str(cycle)}"
                     )
                     continue
                 graph.add(
@@ -650,19 +687,24 @@ class Validator:
                         right=metric_dependency,
                     )
                 )
+                if metric_dependency.id in graph:
+                    continue
                 self.build_metric_dependency_graph(
                     graph=graph,
                     execution_engine=execution_engine,
                     metric_configuration=metric_dependency,
                     configuration=configuration,
                     runtime_configuration=runtime_configuration,
+                    _dependency_path=_dependency_path,
                 )
+            _dependency_path.pop()
 
     def resolve_validation_graph(
         self,
         graph: ValidationGraph,
         metrics: Dict[Tuple[str, str, str], Any],
         runtime_configuration: Optional[dict] = None,
+        requested_metric_ids: Optional[Iterable[Tuple[str, str, str]]] = None,
     ) -> Dict[
         Tuple[str, str, str],
         Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
@@ -684,8 +726,23 @@ class Validator:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ] = {}
 
+        # Metrics saved in previous runs (on unchanged batch data) are reused, and their dependencies are not resolved.
+        metrics.update(
+            self._execution_engine.load_metric_results(
+                metric_configurations=[
+                    metric_configuration
+                    for metric_id, metric_configuration in graph.metric_configurations.items()
+                    if metric_id not in metrics
+                ]
+            )
+        )
+
         ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        # Requested metrics (e.g., validation dependencies of expectations) are resolved, even if they are only
+        # dependencies of metrics, whose values are available.
+        scheduler: ValidationGraphScheduler = ValidationGraphScheduler(
+            graph=graph, metrics=metrics, requested_metric_ids=requested_metric_ids
+        )
 
         exception_info: ExceptionInfo
 
@@ -694,9 +751,7 @@ class Validator:
 
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(
-                validation_graph=graph, metrics=metrics
-            )
+            ready_metrics = scheduler.ready_metrics
 
             # Check to see if the user has disabled progress bars
             disable = False
@@ -715,7 +770,7 @@ class Validator:
             if pbar is None:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 pbar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=scheduler.num_unresolved_metrics,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
@@ -742,6 +797,13 @@ class Validator:
                         runtime_configuration=runtime_configuration,
                     )
                 )
+                scheduler.mark_resolved(
+                    metric_ids=[
+                        metric.id
+                        for metric in computable_metrics
+                        if metric.id in metrics
+                    ]
+                )
                 pbar.update(len(computable_metrics))
             except MetricResolutionError as err:
                 if catch_exceptions:
@@ -781,9 +843,9 @@ aborting graph resolution.
                 else:
                     raise e
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
-                len(ready_metrics) == len(aborted_metrics_info)
-            ):
+            # Done when no metrics are left to resolve, or when all remaining ready metrics have exhausted their retries
+            # (metrics, whose dependencies cannot be resolved, never become ready).
+            if scheduler.ready_metric_ids <= set(aborted_metrics_info.keys()):
                 done = True
 
         pbar.close()
@@ -863,7 +925,21 @@ aborting graph resolution.
                 ), "batches provided to Validator must be Great Expectations Batch objects"
             except AssertionError as e:
                 logger.warning(str(e))
-            self._execution_engine.load_batch_data(batch.id, batch.data)
+            if isinstance(batch, LazyBatch) and not batch.is_loaded:
+                # The execution engine loads the data of the batch when it is first needed.
+                self._execution_engine.load_lazy_batch_data(
+                    batch_id=batch.id, batch_data_loader=batch.load_data
+                )
+            else:
+                self._execution_engine.load_batch_data(batch.id, batch.data)
+                if (
+                    isinstance(batch.batch_markers, BatchMarkers)
+                    and batch.batch_markers.data_fingerprint is not None
+                ):
+                    self._execution_engine.set_batch_fingerprint(
+                        batch_id=batch.id,
+                        fingerprint=batch.batch_markers.data_fingerprint,
+                    )
             self._batches[batch.id] = batch
             # We set the active_batch_id in each iteration of the loop to keep in sync with the active_batch_id for the
             # execution_engine. The final active_batch_id will be that of the final batch loaded.
@@ -889,6 +965,15 @@ aborting graph resolution.
         )
         return batch
 
+    @property
+    def active_batch_data(self) -> Optional[Any]:
+        """Getter for the data of the active batch (as loaded into the execution engine)"""
+        active_batch_id: Optional[str] = self.active_batch_id
+        if not active_batch_id:
+            return None
+
+        return self._execution_engine.loaded_batch_data_dict.get(active_batch_id)
+
     @property
     def active_batch_spec(self) -> Optional[BatchSpec]:
         """Getter for active batch's batch_spec"""
@@ -1384,15 +1469,16 @@ set as active.
                 "great_expectations_version"
             ) or expectation_suite.meta.get("great_expectations.__version__")
 
+            expectation_suite.process_evaluation_parameters(
+                evaluation_parameters=runtime_evaluation_parameters,
+                interactive_evaluation=self.interactive_evaluation,
+                data_context=self._data_context,
+            )
+
             # Group expectations by column
             columns = {}
 
             for expectation in expectation_suite.expectations:
-                expectation.process_evaluation_parameters(
-                    evaluation_parameters=runtime_evaluation_parameters,
-                    interactive_evaluation=self.interactive_evaluation,
-                    data_context=self._data_context,
-                )
                 if "column" in expectation.kwargs and isinstance(
                     expectation.kwargs["column"], Hashable
                 ):
@@ -1621,25 +1707,9 @@ set as active.
         validation_graph: ValidationGraph,
         metrics: Dict[Tuple[str, str, str], Any],
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        """Given validation graph, returns the ready and needed metrics necessary for validation using the dependency
+        indexes of the validation graph (a graph structure of metric ids)"""
+        return validation_graph.get_ready_and_needed_metrics(metrics=metrics)
 
     @staticmethod
     def _resolve_metrics(
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Generate great_expectations/expectations/registry_manifest.py
+
+The manifest records the module implementing every expectation, metric, and renderer of Great Expectations, so that
+the registry only imports an implementation upon its first lookup. Regenerate it after adding, renaming, or moving an
+expectation or a metric:
+
+python scripts/generate_registry_manifest.py
+"""
+
+import os
+from typing import Dict, List
+
+from great_expectations.expectations.registry import build_registry_manifest
+
+MANIFEST_FILEPATH: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "great_expectations",
+    "expectations",
+    "registry_manifest.py",
+)
+
+MANIFEST_HEADER: str = '''"""
+Modules implementing the expectations, metrics, and renderers of Great Expectations, by name.
+
+The registry (great_expectations/expectations/registry.py) imports these modules upon the first lookup of the names they
+implement, rather than along with Great Expectations.
+
+This file is generated by scripts/generate_registry_manifest.py; do not edit it by hand.
+"""
+from typing import Dict
+'''
+
+
+def render_registry_manifest(manifest: Dict[str, Dict[str, str]]) -> str:
+    lines: List[str] = [MANIFEST_HEADER]
+    manifest_name: str
+    modules: Dict[str, str]
+    for manifest_name, modules in manifest.items():
+        lines.append(f"{manifest_name}: Dict[str, str] = {{")
+        lines.extend(
+            f'    "{name}": "{module_name}",' for name, module_name in modules.items()
+        )
+        lines.append("}\n")
+
+    return "\n".join(lines)
+
+
+def main():
+    with open(MANIFEST_FILEPATH, "w") as outfile:
+        outfile.write(render_registry_manifest(manifest=build_registry_manifest()))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,19 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
 from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.util import get_or_create_spark_application
+from great_expectations.core.validation_process_pool_executor import (
+    ValidationProcessPoolExecutor,
+)
 from great_expectations.data_context.data_context import DataContext
-from great_expectations.data_context.types.base import CheckpointConfig
+from great_expectations.data_context.types.base import (
+    CheckpointConfig,
+    ConcurrencyConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
+    ValidationResultIdentifier,
 )
 from great_expectations.util import (
     deep_filter_properties_iterable,
@@ -4890,3 +4898,91 @@ def test_newstyle_checkpoint_does_not_pass_dataframes_via_validations_into_check
         match='batch_data found in validations cannot be saved to CheckpointStore "checkpoint_store"',
     ):
         context.add_checkpoint(**checkpoint_config)
+
+
+def test_newstyle_checkpoint_validates_batch_requests_in_process_pool(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context._project_config.concurrency = ConcurrencyConfig(
+        enabled=True, process_pool_enabled=True, max_process_pool_workers=2
+    )
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "Name"},
+        )
+    )
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": {"$PARAMETER": "min_row_count"}},
+        )
+    )
+    context.save_expectation_suite(suite)
+
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {"class_name": "StoreValidationResultAction"},
+            },
+            {
+                "name": "store_evaluation_params",
+                "action": {"class_name": "StoreEvaluationParametersAction"},
+            },
+        ],
+        evaluation_parameters={"min_row_count": 1000},
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+        ]
+        + [
+            {
+                # In-memory batch data cannot be shipped to worker processes
+                "batch_request": RuntimeBatchRequest(
+                    datasource_name="my_datasource",
+                    data_connector_name="my_runtime_data_connector",
+                    data_asset_name="test_df",
+                    batch_identifiers={
+                        "pipeline_stage_name": "core_processing",
+                        "airflow_run_id": 1234567890,
+                    },
+                    runtime_parameters={
+                        "batch_data": pd.DataFrame(data={"Name": ["a"] * 1500})
+                    },
+                )
+            }
+        ],
+    )
+
+    with mock.patch.object(
+        ValidationProcessPoolExecutor,
+        "submit",
+        autospec=True,
+        side_effect=ValidationProcessPoolExecutor.submit,
+    ) as mock_submit:
+        result: CheckpointResult = checkpoint.run()
+
+    assert mock_submit.call_count == 2
+    assert result.success
+    assert len(context.validations_store.list_keys()) == 3
+
+    validation_result_identifier: ValidationResultIdentifier
+    for validation_result_identifier, run_result in result.run_results.items():
+        validation_result = run_result["validation_result"]
+        assert validation_result.statistics["evaluated_expectations"] == 2
+        assert validation_result.evaluation_parameters == {"min_row_count": 1000}
+        assert validation_result.meta["run_id"] == result.run_id
+        assert context.validations_store.has_key(validation_result_identifier)
@@ -1,4 +1,5 @@
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from timeit import timeit
 
@@ -10,9 +11,13 @@ from great_expectations.core import ExpectationValidationResult
 from great_expectations.core.batch import RuntimeBatchRequest
 from great_expectations.core.evaluation_parameters import (
     _deduplicate_evaluation_parameter_dependencies,
+    compile_evaluation_parameter_expression,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
+    resolve_store_evaluation_parameters,
 )
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.exceptions import DataContextError, EvaluationParameterError
 
 
@@ -330,3 +335,104 @@ def test_now_evaluation_parameter():
     # Require parens to actually invoke
     with pytest.raises(EvaluationParameterError):
         parse_evaluation_parameter("now")
+
+
+def test_compile_evaluation_parameter_expression_is_cached():
+    compiled = compile_evaluation_parameter_expression("a * 2 + trunc(b)")
+    assert compile_evaluation_parameter_expression("a * 2 + trunc(b)") is compiled
+    assert compiled.parse_error is None
+    assert compiled.is_deterministic
+    assert not compile_evaluation_parameter_expression(
+        "now() - timedelta(days=1)"
+    ).is_deterministic
+    assert compile_evaluation_parameter_expression("1 +").parse_error is not None
+
+    # Evaluating the compiled expression does not alter it.
+    assert parse_evaluation_parameter("a * 2 + trunc(b)", {"a": 1, "b": 1.5}) == 3
+    assert parse_evaluation_parameter("a * 2 + trunc(b)", {"a": 2, "b": 2.5}) == 6
+    assert compile_evaluation_parameter_expression("a * 2 + trunc(b)") == compiled
+
+
+def test_parse_evaluation_parameter_is_thread_safe():
+    def _evaluate(idx: int):
+        return parse_evaluation_parameter(f"a * {idx % 10} + b", {"a": idx, "b": 1})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_evaluate, range(500)))
+
+    assert results == [idx * (idx % 10) + 1 for idx in range(500)]
+
+
+def test_expectation_suite_process_evaluation_parameters():
+    suite = ExpectationSuite(
+        expectation_suite_name="my_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": f"column_{idx}",
+                    "min_value": {"$PARAMETER": "lower_bound - 1"},
+                    "max_value": {"$PARAMETER": "upper_bound * 2"},
+                },
+            )
+            for idx in range(3)
+        ],
+    )
+    suite.process_evaluation_parameters(
+        evaluation_parameters={"lower_bound": 1, "upper_bound": 5}
+    )
+
+    for expectation in suite.expectations:
+        assert expectation.kwargs["min_value"] == 0
+        assert expectation.kwargs["max_value"] == 10
+        assert expectation.meta["substituted_parameters"] == {
+            "min_value": 0,
+            "max_value": 10,
+        }
+        assert expectation.get_raw_configuration().kwargs["min_value"] == {
+            "$PARAMETER": "lower_bound - 1"
+        }
+
+
+def test_resolve_store_evaluation_parameters():
+    class MockQueryStore:
+        def __init__(self):
+            self.queries = []
+
+        def get_query_results(self, queries):
+            self.queries.append(queries)
+            return [len(metric_name) for metric_name, _ in queries]
+
+    class MockDataContext:
+        def __init__(self):
+            self.stores = {"my_query_store": MockQueryStore()}
+
+    data_context = MockDataContext()
+    store_values = resolve_store_evaluation_parameters(
+        parameter_expressions=[
+            "urn:great_expectations:stores:my_query_store:abc",
+            "urn:great_expectations:stores:my_query_store:abcd * 2",
+            "urn:great_expectations:stores:my_query_store:abc + 1",
+            "urn:great_expectations:stores:my_query_store:provided",
+            "urn:great_expectations:stores:missing_store:abc",
+        ],
+        evaluation_parameters={
+            "urn:great_expectations:stores:my_query_store:provided": 0
+        },
+        data_context=data_context,
+    )
+
+    # All URNs of a store are fetched in a single call.
+    assert data_context.stores["my_query_store"].queries == [
+        [("abc", {}), ("abcd", {})]
+    ]
+    assert store_values == {
+        "urn:great_expectations:stores:my_query_store:abc": 3,
+        "urn:great_expectations:stores:my_query_store:abcd": 4,
+    }
+    assert (
+        parse_evaluation_parameter(
+            "urn:great_expectations:stores:my_query_store:abcd * 2", store_values
+        )
+        == 8
+    )
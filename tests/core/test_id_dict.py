@@ -0,0 +1,69 @@
+import copy
+import pickle
+
+import pytest
+
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+
+
+def test_frozen_id_dict_to_id_matches_id_dict():
+    kwargs: dict = {"column": "a", "row_condition": 'col("a")>5'}
+    assert FrozenIDDict(kwargs).to_id() == IDDict(kwargs).to_id()
+    assert FrozenIDDict({"column": "a"}).to_id() == "column=a"
+    assert FrozenIDDict().to_id() == tuple()
+    assert FrozenIDDict(kwargs).to_id(id_ignore_keys=["row_condition"]) == "column=a"
+
+
+def test_frozen_id_dict_memoizes_id(monkeypatch):
+    frozen_id_dict = FrozenIDDict({"column": "a", "mostly": 0.9})
+    first_id = frozen_id_dict.to_id()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("id must not be recomputed")
+
+    monkeypatch.setattr(IDDict, "to_id", _fail)
+    assert frozen_id_dict.to_id() == first_id
+
+
+def test_frozen_id_dict_is_immutable():
+    frozen_id_dict = FrozenIDDict({"column": "a"})
+    with pytest.raises(TypeError):
+        frozen_id_dict["column"] = "b"
+    with pytest.raises(TypeError):
+        del frozen_id_dict["column"]
+    with pytest.raises(TypeError):
+        frozen_id_dict.update({"column": "b"})
+    with pytest.raises(TypeError):
+        frozen_id_dict.pop("column")
+    with pytest.raises(TypeError):
+        frozen_id_dict.setdefault("mostly", 1.0)
+    assert frozen_id_dict == {"column": "a"}
+
+
+def test_frozen_id_dict_is_hashable():
+    assert hash(FrozenIDDict({"a": 1, "b": 2})) == hash(FrozenIDDict({"b": 2, "a": 1}))
+    assert len({FrozenIDDict({"a": 1, "b": 2}), FrozenIDDict({"b": 2, "a": 1})}) == 1
+
+
+def test_frozen_id_dict_copies_are_mutable():
+    frozen_id_dict = FrozenIDDict({"column": "a", "value_set": [1, 2]})
+    for copied in [
+        copy.copy(frozen_id_dict),
+        copy.deepcopy(frozen_id_dict),
+        frozen_id_dict.copy(),
+    ]:
+        assert type(copied) is IDDict
+        assert copied == frozen_id_dict
+        copied["column"] = "b"
+
+    deep_copied: IDDict = copy.deepcopy(frozen_id_dict)
+    deep_copied["value_set"].append(3)
+    assert frozen_id_dict["value_set"] == [1, 2]
+
+
+def test_frozen_id_dict_pickle_round_trip():
+    frozen_id_dict = FrozenIDDict({"column": "a", "mostly": 0.9})
+    unpickled = pickle.loads(pickle.dumps(frozen_id_dict))
+    assert isinstance(unpickled, FrozenIDDict)
+    assert unpickled == frozen_id_dict
+    assert unpickled.to_id() == frozen_id_dict.to_id()
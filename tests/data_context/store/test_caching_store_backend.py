@@ -0,0 +1,328 @@
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from great_expectations.core import ExpectationSuite
+from great_expectations.data_context.store import (
+    CachingStoreBackend,
+    ExpectationsStore,
+    InMemoryStoreBackend,
+    TupleFilesystemStoreBackend,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+from great_expectations.exceptions import InvalidKeyError
+
+
+@pytest.fixture
+def caching_in_memory_store_backend() -> CachingStoreBackend:
+    return CachingStoreBackend(
+        store_backend={"class_name": "InMemoryStoreBackend"}, max_size=2
+    )
+
+
+def test_CachingStoreBackend_instantiates_wrapped_store_backend(tmp_path_factory):
+    base_directory: str = str(tmp_path_factory.mktemp("test_caching_store_backend"))
+    store_backend = CachingStoreBackend(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": base_directory,
+        },
+        ttl=60,
+    )
+
+    assert isinstance(store_backend.store_backend, TupleFilesystemStoreBackend)
+    assert (
+        store_backend.store_backend_id == store_backend.store_backend.store_backend_id
+    )
+    assert store_backend.config == {
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": base_directory,
+        },
+        "ttl": 60,
+        "max_size": 1000,
+        "revalidate": False,
+        "module_name": "great_expectations.data_context.store.caching_store_backend",
+        "class_name": "CachingStoreBackend",
+    }
+
+    with pytest.raises(ValueError):
+        CachingStoreBackend(
+            store_backend={"class_name": "InMemoryStoreBackend"}, ttl=-1
+        )
+
+
+def test_CachingStoreBackend_hits_misses_and_writes(caching_in_memory_store_backend):
+    store_backend: CachingStoreBackend = caching_in_memory_store_backend
+    wrapped_store_backend: InMemoryStoreBackend = store_backend.store_backend
+    store_backend.set(("AAA",), "aaa")
+
+    with mock.patch.object(
+        wrapped_store_backend, "_get", wraps=wrapped_store_backend._get
+    ) as mock_get:
+        assert store_backend.get(("AAA",)) == "aaa"
+        assert store_backend.get(("AAA",)) == "aaa"
+        assert store_backend.has_key(("AAA",))
+        assert mock_get.call_count == 1
+
+        # Writes go through to the wrapped store backend and invalidate the cached value
+        store_backend.set(("AAA",), "aaa_2")
+        assert wrapped_store_backend.get(("AAA",)) == "aaa_2"
+        assert store_backend.get(("AAA",)) == "aaa_2"
+        assert mock_get.call_count == 3
+
+    assert store_backend.statistics == {
+        "size": 1,
+        "hits": 2,
+        "misses": 2,
+        "revalidations": 0,
+        "expirations": 0,
+        "evictions": 0,
+    }
+
+    store_backend.remove_key(("AAA",))
+    assert not store_backend.has_key(("AAA",))
+    with pytest.raises(InvalidKeyError):
+        store_backend.get(("AAA",))
+
+
+def test_CachingStoreBackend_evicts_least_recently_used_values(
+    caching_in_memory_store_backend,
+):
+    store_backend: CachingStoreBackend = caching_in_memory_store_backend
+    store_backend.set_many([(("AAA",), "aaa"), (("BBB",), "bbb"), (("CCC",), "ccc")])
+
+    assert store_backend.get_many([("AAA",), ("BBB",)]) == ["aaa", "bbb"]
+    assert store_backend.get(("AAA",)) == "aaa"
+    # ("BBB",) is the least recently used value
+    assert store_backend.get(("CCC",)) == "ccc"
+
+    assert store_backend.statistics["size"] == 2
+    assert store_backend.statistics["evictions"] == 1
+    assert store_backend.get_many([("CCC",), ("AAA",), ("BBB",)]) == [
+        "ccc",
+        "aaa",
+        "bbb",
+    ]
+    assert store_backend.statistics["hits"] == 3
+    assert store_backend.statistics["misses"] == 4
+
+
+def test_CachingStoreBackend_expires_values_after_ttl():
+    store_backend = CachingStoreBackend(
+        store_backend={"class_name": "InMemoryStoreBackend"}, ttl=10
+    )
+    store_backend.set(("AAA",), "aaa")
+
+    with mock.patch(
+        "great_expectations.data_context.store.caching_store_backend.time.monotonic",
+        return_value=100.0,
+    ) as mock_monotonic:
+        assert store_backend.get(("AAA",)) == "aaa"
+        # Another process changes the value, which is served from the cache until it expires
+        store_backend.store_backend.set(("AAA",), "aaa_2")
+
+        mock_monotonic.return_value = 109.0
+        assert store_backend.get(("AAA",)) == "aaa"
+
+        mock_monotonic.return_value = 110.0
+        assert store_backend.get(("AAA",)) == "aaa_2"
+
+    assert store_backend.statistics["hits"] == 1
+    assert store_backend.statistics["misses"] == 2
+    assert store_backend.statistics["expirations"] == 1
+
+
+def test_CachingStoreBackend_revalidates_modification_time(tmp_path_factory):
+    base_directory: str = str(tmp_path_factory.mktemp("test_caching_store_backend"))
+    store_backend = CachingStoreBackend(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": base_directory,
+        },
+        revalidate=True,
+    )
+    store_backend.set(("AAA",), "aaa")
+
+    assert store_backend.get(("AAA",)) == "aaa"
+    assert store_backend.get(("AAA",)) == "aaa"
+    assert store_backend.statistics["revalidations"] == 1
+
+    # Another process changes the file, which is read again since its modification time and size changed
+    filepath: str = os.path.join(base_directory, "AAA")
+    with open(filepath, "w") as outfile:
+        outfile.write("aaa_2")
+    os.utime(filepath, ns=(0, 0))
+
+    assert store_backend.get(("AAA",)) == "aaa_2"
+    assert store_backend.statistics["revalidations"] == 1
+    assert store_backend.statistics["misses"] == 2
+
+
+def test_CachingStoreBackend_revalidates_without_holding_the_lock(tmp_path_factory):
+    base_directory: str = str(tmp_path_factory.mktemp("test_caching_store_backend"))
+    store_backend = CachingStoreBackend(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": base_directory,
+        },
+        revalidate=True,
+    )
+    store_backend.set(("AAA",), "aaa")
+    assert store_backend.get(("AAA",)) == "aaa"
+
+    wrapped_store_backend: TupleFilesystemStoreBackend = store_backend.store_backend
+    get_version = wrapped_store_backend.get_version
+    cached_version: str = get_version(("AAA",))
+    is_first_call: bool = True
+
+    def get_version_while_setting_the_value(key):
+        nonlocal is_first_call
+        if not is_first_call:
+            return get_version(key)
+
+        is_first_call = False
+        # Another thread sets the value while the version is checked, which would deadlock if the lock were held
+        thread = threading.Thread(target=store_backend.set, args=(key, "aaa_2"))
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        return cached_version
+
+    with mock.patch.object(
+        wrapped_store_backend,
+        "get_version",
+        side_effect=get_version_while_setting_the_value,
+    ):
+        # The cached value was invalidated during its revalidation, so it is read again rather than served
+        assert store_backend.get(("AAA",)) == "aaa_2"
+
+    assert store_backend.statistics["revalidations"] == 0
+    assert store_backend.statistics["misses"] == 2
+
+
+def test_CachingStoreBackend_does_not_cache_values_read_before_a_write(
+    caching_in_memory_store_backend,
+):
+    store_backend: CachingStoreBackend = caching_in_memory_store_backend
+    wrapped_store_backend: InMemoryStoreBackend = store_backend.store_backend
+    store_backend.set(("AAA",), "aaa")
+
+    read_started = threading.Event()
+    write_finished = threading.Event()
+    get = wrapped_store_backend._get
+
+    def get_until_the_value_is_set(key):
+        value = get(key)
+        read_started.set()
+        assert write_finished.wait(timeout=10)
+        return value
+
+    values: list = []
+    with mock.patch.object(
+        wrapped_store_backend, "_get", side_effect=get_until_the_value_is_set
+    ):
+        thread = threading.Thread(
+            target=lambda: values.append(store_backend.get(("AAA",)))
+        )
+        thread.start()
+        assert read_started.wait(timeout=10)
+        store_backend.set(("AAA",), "aaa_2")
+        write_finished.set()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    # The value read before the write is returned to its reader, but not cached
+    assert values == ["aaa"]
+    assert store_backend.statistics["size"] == 0
+    assert store_backend.get(("AAA",)) == "aaa_2"
+
+
+def test_CachingStoreBackend_invalidates_values_read_during_a_write(
+    caching_in_memory_store_backend,
+):
+    store_backend: CachingStoreBackend = caching_in_memory_store_backend
+    wrapped_store_backend: InMemoryStoreBackend = store_backend.store_backend
+    store_backend.set(("AAA",), "aaa")
+
+    set_ = wrapped_store_backend._set
+    values: list = []
+
+    def set_after_a_read(key, value, **kwargs):
+        # Another thread reads (and caches) the previous value while the value is being set
+        thread = threading.Thread(target=lambda: values.append(store_backend.get(key)))
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        return set_(key, value, **kwargs)
+
+    with mock.patch.object(wrapped_store_backend, "_set", side_effect=set_after_a_read):
+        store_backend.set(("AAA",), "aaa_2")
+
+    assert values == ["aaa"]
+    assert store_backend.get(("AAA",)) == "aaa_2"
+
+
+def test_CachingStoreBackend_get_many_gets_versions_of_missing_keys_at_once(
+    tmp_path_factory,
+):
+    store_backend = CachingStoreBackend(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(
+                tmp_path_factory.mktemp("test_caching_store_backend")
+            ),
+        },
+        revalidate=True,
+    )
+    store_backend.set_many([(("AAA",), "aaa"), (("BBB",), "bbb"), (("CCC",), "ccc")])
+    assert store_backend.get(("AAA",)) == "aaa"
+
+    wrapped_store_backend: TupleFilesystemStoreBackend = store_backend.store_backend
+    with mock.patch.object(
+        wrapped_store_backend, "get_versions", wraps=wrapped_store_backend.get_versions
+    ) as mock_get_versions:
+        assert store_backend.get_many([("AAA",), ("BBB",), ("CCC",)]) == [
+            "aaa",
+            "bbb",
+            "ccc",
+        ]
+
+    mock_get_versions.assert_called_once_with([("BBB",), ("CCC",)])
+    assert store_backend.get_many([("BBB",), ("CCC",)]) == ["bbb", "ccc"]
+    assert store_backend.statistics["misses"] == 3
+
+
+def test_ExpectationsStore_with_CachingStoreBackend_deserializes_once(
+    tmp_path_factory,
+):
+    base_directory: str = str(tmp_path_factory.mktemp("test_caching_store_backend"))
+    store = ExpectationsStore(
+        store_backend={
+            "class_name": "CachingStoreBackend",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": base_directory,
+            },
+        }
+    )
+    # The default filepath_suffix of the ExpectationsStore is applied to the wrapped store backend
+    assert store.store_backend.store_backend.filepath_suffix == ".json"
+
+    key = ExpectationSuiteIdentifier(expectation_suite_name="my_suite")
+    store.set(key, ExpectationSuite(expectation_suite_name="my_suite"))
+
+    with mock.patch.object(
+        store, "deserialize", wraps=store.deserialize
+    ) as mock_deserialize:
+        suite_dict: dict = store.get(key)
+        suite_dict["meta"]["notes"] = "mutated"
+        assert store.get(key)["expectation_suite_name"] == "my_suite"
+        assert "notes" not in store.get(key)["meta"]
+        assert mock_deserialize.call_count == 1
+
+    assert os.path.isfile(os.path.join(base_directory, "my_suite.json"))
@@ -212,6 +212,7 @@ def test_checkpoint_store(empty_data_context):
                 "platform_specific_separator": True,
                 "fixed_length_key": False,
                 "suppress_store_backend_id": False,
+                "cache_key_index": False,
                 "module_name": "great_expectations.data_context.store.tuple_store_backend",
                 "class_name": "TupleFilesystemStoreBackend",
                 "filepath_suffix": ".yml",
@@ -217,3 +217,49 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+def test_database_store_backend_set_many(sa):
+    store_backend = DatabaseStoreBackend(
+        engine=sa.create_engine("sqlite://"),
+        table_name="test_database_store_backend_set_many",
+        key_columns=["k1", "k2"],
+    )
+    store_backend.set(("a", "1"), "hello")
+
+    # new keys are inserted and existing keys are updated, the last value of a repeated key wins
+    store_backend.set_many(
+        [
+            (("a", "1"), "world"),
+            (("a", "2"), "foo"),
+            (("b", "1"), "bar"),
+            (("a", "2"), "baz"),
+        ]
+    )
+    assert store_backend.get(("a", "1")) == "world"
+    assert store_backend.get(("a", "2")) == "baz"
+    assert store_backend.get(("b", "1")) == "bar"
+
+    # dialects without native upsert statements update the existing keys in the same transaction
+    store_backend.engine.dialect.server_version_info = (3, 0, 0)
+    store_backend.set_many([(("a", "1"), "hello again"), (("c", "1"), "qux")])
+    assert store_backend.get(("a", "1")) == "hello again"
+    assert store_backend.get(("c", "1")) == "qux"
+
+
+def test_database_store_backend_set_many_without_update(sa):
+    store_backend = DatabaseStoreBackend(
+        engine=sa.create_engine("sqlite://"),
+        table_name="test_database_store_backend_set_many_without_update",
+        key_columns=["k1"],
+    )
+    store_backend.set(("1",), "hello")
+
+    # setting a key to its existing value is tolerated
+    store_backend.set_many([(("1",), "hello"), (("2",), "world")], allow_update=False)
+    assert store_backend.get(("2",)) == "world"
+
+    with pytest.raises(StoreBackendError) as exc:
+        store_backend.set_many([(("1",), "foo")], allow_update=False)
+
+    assert "Integrity error" in str(exc.value)
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.metric import MetricResultIdentifier
+from great_expectations.data_context.store import MetricResultStore
+from great_expectations.exceptions import InvalidKeyError
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+@pytest.fixture
+def metric_result_store(tmp_path_factory):
+    return MetricResultStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path_factory.mktemp("metric_results")),
+        }
+    )
+
+
+def test_metric_result_identifier_round_trip():
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    key = MetricResultIdentifier.from_metric_configuration(
+        batch_fingerprint="fingerprint",
+        metric_configuration=metric_configuration,
+    )
+
+    assert key.to_tuple() == (
+        "fingerprint",
+        "column.max",
+        metric_configuration.metric_domain_kwargs_id,
+        "__",
+    )
+    assert MetricResultIdentifier.from_tuple(key.to_tuple()) == key
+    assert (
+        MetricResultIdentifier.from_fixed_length_tuple(key.to_fixed_length_tuple())
+        == key
+    )
+
+
+def test_metric_result_store_set_and_get(metric_result_store):
+    key = MetricResultIdentifier(
+        batch_fingerprint="fingerprint",
+        metric_name="column.value_counts",
+        metric_domain_kwargs_id="domain",
+    )
+    value: dict = {"observed_value": [np.int64(1), 2.5, None, "a"]}
+    metric_result_store.set(key, value)
+
+    assert metric_result_store.get(key) == {"observed_value": [1, 2.5, None, "a"]}
+    assert metric_result_store.list_keys() == [key]
+    assert metric_result_store.config == {
+        "store_backend": metric_result_store.config["store_backend"],
+        "module_name": "great_expectations.data_context.store.metric_store",
+        "class_name": "MetricResultStore",
+    }
+
+    with pytest.raises(InvalidKeyError):
+        metric_result_store.get(
+            MetricResultIdentifier(
+                batch_fingerprint="other_fingerprint",
+                metric_name="column.value_counts",
+                metric_domain_kwargs_id="domain",
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        pytest.param(3, True, id="int"),
+        pytest.param(np.float64(0.5), True, id="numpy_float"),
+        pytest.param(None, True, id="none"),
+        pytest.param(["a", 1, [True]], True, id="list"),
+        pytest.param({"count": 1, "values": ["a"]}, True, id="dict"),
+        pytest.param({1: "a"}, False, id="dict_with_non_string_keys"),
+        pytest.param((1, 2), False, id="tuple"),
+        pytest.param(pd.Timestamp("2021-01-01"), False, id="timestamp"),
+        pytest.param(pd.Series([1, 2]), False, id="series"),
+    ],
+)
+def test_metric_result_store_is_storable_value(value, expected):
+    assert MetricResultStore.is_storable_value(value) is expected
@@ -88,6 +88,7 @@ def test_profiler_store_integration(
                 "module_name": "great_expectations.data_context.store.tuple_store_backend",
                 "platform_specific_separator": True,
                 "suppress_store_backend_id": False,
+                "cache_key_index": False,
             },
             "store_name": "profiler_store",
         },
@@ -1,4 +1,5 @@
 import pytest
+import sqlalchemy as sa
 
 import tests.test_utils as test_utils
 from great_expectations.data_context.store.query_store import SqlAlchemyQueryStore
@@ -69,3 +70,85 @@ def test_query_store_store_backend_id(basic_sqlalchemy_query_store):
     assert basic_sqlalchemy_query_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(basic_sqlalchemy_query_store.store_backend_id)
+
+
+def test_get_query_results(sqlalchemy_query_store_specified_return_type):
+    store = sqlalchemy_query_store_specified_return_type
+    store.set(
+        "q4",
+        {
+            "query": "SELECT count(*) FROM titanic WHERE PClass = '${pclass}';",
+            "return_type": "scalar",
+        },
+    )
+
+    results = store.get_query_results(
+        [("q1", None), ("q3", None), ("q4", {"pclass": "1st"}), ("q3", {})]
+    )
+
+    assert results[0] == ["1st", "2nd", "*", "3rd"]
+    assert results[1] == results[3] == 1313
+    assert results[2] == store.get_query_result("q4", {"pclass": "1st"})
+
+    with pytest.raises(ValueError):
+        store.get_query_results([("q3", None), ("error_query", None)])
+
+
+def test_get_query_results_executes_scalar_queries_in_a_single_statement(
+    sqlalchemy_query_store_specified_return_type,
+):
+    store = sqlalchemy_query_store_specified_return_type
+    store.set(
+        "q4",
+        {
+            "query": "SELECT count(*) FROM titanic WHERE PClass = '${pclass}';",
+            "return_type": "scalar",
+        },
+    )
+
+    statements: list = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(store.engine, "before_cursor_execute", record_statement)
+    try:
+        results = store.get_query_results(
+            [("q1", None), ("q3", None), ("q4", {"pclass": "1st"})]
+        )
+    finally:
+        sa.event.remove(store.engine, "before_cursor_execute", record_statement)
+
+    assert results == [
+        ["1st", "2nd", "*", "3rd"],
+        1313,
+        store.get_query_result("q4", {"pclass": "1st"}),
+    ]
+    # The scalar queries are executed together, and the list query on its own.
+    assert len(statements) == 2
+
+
+def test_get_query_results_requires_scalar_queries_to_return_one_value(
+    sqlalchemy_query_store_specified_return_type,
+):
+    store = sqlalchemy_query_store_specified_return_type
+    store.set(
+        "no_row",
+        {
+            "query": "SELECT count(*) FROM titanic GROUP BY PClass HAVING count(*) < 0;",
+            "return_type": "scalar",
+        },
+    )
+    store.set(
+        "multiple_rows",
+        {"query": "SELECT Name FROM titanic;", "return_type": "scalar"},
+    )
+
+    for key in ["no_row", "multiple_rows"]:
+        with pytest.raises(ValueError):
+            store.get_query_result(key)
+        with pytest.raises(ValueError):
+            store.get_query_results([(key, None)])
+        # Other scalar queries of the same call do not change the result.
+        with pytest.raises(ValueError):
+            store.get_query_results([(key, None), ("q3", None)])
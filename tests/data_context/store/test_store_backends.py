@@ -1,3 +1,4 @@
+import concurrent.futures
 import datetime
 import json
 import os
@@ -396,6 +397,27 @@ def test_InMemoryStoreBackend():
         my_store.get_url_for_key(my_key)
 
 
+@pytest.mark.parametrize("store_backend_class_name", ["InMemory", "TupleFilesystem"])
+def test_StoreBackend_get_many_and_set_many(tmp_path_factory, store_backend_class_name):
+    if store_backend_class_name == "InMemory":
+        my_store = InMemoryStoreBackend()
+    else:
+        my_store = TupleFilesystemStoreBackend(
+            root_directory=str(tmp_path_factory.mktemp("get_many")),
+            base_directory="things",
+        )
+
+    assert my_store.set_many([]) == []
+    my_store.set_many([(("AAA",), "aaa"), (("BBB",), "bbb"), (("CCC",), "ccc")])
+    assert my_store.get(("BBB",)) == "bbb"
+    assert my_store.get_many([("CCC",), ("AAA",)]) == ["ccc", "aaa"]
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("AAA",), ("DDD",)])
+    with pytest.raises(TypeError):
+        my_store.get_many([("AAA",), "BBB"])
+
+
 def test_tuple_filesystem_store_filepath_prefix_error(tmp_path_factory):
     path = str(
         tmp_path_factory.mktemp("test_tuple_filesystem_store_filepath_prefix_error")
@@ -528,6 +550,144 @@ things0/
     assert set(my_store.list_keys()) == {(".ge_store_backend_id",), ("AAA",)}
 
 
+def test_TupleFilesystemStoreBackend_iter_keys_pushes_prefix_down_to_the_listing(
+    tmp_path_factory,
+):
+    project_path = str(tmp_path_factory.mktemp("iter_keys"))
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="validations",
+        filepath_suffix=".json",
+    )
+    keys = [
+        ("suite", "run_0", "20220101T000000.000000Z", "batch_0"),
+        ("suite", "run_1", "20220101T000000.000000Z", "batch_0"),
+        ("suite", "nested", "run_0", "20220101T000000.000000Z", "batch_0"),
+        ("other_suite", "run_0", "20220101T000000.000000Z", "batch_0"),
+    ]
+    for key in keys:
+        my_store.set(key, "{}")
+
+    assert set(my_store.iter_keys(prefix=("suite",))) == set(keys[:3])
+    assert set(my_store.iter_keys(prefix=("suite", "run_1"))) == {keys[1]}
+    assert set(
+        my_store.iter_keys(prefix=("suite",), filter_function=lambda key: len(key) == 4)
+    ) == set(keys[:2])
+    assert list(my_store.iter_keys(prefix=("missing_suite",))) == []
+    assert sorted(
+        len(batch)
+        for batch in my_store.iter_key_batches(
+            filter_function=lambda key: key != StoreBackend.STORE_BACKEND_ID_KEY,
+            batch_size=3,
+        )
+    ) == [1, 3]
+
+    # Only the directory containing the filepath prefix is walked
+    with patch("os.walk", wraps=os.walk) as mock_walk:
+        assert set(my_store.list_keys(prefix=("suite", "run_1"))) == {keys[1]}
+    mock_walk.assert_called_once_with(
+        os.path.join(my_store.full_base_directory, "suite")
+    )
+
+
+def test_TupleFilesystemStoreBackend_iter_keys_with_filepath_template_and_prefix(
+    tmp_path_factory,
+):
+    project_path = str(tmp_path_factory.mktemp("iter_keys_template"))
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="site",
+        filepath_prefix="expectations",
+        filepath_template="{0}/{1}/page-{1}.html",
+        suppress_store_backend_id=True,
+    )
+    my_store.set(("a", "x"), "ax")
+    my_store.set(("a", "y"), "ay")
+    my_store.set(("b", "x"), "bx")
+    with open(os.path.join(my_store.full_base_directory, "index.html"), "w") as f:
+        f.write("")
+
+    assert my_store._convert_key_prefix_to_filepath_prefix(("a",)) == os.path.join(
+        "expectations", "a", ""
+    )
+    assert set(my_store.list_keys()) == {("a", "x"), ("a", "y"), ("b", "x")}
+    assert set(my_store.list_keys(prefix=("a",))) == {("a", "x"), ("a", "y")}
+    assert my_store.list_keys(prefix=("b", "x")) == [("b", "x")]
+
+
+def test_TupleFilesystemStoreBackend_key_index_is_kept_coherent(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("key_index"))
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="things",
+        suppress_store_backend_id=True,
+        cache_key_index=True,
+    )
+    my_store.set(("AAA",), "aaa")
+    assert my_store.cache_key_index is True
+    assert my_store.config["cache_key_index"] is True
+
+    with patch("os.walk", wraps=os.walk) as mock_walk:
+        assert set(my_store.list_keys()) == {("AAA",)}
+        my_store.set(("BBB",), "bbb")
+        my_store.set(("CCC",), "ccc")
+        my_store.remove_key(("AAA",))
+        my_store.move(("CCC",), ("DDD",))
+        assert set(my_store.list_keys()) == {("BBB",), ("DDD",)}
+        assert list(my_store.iter_keys(prefix=("DDD",))) == [("DDD",)]
+
+    # The keys are listed from the filesystem only once
+    assert mock_walk.call_count == 1
+
+    # Keys written by another backend are picked up once the index is refreshed
+    other_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="things",
+        suppress_store_backend_id=True,
+    )
+    other_store.set(("EEE",), "eee")
+    assert set(my_store.list_keys()) == {("BBB",), ("DDD",)}
+    my_store.refresh_key_index()
+    assert set(my_store.list_keys()) == {("BBB",), ("DDD",), ("EEE",)}
+
+
+@mock_s3
+def test_TupleS3StoreBackend_get_many_and_set_many_are_concurrent():
+    bucket = "leakybucket"
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix="this_is_a_test_prefix",
+        max_concurrent_requests=4,
+        suppress_store_backend_id=True,
+    )
+    assert my_store.config["max_concurrent_requests"] == 4
+
+    keys = [(f"key_{idx}",) for idx in range(20)]
+    with patch(
+        "concurrent.futures.ThreadPoolExecutor",
+        wraps=concurrent.futures.ThreadPoolExecutor,
+    ) as mock_executor:
+        my_store.set_many([(key, f"value_{key[0]}") for key in keys])
+        values = my_store.get_many(keys)
+
+    assert mock_executor.call_count == 2
+    mock_executor.assert_called_with(max_workers=4)
+    assert values == [f"value_{key[0]}" for key in keys]
+    assert {
+        s3_object_info["Key"]
+        for s3_object_info in boto3.client("s3").list_objects_v2(
+            Bucket=bucket, Prefix="this_is_a_test_prefix"
+        )["Contents"]
+    } == {f"this_is_a_test_prefix/my_file_{key[0]}" for key in keys}
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("key_0",), ("missing_key",)])
+
+
 @mock_s3
 def test_TupleS3StoreBackend_with_prefix():
     """
@@ -246,6 +246,48 @@ test_ValidationResultStore_with_TupleFileSystemStoreBackend__dir0/
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@mock_s3
+def test_ValidationsStore_get_many_and_set_many_with_TupleS3StoreBackend():
+    bucket = "test_validation_store_bucket"
+    boto3.resource("s3", region_name="us-east-1").create_bucket(Bucket=bucket)
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleS3StoreBackend",
+            "bucket": bucket,
+            "prefix": "test/prefix",
+            "max_concurrent_requests": 4,
+        }
+    )
+    keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+            run_id=f"prod-{idx}",
+            batch_identifier="batch_id",
+        )
+        for idx in range(10)
+    ]
+    my_store.set_many(
+        [
+            (key, ExpectationSuiteValidationResult(success=bool(idx % 2)))
+            for idx, key in enumerate(keys)
+        ]
+    )
+    assert set(my_store.list_keys()) == set(keys)
+
+    # The values are returned in the order of the keys
+    with mock.patch.object(
+        my_store.store_backend,
+        "_create_client",
+        wraps=my_store.store_backend._create_client,
+    ) as mock_create_client:
+        validation_results = my_store.get_many(list(reversed(keys)))
+    mock_create_client.assert_called_once()
+    assert [validation_result.success for validation_result in validation_results] == [
+        bool(idx % 2) for idx in reversed(range(10))
+    ]
+
+
 def test_ValidationsStore_with_DatabaseStoreBackend(sa):
     # Use sqlite so we don't require postgres for this test.
     connection_kwargs = {"drivername": "sqlite"}
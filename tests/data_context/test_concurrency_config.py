@@ -1,3 +1,5 @@
+import pytest
+
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
@@ -29,3 +31,32 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_concurrency_process_pool_configuration():
+    data_context_config = DataContextConfig(
+        concurrency={
+            "enabled": True,
+            "process_pool_enabled": True,
+            "max_process_pool_workers": 4,
+        },
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+    )
+    assert data_context_config.concurrency.process_pool_enabled
+    assert data_context_config.concurrency.max_process_pool_workers == 4
+    assert data_context_config.to_json_dict()["concurrency"] == {
+        "enabled": True,
+        "process_pool_enabled": True,
+        "max_process_pool_workers": 4,
+    }
+
+    # The process pool options are omitted unless configured
+    data_context_config = DataContextConfig(
+        concurrency=ConcurrencyConfig(enabled=True),
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+    )
+    assert not data_context_config.concurrency.process_pool_enabled
+    assert data_context_config.to_json_dict()["concurrency"] == {"enabled": True}
+
+    with pytest.raises(ValueError):
+        ConcurrencyConfig(enabled=True, max_process_pool_workers=0)
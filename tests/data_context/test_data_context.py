@@ -616,6 +616,7 @@ project_path/
 data_docs/
     local_site/
         index.html
+        index_manifest.json
         expectations/
             random/
                 subdir_reader/
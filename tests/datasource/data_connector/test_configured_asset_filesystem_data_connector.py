@@ -1366,3 +1366,127 @@ def test_basic_instantiation_with_nested_directories(tmp_path_factory):
         # FIXME: (Sam) example_data_reference removed temporarily in PR #2590:
         # "example_data_reference": {},
     }
+
+
+def test_batch_definitions_are_looked_up_in_sorted_index(tmp_path_factory):
+    base_directory = str(
+        tmp_path_factory.mktemp("test_batch_definitions_are_looked_up_in_sorted_index")
+    )
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "alex_20200809_1000.csv",
+            "eugene_20200809_1500.csv",
+            "james_20200811_1009.csv",
+            "abe_20200809_1040.csv",
+            "will_20200809_1002.csv",
+            "james_20200713_1567.csv",
+            "eugene_20201129_1900.csv",
+            "will_20200810_1001.csv",
+            "james_20200810_1003.csv",
+            "alex_20200819_1300.csv",
+        ],
+    )
+
+    my_data_connector_yaml = yaml.load(
+        f"""
+        class_name: ConfiguredAssetFilesystemDataConnector
+        datasource_name: test_environment
+        base_directory: {base_directory}
+        glob_directive: "*.csv"
+        assets:
+            TestFiles:
+        default_regex:
+            pattern: (.+)_(.+)_(.+)\\.csv
+            group_names:
+                - name
+                - timestamp
+                - price
+        sorters:
+            - orderby: asc
+              class_name: LexicographicSorter
+              name: name
+            - datetime_format: "%Y%m%d"
+              orderby: desc
+              class_name: DateTimeSorter
+              name: timestamp
+    """,
+    )
+
+    my_data_connector: ConfiguredAssetFilesystemDataConnector = (
+        instantiate_class_from_config(
+            config=my_data_connector_yaml,
+            runtime_environment={
+                "name": "general_filesystem_data_connector",
+                "execution_engine": PandasExecutionEngine(),
+            },
+            config_defaults={
+                "module_name": "great_expectations.datasource.data_connector"
+            },
+        )
+    )
+    my_data_connector._refresh_data_references_cache()
+
+    def get_batch_identifiers(data_connector_query=None, batch_identifiers=None):
+        return [
+            batch_definition.batch_identifiers
+            for batch_definition in my_data_connector._get_batch_definition_list_from_batch_request(
+                BatchRequestBase(
+                    datasource_name="test_environment",
+                    data_connector_name="general_filesystem_data_connector",
+                    data_asset_name="TestFiles",
+                    data_connector_query=data_connector_query,
+                    batch_identifiers=batch_identifiers,
+                )
+            )
+        ]
+
+    # The batch_definitions of the data_asset are sorted and indexed upon its first lookup after the refresh
+    assert len(get_batch_identifiers()) == 10
+
+    with mock.patch(
+        "great_expectations.datasource.data_connector.file_path_data_connector.batch_definition_matches_batch_request"
+    ) as mock_batch_definition_matches_batch_request, mock.patch(
+        "great_expectations.datasource.data_connector.sorter.Sorter.get_sorted_batch_definitions"
+    ) as mock_get_sorted_batch_definitions:
+        assert get_batch_identifiers(
+            data_connector_query={"batch_filter_parameters": {"name": "james"}}
+        ) == [
+            {"name": "james", "timestamp": "20200811", "price": "1009"},
+            {"name": "james", "timestamp": "20200810", "price": "1003"},
+            {"name": "james", "timestamp": "20200713", "price": "1567"},
+        ]
+        assert get_batch_identifiers(
+            data_connector_query={"batch_filter_parameters": {"name": "james"}},
+            batch_identifiers={"timestamp": "20200810"},
+        ) == [{"name": "james", "timestamp": "20200810", "price": "1003"}]
+        assert (
+            get_batch_identifiers(
+                data_connector_query={"batch_filter_parameters": {"name": "james"}},
+                batch_identifiers={"name": "will"},
+            )
+            == []
+        )
+        assert get_batch_identifiers(data_connector_query={"limit": 2}) == [
+            {"name": "abe", "timestamp": "20200809", "price": "1040"},
+            {"name": "alex", "timestamp": "20200819", "price": "1300"},
+        ]
+        assert get_batch_identifiers(
+            data_connector_query={
+                "batch_filter_parameters": {"name": "eugene"},
+                "index": -1,
+            }
+        ) == [{"name": "eugene", "timestamp": "20200809", "price": "1500"}]
+
+    # Lookups neither scan nor sort the batch_definitions
+    mock_batch_definition_matches_batch_request.assert_not_called()
+    mock_get_sorted_batch_definitions.assert_not_called()
+
+    # The index is rebuilt when the data_references cache is refreshed
+    create_files_in_directory(
+        directory=base_directory, file_name_list=["james_20200901_1100.csv"]
+    )
+    my_data_connector._refresh_data_references_cache()
+    assert get_batch_identifiers(
+        data_connector_query={"batch_filter_parameters": {"name": "james"}, "limit": 1}
+    ) == [{"name": "james", "timestamp": "20200901", "price": "1100"}]
@@ -1,5 +1,5 @@
 import json
-from typing import List
+from typing import List, Optional
 from unittest import mock
 
 import boto3
@@ -18,6 +18,7 @@ from great_expectations.core.batch import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import ConfiguredAssetS3DataConnector
+from great_expectations.datasource.data_connector.util import list_s3_keys
 from great_expectations.execution_engine import PandasExecutionEngine
 
 yaml = YAML()
@@ -1117,3 +1118,134 @@ assets:
         )
         == 5
     )
+
+
+@mock_s3
+def test_data_references_are_listed_incrementally_with_persisted_cache(
+    tmp_path_factory,
+):
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+
+    def put_objects(keys: List[str]):
+        for key in keys:
+            client.put_object(
+                Bucket=bucket,
+                Body=test_df.to_csv(index=False).encode("utf-8"),
+                Key=key,
+            )
+
+    put_objects(
+        keys=[
+            "alpha-2020-01.csv",
+            "alpha-2020-02.csv",
+            "beta-2020-01.csv",
+            "gamma.csv",
+        ]
+    )
+
+    data_references_cache_directory: str = str(
+        tmp_path_factory.mktemp("data_references_cache")
+    )
+
+    def build_data_connector(
+        data_references_cache_ttl: Optional[int] = None,
+    ) -> ConfiguredAssetS3DataConnector:
+        return ConfiguredAssetS3DataConnector(
+            name="my_data_connector",
+            datasource_name="FAKE_DATASOURCE_NAME",
+            execution_engine=PandasExecutionEngine(),
+            default_regex={
+                "pattern": "(alpha|beta)-(\\d{4})-(\\d{2})\\.csv",
+                "group_names": ["name", "year", "month"],
+            },
+            bucket=bucket,
+            prefix="",
+            assets={"all": {}},
+            data_references_cache_directory=data_references_cache_directory,
+            data_references_cache_ttl=data_references_cache_ttl,
+        )
+
+    def get_batch_identifiers(
+        my_data_connector: ConfiguredAssetS3DataConnector,
+    ) -> List[dict]:
+        return [
+            dict(batch_definition.batch_identifiers)
+            for batch_definition in my_data_connector.get_batch_definition_list_from_batch_request(
+                BatchRequest(
+                    datasource_name="FAKE_DATASOURCE_NAME",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="all",
+                )
+            )
+        ]
+
+    my_data_connector: ConfiguredAssetS3DataConnector = build_data_connector()
+    assert get_batch_identifiers(my_data_connector=my_data_connector) == [
+        {"name": "alpha", "year": "2020", "month": "01"},
+        {"name": "alpha", "year": "2020", "month": "02"},
+        {"name": "beta", "year": "2020", "month": "01"},
+    ]
+    assert my_data_connector.get_unmatched_data_references() == ["gamma.csv"]
+
+    put_objects(keys=["aardvark-2020-01.csv", "zeta-2020-01.csv", "beta-2020-02.csv"])
+    client.delete_object(Bucket=bucket, Key="gamma.csv")
+
+    # A new DataConnector (e.g., in another process) only lists the keys after the last persisted one ("gamma.csv").
+    my_data_connector = build_data_connector()
+    with mock.patch(
+        "great_expectations.datasource.data_connector.configured_asset_s3_data_connector.list_s3_keys",
+        wraps=list_s3_keys,
+    ) as mock_list_s3_keys:
+        assert get_batch_identifiers(my_data_connector=my_data_connector) == [
+            {"name": "alpha", "year": "2020", "month": "01"},
+            {"name": "alpha", "year": "2020", "month": "02"},
+            {"name": "beta", "year": "2020", "month": "01"},
+        ]
+
+    assert mock_list_s3_keys.call_args[1]["query_options"]["StartAfter"] == "gamma.csv"
+    assert my_data_connector.get_unmatched_data_references() == [
+        "gamma.csv",
+        "zeta-2020-01.csv",
+    ]
+
+    # Nothing was added after the last persisted key ("zeta-2020-01.csv")
+    my_data_connector = build_data_connector()
+    assert len(get_batch_identifiers(my_data_connector=my_data_connector)) == 3
+
+    # Once the last full listing has expired, all keys are listed again, dropping the deleted "gamma.csv" and picking
+    # up "aardvark-2020-01.csv" and "beta-2020-02.csv" (which sort before the last persisted key).
+    my_data_connector = build_data_connector(data_references_cache_ttl=0)
+    assert get_batch_identifiers(my_data_connector=my_data_connector) == [
+        {"name": "alpha", "year": "2020", "month": "01"},
+        {"name": "alpha", "year": "2020", "month": "02"},
+        {"name": "beta", "year": "2020", "month": "01"},
+        {"name": "beta", "year": "2020", "month": "02"},
+    ]
+    assert my_data_connector.get_unmatched_data_references() == [
+        "aardvark-2020-01.csv",
+        "zeta-2020-01.csv",
+    ]
+
+    put_objects(keys=["beta-2020-03.csv"])
+    client.delete_object(Bucket=bucket, Key="alpha-2020-02.csv")
+
+    # Clearing the persisted cache lists all keys again
+    my_data_connector = build_data_connector()
+    my_data_connector.clear_persisted_data_references_cache()
+    my_data_connector._refresh_data_references_cache()
+    assert get_batch_identifiers(my_data_connector=my_data_connector) == [
+        {"name": "alpha", "year": "2020", "month": "01"},
+        {"name": "beta", "year": "2020", "month": "01"},
+        {"name": "beta", "year": "2020", "month": "02"},
+        {"name": "beta", "year": "2020", "month": "03"},
+    ]
+    assert my_data_connector.get_unmatched_data_references() == [
+        "aardvark-2020-01.csv",
+        "zeta-2020-01.csv",
+    ]
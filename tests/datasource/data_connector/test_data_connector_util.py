@@ -7,6 +7,8 @@ from great_expectations.core.batch import BatchDefinition, BatchRequest, IDDict
 
 # noinspection PyProtectedMember
 from great_expectations.datasource.data_connector.util import (
+    DataReferenceMatcher,
+    LazyBatchDefinitionList,
     _invert_regex_to_data_reference_template,
     batch_definition_matches_batch_request,
     build_sorters_from_config,
@@ -266,6 +268,53 @@ def test_convert_data_reference_string_to_batch_identifiers_using_regex_with_nam
     assert "The named group 'price' must explicitly be stated" in caplog.text
 
 
+def test_DataReferenceMatcher_maps_listing_in_single_pass(caplog):
+    data_reference_matcher = DataReferenceMatcher(
+        regex_pattern=r"^(?P<data_asset_name>.+)/(?P<name>.+)_(?P<price>\d+)\.csv$",
+        group_names=["data_asset_name", "name"],
+    )
+
+    assert list(
+        data_reference_matcher.match_all(
+            data_references=["a/alex_1000.csv", "b/eugene_1500.csv", "c/README.md"]
+        )
+    ) == [
+        ("a/alex_1000.csv", ("a", IDDict({"name": "alex"}))),
+        ("b/eugene_1500.csv", ("b", IDDict({"name": "eugene"}))),
+        ("c/README.md", None),
+    ]
+    # The unlisted named group is only warned about once per matcher
+    assert caplog.text.count("The named group 'price' must explicitly be stated") == 1
+
+
+def test_LazyBatchDefinitionList_creates_batch_definitions_upon_access():
+    batch_identifiers = IDDict({"name": "alex", "timestamp": "20200809"})
+    batch_definition_list = LazyBatchDefinitionList(
+        datasource_name="test_datasource",
+        data_connector_name="test_data_connector",
+        mapped_batch_identifiers=[("test_data_asset", batch_identifiers)],
+    )
+
+    with mock.patch(
+        "great_expectations.datasource.data_connector.util.BatchDefinition",
+        wraps=BatchDefinition,
+    ) as mock_batch_definition:
+        assert len(batch_definition_list) == 1
+        assert batch_definition_list.data_asset_name == "test_data_asset"
+        assert mock_batch_definition.call_count == 0
+
+        assert batch_definition_list == [
+            BatchDefinition(
+                datasource_name="test_datasource",
+                data_connector_name="test_data_connector",
+                data_asset_name="test_data_asset",
+                batch_identifiers=batch_identifiers,
+            )
+        ]
+        assert batch_definition_list[0] is batch_definition_list[0]
+        assert mock_batch_definition.call_count == 1
+
+
 def test_map_batch_definition_to_data_reference_string_using_regex():
     # not BatchDefinition
     my_batch_definition = "I_am_a_string"
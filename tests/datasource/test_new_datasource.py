@@ -21,6 +21,7 @@ from great_expectations.core.batch import (
     BatchDefinition,
     BatchRequest,
     IDDict,
+    LazyBatch,
     RuntimeBatchRequest,
 )
 from great_expectations.data_context.util import (
@@ -428,12 +429,21 @@ def test_get_batch_list_from_batch_request(basic_pandas_datasource_v013):
 
     batch: Batch = batch_list[0]
 
+    # The data of the batch is only loaded upon first access.
+    assert isinstance(batch, LazyBatch)
+    assert not batch.is_loaded
+    assert (
+        batch.id
+        not in basic_pandas_datasource_v013.execution_engine.loaded_batch_data_ids
+    )
+
     assert batch.batch_spec is not None
     assert isinstance(batch.data.dataframe, pd.DataFrame)
+    assert batch.is_loaded
     assert batch.data.dataframe.shape[0] == 1313
     assert (
         batch.batch_markers["pandas_data_fingerprint"]
-        == "3aaabc12402f987ff006429a7756f5cf"
+        == "23d7147789156b7629741654a747a4cb"
     )
 
 
@@ -472,7 +482,7 @@ def test_get_batch_with_pipeline_style_batch_request(basic_pandas_datasource_v01
     assert batch.data.dataframe["col2"].values[1] == 4
     assert (
         batch.batch_markers["pandas_data_fingerprint"]
-        == "1e461a0df5fe0a6db2c3bc4ef88ef1f0"
+        == "c81671e7e8e90b9348397573601f2aa7"
     )
 
 
@@ -824,7 +834,7 @@ x,y
 
     my_datasource: Datasource = instantiate_class_from_config(
         yaml.load(
-            fr"""
+            rf"""
 class_name: Datasource
 
 execution_engine:
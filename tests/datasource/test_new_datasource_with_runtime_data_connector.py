@@ -438,7 +438,7 @@ def test_pandas_execution_engine_get_batch_definition_list_from_batch_request_le
     assert my_batch_1.data.dataframe["col2"].values[1] == 4
     assert (
         my_batch_1.batch_markers["pandas_data_fingerprint"]
-        == "1e461a0df5fe0a6db2c3bc4ef88ef1f0"
+        == "c81671e7e8e90b9348397573601f2aa7"
     )
 
 
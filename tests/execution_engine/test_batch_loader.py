@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from great_expectations.core.batch import BatchMarkers
+from great_expectations.execution_engine.batch_loader import PrefetchingBatchLoader
+
+
+def _get_batch_data_loader(batch_id: str, loads: list):
+    def _load_batch_data():
+        loads.append(batch_id)
+        return batch_id, BatchMarkers({"ge_load_time": "20211112T090000.000000Z"})
+
+    return _load_batch_data
+
+
+def test_prefetching_batch_loader_prefetches_at_most_prefetch_count_batches():
+    loads = []
+    loader = PrefetchingBatchLoader(prefetch_count=2)
+    batch_ids = ["batch_1", "batch_2", "batch_3"]
+    loader.prefetch(
+        batch_data_loaders=(
+            (batch_id, _get_batch_data_loader(batch_id=batch_id, loads=loads))
+            for batch_id in batch_ids
+        )
+    )
+    assert loader.prefetched_batch_ids == ("batch_1", "batch_2")
+
+    batch_data, _ = loader.load(
+        batch_id="batch_1",
+        batch_data_loader=_get_batch_data_loader(batch_id="batch_1", loads=loads),
+    )
+    assert batch_data == "batch_1"
+    batch_data, _ = loader.load(
+        batch_id="batch_3",
+        batch_data_loader=_get_batch_data_loader(batch_id="batch_3", loads=loads),
+    )
+    assert batch_data == "batch_3"
+    assert loader.statistics == {"prefetched": 1, "hits": 1, "misses": 1}
+
+    batch_data, _ = loader.load(
+        batch_id="batch_2",
+        batch_data_loader=_get_batch_data_loader(batch_id="batch_2", loads=loads),
+    )
+    assert batch_data == "batch_2"
+    assert loader.prefetched_batch_ids == ()
+    loader.shutdown()
+    assert sorted(loads) == ["batch_1", "batch_2", "batch_3"]
+
+
+def test_prefetching_batch_loader_cancels_discarded_prefetches():
+    loads = []
+    loading = threading.Event()
+    loaded = threading.Event()
+
+    def _load_batch_1():
+        loading.set()
+        loaded.wait(timeout=10)
+        loads.append("batch_1")
+        return "batch_1", BatchMarkers({"ge_load_time": "20211112T090000.000000Z"})
+
+    # With a single worker thread, the prefetch of batch_2 waits for the one of batch_1 to complete.
+    loader = PrefetchingBatchLoader(prefetch_count=2, max_workers=1)
+    loader.prefetch(
+        batch_data_loaders=[
+            ("batch_1", _load_batch_1),
+            ("batch_2", _get_batch_data_loader(batch_id="batch_2", loads=loads)),
+        ]
+    )
+    assert loading.wait(timeout=10)
+
+    loader.discard(batch_id="batch_2")
+    assert loader.prefetched_batch_ids == ("batch_1",)
+    loaded.set()
+    batch_data, _ = loader.load(batch_id="batch_1", batch_data_loader=_load_batch_1)
+    assert batch_data == "batch_1"
+
+    loader.shutdown()
+    assert loads == ["batch_1"]
+
+
+def test_prefetching_batch_loader_raises_prefetch_errors_upon_load():
+    def _fail():
+        raise OSError("unable to read the data")
+
+    loader = PrefetchingBatchLoader(prefetch_count=1)
+    loader.prefetch(batch_data_loaders=[("batch_1", _fail)])
+    with pytest.raises(OSError):
+        loader.load(batch_id="batch_1", batch_data_loader=_fail)
+
+    loader.shutdown()
+
+
+def test_prefetching_batch_loader_loads_in_worker_threads():
+    thread_names = []
+
+    def _load_batch_data():
+        thread_names.append(threading.current_thread().name)
+        return None, BatchMarkers({"ge_load_time": "20211112T090000.000000Z"})
+
+    loader = PrefetchingBatchLoader(prefetch_count=1)
+    loader.prefetch(batch_data_loaders=[("batch_1", _load_batch_data)])
+    loader.load(batch_id="batch_1", batch_data_loader=_load_batch_data)
+    assert len(thread_names) == 1
+    assert thread_names[0].startswith("ge_batch_loader")
+
+    # Prefetching is disabled by default.
+    loader = PrefetchingBatchLoader()
+    loader.prefetch(batch_data_loaders=[("batch_1", _load_batch_data)])
+    assert loader.prefetched_batch_ids == ()
+
+    with pytest.raises(ValueError):
+        PrefetchingBatchLoader(prefetch_count=-1)
+    with pytest.raises(ValueError):
+        PrefetchingBatchLoader(prefetch_count=1, max_workers=0)
@@ -1,8 +1,11 @@
 import pandas as pd
 import pytest
 
-from great_expectations.exceptions import GreatExpectationsError
-from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.metric import MetricResultIdentifier
+from great_expectations.data_context.store import MetricResultStore
+from great_expectations.exceptions import ExecutionEngineError, GreatExpectationsError
+from great_expectations.execution_engine import MetricCache, PandasExecutionEngine
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 # Testing ordinary process of adding column row condition
@@ -213,3 +216,231 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_metric_cache_is_configurable_and_serves_metric_dependencies():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        metric_cache={"max_size": 10, "scalar_values_only": True},
+    )
+    assert isinstance(engine.metric_cache, MetricCache)
+    assert engine.metric_cache.max_size == 10
+    assert engine.metric_cache.scalar_values_only
+
+    table_columns_metric: MetricConfiguration
+    table_columns_metric, _ = get_table_columns_metric(engine=engine)
+
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a", "batch_id": "my_id"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    # The "table.columns" dependency is not provided, but it is served by the metric cache.
+    results = engine.resolve_metrics(metrics_to_resolve=(mean,))
+    assert results[mean.id] == 2.0
+    assert engine.metric_cache.hits == 1
+
+    assert PandasExecutionEngine(caching=False).metric_cache is None
+
+
+def test_metric_cache_is_invalidated_when_batch_data_changes():
+    engine = PandasExecutionEngine()
+    engine.load_batch_data("batch_1", pd.DataFrame({"a": [1, 2, 3]}))
+    engine.load_batch_data("batch_2", pd.DataFrame({"a": [4, 5, 6]}))
+
+    metric_configurations: dict = {
+        batch_id: MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        for batch_id in ["batch_1", "batch_2", None]
+    }
+    engine.resolve_metrics(metrics_to_resolve=metric_configurations.values())
+    assert len(engine.metric_cache) == 3
+
+    # Reloading the same data does not invalidate the cached metrics.
+    engine.load_batch_data("batch_2", engine.loaded_batch_data_dict["batch_2"])
+    assert len(engine.metric_cache) == 3
+
+    # Metrics computed without a batch_id refer to the active batch, and are invalidated when it changes.
+    engine.active_batch_data_id = "batch_1"
+    assert metric_configurations[None].id not in engine.metric_cache
+    assert len(engine.metric_cache) == 2
+
+    engine.load_batch_data("batch_2", pd.DataFrame({"a": [7]}))
+    assert metric_configurations["batch_2"].id not in engine.metric_cache
+    assert metric_configurations["batch_1"].id in engine.metric_cache
+
+    engine.unload_batch_data("batch_1")
+    assert len(engine.metric_cache) == 0
+    assert engine.loaded_batch_data_ids == ["batch_2"]
+    assert engine.active_batch_data_id == "batch_2"
+
+    with pytest.raises(ExecutionEngineError):
+        engine.unload_batch_data("batch_1")
+
+
+def test_metric_result_store_reuses_metrics_of_fingerprinted_batches():
+    metric_result_store = MetricResultStore()
+    row_count = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={"batch_id": "my_id"},
+        metric_value_kwargs=None,
+    )
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})},
+        metric_result_store=metric_result_store,
+    )
+    # Metrics of batches without a fingerprint are not saved.
+    engine.resolve_metrics(metrics_to_resolve=(row_count,))
+    assert metric_result_store.list_keys() == []
+
+    engine.set_batch_fingerprint(batch_id="my_id", fingerprint="fingerprint")
+    results = engine.resolve_metrics(metrics_to_resolve=(row_count,))
+    assert results[row_count.id] == 3
+
+    key = MetricResultIdentifier.from_metric_configuration(
+        batch_fingerprint="fingerprint", metric_configuration=row_count
+    )
+    assert metric_result_store.list_keys() == [key]
+
+    # A new engine with data having the same fingerprint uses the saved value, instead of computing it.
+    metric_result_store.set(key, 42)
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})},
+        metric_result_store=metric_result_store,
+    )
+    engine.set_batch_fingerprint(batch_id="my_id", fingerprint="fingerprint")
+    results = engine.resolve_metrics(metrics_to_resolve=(row_count,))
+    assert results[row_count.id] == 42
+
+    # Reloading the batch with different data discards its fingerprint.
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [1]}))
+    assert engine.batch_fingerprints == {}
+    results = engine.resolve_metrics(metrics_to_resolve=(row_count,))
+    assert results[row_count.id] == 1
+
+    with pytest.raises(ExecutionEngineError):
+        engine.set_batch_fingerprint(batch_id="other_id", fingerprint="fingerprint")
+
+    # The metric_result_store can also be configured.
+    engine = PandasExecutionEngine(
+        metric_result_store={"class_name": "MetricResultStore"}
+    )
+    assert isinstance(engine.metric_result_store, MetricResultStore)
+
+
+def test_lazy_batch_data_is_loaded_upon_access_and_evictable():
+    loads = []
+
+    def _get_batch_data_loader(batch_id: str, df: pd.DataFrame):
+        def _load_batch_data():
+            loads.append(batch_id)
+            return df, BatchMarkers(
+                {
+                    "ge_load_time": "20211112T090000.000000Z",
+                    "pandas_data_fingerprint": batch_id,
+                }
+            )
+
+        return _load_batch_data
+
+    engine = PandasExecutionEngine(max_lazy_batches_in_memory=2)
+    for idx, batch_id in enumerate(["batch_1", "batch_2", "batch_3"]):
+        engine.load_lazy_batch_data(
+            batch_id=batch_id,
+            batch_data_loader=_get_batch_data_loader(
+                batch_id=batch_id, df=pd.DataFrame({"a": list(range(idx + 1))})
+            ),
+        )
+
+    assert engine.loaded_batch_data_ids == ["batch_1", "batch_2", "batch_3"]
+    assert engine.active_batch_data_id == "batch_3"
+    assert loads == []
+
+    row_counts: dict = {
+        batch_id: MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        for batch_id in ["batch_1", "batch_2", "batch_3"]
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=row_counts.values())
+    assert [results[row_counts[batch_id].id] for batch_id in row_counts] == [1, 2, 3]
+    assert sorted(loads) == ["batch_1", "batch_2", "batch_3"]
+    assert engine.batch_fingerprints == {
+        "batch_1": "batch_1",
+        "batch_2": "batch_2",
+        "batch_3": "batch_3",
+    }
+
+    # At most two lazily loaded batches are kept in memory; the least recently accessed one is evicted first.
+    assert engine._batch_data_dict[loads[0]] is None
+    assert engine.evict_batch_data(batch_id=loads[1])
+    assert not engine.evict_batch_data(batch_id=loads[1])
+
+    # Evicted data is loaded again upon its next access.
+    evicted_batch_id: str = loads[1]
+    results = engine.resolve_metrics(metrics_to_resolve=(row_counts[evicted_batch_id],))
+    assert results[row_counts[evicted_batch_id].id] == int(evicted_batch_id[-1])
+    assert loads[3:] == [evicted_batch_id]
+
+    # Batch data, which was not loaded lazily, cannot be evicted.
+    engine.load_batch_data("batch_1", pd.DataFrame({"a": [1]}))
+    assert not engine.evict_batch_data(batch_id="batch_1")
+
+    with pytest.raises(ValueError):
+        PandasExecutionEngine(max_lazy_batches_in_memory=0)
+
+
+def test_lazy_batch_data_of_the_next_batches_is_prefetched():
+    loads = []
+
+    def _get_batch_data_loader(batch_id: str):
+        def _load_batch_data():
+            loads.append(batch_id)
+            return pd.DataFrame({"a": [1, 2, 3]}), BatchMarkers(
+                {"ge_load_time": "20211112T090000.000000Z"}
+            )
+
+        return _load_batch_data
+
+    engine = PandasExecutionEngine(batch_prefetch_count=1, max_lazy_batches_in_memory=1)
+    batch_ids = ["batch_1", "batch_2", "batch_3"]
+    for batch_id in batch_ids:
+        engine.load_lazy_batch_data(
+            batch_id=batch_id, batch_data_loader=_get_batch_data_loader(batch_id)
+        )
+    assert engine.config["batch_prefetch_count"] == 1
+
+    for batch_id in batch_ids:
+        row_count = MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        results = engine.resolve_metrics(metrics_to_resolve=(row_count,))
+        assert results[row_count.id] == 3
+
+    # Loading each batch prefetches the next one, which is then taken from the loader rather than loaded again.
+    assert loads == batch_ids
+    assert engine.batch_loader.statistics == {"prefetched": 0, "hits": 2, "misses": 1}
+
+    # Unloading a batch drops its prefetched data.
+    engine.evict_batch_data(batch_id="batch_3")
+    engine.loaded_batch_data_dict["batch_1"]
+    assert engine.batch_loader.prefetched_batch_ids == ("batch_2",)
+    engine.unload_batch_data(batch_id="batch_2")
+    assert engine.batch_loader.prefetched_batch_ids == ()
+
+    # Closing the engine stops the prefetching worker threads.
+    assert engine.batch_loader._thread_pool_executor is not None
+    engine.close()
+    assert engine.batch_loader._thread_pool_executor is None
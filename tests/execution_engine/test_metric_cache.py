@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    is_scalar_metric_value,
+)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        pytest.param(1, True, id="int"),
+        pytest.param(np.float64(1.5), True, id="numpy_scalar"),
+        pytest.param(None, True, id="none"),
+        pytest.param(["a", "b"], True, id="list_of_scalars"),
+        pytest.param({"observed_value": [1, 2]}, True, id="dict_of_scalars"),
+        pytest.param(pd.Series([1, 2]), False, id="series"),
+        pytest.param(pd.DataFrame({"a": [1]}), False, id="dataframe"),
+        pytest.param((lambda df: df, {}, {}), False, id="metric_partial_fn"),
+    ],
+)
+def test_is_scalar_metric_value(value, expected):
+    assert is_scalar_metric_value(value) is expected
+
+
+def test_metric_cache_counts_hits_and_misses():
+    cache = MetricCache()
+    cache.set(("a", "", ""), None)
+
+    assert cache.get(("a", "", ""), default=0) is None
+    assert cache.get(("b", "", ""), default=0) == 0
+    assert cache.statistics == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_metric_cache_evicts_least_recently_used_values():
+    cache = MetricCache(max_size=2)
+    cache.set(("a", "", ""), 1)
+    cache.set(("b", "", ""), 2)
+    cache.get(("a", "", ""))
+    cache.set(("c", "", ""), 3)
+
+    assert ("a", "", "") in cache
+    assert ("b", "", "") not in cache
+    assert ("c", "", "") in cache
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+    cache.invalidate_batch(batch_id=None)
+    assert len(cache) == 0
+
+
+def test_metric_cache_with_zero_max_size_caches_nothing():
+    cache = MetricCache(max_size=0)
+    cache.set(("a", "", ""), 1)
+
+    assert len(cache) == 0
+    assert cache.evictions == 0
+
+
+def test_metric_cache_invalidates_values_by_batch_id():
+    cache = MetricCache()
+    cache.update(
+        {("a", "", ""): 1, ("b", "", ""): 2, ("c", "", ""): 3},
+        batch_ids={("a", "", ""): "batch_1", ("b", "", ""): "batch_2"},
+    )
+
+    assert cache.invalidate_batch(batch_id="batch_1") == 1
+    assert ("a", "", "") not in cache
+    assert ("b", "", "") in cache
+
+    assert cache.invalidate_batch(batch_id=None) == 1
+    assert ("c", "", "") not in cache
+    assert cache.invalidate_batch(batch_id="batch_1") == 0
+
+    # Re-caching a metric value moves it to the batch on which it has been computed.
+    cache.set(("b", "", ""), 2, batch_id="batch_3")
+    assert cache.invalidate_batch(batch_id="batch_2") == 0
+    assert cache.invalidate_batch(batch_id="batch_3") == 1
+
+
+def test_metric_cache_with_scalar_values_only():
+    cache = MetricCache(scalar_values_only=True)
+    cache.update({("a", "", ""): 1, ("b", "", ""): pd.Series([1, 2])})
+
+    assert ("a", "", "") in cache
+    assert ("b", "", "") not in cache
+
+
+def test_metric_cache_rejects_negative_max_size():
+    with pytest.raises(ValueError):
+        MetricCache(max_size=-1)
@@ -1,8 +1,9 @@
 import datetime
 import os
 import random
+from io import BytesIO
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from unittest import mock
 
 import boto3
@@ -33,6 +34,7 @@ from great_expectations.execution_engine.execution_engine import (
 )
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    hash_pandas_dataframe,
 )
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from tests.expectations.test_util import get_table_columns_metric
@@ -492,6 +494,62 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_domain_records_with_row_condition_is_shared_across_domains():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+    with mock.patch.object(pd.DataFrame, "query", autospec=True) as mock_query:
+        mock_query.side_effect = lambda data, *args, **kwargs: data[data["b"] > 2]
+        data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+        assert engine.get_domain_records(domain_kwargs=domain_kwargs) is data
+        assert (
+            engine.get_domain_records(domain_kwargs=dict(column="a", **domain_kwargs))
+            is data
+        )
+        assert mock_query.call_count == 1
+
+        # Reloading the batch with different data discards the filtered records of the batch.
+        engine.load_batch_data(batch_data=df.copy(), batch_id="1234")
+        assert engine.get_domain_records(domain_kwargs=domain_kwargs) is not data
+        assert mock_query.call_count == 2
+
+    assert data["b"].equals(df[df["b"] > 2]["b"])
+
+
+def test_get_domain_column_values():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    column_values = engine.get_domain_column_values(
+        domain_kwargs={}, column_name="b", filter_column_isnull=True
+    )
+    assert column_values.equals(df["b"][df["b"].notnull()])
+    assert (
+        engine.get_domain_column_values(
+            domain_kwargs={"batch_id": "1234"},
+            column_name="b",
+            filter_column_isnull=True,
+        )
+        is column_values
+    )
+    assert engine.get_domain_column_values(domain_kwargs={}, column_name="b").equals(
+        df["b"]
+    )
+
+    column_values = engine.get_domain_column_values(
+        domain_kwargs={"row_condition": "a > 2", "condition_parser": "pandas"},
+        column_name="b",
+        filter_column_isnull=True,
+    )
+    assert column_values.to_list() == [4]
+
+    engine.unload_batch_data(batch_id="1234")
+    assert len(engine._domain_records_cache) == 0
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = PandasExecutionEngine()
@@ -567,6 +625,69 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metric_bundle_evaluates_column_conditions_column_by_column():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", None, "z"]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    def build_condition_metric(
+        metric_name: str, column: str, metric_value_kwargs: Optional[dict]
+    ) -> MetricConfiguration:
+        return MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+            },
+        )
+
+    a_between = build_condition_metric(
+        "column_values.between.condition", "a", {"min_value": 2, "max_value": 3}
+    )
+    a_in_set = build_condition_metric(
+        "column_values.in_set.condition", "a", {"value_set": [1, 3]}
+    )
+    a_nonnull = build_condition_metric("column_values.nonnull.condition", "a", None)
+    b_in_set = build_condition_metric(
+        "column_values.in_set.condition", "b", {"value_set": ["x", "z"]}
+    )
+
+    with mock.patch.object(
+        engine, "get_compute_domain", wraps=engine.get_compute_domain
+    ) as mock_get_compute_domain:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(a_between, a_in_set, a_nonnull, b_in_set),
+            metrics=metrics,
+        )
+
+    # The compute domain and the values of a column are obtained once for all conditions on the column (null values
+    # being excluded from the values of column "a" for all conditions but column_values.nonnull).
+    assert mock_get_compute_domain.call_count == 3
+    assert list(results[a_between.id][0]) == [True, False, False]
+    assert list(results[a_in_set.id][0]) == [False, True, False]
+    assert list(results[a_nonnull.id][0]) == [False, False, False, True]
+    assert list(results[b_in_set.id][0]) == [False, True, False]
+    assert results[a_between.id][1:] == ({}, {"column": "a"})
+
+    # Conditions on missing columns fail on their own
+    missing_column_in_set = build_condition_metric(
+        "column_values.in_set.condition", "c", {"value_set": [1]}
+    )
+    with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(
+            metrics_to_resolve=(missing_column_in_set,), metrics=metrics
+        )
+    assert e.value.failed_metrics == [missing_column_in_set]
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -999,8 +1120,9 @@ def test_get_batch_data_with_azure_batch_spec(
 ):
     mock_blob_client = mock_azure_conn().get_blob_client()
     mock_azure_obj = mock_blob_client.download_blob()
-    mock_azure_obj.readall.return_value = (
-        b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
+    # The CSV blob is streamed to the reader in chunks, rather than downloaded at once.
+    mock_azure_obj.chunks.return_value = iter(
+        [b"colA,colB,colC\n1,2", b",3\n4,5,6\n7,8,9"]  # (3,3) CSV for testing
     )
 
     df = PandasExecutionEngine().get_batch_data(batch_spec=azure_batch_spec)
@@ -1008,7 +1130,8 @@ def test_get_batch_data_with_azure_batch_spec(
     mock_azure_conn().get_blob_client.assert_called_with(
         container="test_container", blob="path/A-100.csv"
     )
-    mock_azure_obj.readall.assert_called_once()
+    mock_azure_obj.chunks.assert_called_once()
+    mock_azure_obj.readall.assert_not_called()
 
     assert df.dataframe.shape == (3, 3)
 
@@ -1052,7 +1175,8 @@ def test_get_batch_data_with_gcs_batch_spec(
 ):
     mock_gcs_bucket = mock_gcs_conn().get_bucket()
     mock_gcs_blob = mock_gcs_bucket.blob()
-    mock_gcs_blob.download_as_bytes.return_value = (
+    # The CSV blob is streamed to the reader, rather than downloaded at once.
+    mock_gcs_blob.open.return_value = BytesIO(
         b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
     )
 
@@ -1062,7 +1186,8 @@ def test_get_batch_data_with_gcs_batch_spec(
 
     mock_gcs_conn().get_bucket.assert_called_with("test_bucket")
     mock_gcs_bucket.blob.assert_called_with("path/A-100.csv")
-    mock_gcs_blob.download_as_bytes.assert_called_once()
+    mock_gcs_blob.open.assert_called_once()
+    mock_gcs_blob.download_as_bytes.assert_not_called()
 
     assert df.dataframe.shape == (3, 3)
 
@@ -1083,3 +1208,152 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+def test_hash_pandas_dataframe_does_not_depend_on_chunk_size():
+    df = pd.DataFrame(
+        {"a": range(1000), "b": [str(i % 7) for i in range(1000)]},
+        index=range(1000, 2000),
+    )
+    expected_fingerprint = hash_pandas_dataframe(df, chunk_size=len(df))
+
+    for chunk_size in [1, 7, 999, 1000, 5000]:
+        assert hash_pandas_dataframe(df, chunk_size=chunk_size) == expected_fingerprint
+
+    changed_df = df.copy()
+    changed_df.loc[1500, "a"] = -1
+    assert hash_pandas_dataframe(changed_df, chunk_size=7) != expected_fingerprint
+    assert (
+        hash_pandas_dataframe(df.rename(columns={"b": "c"}).astype({"a": float}))
+        != expected_fingerprint
+    )
+    assert (
+        hash_pandas_dataframe(df.astype({"a": "Int64"}), chunk_size=7)
+        != expected_fingerprint
+    )
+
+
+@pytest.mark.parametrize(
+    "df_values", [{"a": [1, 2], "b": [3, 4]}, {"a": [1, {"x": 2}], "b": [3, {"x": 4}]}]
+)
+@pytest.mark.parametrize("sample_size", [None, 1])
+def test_hash_pandas_dataframe_depends_on_column_names(
+    df_values: dict, sample_size: Optional[int]
+):
+    df = pd.DataFrame(df_values)
+    fingerprint = hash_pandas_dataframe(df, sample_size=sample_size)
+
+    # Row hashes alone do not tell renamed or swapped columns apart.
+    assert (
+        hash_pandas_dataframe(df.rename(columns={"b": "c"}), sample_size=sample_size)
+        != fingerprint
+    )
+    assert (
+        hash_pandas_dataframe(
+            df.rename(columns={"a": "b", "b": "a"}), sample_size=sample_size
+        )
+        != fingerprint
+    )
+
+
+def test_hash_pandas_dataframe_with_unhashable_values():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [{"x": 1}, {"x": 2}, {"x": 3}]})
+
+    fingerprint = hash_pandas_dataframe(df)
+    assert hash_pandas_dataframe(df, chunk_size=2) == fingerprint
+
+    changed_df = df.copy()
+    changed_df.at[2, "b"] = {"x": 4}
+    assert hash_pandas_dataframe(changed_df) != fingerprint
+
+
+def test_hash_pandas_dataframe_with_mixed_hashable_and_unhashable_values():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "z", {"x": 1}]})
+
+    fingerprint = hash_pandas_dataframe(df)
+    chunk_size: int
+    for chunk_size in [1, 2, 3, 4]:
+        assert hash_pandas_dataframe(df, chunk_size=chunk_size) == fingerprint
+
+
+def test_hash_pandas_dataframe_with_sample_size():
+    df = pd.DataFrame({"a": range(100)})
+
+    fingerprint = hash_pandas_dataframe(df, sample_size=10)
+    assert hash_pandas_dataframe(df, chunk_size=3, sample_size=10) == fingerprint
+    assert fingerprint != hash_pandas_dataframe(df)
+    # The first and the last rows are always part of the sample.
+    assert hash_pandas_dataframe(df.iloc[:-1], sample_size=10) != fingerprint
+    assert hash_pandas_dataframe(df.replace({99: -1}), sample_size=10) != fingerprint
+
+
+def test_get_batch_data_and_markers_with_file_metadata_fingerprint(
+    test_df_small, tmpdir
+):
+    path = os.path.join(tmpdir, "file.csv")
+    test_df_small.to_csv(path, index=False)
+    batch_spec = PathBatchSpec(path=path, reader_method="read_csv")
+
+    execution_engine = PandasExecutionEngine(data_fingerprint_method="file_metadata")
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    fingerprint = batch_markers["pandas_data_fingerprint"]
+    assert fingerprint != hash_pandas_dataframe(test_df_small)
+
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path, reader_method="read_csv")
+    )
+    assert batch_markers["pandas_data_fingerprint"] == fingerprint
+
+    # The fingerprint changes with the reader options, and with the modification time of the file.
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=path, reader_method="read_csv", reader_options={"nrows": 1}
+        )
+    )
+    assert batch_markers["pandas_data_fingerprint"] != fingerprint
+
+    stat_result = os.stat(path)
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path, reader_method="read_csv")
+    )
+    assert batch_markers["pandas_data_fingerprint"] != fingerprint
+
+    # In-memory data is always fingerprinted using the data.
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(batch_data=test_df_small)
+    )
+    assert batch_markers["pandas_data_fingerprint"] == hash_pandas_dataframe(
+        test_df_small
+    )
+
+
+def test_get_batch_data_and_markers_with_s3_file_metadata_fingerprint(test_s3_files):
+    bucket, keys = test_s3_files
+    execution_engine = PandasExecutionEngine(data_fingerprint_method="file_metadata")
+
+    fingerprints = set()
+    for key in keys[:2]:
+        _, batch_markers = execution_engine.get_batch_data_and_markers(
+            batch_spec=S3BatchSpec(
+                path=f"s3a://{os.path.join(bucket, key)}", reader_method="read_csv"
+            )
+        )
+        fingerprints.add(batch_markers["pandas_data_fingerprint"])
+
+    # Objects with the same content (ETag) but different paths get different fingerprints.
+    assert len(fingerprints) == 2
+
+
+def test_get_batch_data_and_markers_without_fingerprint(test_df_small):
+    _, batch_markers = PandasExecutionEngine(
+        data_fingerprint_method=None
+    ).get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(batch_data=test_df_small)
+    )
+    assert "pandas_data_fingerprint" not in batch_markers
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(data_fingerprint_method="checksum")
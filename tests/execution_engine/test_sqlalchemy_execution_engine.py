@@ -10,6 +10,7 @@ from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
@@ -18,6 +19,9 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.util import (
+    get_sqlalchemy_conditional_aggregate,
+)
 
 # Function to test for spark dataframe equality
 from great_expectations.self_check.util import build_sa_engine
@@ -827,3 +831,301 @@ def test_sample_using_random(sqlite_view_engine, test_df):
     assert len(rows_0) == len(rows_1)
 
     assert not (rows_0 == rows_1)
+
+
+def test_resolve_metric_bundle_attributes_failures_to_failing_domain_only(sa):
+    engine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+    )
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    good_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    bad_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={
+            "column": "b",
+            "row_condition": 'col("does_not_exist")>0',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(good_metric, bad_metric), metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_good_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs=good_metric.metric_domain_kwargs,
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "metric_partial_fn": good_metric,
+            "table.columns": table_columns_metric,
+        },
+    )
+    desired_bad_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs=bad_metric.metric_domain_kwargs,
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "metric_partial_fn": bad_metric,
+            "table.columns": table_columns_metric,
+        },
+    )
+    with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(
+            metrics_to_resolve=(desired_good_metric, desired_bad_metric),
+            metrics=metrics,
+        )
+
+    assert [
+        metric_configuration.id for metric_configuration in e.value.failed_metrics
+    ] == [desired_bad_metric.id]
+
+
+def test_resolve_metric_bundle_executes_domains_concurrently(sa, tmp_path):
+    db_file_path: str = os.path.join(tmp_path, "concurrency.db")
+    sqlalchemy_engine = sa.create_engine(
+        f"sqlite:///{db_file_path}", connect_args={"check_same_thread": False}
+    )
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 5]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(enabled=True),
+        fuse_row_condition_domains=False,
+    )
+    # Use the pooled engine (instead of the single connection pinned for sqlite) to exercise concurrent queries.
+    engine.engine.close()
+    engine.engine = engine._engine_backup
+    engine._engine_backup = None
+
+    batch_data = SqlAlchemyBatchData(execution_engine=engine, table_name="test")
+    engine.load_batch_data("__", batch_data)
+    assert engine._can_execute_queries_concurrently(domain_kwargs_list=[{}])
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    partial_metrics: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs={
+                "column": column,
+                "row_condition": f'col("a")>{threshold}',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+            },
+        )
+        for column in ["a", "b"]
+        for threshold in [0, 1, 2]
+    ]
+    results = engine.resolve_metrics(
+        metrics_to_resolve=partial_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_metrics: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "metric_partial_fn": partial_metric,
+                "table.columns": table_columns_metric,
+            },
+        )
+        for partial_metric in partial_metrics
+    ]
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in desired_metrics] == [3, 3, 3, 5, 5, 5]
+
+    engine.close()
+
+
+@pytest.mark.parametrize(
+    "aggregate,expected",
+    [
+        pytest.param(
+            lambda sa: sa.func.count(),
+            "count(CASE WHEN (a > 1) THEN 1 END)",
+            id="count_star",
+        ),
+        pytest.param(
+            lambda sa: sa.func.sum(sa.case([(sa.column("b") == 2, 1)], else_=0)),
+            "sum(CASE WHEN (a > 1) THEN CASE WHEN (b = 2) THEN 1 ELSE 0 END END)",
+            id="sum_of_case",
+        ),
+        pytest.param(
+            lambda sa: sa.func.count(sa.distinct(sa.column("b"))),
+            "count(DISTINCT CASE WHEN (a > 1) THEN b END)",
+            id="count_distinct",
+        ),
+        pytest.param(
+            lambda sa: sa.func.max(sa.column("b")) - sa.func.min(sa.column("b")),
+            "max(CASE WHEN (a > 1) THEN b END) - min(CASE WHEN (a > 1) THEN b END)",
+            id="expression_of_aggregates",
+        ),
+        pytest.param(
+            lambda sa: sa.func.percentile_disc(0.5).within_group(sa.column("b")),
+            None,
+            id="ordered_set_aggregate",
+        ),
+        pytest.param(lambda sa: sa.column("b"), None, id="column"),
+    ],
+)
+def test_get_sqlalchemy_conditional_aggregate(sa, aggregate, expected):
+    conditional_aggregate = get_sqlalchemy_conditional_aggregate(
+        aggregate=aggregate(sa), condition=sa.column("a") > 1
+    )
+    if expected is None:
+        assert conditional_aggregate is None
+    else:
+        assert (
+            str(conditional_aggregate.compile(compile_kwargs={"literal_binds": True}))
+            == expected
+        )
+
+
+def test_fuse_row_condition_domains_is_opt_in(sa):
+    engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+    assert not engine._fuse_row_condition_domains
+
+    engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", fuse_row_condition_domains=True
+    )
+    assert engine._fuse_row_condition_domains
+
+
+@pytest.mark.parametrize("fuse_row_condition_domains", [True, False])
+def test_resolve_metric_bundle_fuses_row_condition_domains(
+    caplog, sa, fuse_row_condition_domains
+):
+    engine = build_sa_engine(
+        pd.DataFrame(
+            {
+                "a": [1, 2, None, 4, 5, None],
+                "b": [4, None, 4, 8, None, 1],
+                "c": [1, 2, 3, 4, 5, 6],
+            }
+        ),
+        sa,
+    )
+    engine._fuse_row_condition_domains = fuse_row_condition_domains
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    partial_metrics: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="table.row_count.aggregate_fn",
+            metric_domain_kwargs={},
+            metric_value_kwargs=None,
+        )
+    ]
+    for column in ["a", "b"]:
+        domain_kwargs: dict = engine.add_column_row_condition(
+            {"column": column}, filter_null=True
+        )
+        partial_metrics.extend(
+            [
+                MetricConfiguration(
+                    metric_name=f"{metric_name}.aggregate_fn",
+                    metric_domain_kwargs=domain_kwargs,
+                    metric_value_kwargs=None,
+                    metric_dependencies={
+                        "table.columns": table_columns_metric,
+                    },
+                )
+                for metric_name in ["column.max", "column.mean"]
+            ]
+        )
+    partial_metrics.append(
+        MetricConfiguration(
+            metric_name="column.min.aggregate_fn",
+            metric_domain_kwargs={
+                "column": "c",
+                "row_condition": 'col("c")>3',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+            },
+        )
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=partial_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_metrics: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "metric_partial_fn": partial_metric,
+                "table.columns": table_columns_metric,
+            },
+        )
+        for partial_metric in partial_metrics
+    ]
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in desired_metrics] == [
+        6,
+        5,
+        3.0,
+        8,
+        4.25,
+        4,
+    ]
+
+    queries_executed: int = len(
+        [
+            record
+            for record in caplog.records
+            if record.message.startswith("SqlAlchemyExecutionEngine computed")
+        ]
+    )
+    assert queries_executed == (1 if fuse_row_condition_domains else 4)
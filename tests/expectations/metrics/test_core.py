@@ -192,6 +192,68 @@ def test_quantiles_metric_sa(sa):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+def test_quantiles_metric_sa_computes_all_quantiles_in_a_single_query(sa):
+    engine = build_sa_engine(
+        pd.DataFrame({"a": [7, None, 3, 10, 1, 5, None, 2, 9, 4, 8, 6]}), sa
+    )
+
+    statements: list = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 1.0e-1, 2.5e-1, 5.0e-1, 9.0e-1, 1.0],
+            "allow_relative_error": False,
+        },
+    )
+    sa.event.listen(engine.engine, "before_cursor_execute", _record_statement)
+    try:
+        results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    finally:
+        sa.event.remove(engine.engine, "before_cursor_execute", _record_statement)
+
+    # percentile_disc semantics over the non-null values
+    assert results == {desired_metric.id: [1.0, 1.0, 3.0, 5.0, 9.0, 10.0]}
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize(
+    "column_values,expected_median",
+    [
+        ([3, None, 1, 2], 2),
+        ([4, None, 1, 3, 2], 2.5),
+        ([None, 5], 5),
+    ],
+)
+def test_median_metric_sa(sa, column_values, expected_median):
+    engine = build_sa_engine(pd.DataFrame({"a": column_values}), sa)
+
+    nonnull_count_metric = MetricConfiguration(
+        metric_name="column_values.nonnull.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    desired_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={"column_values.nonnull.count": nonnull_count_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,),
+        metrics={
+            nonnull_count_metric.id: len(
+                [value for value in column_values if value is not None]
+            )
+        },
+    )
+    assert results == {desired_metric.id: expected_median}
+
+
 def test_quantiles_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
@@ -657,6 +719,62 @@ def test_map_column_value_lengths_between_pd():
     assert ser_expected_lengths.equals(result_series)
 
 
+@pytest.mark.parametrize(
+    "data,metric_value_kwargs,expected_condition",
+    [
+        (
+            [1, 2, 3, 4, 5],
+            {"min_value": 2, "max_value": 4},
+            [False, True, True, True, False],
+        ),
+        (
+            [1, 2, 3, 4, 5],
+            {"min_value": 2, "max_value": 4, "strict_min": True, "strict_max": True},
+            [False, False, True, False, False],
+        ),
+        (
+            [1.5, 2.5, None, 4.5],
+            {"min_value": 2.0},
+            [False, True, True],
+        ),
+        (
+            [1, 2, 3],
+            {"max_value": 2, "strict_max": True},
+            [True, False, False],
+        ),
+        (
+            ["a", "b", "c"],
+            {"min_value": "b", "max_value": "c"},
+            [False, True, True],
+        ),
+    ],
+)
+def test_map_column_values_between_pd(data, metric_value_kwargs, expected_condition):
+    engine = build_pandas_engine(pd.DataFrame({"a": data}))
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.between.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,), metrics=metrics
+    )
+    # The condition metric holds the unexpected (i.e., not between) values.
+    assert list(~results[condition_metric.id][0]) == expected_condition
+
+
 def test_map_column_values_increasing_pd():
     engine = build_pandas_engine(
         pd.DataFrame(
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pandas as pd
 import pytest
 
@@ -350,3 +352,50 @@ def test_include_unexpected_rows_without_explicit_result_format_raises_error(
     )
     with pytest.raises(ValueError):
         expectation.validate(validator)
+
+
+def test_pandas_map_metrics_share_row_condition_domain(dataframe_for_unexpected_rows):
+    batch: Batch = Batch(data=dataframe_for_unexpected_rows)
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[
+            batch,
+        ],
+    )
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "b",
+                "value_set": ["fish", "dog", "giraffe"],
+                "row_condition": "a>2",
+                "condition_parser": "pandas",
+                "result_format": {"result_format": "COMPLETE"},
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "min_value": 4,
+                "max_value": 20,
+                "row_condition": "a>2",
+                "condition_parser": "pandas",
+                "result_format": {"result_format": "COMPLETE"},
+            },
+        ),
+    ]
+
+    original_query = pd.DataFrame.query
+    with mock.patch.object(
+        pd.DataFrame, "query", autospec=True, side_effect=original_query
+    ) as mock_query:
+        results = validator.graph_validate(configurations=expectation_configurations)
+
+    # The row_condition is evaluated once for all metrics of both expectations.
+    assert mock_query.call_count == 1
+
+    assert results[0].result["unexpected_list"] == ["lion", "zebra"]
+    assert results[0].result["unexpected_index_list"] == [4, 5]
+    assert results[1].result["unexpected_list"] == [22, 3]
+    assert results[1].result["unexpected_index_list"] == [2, 3]
@@ -1,8 +1,17 @@
+import os
+import subprocess
+import sys
+
+import great_expectations
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.expectations import registry_manifest
 from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
     ExpectColumnValuesToBeInSet,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    build_registry_manifest,
+    get_expectation_impl,
+)
 
 
 def test_registry_basics():
@@ -16,3 +25,41 @@ def test_registry_from_configuration():
         kwargs={"column": "PClass", "value_set": [1, 2, 3]},
     )
     assert configuration._get_expectation_impl() == ExpectColumnValuesToBeInSet
+
+
+def test_registry_manifest_is_up_to_date():
+    # Run scripts/generate_registry_manifest.py to update the manifest after adding (or moving) an expectation or metric.
+    assert build_registry_manifest() == {
+        "EXPECTATION_MODULES": registry_manifest.EXPECTATION_MODULES,
+        "METRIC_MODULES": registry_manifest.METRIC_MODULES,
+        "RENDERER_MODULES": registry_manifest.RENDERER_MODULES,
+    }
+
+
+def test_registry_imports_implementations_upon_first_lookup():
+    code = """
+import sys
+
+import great_expectations
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import (
+    get_expectation_impl,
+    get_metric_provider,
+)
+
+assert "great_expectations.expectations.metrics" not in sys.modules
+assert "great_expectations.expectations.core" not in sys.modules
+
+assert get_metric_provider("column.max", PandasExecutionEngine()) is not None
+assert "great_expectations.expectations.metrics" in sys.modules
+assert "great_expectations.expectations.core" not in sys.modules
+
+assert get_expectation_impl("expect_column_max_to_be_between") is not None
+assert "great_expectations.expectations.core" in sys.modules
+"""
+    # Import the great_expectations package under test (rather than one found from the current working directory).
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(great_expectations.__file__)),
+    )
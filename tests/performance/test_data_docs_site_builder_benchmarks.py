@@ -0,0 +1,131 @@
+"""
+Benchmark building a Data Docs site from thousands of synthetic validation results.
+
+The "serial" strategy renders every page in the main process, the "parallel" strategy renders the pages in a pool of
+rendering processes, and the "unchanged" strategy rebuilds a site that has already been built (so that every page and
+static asset is skipped, since its content hash, recorded in the index manifest, has not changed).
+"""
+
+import os
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context import DataContext
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.render.renderer.site_builder import SiteBuilder
+
+NUMBER_OF_EXPECTATIONS: int = 5
+
+
+def _build_validation_result(idx: int) -> ExpectationSuiteValidationResult:
+    results: list = [
+        ExpectationValidationResult(
+            success=bool((idx + expectation_idx) % 3),
+            expectation_config=ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": f"column_{expectation_idx}"},
+            ),
+            result={
+                "element_count": 100,
+                "unexpected_count": (idx + expectation_idx) % 3,
+                "unexpected_percent": float((idx + expectation_idx) % 3),
+                "partial_unexpected_list": [],
+            },
+        )
+        for expectation_idx in range(NUMBER_OF_EXPECTATIONS)
+    ]
+    return ExpectationSuiteValidationResult(
+        success=all(result.success for result in results),
+        results=results,
+        statistics={
+            "evaluated_expectations": len(results),
+            "successful_expectations": sum(result.success for result in results),
+            "unsuccessful_expectations": sum(not result.success for result in results),
+            "success_percent": None,
+        },
+        meta={
+            "great_expectations_version": "0.14.3",
+            "expectation_suite_name": f"suite_{idx % 10}",
+            "run_id": {"run_name": f"run_{idx}", "run_time": "2022-01-01T00:00:00Z"},
+            "batch_kwargs": {"datasource": "synthetic", "batch": idx},
+        },
+    )
+
+
+def _build_data_context(
+    project_path: str, number_of_validation_results: int
+) -> DataContext:
+    context: DataContext = DataContext.create(project_path)
+    idx: int
+    for idx in range(number_of_validation_results):
+        context.validations_store.set(
+            ValidationResultIdentifier(
+                expectation_suite_identifier=ExpectationSuiteIdentifier(
+                    expectation_suite_name=f"suite_{idx % 10}"
+                ),
+                run_id=RunIdentifier(
+                    run_name=f"run_{idx}", run_time="2022-01-01T00:00:00Z"
+                ),
+                batch_identifier=f"batch_{idx}",
+            ),
+            _build_validation_result(idx=idx),
+        )
+
+    return context
+
+
+def _build_site_builder(
+    context: DataContext, rendering_processes: int, skip_unchanged_pages: bool
+) -> SiteBuilder:
+    site_config: dict = (
+        context.project_config_with_variables_substituted.data_docs_sites["local_site"]
+    )
+    return SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **{
+            **site_config,
+            "rendering_processes": rendering_processes,
+            "skip_unchanged_pages": skip_unchanged_pages,
+        },
+    )
+
+
+@pytest.mark.parametrize("strategy", ["serial", "parallel", "unchanged"])
+@pytest.mark.parametrize("number_of_validation_results", [1000, 5000])
+def test_data_docs_site_builder_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    tmp_path,
+    number_of_validation_results: int,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    context: DataContext = _build_data_context(
+        project_path=str(tmp_path),
+        number_of_validation_results=number_of_validation_results,
+    )
+    site_builder: SiteBuilder = _build_site_builder(
+        context=context,
+        rendering_processes=1 if strategy == "serial" else 4,
+        skip_unchanged_pages=strategy == "unchanged",
+    )
+    if strategy == "unchanged":
+        site_builder.build()
+
+    index_page_url, _ = benchmark.pedantic(site_builder.build, rounds=1)
+
+    assert os.path.isfile(index_page_url[len("file://") :])
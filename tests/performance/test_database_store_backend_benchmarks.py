@@ -0,0 +1,97 @@
+"""
+Benchmark storing the metrics of a validation result into a SQLite database backed metric store.
+
+The "set_many" strategy writes all the metrics by a single transactional bulk upsert, while the "set" strategy writes
+them key by key (every key being checked, inserted or updated by statements of its own).
+"""
+
+from typing import List, Tuple
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.store import DatabaseStoreBackend, MetricStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+
+sa = pytest.importorskip("sqlalchemy")
+
+
+def _build_metric_store(tmp_path_factory) -> MetricStore:
+    database_path = tmp_path_factory.mktemp("metric_store") / "metrics.db"
+    return MetricStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "url": f"sqlite:///{database_path}",
+        }
+    )
+
+
+def _build_metrics(
+    number_of_metrics: int, run_name: str
+) -> List[Tuple[ValidationMetricIdentifier, float]]:
+    return [
+        (
+            ValidationMetricIdentifier(
+                run_id=RunIdentifier(run_name=run_name),
+                data_asset_name=None,
+                expectation_suite_identifier=ExpectationSuiteIdentifier(
+                    "benchmark_suite"
+                ),
+                metric_name="expect_column_mean_to_be_between.result.observed_value",
+                metric_kwargs_id=f"column=column_{idx}",
+            ),
+            idx * 0.5,
+        )
+        for idx in range(number_of_metrics)
+    ]
+
+
+def _set_many(
+    store: MetricStore, metrics: List[Tuple[ValidationMetricIdentifier, float]]
+) -> None:
+    store.set_many(metrics)
+
+
+def _set(
+    store: MetricStore, metrics: List[Tuple[ValidationMetricIdentifier, float]]
+) -> None:
+    key: ValidationMetricIdentifier
+    value: float
+    for key, value in metrics:
+        store.set(key, value)
+
+
+@pytest.mark.parametrize("strategy", ["set_many", "set"])
+@pytest.mark.parametrize("number_of_metrics", [100, 500, 2000])
+def test_database_metric_store_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    tmp_path_factory,
+    number_of_metrics: int,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    store: MetricStore = _build_metric_store(tmp_path_factory)
+    assert isinstance(store.store_backend, DatabaseStoreBackend)
+    store_metrics = _set_many if strategy == "set_many" else _set
+
+    stored_metrics: List[List[Tuple[ValidationMetricIdentifier, float]]] = []
+
+    def _setup():
+        # Every round stores the metrics of a new run, the way consecutive validations do.
+        stored_metrics.append(
+            _build_metrics(number_of_metrics, f"run_{len(stored_metrics)}")
+        )
+        return (store, stored_metrics[-1]), {}
+
+    benchmark.pedantic(store_metrics, setup=_setup, rounds=5)
+
+    key, value = stored_metrics[-1][-1]
+    assert store.get(key) == value
@@ -0,0 +1,91 @@
+"""
+Benchmark the substitution of evaluation parameters into suites with hundreds of parameterized expectations.
+
+The "suite" strategy processes the evaluation parameters of the whole suite in one pass (every distinct parameter
+expression is evaluated once), while the "expectation" strategy processes them expectation by expectation (every
+occurrence of a parameter expression is evaluated, from its compiled form).
+"""
+
+from typing import Dict
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
+
+# Number of distinct parameter expressions shared by the expectations of the synthetic suites.
+NUMBER_OF_DISTINCT_EXPRESSIONS = 20
+
+
+def _build_parameterized_suite(number_of_expectations: int) -> ExpectationSuite:
+    return ExpectationSuite(
+        expectation_suite_name="parameterized_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": f"column_{idx}",
+                    "min_value": {
+                        "$PARAMETER": f"trunc(lower_bound_{bound_idx} * 0.9)"
+                    },
+                    "max_value": {"$PARAMETER": f"upper_bound_{bound_idx} * 1.1 + 1"},
+                },
+            )
+            for idx, bound_idx in (
+                (idx, idx % NUMBER_OF_DISTINCT_EXPRESSIONS)
+                for idx in range(number_of_expectations)
+            )
+        ],
+    )
+
+
+def _get_evaluation_parameters() -> Dict[str, int]:
+    evaluation_parameters: Dict[str, int] = {}
+    for idx in range(NUMBER_OF_DISTINCT_EXPRESSIONS):
+        evaluation_parameters[f"lower_bound_{idx}"] = idx
+        evaluation_parameters[f"upper_bound_{idx}"] = 100 + idx
+    return evaluation_parameters
+
+
+def _process_suite(suite: ExpectationSuite, evaluation_parameters: dict) -> None:
+    suite.process_evaluation_parameters(evaluation_parameters=evaluation_parameters)
+
+
+def _process_expectations(suite: ExpectationSuite, evaluation_parameters: dict) -> None:
+    expectation: ExpectationConfiguration
+    for expectation in suite.expectations:
+        expectation.process_evaluation_parameters(
+            evaluation_parameters=evaluation_parameters
+        )
+
+
+@pytest.mark.parametrize("strategy", ["suite", "expectation"])
+@pytest.mark.parametrize("number_of_expectations", [100, 500, 2000])
+def test_evaluation_parameter_substitution_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_expectations: int,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    evaluation_parameters: Dict[str, int] = _get_evaluation_parameters()
+    process = _process_suite if strategy == "suite" else _process_expectations
+
+    def _setup():
+        # Substitution mutates the expectations, hence every round processes a fresh suite.
+        return (
+            _build_parameterized_suite(number_of_expectations),
+            evaluation_parameters,
+        ), {}
+
+    benchmark.pedantic(process, setup=_setup, rounds=5)
+
+    suite: ExpectationSuite = _build_parameterized_suite(number_of_expectations)
+    process(suite, evaluation_parameters)
+    assert suite.expectations[-1].kwargs["max_value"] == pytest.approx(
+        (100 + (number_of_expectations - 1) % NUMBER_OF_DISTINCT_EXPRESSIONS) * 1.1 + 1
+    )
@@ -0,0 +1,44 @@
+"""
+Benchmark the time taken by `import great_expectations` in a fresh interpreter.
+
+The "lazy" variant only imports Great Expectations, whose registry imports the implementations of expectations and
+metrics upon their first lookup, while the "eager" variant also imports all of them (which is how every import of Great
+Expectations used to behave).
+"""
+
+import subprocess
+import sys
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+IMPORT_STATEMENTS = {
+    "lazy": "import great_expectations",
+    "eager": (
+        "import great_expectations; "
+        "import great_expectations.expectations.core; "
+        "import great_expectations.expectations.metrics"
+    ),
+}
+
+
+def _import_in_fresh_interpreter(statement: str):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.parametrize("strategy", ["lazy", "eager"])
+def test_import_great_expectations_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    benchmark.pedantic(
+        _import_in_fresh_interpreter,
+        args=(IMPORT_STATEMENTS[strategy],),
+        iterations=1,
+        rounds=5,
+    )
@@ -0,0 +1,143 @@
+"""
+Benchmark the evaluation of column map expectations on a wide pandas batch.
+
+The "vectorized" strategy compares numeric columns with their bounds at once, while the "element_wise" strategy
+compares every value with the bounds in a Python function (which is how columns of other dtypes are compared).
+
+The "bundled" strategy evaluates all conditions on a column against the column values obtained once for the column,
+while the "per_metric" strategy obtains the compute domain and the column values for every condition on its own.
+"""
+
+from typing import List
+from unittest import mock
+
+import _pytest.config
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+NUMBER_OF_COLUMNS: int = 6
+
+
+def _build_wide_dataframe(number_of_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    data: dict = {
+        f"column_{idx}": rng.integers(low=0, high=100, size=number_of_rows)
+        for idx in range(NUMBER_OF_COLUMNS)
+    }
+    return pd.DataFrame(data)
+
+
+def _build_expectation_configurations() -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": f"column_{idx}", "min_value": 0, "max_value": 98},
+        )
+        for idx in range(NUMBER_OF_COLUMNS)
+    ]
+
+
+def _build_multiple_expectation_configurations() -> List[ExpectationConfiguration]:
+    expectation_configurations: List[ExpectationConfiguration] = []
+    for idx in range(NUMBER_OF_COLUMNS):
+        column: str = f"column_{idx}"
+        expectation_configurations.extend(
+            [
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_between",
+                    kwargs={"column": column, "min_value": 0, "max_value": 98},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_in_set",
+                    kwargs={"column": column, "value_set": list(range(99))},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": column},
+                ),
+            ]
+        )
+    return expectation_configurations
+
+
+def _validate(
+    validator: Validator, expectation_configurations: List[ExpectationConfiguration]
+) -> list:
+    return validator.graph_validate(configurations=expectation_configurations)
+
+
+@pytest.mark.parametrize("strategy", ["vectorized", "element_wise"])
+@pytest.mark.parametrize("number_of_rows", [1000000, 10000000])
+def test_pandas_column_values_between_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_rows: int,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    expectation_configurations: List[
+        ExpectationConfiguration
+    ] = _build_expectation_configurations()
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=_build_wide_dataframe(number_of_rows=number_of_rows))],
+    )
+
+    with mock.patch(
+        "great_expectations.expectations.metrics.column_map_metrics.column_values_between._can_compare_numeric_column",
+        return_value=strategy == "vectorized",
+    ):
+        results: list = benchmark.pedantic(
+            _validate, args=(validator, expectation_configurations), rounds=1
+        )
+
+    assert len(results) == len(expectation_configurations)
+    assert not any(result.success for result in results)
+
+
+@pytest.mark.parametrize("strategy", ["bundled", "per_metric"])
+@pytest.mark.parametrize("number_of_rows", [1000000, 10000000])
+def test_pandas_multiple_column_map_expectations_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_rows: int,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    expectation_configurations: List[
+        ExpectationConfiguration
+    ] = _build_multiple_expectation_configurations()
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=_build_wide_dataframe(number_of_rows=number_of_rows))],
+    )
+
+    if strategy == "bundled":
+        results: list = benchmark.pedantic(
+            _validate, args=(validator, expectation_configurations), rounds=1
+        )
+    else:
+        with mock.patch.object(
+            PandasExecutionEngine, "_is_bundled_metric_fn", return_value=False
+        ):
+            results = benchmark.pedantic(
+                _validate, args=(validator, expectation_configurations), rounds=1
+            )
+
+    assert len(results) == len(expectation_configurations)
+    assert [result.success for result in results] == [
+        False,
+        False,
+        True,
+    ] * NUMBER_OF_COLUMNS
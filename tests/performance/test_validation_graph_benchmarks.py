@@ -0,0 +1,147 @@
+"""
+Benchmark scheduling of large synthetic validation graphs.
+
+The "scheduler" strategy releases ready metrics incrementally (as their dependencies are resolved) by way of the
+ValidationGraphScheduler, while the "rescan" strategy re-derives ready and needed metrics from a deep copy of every edge
+of the graph on each resolution round (which is how the validation graph used to be processed).
+"""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    MetricEdge,
+    ValidationGraph,
+    ValidationGraphScheduler,
+)
+
+# Shape of the dependency chain built for every synthetic expectation, similar to that of column map expectations.
+METRIC_NAMES_PER_EXPECTATION: List[str] = [
+    "column_values.in_set.unexpected_count",
+    "column_values.in_set.unexpected_count.aggregate_fn",
+    "column_values.in_set.condition",
+    "column_values.nonnull.unexpected_count",
+    "column_values.nonnull.unexpected_count.aggregate_fn",
+    "column_values.nonnull.condition",
+]
+
+
+def _build_synthetic_validation_graph(number_of_expectations: int) -> ValidationGraph:
+    graph = ValidationGraph()
+
+    table_columns = MetricConfiguration(
+        metric_name="table.columns", metric_domain_kwargs={}
+    )
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count", metric_domain_kwargs={}
+    )
+    graph.add(MetricEdge(left=table_columns))
+    graph.add(MetricEdge(left=table_row_count))
+
+    idx: int
+    for idx in range(number_of_expectations):
+        chain: List[MetricConfiguration] = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": f"column_{idx}"},
+                metric_value_kwargs={"value_set": [idx]},
+            )
+            for metric_name in METRIC_NAMES_PER_EXPECTATION
+        ]
+        graph.add(MetricEdge(left=chain[0], right=table_row_count))
+        for left, right in zip(chain, chain[1:]):
+            graph.add(MetricEdge(left=left, right=right))
+        graph.add(MetricEdge(left=chain[-1], right=table_columns))
+
+    return graph
+
+
+def _schedule_with_scheduler(graph: ValidationGraph) -> int:
+    metrics: Dict[Tuple[str, str, str], Any] = {}
+    scheduler = ValidationGraphScheduler(graph=graph, metrics=metrics)
+    num_rounds: int = 0
+    while scheduler.ready_metric_ids:
+        ready_metrics = scheduler.ready_metrics
+        metrics.update({metric.id: None for metric in ready_metrics})
+        scheduler.mark_resolved(metric_ids=[metric.id for metric in ready_metrics])
+        num_rounds += 1
+
+    return num_rounds
+
+
+def _schedule_with_rescan(graph: ValidationGraph) -> int:
+    metrics: Dict[Tuple[str, str, str], Any] = {}
+    num_rounds: int = 0
+    while True:
+        unmet_dependency_ids = set()
+        maybe_ready_ids = set()
+        maybe_ready = set()
+        edge: MetricEdge
+        for edge in copy.deepcopy(graph.edges):
+            if edge.left.id not in metrics:
+                if edge.right is None or edge.right.id in metrics:
+                    if edge.left.id not in maybe_ready_ids:
+                        maybe_ready_ids.add(edge.left.id)
+                        maybe_ready.add(edge.left)
+                else:
+                    unmet_dependency_ids.add(edge.left.id)
+
+        ready_metrics = {
+            metric for metric in maybe_ready if metric.id not in unmet_dependency_ids
+        }
+        if len(ready_metrics) == 0:
+            break
+
+        metrics.update({metric.id: None for metric in ready_metrics})
+        num_rounds += 1
+
+    return num_rounds
+
+
+@pytest.mark.parametrize("strategy", ["scheduler", "rescan"])
+@pytest.mark.parametrize("number_of_expectations", [100, 600, 2000])
+def test_validation_graph_scheduling_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_expectations: int,
+    strategy: str,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    graph: ValidationGraph = _build_synthetic_validation_graph(
+        number_of_expectations=number_of_expectations
+    )
+    schedule = (
+        _schedule_with_scheduler if strategy == "scheduler" else _schedule_with_rescan
+    )
+
+    num_rounds: int = benchmark.pedantic(schedule, args=(graph,), rounds=3)
+
+    assert num_rounds == len(METRIC_NAMES_PER_EXPECTATION) + 1
+
+
+@pytest.mark.parametrize("number_of_expectations", [100, 600, 2000])
+def test_validation_graph_construction_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_expectations: int,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    graph: ValidationGraph = benchmark.pedantic(
+        _build_synthetic_validation_graph,
+        args=(number_of_expectations,),
+        rounds=3,
+    )
+
+    assert graph.find_cycle() is None
+    assert len(graph.metric_configurations) == 2 + number_of_expectations * len(
+        METRIC_NAMES_PER_EXPECTATION
+    )
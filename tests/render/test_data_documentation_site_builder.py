@@ -1,6 +1,8 @@
+import json
 import os
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -494,6 +496,311 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+def test_site_index_builder_renders_index_from_index_manifest(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    number_of_profiling_results: int = len(
+        context.stores["validations_store"].list_keys()
+    )
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, index_links_dict = site_builder.build()
+    assert len(index_links_dict["profiling_links"]) == number_of_profiling_results
+
+    index_manifest_path = os.path.join(
+        site_builder.target_store.store_backends["index_page"].full_base_directory,
+        "index_manifest.json",
+    )
+    with open(index_manifest_path) as f:
+        index_manifest = json.load(f)
+    assert len(index_manifest["validation_results"]) == number_of_profiling_results
+    assert all(
+        entry["success"] is not None and "evaluated_expectations" in entry["statistics"]
+        for entry in index_manifest["validation_results"]
+    )
+
+    # a new site builder renders the index page from the persisted index manifest, without loading any validation
+    # result
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    with mock.patch.object(
+        context, "get_validation_result", side_effect=AssertionError
+    ) as mock_get_validation_result:
+        _, manifest_index_links_dict = site_builder.site_index_builder.build()
+    assert mock_get_validation_result.call_count == 0
+    assert (
+        manifest_index_links_dict["profiling_links"]
+        == index_links_dict["profiling_links"]
+    )
+
+    # entries of removed validation results are dropped from the index manifest
+    removed_validation_result_key = next(
+        iter(context.stores["validations_store"].list_keys())
+    )
+    context.stores["validations_store"].store_backend.remove_key(
+        removed_validation_result_key.to_tuple()
+    )
+    _, index_links_dict = site_builder.site_index_builder.build()
+    assert len(index_links_dict["profiling_links"]) == number_of_profiling_results - 1
+    with open(index_manifest_path) as f:
+        index_manifest = json.load(f)
+    assert len(index_manifest["validation_results"]) == number_of_profiling_results - 1
+
+    # the index manifest is recreated from the validation results on demand only,
+    # loading them in a single batch
+    validations_store = context.stores["validations_store"]
+    with mock.patch.object(
+        validations_store, "get_many", wraps=validations_store.get_many
+    ) as mock_get_many, mock.patch.object(
+        context, "get_validation_result", side_effect=AssertionError
+    ):
+        _, index_links_dict = site_builder.site_index_builder.build(
+            rebuild_index_manifest=True
+        )
+    mock_get_many.assert_called_once()
+    assert len(mock_get_many.call_args[0][0]) == number_of_profiling_results - 1
+    assert len(index_links_dict["profiling_links"]) == number_of_profiling_results - 1
+
+
+def test_site_builder_skips_rendering_unchanged_pages(
+    site_builder_data_context_with_html_store_titanic_random, tmp_path
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    # pages are rendered on every build, unless skipping unchanged pages is enabled
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    site_builder.build()
+    profiling_section_builder = site_builder.site_section_builders["profiling"]
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        wraps=profiling_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build()
+    assert mock_render.call_count > 0
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **{**local_site_config, "skip_unchanged_pages": True}
+    )
+    site_builder.build()
+
+    profiling_section_builder = site_builder.site_section_builders["profiling"]
+    validation_result_key = next(
+        key
+        for key in context.stores["validations_store"].list_keys()
+        if key.run_id.run_name == "profiling"
+    )
+
+    # nothing changed since the site was built
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        wraps=profiling_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build()
+    assert mock_render.call_count == 0
+
+    # a changed validation result is rendered again
+    validation_result = context.stores["validations_store"].get(validation_result_key)
+    validation_result.meta["changed"] = True
+    context.stores["validations_store"].set(validation_result_key, validation_result)
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        wraps=profiling_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build()
+    assert mock_render.call_count == 1
+
+    # so is a page that was removed from the site
+    site_builder.target_store.store_backends[ValidationResultIdentifier].remove_key(
+        validation_result_key.to_tuple()
+    )
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        wraps=profiling_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build()
+    assert mock_render.call_count == 1
+    assert site_builder.target_store.store_backends[ValidationResultIdentifier].has_key(
+        validation_result_key.to_tuple()
+    )
+
+    # every page is rendered again once a custom template is edited
+    custom_template = tmp_path / "custom_view.j2"
+    custom_template.write_text("{{ content }}")
+    profiling_section_builder.custom_views_directory = str(tmp_path)
+    site_builder.build()
+    custom_template.write_text("<div>{{ content }}</div>")
+    os.utime(custom_template, ns=(0, 0))
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        wraps=profiling_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build()
+    assert mock_render.call_count > 0
+
+    # and every page is rendered when the index manifest is rebuilt on demand
+    with mock.patch.object(
+        profiling_section_builder.renderer_class,
+        "render",
+        wraps=profiling_section_builder.renderer_class.render,
+    ) as mock_render:
+        site_builder.build(rebuild_index_manifest=True)
+    assert mock_render.call_count == len(
+        context.stores["validations_store"].list_keys()
+    )
+
+
+def test_site_builder_reads_resources_in_batches(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    validations_store_backend = context.stores["validations_store"].store_backend
+    number_of_validation_results = len(context.stores["validations_store"].list_keys())
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    with mock.patch.object(
+        validations_store_backend, "get_many", wraps=validations_store_backend.get_many
+    ) as mock_get_many, mock.patch.object(
+        validations_store_backend, "get", wraps=validations_store_backend.get
+    ) as mock_get:
+        site_builder.build()
+
+    # the validation results are read in batches rather than one at a time
+    assert mock_get_many.call_count >= 1
+    assert mock_get.call_count == 0
+    assert (
+        len(
+            site_builder.target_store.store_backends[
+                ValidationResultIdentifier
+            ].list_keys()
+        )
+        == number_of_validation_results
+    )
+
+    # a batch with a missing resource is read one resource at a time, skipping the missing one
+    missing_key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("missing_suite"),
+        run_id=RunIdentifier(run_name="profiling"),
+        batch_identifier="missing_batch",
+    )
+    profiling_section_builder = site_builder.site_section_builders["profiling"]
+    serialized_resources = list(
+        profiling_section_builder._read_serialized_resources(
+            resource_keys=[missing_key]
+            + context.stores["validations_store"].list_keys()
+        )
+    )
+    assert len(serialized_resources) == number_of_validation_results
+    assert missing_key not in [key for key, _ in serialized_resources]
+
+
+def test_site_builder_copies_only_missing_or_outdated_static_assets(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    site_builder.build()
+
+    static_assets_backend = site_builder.target_store.store_backends["static_assets"]
+    static_asset_keys = [
+        key for key in static_assets_backend.list_keys() if key[0] == "static"
+    ]
+    assert len(static_asset_keys) > 0
+
+    with mock.patch.object(
+        static_assets_backend, "set", wraps=static_assets_backend.set
+    ) as mock_set:
+        site_builder.build()
+    assert mock_set.call_count == 0
+
+    static_assets_backend.remove_key(static_asset_keys[0])
+    with mock.patch.object(
+        static_assets_backend, "set", wraps=static_assets_backend.set
+    ) as mock_set:
+        site_builder.build()
+    assert mock_set.call_count == 1
+    assert mock_set.call_args[0][0] == static_asset_keys[0]
+
+
+def test_site_builder_renders_pages_in_parallel(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    serial_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, serial_index_links_dict = serial_site_builder.build()
+
+    parallel_site_config: dict = {
+        **local_site_config,
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "uncommitted/data_docs/parallel_site/",
+        },
+        "rendering_processes": 2,
+    }
+    parallel_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **parallel_site_config
+    )
+    _, parallel_index_links_dict = parallel_site_builder.build()
+
+    for key_class in [ExpectationSuiteIdentifier, ValidationResultIdentifier]:
+        serial_page_keys = set(
+            serial_site_builder.target_store.store_backends[key_class].list_keys()
+        )
+        parallel_page_keys = set(
+            parallel_site_builder.target_store.store_backends[key_class].list_keys()
+        )
+        assert len(serial_page_keys) > 0
+        assert parallel_page_keys == serial_page_keys
+
+    assert (
+        parallel_index_links_dict["profiling_links"]
+        == serial_index_links_dict["profiling_links"]
+    )
+
+
 @pytest.mark.rendered_output
 def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder_data_context_with_html_store_titanic_random,
@@ -0,0 +1,70 @@
+import copy
+
+import pytest
+
+from great_expectations.core.id_dict import FrozenIDDict
+from great_expectations.validator.metric_configuration import (
+    MetricConfiguration,
+    MetricConfigurationID,
+)
+
+
+def test_metric_configuration_id():
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+
+    assert isinstance(metric_configuration.id, MetricConfigurationID)
+    assert metric_configuration.id == ("column.max", "column=a", tuple())
+    assert metric_configuration.id.metric_name == "column.max"
+    assert metric_configuration.id is metric_configuration.id
+    assert isinstance(metric_configuration.metric_domain_kwargs, FrozenIDDict)
+
+    with pytest.raises(TypeError):
+        metric_configuration.metric_domain_kwargs["column"] = "b"
+
+
+def test_metric_configuration_as_dictionary_key():
+    metric_configuration = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a", "batch_id": "1234"},
+        metric_value_kwargs={"quantiles": [0.25, 0.5, 0.75]},
+    )
+    same_metric_configuration = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"batch_id": "1234", "column": "a"},
+        metric_value_kwargs={"quantiles": [0.25, 0.5, 0.75]},
+    )
+    other_metric_configuration = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "b", "batch_id": "1234"},
+        metric_value_kwargs={"quantiles": [0.25, 0.5, 0.75]},
+    )
+
+    assert metric_configuration == same_metric_configuration
+    assert metric_configuration != other_metric_configuration
+    assert {
+        metric_configuration: 1,
+        same_metric_configuration: 2,
+        other_metric_configuration: 3,
+    } == {metric_configuration: 2, other_metric_configuration: 3}
+
+
+def test_metric_configuration_deepcopy():
+    dependency = MetricConfiguration(
+        metric_name="table.columns", metric_domain_kwargs={}
+    )
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_dependencies={"table.columns": dependency},
+    )
+
+    copied = copy.deepcopy(metric_configuration)
+
+    assert copied == metric_configuration
+    assert copied is not metric_configuration
+    assert isinstance(copied.metric_domain_kwargs, FrozenIDDict)
+    assert copied.metric_dependencies["table.columns"] == dependency
@@ -0,0 +1,208 @@
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    MetricEdge,
+    ValidationGraph,
+    ValidationGraphScheduler,
+)
+from great_expectations.validator.validator import Validator
+
+
+def _metric(name: str) -> MetricConfiguration:
+    return MetricConfiguration(metric_name=name, metric_domain_kwargs={})
+
+
+@pytest.fixture
+def diamond_graph() -> Tuple[ValidationGraph, Dict[str, MetricConfiguration]]:
+    """
+    top -> left -> bottom
+    top -> right -> bottom
+    """
+    metrics: Dict[str, MetricConfiguration] = {
+        name: _metric(name) for name in ["top", "left", "right", "bottom"]
+    }
+    graph = ValidationGraph()
+    graph.add(MetricEdge(left=metrics["top"], right=metrics["left"]))
+    graph.add(MetricEdge(left=metrics["top"], right=metrics["right"]))
+    graph.add(MetricEdge(left=metrics["left"], right=metrics["bottom"]))
+    graph.add(MetricEdge(left=metrics["right"], right=metrics["bottom"]))
+    graph.add(MetricEdge(left=metrics["bottom"]))
+    return graph, metrics
+
+
+def test_validation_graph_indexes(diamond_graph):
+    graph, metrics = diamond_graph
+
+    # Duplicate edges are ignored.
+    graph.add(MetricEdge(left=metrics["top"], right=metrics["left"]))
+    assert len(graph.edges) == 5
+    assert len(graph.edge_ids) == 5
+
+    assert set(graph.metric_configurations.keys()) == {
+        metric.id for metric in metrics.values()
+    }
+    assert metrics["top"].id in graph
+    assert graph.get_dependencies(metric_id=metrics["top"].id) == {
+        metrics["left"].id,
+        metrics["right"].id,
+    }
+    assert graph.get_dependents(metric_id=metrics["bottom"].id) == {
+        metrics["left"].id,
+        metrics["right"].id,
+    }
+    assert graph.get_dependencies(metric_id=metrics["bottom"].id) == set()
+
+
+def test_validation_graph_edges_are_not_mutable_through_property(diamond_graph):
+    graph, _ = diamond_graph
+    graph.edges.clear()
+    assert len(graph.edges) == 5
+
+
+def test_validation_graph_get_ready_and_needed_metrics(diamond_graph):
+    graph, metrics = diamond_graph
+
+    ready_metrics, needed_metrics = graph.get_ready_and_needed_metrics(metrics={})
+    assert {metric.id for metric in ready_metrics} == {metrics["bottom"].id}
+    assert {metric.id for metric in needed_metrics} == {
+        metrics["top"].id,
+        metrics["left"].id,
+        metrics["right"].id,
+    }
+
+    ready_metrics, needed_metrics = graph.get_ready_and_needed_metrics(
+        metrics={metrics["bottom"].id: 1, metrics["left"].id: 2}
+    )
+    assert {metric.id for metric in ready_metrics} == {metrics["right"].id}
+    assert {metric.id for metric in needed_metrics} == {metrics["top"].id}
+
+
+def test_validation_graph_scheduler_releases_metrics_in_topological_order(
+    diamond_graph,
+):
+    graph, metrics = diamond_graph
+    scheduler = ValidationGraphScheduler(graph=graph)
+
+    assert scheduler.num_unresolved_metrics == 4
+
+    resolution_rounds: List[set] = []
+    while scheduler.ready_metric_ids:
+        ready_metric_ids = scheduler.ready_metric_ids
+        resolution_rounds.append(ready_metric_ids)
+        scheduler.mark_resolved(metric_ids=ready_metric_ids)
+
+    assert resolution_rounds == [
+        {metrics["bottom"].id},
+        {metrics["left"].id, metrics["right"].id},
+        {metrics["top"].id},
+    ]
+    assert scheduler.num_unresolved_metrics == 0
+
+
+def test_validation_graph_scheduler_with_partially_resolved_metrics(diamond_graph):
+    graph, metrics = diamond_graph
+    scheduler = ValidationGraphScheduler(
+        graph=graph, metrics={metrics["bottom"].id: 1, metrics["left"].id: 2}
+    )
+
+    assert scheduler.num_unresolved_metrics == 2
+    assert {metric.id for metric in scheduler.ready_metrics} == {metrics["right"].id}
+
+    # A metric that failed to resolve is not released; its dependents never become ready.
+    scheduler.mark_resolved(metric_ids=[])
+    assert scheduler.ready_metric_ids == {metrics["right"].id}
+
+    scheduler.mark_resolved(metric_ids=[metrics["right"].id])
+    assert scheduler.ready_metric_ids == {metrics["top"].id}
+
+
+def test_validation_graph_scheduler_skips_dependencies_of_available_metrics(
+    diamond_graph,
+):
+    graph, metrics = diamond_graph
+
+    # Only "right" is needed by the unresolved "top"; "bottom" is needed by no unresolved metric.
+    scheduler = ValidationGraphScheduler(
+        graph=graph, metrics={metrics["left"].id: 2, metrics["bottom"].id: 1}
+    )
+    assert scheduler.num_unresolved_metrics == 2
+
+    scheduler = ValidationGraphScheduler(graph=graph, metrics={metrics["top"].id: 3})
+    assert scheduler.num_unresolved_metrics == 0
+    assert scheduler.ready_metric_ids == set()
+
+    scheduler = ValidationGraphScheduler(graph=graph, metrics={metrics["left"].id: 2})
+    assert scheduler.num_unresolved_metrics == 3
+    assert scheduler.ready_metric_ids == {metrics["bottom"].id}
+
+
+def test_validation_graph_scheduler_resolves_requested_dependencies_of_available_metrics(
+    diamond_graph,
+):
+    graph, metrics = diamond_graph
+
+    # "left" is requested (e.g., by an expectation), although "top", which depends on it, is available.
+    scheduler = ValidationGraphScheduler(
+        graph=graph,
+        metrics={metrics["top"].id: 3},
+        requested_metric_ids=[metrics["top"].id, metrics["left"].id],
+    )
+    assert scheduler.num_unresolved_metrics == 2
+    assert scheduler.ready_metric_ids == {metrics["bottom"].id}
+
+    scheduler.mark_resolved(metric_ids=[metrics["bottom"].id])
+    assert scheduler.ready_metric_ids == {metrics["left"].id}
+
+
+def test_validation_graph_find_cycle(diamond_graph):
+    graph, metrics = diamond_graph
+    assert graph.find_cycle() is None
+
+    graph.add(MetricEdge(left=metrics["bottom"], right=metrics["top"]))
+    cycle: Optional[List[Tuple[str, str, str]]] = graph.find_cycle()
+    assert cycle is not None
+    assert cycle[0] == cycle[-1]
+    assert metrics["top"].id in cycle and metrics["bottom"].id in cycle
+
+
+def test_build_metric_dependency_graph_shares_common_dependencies():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine, batches=[Batch(data=df)])
+
+    graph = ValidationGraph()
+    for column in ["a", "b"]:
+        configuration = ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": column, "min_value": 0, "max_value": 100},
+        )
+        validator.build_metric_dependency_graph(
+            graph=graph,
+            execution_engine=engine,
+            metric_configuration=MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={"column": column},
+            ),
+            configuration=configuration,
+        )
+
+    assert graph.find_cycle() is None
+    # The "table.columns" metric is shared by both "column.max" metrics.
+    table_columns_ids = [
+        metric_id
+        for metric_id in graph.metric_configurations
+        if metric_id[0] == "table.columns"
+    ]
+    assert len(table_columns_ids) == 1
+    assert len(graph.get_dependents(metric_id=table_columns_ids[0])) >= 2
+
+    metrics: dict = {}
+    validator.resolve_validation_graph(graph=graph, metrics=metrics)
+    assert all(metric_id in metrics for metric_id in graph.metric_configurations)
@@ -20,6 +20,7 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
+from great_expectations.data_context.store import MetricResultStore
 from great_expectations.data_context.types.base import ProgressBarsConfig
 from great_expectations.datasource.data_connector.batch_filter import (
     BatchFilter,
@@ -937,7 +938,7 @@ def test_validator_load_additional_batch_to_validator(
     first_batch_markers: BatchMarkers = validator.active_batch_markers
     assert (
         first_batch_markers["pandas_data_fingerprint"]
-        == "c4f929e6d4fab001fedc9e075bf4b612"
+        == "5a33d88009d55c663022129e69757362"
     )
 
     feb_batch_request: BatchRequest = BatchRequest(
@@ -953,7 +954,7 @@ def test_validator_load_additional_batch_to_validator(
     updated_batch_markers: BatchMarkers = validator.active_batch_markers
     assert (
         updated_batch_markers["pandas_data_fingerprint"]
-        == "88b447d903f05fb594b87b13de399e45"
+        == "9943d983f62c930c4e36c4497ede5e36"
     )
 
     assert len(validator.batches) == 2
@@ -1078,3 +1079,66 @@ def test_validator_progress_bar_config_disabled(
 
     assert mock_tqdm.called is True
     assert mock_tqdm.call_args[1]["disable"] is True
+
+
+def test_graph_validate_reuses_metric_results_of_unchanged_batch_data(
+    basic_datasource,
+):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch_request = RuntimeBatchRequest(
+        **{
+            "datasource_name": "my_datasource",
+            "data_connector_name": "test_runtime_data_connector",
+            "data_asset_name": "IN_MEMORY_DATA_ASSET",
+            "runtime_parameters": {
+                "batch_data": df,
+            },
+            "batch_identifiers": {
+                "pipeline_stage_name": 0,
+                "airflow_run_id": 0,
+                "custom_key_0": 0,
+            },
+        }
+    )
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_value_z_scores_to_be_less_than",
+        kwargs={
+            "column": "b",
+            "mostly": 0.9,
+            "threshold": 4,
+            "double_sided": True,
+        },
+    )
+    metric_result_store = MetricResultStore()
+
+    results: list = []
+    resolved_metric_names: list = []
+    for _ in range(2):
+        batch = basic_datasource.get_single_batch_from_batch_request(batch_request)
+        assert batch.batch_markers.data_fingerprint is not None
+
+        execution_engine = PandasExecutionEngine(
+            metric_result_store=metric_result_store
+        )
+        validator = Validator(execution_engine=execution_engine, batches=[batch])
+        with mock.patch.object(
+            execution_engine,
+            "resolve_metrics",
+            wraps=execution_engine.resolve_metrics,
+        ) as mock_resolve_metrics:
+            results.append(
+                validator.graph_validate(configurations=[expectation_configuration])
+            )
+
+        resolved_metric_names.append(
+            {
+                metric.metric_name
+                for call in mock_resolve_metrics.call_args_list
+                for metric in call.kwargs["metrics_to_resolve"]
+            }
+        )
+
+    assert results[0] == results[1]
+    assert "column_values.z_score.map" in resolved_metric_names[0]
+    # All metrics requested by the expectation were saved in the first run, so nothing is computed in the second one.
+    assert resolved_metric_names[1] == set()